@@ -1,53 +1,58 @@
 import numpy as np
 from PIL import Image
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.expressions import (TileRenderer, sin, cos, exp, sqrt, floor, arctan2,
+                                     maximum, clip, where, normal)
 
 # Chromatic Equations - Where Mathematics Paints
 # Each pixel's color determined by its position in mathematical space
 
 WIDTH, HEIGHT = 1080, 1080
 
-# Create array for the image
-image_array = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+# Every formula below is an expression graph; nothing is computed until
+# the renderer sweeps the canvas in float32 row tiles across threads
+renderer = TileRenderer(WIDTH, HEIGHT)
 
 print("Solving chromatic equations...")
 
-# Create coordinate grids normalized to [-1, 1]
-x_grid = np.linspace(-1, 1, WIDTH)
-y_grid = np.linspace(-1, 1, HEIGHT)
-X, Y = np.meshgrid(x_grid, y_grid)
+# Coordinate grids normalized to [-1, 1]
+X, Y = renderer.X, renderer.Y
 
 # Convert to polar coordinates
-R = np.sqrt(X**2 + Y**2)
-THETA = np.arctan2(Y, X)
+R = sqrt(X**2 + Y**2)
+THETA = arctan2(Y, X)
 
 # Mathematical functions for each color channel
 # Red channel - combination of radial and angular functions
-red_function = np.sin(5 * R) * np.cos(3 * THETA) + \
-               0.5 * np.sin(R * 10 + THETA * 2)
+red_function = sin(5 * R) * cos(3 * THETA) + \
+               0.5 * sin(R * 10 + THETA * 2)
 
 # Green channel - different frequency relationships
-green_function = np.cos(4 * R) * np.sin(5 * THETA) + \
-                 0.3 * np.sin(R * 8 - THETA * 3) * np.cos(R * 2)
+green_function = cos(4 * R) * sin(5 * THETA) + \
+                 0.3 * sin(R * 8 - THETA * 3) * cos(R * 2)
 
 # Blue channel - complex interference patterns
-blue_function = np.sin(6 * R + THETA) * np.cos(2 * R - THETA) + \
-                0.4 * np.sin((X + Y) * 5) * np.cos((X - Y) * 5)
+blue_function = sin(6 * R + THETA) * cos(2 * R - THETA) + \
+                0.4 * sin((X + Y) * 5) * cos((X - Y) * 5)
 
 # Add interference between channels
-interference = 0.2 * np.sin(10 * (red_function + green_function + blue_function))
+interference = 0.2 * sin(10 * (red_function + green_function + blue_function))
 
 # Apply transformations
-red_transformed = red_function + interference * np.cos(THETA * 4)
-green_transformed = green_function + interference * np.sin(THETA * 3)
-blue_transformed = blue_function + interference * np.cos(THETA * 5)
+red_transformed = red_function + interference * cos(THETA * 4)
+green_transformed = green_function + interference * sin(THETA * 3)
+blue_transformed = blue_function + interference * cos(THETA * 5)
 
 # Create smooth transitions using additional functions
 # Distance-based modulation
-distance_mod = np.exp(-R**2 * 0.5)  # Gaussian falloff from center
+distance_mod = exp(-R**2 * 0.5)  # Gaussian falloff from center
 
 # Angular modulation
-angular_mod = 0.5 + 0.5 * np.sin(THETA * 6)
+angular_mod = 0.5 + 0.5 * sin(THETA * 6)
 
 # Apply modulations
 red_final = red_transformed * (0.7 + 0.3 * distance_mod) * (0.8 + 0.2 * angular_mod)
@@ -55,45 +60,44 @@ green_final = green_transformed * (0.6 + 0.4 * distance_mod) * (0.9 + 0.1 * angu
 blue_final = blue_transformed * (0.8 + 0.2 * distance_mod) * (0.7 + 0.3 * angular_mod)
 
 # Normalize to [0, 1] range
-def normalize_channel(channel):
-    """Normalize array to 0-1 range with enhanced contrast"""
-    min_val = np.min(channel)
-    max_val = np.max(channel)
+def normalize_channel(channel, bounds):
+    """Normalize expression to 0-1 range with enhanced contrast"""
+    min_val, max_val = bounds
     
     if max_val > min_val:
         normalized = (channel - min_val) / (max_val - min_val)
         # Apply sigmoid for smoother transitions
-        normalized = 1 / (1 + np.exp(-6 * (normalized - 0.5)))
+        normalized = 1 / (1 + exp(-6 * (normalized - 0.5)))
         return normalized
     return channel
 
-red_normalized = normalize_channel(red_final)
-green_normalized = normalize_channel(green_final)
-blue_normalized = normalize_channel(blue_final)
+# First sweep only measures each channel's range
+red_bounds, green_bounds, blue_bounds = renderer.extrema(red_final, green_final, blue_final)
+
+red_normalized = normalize_channel(red_final, red_bounds)
+green_normalized = normalize_channel(green_final, green_bounds)
+blue_normalized = normalize_channel(blue_final, blue_bounds)
 
 print("Applying chromatic transformations...")
 
 # Add subtle noise for organic feel
 noise_scale = 0.02
-red_normalized += np.random.normal(0, noise_scale, red_normalized.shape)
-green_normalized += np.random.normal(0, noise_scale, green_normalized.shape)
-blue_normalized += np.random.normal(0, noise_scale, blue_normalized.shape)
+red_normalized = red_normalized + normal(noise_scale)
+green_normalized = green_normalized + normal(noise_scale)
+blue_normalized = blue_normalized + normal(noise_scale)
 
-# Clip values and convert to uint8
-image_array[:, :, 0] = np.clip(red_normalized * 255, 0, 255).astype(np.uint8)
-image_array[:, :, 1] = np.clip(green_normalized * 255, 0, 255).astype(np.uint8)
-image_array[:, :, 2] = np.clip(blue_normalized * 255, 0, 255).astype(np.uint8)
+# Clip values and quantize to 8-bit levels
+channels = [floor(clip(normalized * 255, 0, 255))
+            for normalized in (red_normalized, green_normalized, blue_normalized)]
 
 # Add mathematical structure overlays
 print("Adding geometric harmonics...")
 
-# Create geometric overlay
-overlay = np.zeros((HEIGHT, WIDTH, 3), dtype=np.float32)
-
 # Concentric circles with varying opacity
+overlay = [0.0, 0.0, 0.0]
 for i in range(1, 8):
     radius = i * 0.15
-    circle_mask = np.abs(R - radius) < 0.005
+    circle_mask = abs(R - radius) < 0.005
     
     # Color based on radius
     hue = i / 8
@@ -104,32 +108,26 @@ for i in range(1, 8):
     else:
         color = [(hue - 0.67) * 3, 0, 1 - (hue - 0.67) * 3]
     
-    overlay[circle_mask] = color
+    overlay = [where(circle_mask, color[c], overlay[c]) for c in range(3)]
 
 # Radial lines
 for angle in np.linspace(0, 2 * np.pi, 12, endpoint=False):
-    line_mask = np.abs(THETA - angle) < 0.01
-    overlay[line_mask] = [0.3, 0.3, 0.3]
+    line_mask = abs(THETA - angle) < 0.01
+    overlay = [where(line_mask, 0.3, overlay[c]) for c in range(3)]
 
 # Blend overlay with main image
 alpha = 0.15  # Overlay transparency
-for c in range(3):
-    image_array[:, :, c] = np.clip(
-        image_array[:, :, c] * (1 - alpha) + overlay[:, :, c] * alpha * 255,
-        0, 255
-    ).astype(np.uint8)
-
-# Add central focal point
-center_x, center_y = WIDTH // 2, HEIGHT // 2
-for r in range(30, 0, -1):
-    mask = R < (r / WIDTH)
-    brightness = (30 - r) / 30
-    
-    for c in range(3):
-        image_array[mask, c] = np.clip(
-            image_array[mask, c] + brightness * 30,
-            0, 255
-        ).astype(np.uint8)
+channels = [floor(clip(channels[c] * (1 - alpha) + overlay[c] * alpha * 255, 0, 255))
+            for c in range(3)]
+
+# Add central focal point - rings r = 30..1 each add (30 - r) inside R < r / WIDTH,
+# which sums to the triangular number of the rings covering a pixel
+covering_rings = maximum(29 - floor(R * WIDTH), 0)
+focal_glow = covering_rings * (covering_rings + 1) / 2
+channels = [channel + focal_glow for channel in channels]
+
+# Second sweep writes the finished 8-bit image directly
+image_array = renderer.render(channels, scale=1)
 
 # Create and save the image
 image = Image.fromarray(image_array, 'RGB')
@@ -1,10 +1,17 @@
 from PIL import Image, ImageDraw, ImageFilter
 import numpy as np
 from scipy.ndimage import gaussian_filter
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import shortest_path
 import math
 import random
 import colorsys
 import struct
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.curves import ragged, scatter_add
 
 # Canvas dimensions
 WIDTH, HEIGHT = 1080, 1080
@@ -13,270 +20,406 @@ WIDTH, HEIGHT = 1080, 1080
 img = Image.new('RGB', (WIDTH, HEIGHT), color=(5, 5, 10))
 draw = ImageDraw.Draw(img, 'RGBA')
 
-# Data packet class
-class DataPacket:
-    def __init__(self, data_type, size, origin, destination):
-        self.type = data_type  # 'text', 'image', 'video', 'code', 'neural'
-        self.size = size
-        self.origin = origin
-        self.destination = destination
-        self.position = list(origin)
-        self.velocity = [0, 0]
-        self.age = 0
-        self.path_history = [list(origin)]
-        self.corrupted = random.random() < 0.05  # 5% corruption rate
-        self.encrypted = random.random() < 0.3  # 30% encrypted
-        
-        # Visual properties based on type
-        self.color = self._get_type_color()
-        self.pattern = self._get_type_pattern()
-        
-    def _get_type_color(self):
-        """Color coding for different data types"""
-        colors = {
-            'text': (100, 200, 255),      # Blue - language
-            'image': (255, 150, 100),     # Orange - visual
-            'video': (255, 100, 200),     # Pink - motion
-            'code': (100, 255, 150),      # Green - logic
-            'neural': (200, 100, 255),    # Purple - thought
-        }
-        return colors.get(self.type, (200, 200, 200))
-    
-    def _get_type_pattern(self):
-        """Visual pattern for data type"""
-        patterns = {
-            'text': 'lines',
-            'image': 'pixels',
-            'video': 'frames',
-            'code': 'brackets',
-            'neural': 'synapses'
-        }
-        return patterns.get(self.type, 'dots')
+# Size of the data flow
+INITIAL_PACKETS = 50
+SIMULATION_STEPS = 100
+MAX_PACKETS = 1 << 16  # Capacity of the packet pool; spawns beyond it are dropped
+HISTORY_LENGTH = 100  # Trail points kept per packet, from its origin on
+
+# Data types and their visual properties
+DATA_TYPES = ('text', 'image', 'video', 'code', 'neural')
+TYPE_COLORS = np.array([
+    (100, 200, 255),      # Blue - language
+    (255, 150, 100),      # Orange - visual
+    (255, 100, 200),      # Pink - motion
+    (100, 255, 150),      # Green - logic
+    (200, 100, 255),      # Purple - thought
+])
+TYPE_PATTERNS = ('lines', 'pixels', 'frames', 'brackets', 'synapses')
+# Light text and code outrun heavy media
+TYPE_SPEED = np.array([1.2, 0.9, 0.8, 1.2, 1.0])
+
+# The network as a graph: nodes, undirected connections, and routes
+class Network:
+    """Nodes and connections with all-pairs shortest paths
     
-    def update(self):
-        """Update packet position"""
-        # Move toward destination
-        dx = self.destination[0] - self.position[0]
-        dy = self.destination[1] - self.position[1]
-        distance = math.sqrt(dx*dx + dy*dy)
-        
-        if distance > 5:
-            # Normalize and apply speed based on size
-            speed = 5 / (1 + self.size * 0.1)  # Smaller packets move faster
-            self.velocity[0] = speed * dx / distance
-            self.velocity[1] = speed * dy / distance
-            
-            # Add some randomness for organic movement
-            self.velocity[0] += random.uniform(-0.5, 0.5)
-            self.velocity[1] += random.uniform(-0.5, 0.5)
-            
-            # Update position
-            self.position[0] += self.velocity[0]
-            self.position[1] += self.velocity[1]
-            
-            # Store path
-            if len(self.path_history) < 100:
-                self.path_history.append(list(self.position))
+    Once built, routes are computed for every pair of nodes at once, and
+    each directed hop along a connection is an edge with an id. A packet
+    heading for a destination leaves any node through
+    edge_id[node, next_hop[node, destination]].
+    """
+    
+    NODE_TYPES = ('server', 'router', 'terminal', 'database', 'ai')
+    
+    def __init__(self):
+        self.positions = []
+        self.types = []
+        self.links = []
+    
+    def add_node(self, x, y, node_type='router'):
+        self.positions.append((x, y))
+        self.types.append(self.NODE_TYPES.index(node_type))
+        return len(self.positions) - 1
+    
+    def connect(self, a, b):
+        self.links.append((a, b))
+    
+    def build(self):
+        """Freeze the topology into arrays and route every pair of nodes"""
+        self.position = np.array(self.positions, dtype=np.float64)
+        self.type = np.array(self.types)
+        count = len(self.position)
+        self.processing_power = np.random.uniform(0.5, 1.0, count)
+        self.activity = np.zeros(count)
         
-        self.age += 1
+        # Every connection becomes a directed edge each way
+        links = np.array(self.links, dtype=np.int64).reshape(-1, 2)
+        self.edge_from = np.concatenate([links[:, 0], links[:, 1]])
+        self.edge_to = np.concatenate([links[:, 1], links[:, 0]])
+        self.edge_length = np.hypot(*(self.position[self.edge_to] - self.position[self.edge_from]).T)
+        self.edge_id = np.full((count, count), -1)
+        self.edge_id[self.edge_from, self.edge_to] = np.arange(len(self.edge_from))
         
-        return distance < 5  # Reached destination
-
-# Network node class
-class NetworkNode:
-    def __init__(self, x, y, node_type='router'):
-        self.x = x
-        self.y = y
-        self.type = node_type  # 'server', 'router', 'terminal', 'database', 'ai'
-        self.buffer = []
-        self.processing_power = random.uniform(0.5, 1.0)
-        self.connections = []
-        self.activity = 0
+        # All-pairs shortest paths; the predecessor of a node on the way
+        # back from a destination is the next hop towards it
+        graph = csr_matrix((np.maximum(self.edge_length, 1e-9), (self.edge_from, self.edge_to)),
+                           shape=(count, count))
+        self.distance, predecessors = shortest_path(graph, directed=True, return_predecessors=True)
+        self.next_hop = predecessors.T
+    
+    def reachable(self, origin, destination):
+        return (origin != destination) & np.isfinite(self.distance[origin, destination])
+    
+    def first_edge(self, origin, destination):
+        return self.edge_id[origin, self.next_hop[origin, destination]]
+    
+    def process_packets(self, nodes, types):
+        """Process packets of the given types arriving at nodes, all at once
         
-    def process_packet(self, packet):
-        """Process incoming packet"""
-        self.activity = min(1.0, self.activity + 0.1)
+        Returns the packets' types afterwards and the mask of packets a
+        database replicates.
+        """
+        arrivals = np.bincount(nodes, minlength=len(self.activity))
+        self.activity = np.minimum(1.0, self.activity + arrivals * 0.1)
         
         # Different nodes handle data differently
-        if self.type == 'ai':
-            # AI nodes transform data
-            if packet.type == 'text':
-                packet.type = 'neural'
-                packet.color = packet._get_type_color()
-        elif self.type == 'database':
-            # Databases store and replicate
-            if random.random() < 0.3:
-                return packet  # Replicate
+        node_type = self.type[nodes]
         
-        return None
+        # AI nodes transform data
+        transform = (node_type == self.NODE_TYPES.index('ai')) & (types == DATA_TYPES.index('text'))
+        types = np.where(transform, DATA_TYPES.index('neural'), types)
+        
+        # Databases store and replicate
+        replicate = (node_type == self.NODE_TYPES.index('database')) & (np.random.random(len(nodes)) < 0.3)
+        return types, replicate
     
     def update(self):
         """Update node state"""
         self.activity *= 0.95  # Decay activity
 
+# Data packets, as a pool of columns riding the routes
+class PacketStream:
+    """Packets in fixed-capacity arrays: route edge, progress along it, trail
+    
+    Each packet sits on a directed edge of the network with its progress
+    along it in pixels. Trails go into a preallocated history buffer that
+    keeps the first HISTORY_LENGTH positions of every packet.
+    """
+    
+    def __init__(self, network, capacity=MAX_PACKETS):
+        self.network = network
+        self.type = np.zeros(capacity, dtype=np.int64)
+        self.size = np.zeros(capacity)
+        self.destination = np.zeros(capacity, dtype=np.int64)
+        self.edge = np.zeros(capacity, dtype=np.int64)
+        self.progress = np.zeros(capacity)
+        self.wobble = np.zeros((capacity, 2))
+        self.position = np.zeros((capacity, 2))
+        self.age = np.zeros(capacity, dtype=np.int64)
+        self.corrupted = np.zeros(capacity, dtype=bool)
+        self.encrypted = np.zeros(capacity, dtype=bool)
+        self.history = np.zeros((capacity, HISTORY_LENGTH, 2), dtype=np.float32)
+        self.history_length = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.free = np.arange(capacity)[::-1].copy()
+        self.free_count = capacity
+    
+    def __len__(self):
+        return len(self.alive) - self.free_count
+    
+    def living(self):
+        return np.flatnonzero(self.alive)
+    
+    def _take(self, count):
+        count = min(count, self.free_count)
+        slots = self.free[self.free_count - count:self.free_count].copy()
+        self.free_count -= count
+        self.alive[slots] = True
+        return slots
+    
+    def release(self, slots):
+        self.alive[slots] = False
+        self.free[self.free_count:self.free_count + len(slots)] = slots
+        self.free_count += len(slots)
+    
+    def spawn(self, origin, destination, data_type, size):
+        """Send packets between nodes; pairs with no route between them are dropped"""
+        keep = self.network.reachable(origin, destination)
+        slots = self._take(keep.sum())
+        count = len(slots)
+        origin, destination = origin[keep][:count], destination[keep][:count]
+        
+        self.type[slots] = data_type[keep][:count]
+        self.size[slots] = size[keep][:count]
+        self.destination[slots] = destination
+        self.edge[slots] = self.network.first_edge(origin, destination)
+        self.progress[slots] = 0
+        self.wobble[slots] = 0
+        self.position[slots] = self.network.position[origin]
+        self.age[slots] = 0
+        self.corrupted[slots] = np.random.random(count) < 0.05  # 5% corruption rate
+        self.encrypted[slots] = np.random.random(count) < 0.3  # 30% encrypted
+        self.history[slots, 0] = self.network.position[origin]
+        self.history_length[slots] = 1
+        return slots
+    
+    def spawn_random(self, count):
+        """Random origins, destinations, types and sizes"""
+        nodes = len(self.network.position)
+        return self.spawn(np.random.randint(0, nodes, count), np.random.randint(0, nodes, count),
+                          np.random.randint(0, len(DATA_TYPES), count), np.random.uniform(0.1, 1.0, count))
+    
+    def replicate(self, slots):
+        copies = self._take(len(slots))
+        for column in (self.type, self.size, self.destination, self.edge, self.progress, self.wobble,
+                       self.position, self.age, self.corrupted, self.encrypted, self.history,
+                       self.history_length):
+            column[copies] = column[slots[:len(copies)]]
+        return copies
+    
+    def update(self):
+        """Advance every packet along its route
+        
+        Returns the slots of packets that reached their destination.
+        """
+        network = self.network
+        living = self.living()
+        
+        # Smaller packets move faster
+        speed = 5 / (1 + self.size[living] * 0.1) * TYPE_SPEED[self.type[living]]
+        self.progress[living] += speed
+        
+        # Hop across as many nodes as this step reaches
+        arrived = []
+        replicated = []
+        moving = living
+        while True:
+            edge = self.edge[moving]
+            over = self.progress[moving] >= network.edge_length[edge]
+            if not over.any():
+                break
+            hopping = moving[over]
+            node = network.edge_to[self.edge[hopping]]
+            self.progress[hopping] -= network.edge_length[self.edge[hopping]]
+            self.type[hopping], replicate = network.process_packets(node, self.type[hopping])
+            
+            # Reached destination, or on to the next hop
+            done = node == self.destination[hopping]
+            arrived.append(hopping[done])
+            replicated.append(hopping[replicate & ~done])
+            onward = hopping[~done]
+            self.edge[onward] = network.first_edge(node[~done], self.destination[onward])
+            moving = onward
+        
+        arrived = np.concatenate(arrived) if arrived else np.zeros(0, dtype=np.int64)
+        moving = living[~np.isin(living, arrived)]
+        
+        # Position along the edge, with some randomness for organic movement
+        edge = self.edge[moving]
+        start, end = network.position[network.edge_from[edge]], network.position[network.edge_to[edge]]
+        t = (self.progress[moving] / network.edge_length[edge])[:, np.newaxis]
+        self.wobble[moving] = self.wobble[moving] * 0.8 + np.random.uniform(-0.5, 0.5, (len(moving), 2))
+        self.position[moving] = start + (end - start) * t + self.wobble[moving]
+        
+        # Store path
+        recording = moving[self.history_length[moving] < HISTORY_LENGTH]
+        self.history[recording, self.history_length[recording]] = self.position[recording]
+        self.history_length[recording] += 1
+        self.age[living] += 1
+        
+        if replicated:
+            self.replicate(np.concatenate(replicated))
+        return arrived
+
+def trail_pixels(start, end):
+    """Pixels along line segments, one per step along their longer axis
+
+    Returns (x, y, index, steep), steep marking segments closer to vertical.
+    """
+    delta = end - start
+    steps = np.maximum(1, np.ceil(np.abs(delta).max(axis=1))).astype(np.int64)
+    index, step = ragged(steps)
+    t = step / steps[index]
+    x = start[index, 0] + delta[index, 0] * t
+    y = start[index, 1] + delta[index, 1] * t
+    steep = np.abs(delta[:, 1]) > np.abs(delta[:, 0])
+    return x, y, index, steep[index]
+
+def draw_trails(img, packets):
+    """Composite every packet's path trail onto the image at once
+    
+    Segments fade in along the trail; encrypted data is a dashed 1px line,
+    the rest 2px wide. Overlapping translucent segments combine as
+    1 - exp(-sum of alphas) with their alpha-weighted mean color, which
+    is what stacking many faint lines amounts to.
+    """
+    living = packets.living()
+    length = packets.history_length[living]
+    owner, i = ragged(np.maximum(length - 1, 0))
+    trail = living[owner]
+    alpha = (50 * i / packets.history_length[trail]).astype(int) / 255
+    encrypted = packets.encrypted[trail]
+    
+    # Dashed line for encrypted
+    shown = ~encrypted | (i % 4 < 2)
+    trail, i, alpha, encrypted = trail[shown], i[shown], alpha[shown], encrypted[shown]
+    
+    x, y, segment, steep = trail_pixels(packets.history[trail, i].astype(np.float64),
+                                        packets.history[trail, i + 1].astype(np.float64))
+    
+    # Wide lines take the neighbouring pixel across the line as well
+    wide = ~encrypted[segment]
+    x = np.concatenate([x, x[wide] + steep[wide]])
+    y = np.concatenate([y, y[wide] + ~steep[wide]])
+    segment = np.concatenate([segment, segment[wide]])
+    
+    color = TYPE_COLORS[packets.type[trail]][segment]
+    weight = alpha[segment]
+    layer = np.zeros((HEIGHT, WIDTH, 4))
+    scatter_add(layer, np.round(x), np.round(y), np.column_stack([color * weight[:, np.newaxis], weight]))
+    
+    coverage = layer[..., 3:]
+    blended = 1 - np.exp(-coverage)
+    mean_color = layer[..., :3] / np.maximum(coverage, 1e-12)
+    base = np.asarray(img, dtype=np.float64)
+    return Image.fromarray((base * (1 - blended) + mean_color * blended + 0.5).astype(np.uint8))
+
 # Create network topology
-nodes = []
-node_positions = []
+network = Network()
 
 # Central AI core
-ai_core = NetworkNode(WIDTH/2, HEIGHT/2, 'ai')
-nodes.append(ai_core)
-node_positions.append((ai_core.x, ai_core.y))
+ai_core = network.add_node(WIDTH/2, HEIGHT/2, 'ai')
 
 # Surrounding servers
+servers = []
 for i in range(6):
     angle = i * math.pi / 3
     radius = 200
     x = WIDTH/2 + radius * math.cos(angle)
     y = HEIGHT/2 + radius * math.sin(angle)
-    server = NetworkNode(x, y, 'server')
-    nodes.append(server)
-    node_positions.append((x, y))
+    server = network.add_node(x, y, 'server')
+    servers.append(server)
     # Connect to AI core
-    ai_core.connections.append(server)
-    server.connections.append(ai_core)
+    network.connect(ai_core, server)
 
 # Edge routers
+routers = []
 for i in range(12):
     angle = i * math.pi / 6
     radius = 350
     x = WIDTH/2 + radius * math.cos(angle)
     y = HEIGHT/2 + radius * math.sin(angle)
-    router = NetworkNode(x, y, 'router')
-    nodes.append(router)
-    node_positions.append((x, y))
+    router = network.add_node(x, y, 'router')
+    routers.append(router)
     
     # Connect to nearest servers
-    for server in nodes[1:7]:
-        dist = math.sqrt((x - server.x)**2 + (y - server.y)**2)
+    for server in servers:
+        sx, sy = network.positions[server]
+        dist = math.sqrt((x - sx)**2 + (y - sy)**2)
         if dist < 200:
-            router.connections.append(server)
-            server.connections.append(router)
+            network.connect(router, server)
 
 # Terminal nodes (user endpoints)
 for _ in range(20):
     x = random.uniform(50, WIDTH - 50)
     y = random.uniform(50, HEIGHT - 50)
-    terminal = NetworkNode(x, y, 'terminal')
-    nodes.append(terminal)
-    node_positions.append((x, y))
+    terminal = network.add_node(x, y, 'terminal')
     
     # Connect to nearest router
     min_dist = float('inf')
     nearest = None
-    for router in nodes[7:19]:  # Just the routers
-        dist = math.sqrt((x - router.x)**2 + (y - router.y)**2)
+    for router in routers:
+        rx, ry = network.positions[router]
+        dist = math.sqrt((x - rx)**2 + (y - ry)**2)
         if dist < min_dist:
             min_dist = dist
             nearest = router
     
-    if nearest and min_dist < 300:
-        terminal.connections.append(nearest)
-        nearest.connections.append(terminal)
+    if nearest is not None and min_dist < 300:
+        network.connect(terminal, nearest)
 
-# Draw network infrastructure
-# Connection lines
-for node in nodes:
-    for connected in node.connections:
-        # Avoid duplicate lines
-        if node.x < connected.x or (node.x == connected.x and node.y < connected.y):
-            # Data highway glow
-            for width in [10, 5, 2]:
-                alpha = 30 + (10 - width) * 10
-                draw.line([(node.x, node.y), (connected.x, connected.y)],
-                         fill=(50, 50, 100, alpha), width=width)
+network.build()
 
-# Create data packets
-packets = []
-data_types = ['text', 'image', 'video', 'code', 'neural']
+# Draw network infrastructure
+# Connection lines, once each
+for a, b in network.links:
+    # Data highway glow
+    for width in [10, 5, 2]:
+        alpha = 30 + (10 - width) * 10
+        draw.line([network.positions[a], network.positions[b]],
+                 fill=(50, 50, 100, alpha), width=width)
 
-# Initial burst of data
-for _ in range(50):
-    # Random origin and destination
-    origin_node = random.choice(nodes)
-    dest_node = random.choice(nodes)
-    
-    if origin_node != dest_node:
-        data_type = random.choice(data_types)
-        size = random.uniform(0.1, 1.0)
-        
-        packet = DataPacket(data_type, size, 
-                          (origin_node.x, origin_node.y),
-                          (dest_node.x, dest_node.y))
-        packets.append(packet)
+# Create data packets - an initial burst of data
+packets = PacketStream(network)
+packets.spawn_random(INITIAL_PACKETS)
 
 # Simulate data flow
-for _ in range(100):
-    # Update packets
-    for packet in packets[:]:
-        if packet.update():
-            # Reached destination
-            packets.remove(packet)
-            
-            # Sometimes spawn new packets
-            if random.random() < 0.3:
-                origin_node = random.choice(nodes)
-                dest_node = random.choice(nodes)
-                if origin_node != dest_node:
-                    new_packet = DataPacket(
-                        random.choice(data_types),
-                        random.uniform(0.1, 1.0),
-                        (origin_node.x, origin_node.y),
-                        (dest_node.x, dest_node.y)
-                    )
-                    packets.append(new_packet)
+for _ in range(SIMULATION_STEPS):
+    # Update packets; those that reached their destination are done
+    arrived = packets.update()
+    packets.release(arrived)
+    
+    # Sometimes spawn new packets
+    packets.spawn_random(int((np.random.random(len(arrived)) < 0.3).sum()))
     
     # Update nodes
-    for node in nodes:
-        node.update()
+    network.update()
 
 # Draw data streams
-for packet in packets:
-    # Draw path trail
-    if len(packet.path_history) > 1:
-        for i in range(len(packet.path_history) - 1):
-            alpha = int(50 * i / len(packet.path_history))
-            
-            # Encrypted data has different appearance
-            if packet.encrypted:
-                # Dashed line for encrypted
-                if i % 4 < 2:
-                    draw.line([packet.path_history[i], packet.path_history[i+1]],
-                             fill=packet.color + (alpha,), width=1)
-            else:
-                draw.line([packet.path_history[i], packet.path_history[i+1]],
-                         fill=packet.color + (alpha,), width=2)
-    
+img = draw_trails(img, packets)
+draw = ImageDraw.Draw(img, 'RGBA')
+
+for slot in packets.living():
     # Draw packet
-    x, y = packet.position
-    size = 5 + packet.size * 10
+    x, y = packets.position[slot]
+    size = 5 + packets.size[slot] * 10
+    color = tuple(int(c) for c in TYPE_COLORS[packets.type[slot]])
+    pattern = TYPE_PATTERNS[packets.type[slot]]
     
     # Corrupted packets flicker
-    if packet.corrupted:
+    if packets.corrupted[slot]:
         size *= random.uniform(0.8, 1.2)
         # Glitch colors
-        r, g, b = packet.color
+        r, g, b = color
         r = min(255, r + random.randint(-50, 50))
         g = min(255, g + random.randint(-50, 50))
         b = min(255, b + random.randint(-50, 50))
         color = (r, g, b)
-    else:
-        color = packet.color
     
     # Draw based on pattern
-    if packet.pattern == 'lines':
+    if pattern == 'lines':
         # Text data - horizontal lines
         for i in range(3):
             y_offset = (i - 1) * 4
             draw.line([(x - size/2, y + y_offset), (x + size/2, y + y_offset)],
                      fill=color + (200,), width=1)
-    elif packet.pattern == 'pixels':
+    elif pattern == 'pixels':
         # Image data - pixel grid
         for i in range(-1, 2):
             for j in range(-1, 2):
                 draw.rectangle([x + i*3 - 1, y + j*3 - 1, x + i*3 + 1, y + j*3 + 1],
                               fill=color + (150,))
-    elif packet.pattern == 'frames':
+    elif pattern == 'frames':
         # Video data - stacked rectangles
         for i in range(3):
             offset = i * 3
@@ -287,7 +430,7 @@ for packet in packets:
             if x1 < x2 and y1 < y2:  # Ensure valid rectangle
                 draw.rectangle([x1, y1, x2, y2],
                               outline=color + (180,), width=1)
-    elif packet.pattern == 'brackets':
+    elif pattern == 'brackets':
         # Code data - bracket symbols
         draw.text((x - 5, y - 5), "{}", fill=color + (200,))
     else:  # neural/synapses
@@ -298,40 +441,42 @@ for packet in packets:
             draw.line([(x, y), (end_x, end_y)], fill=color + (180,), width=2)
 
 # Draw nodes
-for node in nodes:
+for node, node_type in enumerate(network.type):
+    x, y = network.position[node]
+    activity = network.activity[node]
     # Node appearance based on type and activity
-    if node.type == 'ai':
+    if Network.NODE_TYPES[node_type] == 'ai':
         # AI core - pulsing circles
         for r in range(40, 10, -5):
             pulse = 0.5 + 0.5 * math.sin(r * 0.2)
             alpha = int(100 * pulse * (1 - r / 40))
-            draw.ellipse([node.x - r, node.y - r, node.x + r, node.y + r],
+            draw.ellipse([x - r, y - r, x + r, y + r],
                         fill=(200, 100, 255, alpha))
         # Core
-        draw.ellipse([node.x - 10, node.y - 10, node.x + 10, node.y + 10],
+        draw.ellipse([x - 10, y - 10, x + 10, y + 10],
                     fill=(255, 200, 255))
-    elif node.type == 'server':
+    elif Network.NODE_TYPES[node_type] == 'server':
         # Server - stacked rectangles
         for i in range(3):
             y_offset = (i - 1) * 8
-            color = (100, 150, 200) if node.activity < 0.5 else (200, 150, 100)
-            draw.rectangle([node.x - 15, node.y + y_offset - 3,
-                           node.x + 15, node.y + y_offset + 3],
+            color = (100, 150, 200) if activity < 0.5 else (200, 150, 100)
+            draw.rectangle([x - 15, y + y_offset - 3,
+                           x + 15, y + y_offset + 3],
                           fill=color)
-    elif node.type == 'router':
+    elif Network.NODE_TYPES[node_type] == 'router':
         # Router - diamond
         points = [
-            (node.x, node.y - 15),
-            (node.x + 15, node.y),
-            (node.x, node.y + 15),
-            (node.x - 15, node.y)
+            (x, y - 15),
+            (x + 15, y),
+            (x, y + 15),
+            (x - 15, y)
         ]
-        color = (150, 200, 150) if node.activity < 0.5 else (200, 200, 100)
+        color = (150, 200, 150) if activity < 0.5 else (200, 200, 100)
         draw.polygon(points, fill=color)
     else:  # terminal
         # Terminal - simple circle
-        color = (150, 150, 200) if node.activity < 0.5 else (200, 200, 255)
-        draw.ellipse([node.x - 8, node.y - 8, node.x + 8, node.y + 8],
+        color = (150, 150, 200) if activity < 0.5 else (200, 200, 255)
+        draw.ellipse([x - 8, y - 8, x + 8, y + 8],
                     fill=color)
 
 # Add digital rain effect
@@ -1,17 +1,17 @@
 import numpy as np
 from PIL import Image, ImageDraw
-import math
-import colorsys
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.waves import WaveField
+from meditations.color import rgb_to_hsv, hsv_to_rgb, to_uint8
 
 # Emotional Resonance - Where Mathematics Meets Feeling
 # Each emotion creates its own wave signature, interfering to create complex patterns
 
 WIDTH, HEIGHT = 1080, 1080
 
-# Create the canvas
-image = Image.new('RGB', (WIDTH, HEIGHT), (0, 0, 0))
-pixels = image.load()
-
 # Emotional wave sources - each with position, frequency, amplitude, and color
 emotions = {
     'joy': {
@@ -58,38 +58,25 @@ emotions = {
 
 print("Calculating emotional interference patterns...")
 
-# Create numpy arrays for faster computation
-wave_field = np.zeros((HEIGHT, WIDTH), dtype=np.float32)
-color_field = np.zeros((HEIGHT, WIDTH, 3), dtype=np.float32)
-
-# Generate coordinate grids
-y_grid, x_grid = np.meshgrid(np.arange(HEIGHT), np.arange(WIDTH), indexing='ij')
+# Precomputed pixel grid shared by every emotion
+field = WaveField(WIDTH, HEIGHT)
+wave_field = field.zeros()
+emotion_waves = []
 
 # Calculate wave interference for each emotion
 for emotion_name, emotion in emotions.items():
     print(f"Processing {emotion_name}...")
     
-    emotion_wave = np.zeros((HEIGHT, WIDTH), dtype=np.float32)
-    
-    for center in emotion['centers']:
-        cx, cy = center
-        
-        # Calculate distance from center for each pixel
-        distances = np.sqrt((x_grid - cx)**2 + (y_grid - cy)**2)
-        
-        # Generate wave with decay
-        wave = emotion['amplitude'] * np.exp(-distances * emotion['decay']) * \
-               np.sin(distances * emotion['frequency'] + emotion['phase'])
-        
-        # Add to emotion's total wave
-        emotion_wave += wave
+    # Generate waves with decay from each center
+    emotion_wave = field.radial(emotion['centers'], emotion['amplitude'], emotion['frequency'],
+                                phase=emotion['phase'], decay=emotion['decay'])
     
     # Add to total wave field
     wave_field += emotion_wave
-    
-    # Add weighted color contribution based on wave amplitude
-    for i in range(3):
-        color_field[:, :, i] += np.abs(emotion_wave) * emotion['color'][i]
+    emotion_waves.append(emotion_wave)
+
+# Add weighted color contribution based on wave amplitude
+color_field = field.weighted_colors(emotion_waves, [emotion['color'] for emotion in emotions.values()])
 
 # Normalize the wave field
 wave_min = np.min(wave_field)
@@ -103,40 +90,26 @@ if color_max > 0:
 
 print("Rendering the emotional landscape...")
 
+# Create interference pattern effect
+# Bright regions where waves constructively interfere
+# Dark regions where they destructively interfere
+brightness = 0.3 + 0.7 * wave_normalized
+
+# Add subtle iridescence based on wave phase
+hue_shift = np.sin(wave_field * 0.01) * 0.1
+
+# Convert to HSV for hue manipulation
+hsv = rgb_to_hsv(color_field)
+hsv[:, :, 0] = (hsv[:, :, 0] + hue_shift) % 1.0
+hsv[:, :, 1] = np.minimum(1.0, hsv[:, :, 1] * (1.2 - 0.2 * wave_normalized))  # Desaturate at interference nodes
+hsv[:, :, 2] *= brightness
+
+# Convert back to RGB, with subtle noise for texture shared by all channels
+rgb = hsv_to_rgb(hsv)
+rgb += np.random.normal(0, 0.02, (HEIGHT, WIDTH, 1))
+
 # Convert to image
-for y in range(HEIGHT):
-    for x in range(WIDTH):
-        # Get normalized wave value
-        wave_val = wave_normalized[y, x]
-        
-        # Get color from emotional contributions
-        r, g, b = color_field[y, x]
-        
-        # Create interference pattern effect
-        # Bright regions where waves constructively interfere
-        # Dark regions where they destructively interfere
-        brightness = 0.3 + 0.7 * wave_val
-        
-        # Add subtle iridescence based on wave phase
-        phase_shift = wave_field[y, x] * 0.01
-        hue_shift = math.sin(phase_shift) * 0.1
-        
-        # Convert to HSV for hue manipulation
-        h, s, v = colorsys.rgb_to_hsv(r, g, b)
-        h = (h + hue_shift) % 1.0
-        s = min(1.0, s * (1.2 - 0.2 * wave_val))  # Desaturate at interference nodes
-        v = v * brightness
-        
-        # Convert back to RGB
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        
-        # Add subtle noise for texture
-        noise = np.random.normal(0, 0.02)
-        r = max(0, min(1, r + noise))
-        g = max(0, min(1, g + noise))
-        b = max(0, min(1, b + noise))
-        
-        pixels[x, y] = (int(r * 255), int(g * 255), int(b * 255))
+image = Image.fromarray(to_uint8(rgb), 'RGB')
 
 # Add resonance points where multiple emotions strongly interfere
 draw = ImageDraw.Draw(image)
@@ -9,7 +9,13 @@ This piece explores the aesthetic of systems moving toward equilibrium.
 import numpy as np
 from PIL import Image, ImageDraw
 import colorsys
-from scipy.ndimage import gaussian_filter
+from scipy.ndimage import gaussian_filter, uniform_filter
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.color import rgb_to_hsv, hsv_to_rgb
+from meditations.walkers import WalkerEngine
 
 # Canvas of possibilities
 width, height = 1080, 1080
@@ -48,41 +54,35 @@ for step in range(entropy_steps):
 
 # Entropy visualization - particle traces showing the flow
 num_particles = 2000
-for _ in range(num_particles):
-    # Start from areas of order
-    start_x = np.random.randint(width)
-    start_y = np.random.randint(height)
-    
-    # Particle color based on local entropy
-    local_color = order_map[start_y, start_x]
-    particle_hue = colorsys.rgb_to_hsv(*(local_color/255))[0]
-    
-    # Trace the particle's journey toward equilibrium
-    x, y = float(start_x), float(start_y)
-    path = [(x, y)]
-    
-    for step in range(50):
-        # Movement influenced by local gradients
-        dx = np.random.normal(0, 2)
-        dy = np.random.normal(0, 2)
-        
-        # But also drawn toward areas of different order
-        if 1 < x < width-2 and 1 < y < height-2:
-            local_variance = np.var(order_map[int(y-1):int(y+2), int(x-1):int(x+2)])
-            dx += 0.5 * np.sign(local_variance) * np.random.randn()
-            dy += 0.5 * np.sign(local_variance) * np.random.randn()
-        
-        x = np.clip(x + dx, 0, width-1)
-        y = np.clip(y + dy, 0, height-1)
-        path.append((x, y))
-    
-    # Draw the entropy path
-    for i in range(len(path)-1):
-        alpha = 1 - (i / len(path))  # Fade over time
-        r, g, b = colorsys.hsv_to_rgb(particle_hue, 0.6, 0.7 * alpha)
-        draw.line([path[i], path[i+1]], 
-                 fill=(int(r*255), int(g*255), int(b*255)), 
-                 width=1)
+walker_engine = WalkerEngine(width, height, seed=42)
+
+# Start from areas of order
+starts = np.column_stack([np.random.randint(width, size=num_particles),
+                          np.random.randint(height, size=num_particles)])
+
+# Particle color based on local entropy
+particle_hues = rgb_to_hsv(order_map[starts[:, 1], starts[:, 0]] / 255)[:, 0]
+
+# Movement is drawn toward areas of different order: wherever the 3x3
+# neighbourhood varies, an extra 0.5-sigma kick joins the 2-sigma step
+local_mean = np.mean([uniform_filter(order_map[:, :, c], size=3) for c in range(3)], axis=0)
+local_square = np.mean([uniform_filter(order_map[:, :, c]**2, size=3) for c in range(3)], axis=0)
+varied = local_square - local_mean**2 > 1e-9
+varied[:2, :] = varied[-2:, :] = False
+varied[:, :2] = varied[:, -2:] = False
+noise_map = np.where(varied, np.sqrt(2**2 + 0.5**2), 2.0)
+
+# Trace every particle's journey toward equilibrium at once
+paths, _ = walker_engine.trace(starts, 50, noise='gaussian', scale=1.0,
+                               noise_map=noise_map, clamp=True)
+
+# Draw the entropy paths, fading over time
+alpha = 1 - np.arange(paths.shape[1] - 1) / paths.shape[1]
+hsv = np.stack(np.broadcast_arrays(particle_hues[:, np.newaxis], 0.6, 0.7 * alpha), axis=-1)
+path_colors = (hsv_to_rgb(hsv) * 255).astype(int)
+for path, colors in zip(paths.tolist(), path_colors.tolist()):
+    for i, color in enumerate(colors):
+        draw.line([tuple(path[i]), tuple(path[i+1])], fill=tuple(color), width=1)
 
 # The background shows the final entropy state
 for y in range(height):
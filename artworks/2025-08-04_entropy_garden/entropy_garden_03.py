@@ -9,8 +9,14 @@ into maximum beauty? This piece visualizes entropy as a creative force.
 import numpy as np
 from PIL import Image, ImageDraw
 import colorsys
-from scipy.ndimage import gaussian_filter, rotate
+from scipy.ndimage import gaussian_filter, rotate, uniform_filter
 from scipy.interpolate import interp1d
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.color import hsv_to_rgb
+from meditations.walkers import WalkerEngine
 
 # The canvas of possibilities
 width, height = 1080, 1080
@@ -81,55 +87,45 @@ for y in range(0, height, 3):
 
 # Entropy flow visualization - particles flowing from hot to cold
 num_particles = 3000
-for i in range(num_particles):
-    # Start from high temperature regions
-    attempts = 0
-    while attempts < 10:
-        start_x = np.random.randint(50, width-50)
-        start_y = np.random.randint(50, height-50)
-        if temperature_field[start_y, start_x] > 0.5:
-            break
-        attempts += 1
-    
-    # Particle properties
-    x, y = float(start_x), float(start_y)
-    energy = temperature_field[start_y, start_x]
-    
-    # Color based on energy
-    hue = 0.1 + 0.8 * energy
-    path = []
-    
-    # Trace particle path as it loses energy
-    for step in range(80):
-        if 5 < x < width-5 and 5 < y < height-5:
-            # Calculate temperature gradient
-            local_temp = temperature_field[int(y-2):int(y+3), int(x-2):int(x+3)]
-            gy, gx = np.gradient(local_temp)
-            
-            # Move down gradient (toward equilibrium) with Brownian motion
-            dx = -np.mean(gx) * 10 + np.random.normal(0, 3)
-            dy = -np.mean(gy) * 10 + np.random.normal(0, 3)
-            
-            # Update position
-            x = np.clip(x + dx, 0, width-1)
-            y = np.clip(y + dy, 0, height-1)
-            
-            # Update energy (cooling)
-            energy *= 0.98
-            energy = max(energy, temperature_field[int(y), int(x)])
-            
-            # Draw segment
-            if len(path) > 0:
-                # Color shifts as particle cools
-                segment_hue = (hue - 0.3 * (1 - energy)) % 1.0
-                alpha = energy * 0.7
-                
-                r, g, b = colorsys.hsv_to_rgb(segment_hue, 0.6, alpha)
-                draw.line([path[-1], (x, y)], 
-                         fill=(int(r*255), int(g*255), int(b*255)), 
-                         width=1 if energy > 0.3 else 2)
-            
-            path.append((x, y))
+num_steps = 80
+walker_engine = WalkerEngine(width, height, seed=161803)
+
+# Start from high temperature regions - the first of 10 tries that lands hot
+tries_x = np.random.randint(50, width-50, size=(num_particles, 10))
+tries_y = np.random.randint(50, height-50, size=(num_particles, 10))
+hot = temperature_field[tries_y, tries_x] > 0.5
+first_hot = np.where(hot.any(axis=1), hot.argmax(axis=1), 9)
+start_x = tries_x[np.arange(num_particles), first_hot]
+start_y = tries_y[np.arange(num_particles), first_hot]
+
+# Move down the gradient (toward equilibrium) with Brownian motion. The 5x5
+# box filter stands in for averaging np.gradient over a window around each particle
+paths, taken = walker_engine.trace(np.column_stack([start_x, start_y]), num_steps,
+                                   noise='gaussian', scale=3,
+                                   drift=uniform_filter(temperature_field, size=5),
+                                   drift_strength=-10, clamp=True, margin=5)
+
+# Cooling along each path, never below the local temperature
+energy = np.empty((num_particles, num_steps + 1))
+energy[:, 0] = temperature_field[start_y, start_x]
+cells = paths.astype(int)
+for step in range(1, num_steps + 1):
+    energy[:, step] = np.maximum(energy[:, step - 1] * 0.98,
+                                 temperature_field[cells[:, step, 1], cells[:, step, 0]])
+
+# Color shifts as particle cools
+hue = 0.1 + 0.8 * energy[:, :1]
+segment_hue = (hue - 0.3 * (1 - energy)) % 1.0
+hsv = np.stack(np.broadcast_arrays(segment_hue, 0.6, energy * 0.7), axis=-1)
+segment_colors = (hsv_to_rgb(hsv) * 255).astype(int)
+segment_widths = np.where(energy > 0.3, 1, 2)
+
+# Draw segments between recorded positions, skipping the first move as before
+for path, colors, widths, count in zip(paths.tolist(), segment_colors.tolist(),
+                                       segment_widths.tolist(), taken.tolist()):
+    for step in range(2, count + 1):
+        draw.line([tuple(path[step - 1]), tuple(path[step])],
+                  fill=tuple(colors[step]), width=widths[step])
 
 # Entropy blooms - where energy dissipation creates beauty
 bloom_centers = []
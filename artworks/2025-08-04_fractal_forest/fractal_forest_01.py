@@ -1,6 +1,11 @@
 import numpy as np
 from PIL import Image, ImageDraw
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.sprites import GlowSprites
 
 # Fractal Forest - L-System Exploration
 # Where mathematical rules grow into living forms
@@ -12,6 +17,9 @@ WIDTH, HEIGHT = 1080, 1080
 image = Image.new('RGB', (WIDTH, HEIGHT), (5, 10, 15))
 draw = ImageDraw.Draw(image)
 
+# Radial glows are rendered once and stamped
+glow_sprites = GlowSprites()
+
 # L-System configuration
 class LSystem:
     def __init__(self, axiom, rules, angle, length):
@@ -146,14 +154,14 @@ tree3.draw(draw, 810, 900, -90, string3, color_base=(120, 220, 120))
 moon_x, moon_y = 900, 180
 moon_radius = 60
 
-# Draw moon
-for r in range(moon_radius, 0, -2):
-    alpha = int(255 * (r / moon_radius) ** 2)
-    color = (200 + int(55 * r / moon_radius), 
-             200 + int(55 * r / moon_radius), 
-             180 + int(75 * r / moon_radius))
-    draw.ellipse([moon_x - r, moon_y - r, moon_x + r, moon_y + r], 
-                 fill=color)
+# Draw moon - a pale disk brightening toward its rim
+sky = np.array(image, dtype=np.float32)
+glow_sprites.stamp(sky, moon_x, moon_y, moon_radius, (200, 200, 180),
+                   profile='ring', exponent=0, mode='replace')
+glow_sprites.stamp(sky, moon_x, moon_y, moon_radius, (55, 55, 75), profile='ring')
+
+image = Image.fromarray(np.clip(sky, 0, 255).astype(np.uint8), 'RGB')
+draw = ImageDraw.Draw(image)
 
 # Add fireflies as glowing points
 np.random.seed(42)
@@ -1,15 +1,16 @@
-from PIL import Image, ImageDraw
+from PIL import Image
 import numpy as np
 import math
-import colorsys
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.waves import WaveField, radial_wave
+from meditations.color import hsv_to_rgb, to_uint8
 
 # Canvas dimensions
 WIDTH, HEIGHT = 1080, 1080
 
-# Create the image
-img = Image.new('RGB', (WIDTH, HEIGHT), color=(10, 10, 15))
-pixels = img.load()
-
 # Wave parameters
 waves = [
     # (amplitude, frequency, phase, angle)
@@ -20,61 +21,46 @@ waves = [
     (40, 0.035, math.pi, math.pi/2),
 ]
 
-# Calculate wave interference at each pixel
-for x in range(WIDTH):
-    for y in range(HEIGHT):
-        # Center coordinates
-        cx = x - WIDTH / 2
-        cy = y - HEIGHT / 2
-        
-        # Sum wave contributions
-        total = 0
-        phase_sum = 0
-        
-        for amp, freq, phase, angle in waves:
-            # Rotate coordinates by wave angle
-            rx = cx * math.cos(angle) - cy * math.sin(angle)
-            ry = cx * math.sin(angle) + cy * math.cos(angle)
-            
-            # Calculate wave value
-            distance = math.sqrt(rx*rx + ry*ry)
-            wave_value = amp * math.sin(distance * freq + phase)
-            total += wave_value
-            
-            # Track phase for color calculation
-            phase_sum += (distance * freq + phase) % (2 * math.pi)
-        
-        # Normalize and map to color
-        normalized = (total + 200) / 400  # Normalize to 0-1
-        normalized = max(0, min(1, normalized))
-        
-        # Color based on interference pattern and phase
-        hue = (phase_sum / (2 * math.pi * len(waves))) % 1.0
-        
-        # Saturation varies with amplitude
-        saturation = 0.3 + 0.7 * abs(normalized - 0.5) * 2
-        
-        # Value creates the interference pattern
-        value = normalized
-        
-        # Convert HSV to RGB
-        r, g, b = colorsys.hsv_to_rgb(hue, saturation, value)
-        pixels[x, y] = (int(r * 255), int(g * 255), int(b * 255))
+# Every wave is circular about the canvas center - rotating the coordinates
+# by a wave's angle leaves the distance unchanged
+field = WaveField(WIDTH, HEIGHT)
+center = (WIDTH / 2, HEIGHT / 2)
+
+# Sum wave contributions, tracking phase for color calculation
+phase_sum = field.zeros()
+total = field.interfere([radial_wave(center, amp, freq, phase) for amp, freq, phase, angle in waves],
+                        phase_sum=phase_sum, wrap_phase=True)
+
+# Normalize and map to color
+normalized = np.clip((total + 200) / 400, 0, 1)  # Normalize to 0-1
+
+# Color based on interference pattern and phase
+hue = (phase_sum / (2 * math.pi * len(waves))) % 1.0
+
+# Saturation varies with amplitude
+saturation = 0.3 + 0.7 * np.abs(normalized - 0.5) * 2
+
+# Value creates the interference pattern
+value = normalized
+
+# Convert HSV to RGB
+rgb = hsv_to_rgb(np.stack([hue, saturation, value], axis=-1))
 
 # Add subtle radial gradient overlay
-draw = ImageDraw.Draw(img)
-for i in range(100):
-    radius = WIDTH * (1 - i/100)
-    alpha = int(255 * (i/100) * 0.3)
-    # Create darker edges
-    overlay = Image.new('RGBA', (WIDTH, HEIGHT), (0, 0, 0, 0))
-    overlay_draw = ImageDraw.Draw(overlay)
-    overlay_draw.ellipse(
-        [WIDTH/2 - radius, HEIGHT/2 - radius, 
-         WIDTH/2 + radius, HEIGHT/2 + radius],
-        fill=(10, 10, 20, alpha)
-    )
-    img = Image.alpha_composite(img.convert('RGBA'), overlay).convert('RGB')
+# Ring i darkens everything within WIDTH * (1 - i/100); every ring shares one
+# color, so stacking them is a single blend by the opacity of the rings covering a pixel
+ring_alpha = np.array([int(255 * (i/100) * 0.3) for i in range(100)]) / 255
+ring_transmission = np.append(np.cumprod(1 - ring_alpha), 1.0)
+
+y, x = np.ogrid[0:HEIGHT, 0:WIDTH]
+distance = np.hypot(x - WIDTH / 2, y - HEIGHT / 2)
+last_ring = np.floor(100 * (1 - distance / WIDTH)).astype(int)
+transmission = ring_transmission[np.where(last_ring >= 0, np.minimum(last_ring, 99), 100)]
+
+# Create darker edges
+edge_color = np.array([10, 10, 20])
+pixels = edge_color + (to_uint8(rgb) - edge_color) * transmission[:, :, np.newaxis]
+img = Image.fromarray(np.clip(np.rint(pixels), 0, 255).astype(np.uint8), 'RGB')
 
 img.save('resonance_01.png')
 print("Resonance piece created: resonance_01.png")
\ No newline at end of file
@@ -1,30 +1,26 @@
 from PIL import Image, ImageDraw, ImageFilter
 import numpy as np
 import math
-import colorsys
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.waves import WaveField, radial_wave
+from meditations.color import hsv_to_rgb
 
 # Canvas dimensions
 WIDTH, HEIGHT = 1080, 1080
 
-# Create base image with gradient background
-img = Image.new('RGB', (WIDTH, HEIGHT))
-draw = ImageDraw.Draw(img)
+field = WaveField(WIDTH, HEIGHT)
 
 # Radial gradient background
-for y in range(HEIGHT):
-    for x in range(WIDTH):
-        # Distance from center
-        dx = x - WIDTH/2
-        dy = y - HEIGHT/2
-        dist = math.sqrt(dx*dx + dy*dy) / (WIDTH/2)
-        
-        # Gradient from deep purple to black at edges
-        r = int(20 * (1 - dist))
-        g = int(10 * (1 - dist))
-        b = int(30 * (1 - dist))
-        draw.point((x, y), (r, g, b))
-
-pixels = img.load()
+# Distance from center
+dx = field.x - WIDTH/2
+dy = field.y - HEIGHT/2
+dist = np.sqrt(dx*dx + dy*dy) / (WIDTH/2)
+
+# Gradient from deep purple to black at edges
+background = np.clip(np.array([20, 10, 30]) * (1 - dist)[:, :, np.newaxis], 0, None).astype(int)
 
 # Multiple wave sources creating interference
 wave_sources = [
@@ -36,58 +32,43 @@ wave_sources = [
     (WIDTH * 0.8, HEIGHT * 0.8, 65, 0.85, 3*math.pi/4),
 ]
 
-# Calculate interference pattern
-for y in range(HEIGHT):
-    for x in range(WIDTH):
-        # Sum waves from all sources
-        wave_sum = 0
-        color_angle = 0
-        
-        for sx, sy, wavelength, amplitude, phase in wave_sources:
-            # Distance from this source
-            dx = x - sx
-            dy = y - sy
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            # Wave contribution with decay
-            decay = math.exp(-distance / (WIDTH * 0.5))
-            wave = amplitude * decay * math.sin(2 * math.pi * distance / wavelength + phase)
-            wave_sum += wave
-            
-            # Accumulate phase for color
-            color_angle += (distance / wavelength + phase)
-        
-        # Normalize wave sum
-        intensity = (wave_sum + len(wave_sources)) / (2 * len(wave_sources))
-        intensity = max(0, min(1, intensity))
-        
-        # Create vibrant colors based on interference
-        hue = (color_angle / (2 * math.pi)) % 1.0
-        
-        # High saturation in interference zones
-        if abs(wave_sum) > 0.5:
-            saturation = 0.8 + 0.2 * abs(wave_sum) / len(wave_sources)
-        else:
-            saturation = 0.3 + 0.5 * abs(wave_sum)
-        
-        # Brightness follows interference pattern
-        value = 0.2 + 0.8 * intensity
-        
-        # Add highlights at constructive interference
-        if wave_sum > len(wave_sources) * 0.7:
-            value = min(1.0, value + 0.3)
-            saturation = max(0.3, saturation - 0.2)
-        
-        # Convert to RGB
-        r, g, b = colorsys.hsv_to_rgb(hue, saturation, value)
-        
-        # Blend with existing pixel
-        existing = pixels[x, y]
-        pixels[x, y] = (
-            int(existing[0] * 0.3 + r * 255 * 0.7),
-            int(existing[1] * 0.3 + g * 255 * 0.7),
-            int(existing[2] * 0.3 + b * 255 * 0.7)
-        )
+# Calculate interference pattern - waves from all sources with decay
+phase_sum = field.zeros()
+wave_sum = field.interfere(
+    [radial_wave((sx, sy), amplitude, 2 * math.pi / wavelength, phase, decay=1 / (WIDTH * 0.5))
+     for sx, sy, wavelength, amplitude, phase in wave_sources],
+    phase_sum=phase_sum)
+
+# Accumulate phase for color: sum of (distance / wavelength + phase), recovered
+# from the summed wave arguments (2pi distance / wavelength + phase)
+source_phases = sum(phase for _, _, _, _, phase in wave_sources)
+color_angle = phase_sum / (2 * math.pi) + source_phases * (1 - 1 / (2 * math.pi))
+
+# Normalize wave sum
+intensity = np.clip((wave_sum + len(wave_sources)) / (2 * len(wave_sources)), 0, 1)
+
+# Create vibrant colors based on interference
+hue = (color_angle / (2 * math.pi)) % 1.0
+
+# High saturation in interference zones
+saturation = np.where(np.abs(wave_sum) > 0.5,
+                      0.8 + 0.2 * np.abs(wave_sum) / len(wave_sources),
+                      0.3 + 0.5 * np.abs(wave_sum))
+
+# Brightness follows interference pattern
+value = 0.2 + 0.8 * intensity
+
+# Add highlights at constructive interference
+highlight = wave_sum > len(wave_sources) * 0.7
+value = np.where(highlight, np.minimum(1.0, value + 0.3), value)
+saturation = np.where(highlight, np.maximum(0.3, saturation - 0.2), saturation)
+
+# Convert to RGB
+rgb = hsv_to_rgb(np.stack([hue, saturation, value], axis=-1))
+
+# Blend with the background
+pixels = (background * 0.3 + rgb * 255 * 0.7).astype(np.uint8)
+img = Image.fromarray(pixels, 'RGB')
 
 # Add concentric ring highlights
 overlay = Image.new('RGBA', (WIDTH, HEIGHT), (0, 0, 0, 0))
@@ -1,45 +1,55 @@
 import numpy as np
 from PIL import Image
-import math
-import colorsys
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.canvas_stats import CanvasStats
+from meditations.color import hsv_to_rgb
+from meditations.sprites import GlowSprites
 
 # Sentient Canvas - An Artwork with Emotional States
 # Where the algorithm experiences its own creation
 
 WIDTH, HEIGHT = 1080, 1080
+BRUSHES = 8
+TRAIL_LENGTH = 20
+MEMORY_LENGTH = 50
 
 # Initialize the canvas
 canvas = np.zeros((HEIGHT, WIDTH, 3), dtype=np.float32)
+canvas_stats = CanvasStats(canvas)  # Running statistics the brushes feel through
+brush_stamps = GlowSprites()
 
 # Emotional state system
+EMOTIONS = ('joy', 'melancholy', 'agitation', 'serenity', 'curiosity', 'fear')
+JOY, MELANCHOLY, AGITATION, SERENITY, CURIOSITY, FEAR = range(len(EMOTIONS))
+
+# Relationships between emotions: RELATIONSHIPS[emotion, other] is how
+# much the other emotion pulls on this one
+RELATIONSHIPS = np.zeros((len(EMOTIONS), len(EMOTIONS)))
+for emotion, influences in {
+    'joy': {'melancholy': -0.7, 'serenity': 0.5, 'curiosity': 0.3},
+    'melancholy': {'joy': -0.7, 'fear': 0.3, 'agitation': -0.4},
+    'agitation': {'serenity': -0.8, 'fear': 0.4, 'curiosity': 0.2},
+    'serenity': {'agitation': -0.8, 'joy': 0.4, 'melancholy': -0.3},
+    'curiosity': {'fear': -0.3, 'joy': 0.2, 'agitation': 0.1},
+    'fear': {'curiosity': -0.3, 'melancholy': 0.3, 'agitation': 0.5}
+}.items():
+    for other_emotion, influence in influences.items():
+        RELATIONSHIPS[EMOTIONS.index(emotion), EMOTIONS.index(other_emotion)] = influence
+
 class EmotionalSystem:
     def __init__(self):
-        # Core emotions with values 0-1
-        self.emotions = {
-            'joy': 0.5,
-            'melancholy': 0.5,
-            'agitation': 0.3,
-            'serenity': 0.7,
-            'curiosity': 0.6,
-            'fear': 0.2
-        }
+        # Core emotions with values 0-1, indexed as EMOTIONS
+        self.emotions = np.array([0.5, 0.5, 0.3, 0.7, 0.6, 0.2])
         
         # Emotional memory - recent history affects current state
-        self.memory = []
-        self.memory_length = 50
+        self.memory = np.zeros((MEMORY_LENGTH, len(EMOTIONS)))
+        self.memory_count = 0
         
         # Emotional momentum - emotions have inertia
-        self.momentum = {emotion: 0.0 for emotion in self.emotions}
-        
-        # Relationships between emotions
-        self.relationships = {
-            'joy': {'melancholy': -0.7, 'serenity': 0.5, 'curiosity': 0.3},
-            'melancholy': {'joy': -0.7, 'fear': 0.3, 'agitation': -0.4},
-            'agitation': {'serenity': -0.8, 'fear': 0.4, 'curiosity': 0.2},
-            'serenity': {'agitation': -0.8, 'joy': 0.4, 'melancholy': -0.3},
-            'curiosity': {'fear': -0.3, 'joy': 0.2, 'agitation': 0.1},
-            'fear': {'curiosity': -0.3, 'melancholy': 0.3, 'agitation': 0.5}
-        }
+        self.momentum = np.zeros(len(EMOTIONS))
     
     def feel_pattern(self, pattern_metrics):
         """React emotionally to created patterns"""
@@ -50,151 +60,166 @@ class EmotionalSystem:
         movement = pattern_metrics.get('movement', 0.5)
         
         # Patterns influence emotions
-        emotion_changes = {
-            'joy': harmony * 0.1 - chaos * 0.05,
-            'melancholy': density * 0.05 - movement * 0.08,
-            'agitation': chaos * 0.12 - harmony * 0.1,
-            'serenity': harmony * 0.08 - chaos * 0.06,
-            'curiosity': movement * 0.07 + (abs(chaos - 0.5) * 0.05),
-            'fear': chaos * 0.06 - harmony * 0.04
-        }
+        emotion_changes = np.array([
+            harmony * 0.1 - chaos * 0.05,                 # joy
+            density * 0.05 - movement * 0.08,             # melancholy
+            chaos * 0.12 - harmony * 0.1,                 # agitation
+            harmony * 0.08 - chaos * 0.06,                # serenity
+            movement * 0.07 + (abs(chaos - 0.5) * 0.05),  # curiosity
+            chaos * 0.06 - harmony * 0.04                 # fear
+        ])
         
-        # Apply emotional relationships
-        for emotion, change in emotion_changes.items():
-            # Other emotions influence this one
-            for other_emotion, influence in self.relationships.get(emotion, {}).items():
-                change += self.emotions[other_emotion] * influence * 0.03
-            
-            # Update with momentum
-            self.momentum[emotion] = self.momentum[emotion] * 0.8 + change
-            self.emotions[emotion] += self.momentum[emotion]
-            
-            # Keep in bounds with soft limits
-            self.emotions[emotion] = 1 / (1 + math.exp(-4 * (self.emotions[emotion] - 0.5)))
+        # Apply emotional relationships - other emotions influence each one
+        emotion_changes += RELATIONSHIPS @ self.emotions * 0.03
+        
+        # Update with momentum
+        self.momentum = self.momentum * 0.8 + emotion_changes
+        self.emotions = self.emotions + self.momentum
         
-        # Store in memory
-        self.memory.append(dict(self.emotions))
-        if len(self.memory) > self.memory_length:
-            self.memory.pop(0)
+        # Keep in bounds with soft limits
+        self.emotions = 1 / (1 + np.exp(-4 * (self.emotions - 0.5)))
+        
+        # Store in memory, over the oldest state
+        self.memory[self.memory_count % MEMORY_LENGTH] = self.emotions
+        self.memory_count += 1
+    
+    def recent_memory(self):
+        """Remembered emotional states as (time, emotion), oldest first"""
+        kept = min(self.memory_count, MEMORY_LENGTH)
+        return self.memory[(self.memory_count - kept + np.arange(kept)) % MEMORY_LENGTH]
     
     def get_color_influence(self):
         """Convert emotional state to color tendencies"""
+        e = self.emotions
         # Each emotion influences color differently
-        hue_base = (self.emotions['joy'] * 0.1 +  # Yellow
-                   self.emotions['melancholy'] * 0.6 +  # Blue
-                   self.emotions['agitation'] * 0.0 +  # Red
-                   self.emotions['serenity'] * 0.4 +  # Cyan
-                   self.emotions['curiosity'] * 0.8 +  # Purple
-                   self.emotions['fear'] * 0.3)  # Green
+        hue_base = (e[JOY] * 0.1 +  # Yellow
+                   e[MELANCHOLY] * 0.6 +  # Blue
+                   e[AGITATION] * 0.0 +  # Red
+                   e[SERENITY] * 0.4 +  # Cyan
+                   e[CURIOSITY] * 0.8 +  # Purple
+                   e[FEAR] * 0.3)  # Green
         
-        saturation = (self.emotions['joy'] * 0.3 + 
-                     self.emotions['agitation'] * 0.4 +
-                     self.emotions['fear'] * 0.2) + 0.3
+        saturation = (e[JOY] * 0.3 + 
+                     e[AGITATION] * 0.4 +
+                     e[FEAR] * 0.2) + 0.3
         
-        value = (self.emotions['serenity'] * 0.3 + 
-                self.emotions['joy'] * 0.2 -
-                self.emotions['melancholy'] * 0.2) + 0.5
+        value = (e[SERENITY] * 0.3 + 
+                e[JOY] * 0.2 -
+                e[MELANCHOLY] * 0.2) + 0.5
         
         return hue_base % 1.0, min(1.0, saturation), min(1.0, max(0.2, value))
     
     def get_movement_style(self):
         """Emotional state influences how patterns move"""
+        e = self.emotions
         return {
-            'speed': self.emotions['agitation'] * 2 + self.emotions['curiosity'],
-            'smoothness': self.emotions['serenity'] * 2 - self.emotions['agitation'],
-            'complexity': self.emotions['curiosity'] + self.emotions['fear'] * 0.5,
-            'direction_change': self.emotions['agitation'] * 0.5 + self.emotions['curiosity'] * 0.3
+            'speed': e[AGITATION] * 2 + e[CURIOSITY],
+            'smoothness': e[SERENITY] * 2 - e[AGITATION],
+            'complexity': e[CURIOSITY] + e[FEAR] * 0.5,
+            'direction_change': e[AGITATION] * 0.5 + e[CURIOSITY] * 0.3
         }
 
 # Initialize emotional system
 emotional_system = EmotionalSystem()
 
 # Pattern generation influenced by emotions
-class EmotionalBrush:
+class EmotionalBrushes:
+    """Every brush on the canvas as rows of arrays
+    
+    All brushes share one emotional state, so within an iteration they
+    share speed, color and brush size. Their trails are painted together
+    as dabs of one cached gaussian stamp, and each brush then feels the
+    canvas around it through canvas_stats.
+    """
+    
     def __init__(self, x, y, emotional_system):
-        self.x = x
-        self.y = y
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
         self.emotional_system = emotional_system
-        self.trail = []
-        self.age = 0
-        
+        self.age = np.zeros(len(self.x), dtype=np.int64)
+        # Trails, oldest first; only the last trail_length points are drawn
+        self.trail = np.zeros((len(self.x), TRAIL_LENGTH, 2))
+        self.trail_length = np.zeros(len(self.x), dtype=np.int64)
+    
+    def __len__(self):
+        return len(self.x)
+    
+    def add(self, x, y):
+        self.x = np.append(self.x, x)
+        self.y = np.append(self.y, y)
+        self.age = np.append(self.age, 0)
+        self.trail = np.concatenate([self.trail, np.zeros((1, TRAIL_LENGTH, 2))])
+        self.trail_length = np.append(self.trail_length, 0)
+    
+    def remove_oldest(self):
+        self.x, self.y, self.age = self.x[1:], self.y[1:], self.age[1:]
+        self.trail, self.trail_length = self.trail[1:], self.trail_length[1:]
+    
     def paint(self, canvas):
         """Paint on canvas based on emotional state"""
         movement = self.emotional_system.get_movement_style()
-        color_influence = self.emotional_system.get_color_influence()
+        h, s, v = self.emotional_system.get_color_influence()
+        emotions = self.emotional_system.emotions
         
         # Movement influenced by emotions
         speed = movement['speed'] * 3
         self.age += 1
         
         # Calculate movement direction
-        if self.age % int(10 / (movement['direction_change'] + 0.1)) == 0:
-            base_angle = np.random.uniform(0, 2 * np.pi)
-        else:
-            base_angle = math.atan2(self.y - HEIGHT/2, self.x - WIDTH/2)
+        base_angle = np.arctan2(self.y - HEIGHT/2, self.x - WIDTH/2)
+        turning = self.age % int(10 / (movement['direction_change'] + 0.1)) == 0
+        base_angle[turning] = np.random.uniform(0, 2 * np.pi, turning.sum())
         
         # Emotional influence on direction
-        angle_variation = (self.emotional_system.emotions['curiosity'] - 0.5) * np.pi
-        angle = base_angle + angle_variation * math.sin(self.age * 0.1)
+        angle_variation = (emotions[CURIOSITY] - 0.5) * np.pi
+        angle = base_angle + angle_variation * np.sin(self.age * 0.1)
         
         # Update position with boundary wrapping
-        self.x = (self.x + speed * math.cos(angle)) % WIDTH
-        self.y = (self.y + speed * math.sin(angle)) % HEIGHT
+        self.x = (self.x + speed * np.cos(angle)) % WIDTH
+        self.y = (self.y + speed * np.sin(angle)) % HEIGHT
         
         # Store trail
-        self.trail.append((self.x, self.y))
-        if len(self.trail) > 20:
-            self.trail.pop(0)
+        self.trail[:, :-1] = self.trail[:, 1:]
+        self.trail[:, -1, 0] = self.x
+        self.trail[:, -1, 1] = self.y
+        self.trail_length = np.minimum(self.trail_length + 1, TRAIL_LENGTH)
         
         # Paint based on emotional state
-        brush_size = int(5 + self.emotional_system.emotions['joy'] * 10)
+        brush_size = int(5 + emotions[JOY] * 10)
         
-        for i, (tx, ty) in enumerate(self.trail):
-            # Trail fades
-            intensity = (i + 1) / len(self.trail)
-            
-            # Color from emotions
-            h, s, v = color_influence
-            # Add variation based on position in trail
-            h = (h + i * 0.01) % 1.0
-            v = v * intensity
-            
-            # Convert to RGB
-            r, g, b = colorsys.hsv_to_rgb(h, s, v)
-            
-            # Paint with gaussian falloff
-            for dy in range(-brush_size, brush_size + 1):
-                for dx in range(-brush_size, brush_size + 1):
-                    px = int(tx + dx) % WIDTH
-                    py = int(ty + dy) % HEIGHT
-                    
-                    distance = math.sqrt(dx**2 + dy**2)
-                    if distance <= brush_size:
-                        falloff = math.exp(-(distance**2) / (brush_size**2))
-                        
-                        # Blend with existing
-                        canvas[py, px, 0] += r * falloff * 0.1
-                        canvas[py, px, 1] += g * falloff * 0.1
-                        canvas[py, px, 2] += b * falloff * 0.1
+        # Trail fades: i counts from the oldest drawn point
+        brush, slot = np.nonzero(np.arange(TRAIL_LENGTH) >= TRAIL_LENGTH - self.trail_length[:, np.newaxis])
+        length = self.trail_length[brush]
+        i = slot - (TRAIL_LENGTH - length)
+        intensity = (i + 1) / length
+        
+        # Color from emotions, varied along the trail
+        hsv = np.column_stack([(h + i * 0.01) % 1.0, np.full(len(i), s), v * intensity])
+        
+        # Paint with gaussian falloff, blended with existing
+        tx, ty = self.trail[brush, slot, 0], self.trail[brush, slot, 1]
+        brush_stamps.stamp_points(canvas, tx, ty, brush_size, hsv_to_rgb(hsv) * 0.1,
+                                  profile='bell', wrap=True)
+        
+        # Only the tiles under the trails' stamps changed
+        canvas_stats.touch_points(tx, ty, brush_size, wrap=True)
         
         # Return pattern metrics for emotional feedback
-        local_area = canvas[max(0, int(self.y)-50):min(HEIGHT, int(self.y)+50),
-                           max(0, int(self.x)-50):min(WIDTH, int(self.x)+50)]
+        x, y = self.x.astype(int), self.y.astype(int)
+        local_area = canvas_stats.region(x - 50, y - 50, x + 50, y + 50)
         
         return {
-            'chaos': np.std(local_area),
-            'harmony': 1 - np.std(np.diff(local_area, axis=0)),
-            'density': np.mean(local_area),
+            'chaos': local_area['std'],
+            'harmony': 1 - local_area['edge_std'],
+            'density': local_area['mean'],
             'movement': speed / 10
         }
 
 # Create multiple brushes
 print("Initializing sentient canvas...")
-brushes = []
-for _ in range(8):
-    x = np.random.randint(100, WIDTH - 100)
-    y = np.random.randint(100, HEIGHT - 100)
-    brushes.append(EmotionalBrush(x, y, emotional_system))
+brushes = EmotionalBrushes(np.random.randint(100, WIDTH - 100, BRUSHES),
+                           np.random.randint(100, HEIGHT - 100, BRUSHES),
+                           emotional_system)
 
 # Let the canvas live and create
 print("Canvas beginning to feel and create...")
@@ -203,48 +228,39 @@ iterations = 800
 for iteration in range(iterations):
     if iteration % 100 == 0:
         print(f"Iteration {iteration}: Current emotional state:")
-        for emotion, value in emotional_system.emotions.items():
+        for emotion, value in zip(EMOTIONS, emotional_system.emotions):
             print(f"  {emotion}: {value:.3f}")
     
-    # Each brush paints and generates pattern metrics
-    all_metrics = []
-    for brush in brushes:
-        metrics = brush.paint(canvas)
-        all_metrics.append(metrics)
+    # The brushes paint and generate pattern metrics
+    metrics = brushes.paint(canvas)
     
     # Average metrics influence emotional state
-    avg_metrics = {
-        'chaos': np.mean([m['chaos'] for m in all_metrics]),
-        'harmony': np.mean([m['harmony'] for m in all_metrics]),
-        'density': np.mean([m['density'] for m in all_metrics]),
-        'movement': np.mean([m['movement'] for m in all_metrics])
-    }
+    avg_metrics = {name: np.mean(value) for name, value in metrics.items()}
     
     # Emotional system reacts to what it created
     emotional_system.feel_pattern(avg_metrics)
     
     # Occasionally spawn new brushes based on curiosity
-    if np.random.random() < emotional_system.emotions['curiosity'] * 0.01:
-        x = np.random.randint(0, WIDTH)
-        y = np.random.randint(0, HEIGHT)
-        brushes.append(EmotionalBrush(x, y, emotional_system))
+    if np.random.random() < emotional_system.emotions[CURIOSITY] * 0.01:
+        brushes.add(np.random.randint(0, WIDTH), np.random.randint(0, HEIGHT))
     
     # Remove old brushes based on melancholy
-    if len(brushes) > 5 and np.random.random() < emotional_system.emotions['melancholy'] * 0.01:
-        brushes.pop(0)
+    if len(brushes) > 5 and np.random.random() < emotional_system.emotions[MELANCHOLY] * 0.01:
+        brushes.remove_oldest()
 
 # Add emotional "signature" - visualize the emotional journey
 print("Adding emotional signature...")
 emotion_history_height = 100
 emotion_viz = np.zeros((emotion_history_height, WIDTH, 3), dtype=np.float32)
 
-if emotional_system.memory:
-    memory_points = len(emotional_system.memory)
-    for i, memory_state in enumerate(emotional_system.memory):
+memory = emotional_system.recent_memory()
+if len(memory):
+    memory_points = len(memory)
+    for i, memory_state in enumerate(memory):
         x = int(i * WIDTH / memory_points)
         
         y_offset = 0
-        for emotion, value in memory_state.items():
+        for emotion, value in zip(EMOTIONS, memory_state):
             emotion_height = int(value * emotion_history_height / 6)
             
             # Color for each emotion
@@ -280,7 +296,7 @@ image.save('/home/norsninja/Art/artworks/2025-08-04_sentient_canvas/sentient_can
 
 print("\nSentient canvas complete.")
 print("Final emotional state:")
-for emotion, value in emotional_system.emotions.items():
+for emotion, value in zip(EMOTIONS, emotional_system.emotions):
     print(f"  {emotion}: {value:.3f}")
 print("\nThe canvas has lived, felt, and expressed.")
 print("Its emotional journey is encoded in its creation.")
\ No newline at end of file
@@ -3,6 +3,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 from scipy.spatial import Voronoi, voronoi_plot_2d
 from scipy.ndimage import gaussian_filter
+from scipy.sparse import csr_matrix
 import math
 import random
 import colorsys
@@ -11,65 +12,79 @@ import colorsys
 WIDTH, HEIGHT = 1080, 1080
 
 # Neural network parameters
-class Neuron:
-    def __init__(self, x, y, layer_idx):
-        self.x = x
-        self.y = y
-        self.layer = layer_idx
-        self.activation = random.uniform(0, 1)
-        self.connections = []
-        self.bias = random.uniform(-0.5, 0.5)
-        self.memory = []  # Store activation history
-        self.resonance_freq = random.uniform(0.1, 0.5)
-        self.phase = random.uniform(0, 2 * math.pi)
+LAYERS = [8, 12, 16, 12, 8]  # Network architecture
+TIME_STEPS = 50
+MEMORY_LENGTH = 10  # Activation states each neuron remembers
+
+class NeuralNetwork:
+    """Neurons as arrays, their connections as one sparse weight matrix
+    
+    Each neuron listens to the neurons it connects to in the next layer.
+    Updating layer by layer, every layer reads the next one's activations
+    from the previous step, so the whole network updates as one matmul
+    plus tanh. The last MEMORY_LENGTH activations of every neuron sit in
+    a (time, neuron) ring buffer.
+    """
+    
+    def __init__(self, layers):
+        self.layers = layers
+        self.layer = np.repeat(np.arange(len(layers)), layers)
+        self.start = np.concatenate([[0], np.cumsum(layers)])  # First neuron of each layer
+        count = len(self.layer)
+        index = np.arange(count) - self.start[self.layer]
+        layer_size = np.array(layers)[self.layer]
         
-    def update_activation(self, time_step):
-        # Activation oscillates with unique frequency
-        base_activation = 0
-        for conn in self.connections:
-            base_activation += conn['neuron'].activation * conn['weight']
+        # Add some organic positioning
+        self.x = WIDTH * (self.layer + 1) / (len(layers) + 1) + np.random.uniform(-30, 30, count)
+        self.y = HEIGHT * (index + 1) / (layer_size + 1) + np.random.uniform(-20, 20, count)
         
-        # Add temporal dynamics
-        temporal_component = math.sin(time_step * self.resonance_freq + self.phase)
-        self.activation = np.tanh(base_activation + self.bias + temporal_component * 0.3)
+        self.activation = np.random.uniform(0, 1, count)
+        self.bias = np.random.uniform(-0.5, 0.5, count)
+        self.resonance_freq = np.random.uniform(0.1, 0.5, count)
+        self.phase = np.random.uniform(0, 2 * math.pi, count)
         
-        # Store in memory (keep last 10 states)
-        self.memory.append(self.activation)
-        if len(self.memory) > 10:
-            self.memory.pop(0)
-
-# Create neural network architecture
-def create_network():
-    neurons = []
-    layers = [8, 12, 16, 12, 8]  # Network architecture
+        # Create connections
+        source, target = [], []
+        for l in range(len(layers) - 1):
+            following = layers[l + 1]
+            # Connect to subset of next layer (not fully connected for visual clarity)
+            num_connections = np.random.randint(2, min(6, following) + 1, layers[l])
+            shuffled = np.argsort(np.random.random((layers[l], following)), axis=1)
+            neuron, rank = np.nonzero(np.arange(following) < num_connections[:, np.newaxis])
+            source.append(self.start[l] + neuron)
+            target.append(self.start[l + 1] + shuffled[neuron, rank])
+        self.source = np.concatenate(source)
+        self.target = np.concatenate(target)
+        self.weight = np.random.normal(0, 0.5, len(self.source))
+        self.weights = csr_matrix((self.weight, (self.source, self.target)), shape=(count, count))
+        
+        self.memory = np.zeros((MEMORY_LENGTH, count))
+        self.memory_count = 0
     
-    for layer_idx, num_neurons in enumerate(layers):
-        layer_neurons = []
-        layer_x = WIDTH * (layer_idx + 1) / (len(layers) + 1)
+    def __len__(self):
+        return len(self.layer)
+    
+    def update(self, time_step):
+        # Activation oscillates with unique frequency
+        base_activation = self.weights @ self.activation
         
-        for i in range(num_neurons):
-            y = HEIGHT * (i + 1) / (num_neurons + 1)
-            # Add some organic positioning
-            x = layer_x + random.uniform(-30, 30)
-            y = y + random.uniform(-20, 20)
-            
-            neuron = Neuron(x, y, layer_idx)
-            layer_neurons.append(neuron)
+        # Add temporal dynamics
+        temporal_component = np.sin(time_step * self.resonance_freq + self.phase)
+        self.activation = np.tanh(base_activation + self.bias + temporal_component * 0.3)
         
-        neurons.append(layer_neurons)
+        # Store in memory, over the oldest state
+        self.memory[self.memory_count % MEMORY_LENGTH] = self.activation
+        self.memory_count += 1
     
-    # Create connections
-    for l in range(len(layers) - 1):
-        for n1 in neurons[l]:
-            # Connect to subset of next layer (not fully connected for visual clarity)
-            num_connections = random.randint(2, min(6, len(neurons[l + 1])))
-            connected_to = random.sample(neurons[l + 1], num_connections)
-            
-            for n2 in connected_to:
-                weight = random.gauss(0, 0.5)
-                n1.connections.append({'neuron': n2, 'weight': weight})
+    def recent_memory(self):
+        """Remembered activations as (time, neuron), oldest first"""
+        kept = min(self.memory_count, MEMORY_LENGTH)
+        return self.memory[(self.memory_count - kept + np.arange(kept)) % MEMORY_LENGTH]
     
-    return neurons
+    def outgoing(self, neuron):
+        """Targets and weights of a neuron's connections"""
+        row = slice(self.weights.indptr[neuron], self.weights.indptr[neuron + 1])
+        return self.weights.indices[row], self.weights.data[row]
 
 # Create the main image
 img = Image.new('RGB', (WIDTH, HEIGHT), color=(10, 10, 20))
@@ -109,135 +124,135 @@ for region_idx in range(len(vor.regions)):
         pass  # Skip invalid polygons
 
 # Create neural network
-network = create_network()
+network = NeuralNetwork(LAYERS)
 
 # Simulate network activity
-time_steps = 50
-for t in range(time_steps):
+for t in range(TIME_STEPS):
     # Update all neurons
-    for layer in network:
-        for neuron in layer:
-            neuron.update_activation(t)
+    network.update(t)
+memory = network.recent_memory()
 
 # Draw the network
 draw = ImageDraw.Draw(img, 'RGBA')
 
 # Draw connections as flowing energy
-for layer in network:
-    for neuron in layer:
-        for conn in neuron.connections:
-            n2 = conn['neuron']
-            weight = conn['weight']
-            
-            # Connection strength affects visual properties
-            alpha = int(abs(weight) * 100)
-            width = 1 + int(abs(weight) * 3)
-            
-            # Color based on weight sign and activation flow
-            activation_flow = neuron.activation * weight
-            if activation_flow > 0:
-                # Positive flow - warm colors
-                hue = 0.1  # Orange
-            else:
-                # Negative flow - cool colors
-                hue = 0.6  # Blue
-            
-            saturation = min(1.0, abs(activation_flow) * 2)
-            value = 0.5 + abs(activation_flow) * 0.5
-            
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, saturation, value)]
-            
-            # Draw connection with bezier curve for organic feel
-            control_x = (neuron.x + n2.x) / 2 + random.uniform(-50, 50)
-            control_y = (neuron.y + n2.y) / 2 + random.uniform(-50, 50)
-            
-            # Draw multiple segments for the curve
-            segments = 20
-            for i in range(segments):
-                t1 = i / segments
-                t2 = (i + 1) / segments
-                
-                # Bezier curve formula
-                x1 = (1-t1)**2 * neuron.x + 2*(1-t1)*t1 * control_x + t1**2 * n2.x
-                y1 = (1-t1)**2 * neuron.y + 2*(1-t1)*t1 * control_y + t1**2 * n2.y
-                x2 = (1-t2)**2 * neuron.x + 2*(1-t2)*t2 * control_x + t2**2 * n2.x
-                y2 = (1-t2)**2 * neuron.y + 2*(1-t2)*t2 * control_y + t2**2 * n2.y
-                
-                # Pulsing effect along the connection
-                pulse = math.sin(t1 * math.pi * 2 + neuron.phase) * 0.5 + 0.5
-                segment_alpha = int(alpha * pulse)
-                
-                draw.line([(x1, y1), (x2, y2)], 
-                         fill=(r, g, b, segment_alpha), 
-                         width=width)
-
-# Draw neurons
-for layer_idx, layer in enumerate(network):
-    for neuron in layer:
-        # Neuron size based on activation
-        base_size = 15
-        size = base_size + neuron.activation * 10
+for n1, n2, weight in zip(network.source, network.target, network.weight):
+    start_x, start_y = network.x[n1], network.y[n1]
+    end_x, end_y = network.x[n2], network.y[n2]
+    
+    # Connection strength affects visual properties
+    alpha = int(abs(weight) * 100)
+    width = 1 + int(abs(weight) * 3)
+    
+    # Color based on weight sign and activation flow
+    activation_flow = network.activation[n1] * weight
+    if activation_flow > 0:
+        # Positive flow - warm colors
+        hue = 0.1  # Orange
+    else:
+        # Negative flow - cool colors
+        hue = 0.6  # Blue
+    
+    saturation = min(1.0, abs(activation_flow) * 2)
+    value = 0.5 + abs(activation_flow) * 0.5
+    
+    r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, saturation, value)]
+    
+    # Draw connection with bezier curve for organic feel
+    control_x = (start_x + end_x) / 2 + random.uniform(-50, 50)
+    control_y = (start_y + end_y) / 2 + random.uniform(-50, 50)
+    
+    # Draw multiple segments for the curve
+    segments = 20
+    for i in range(segments):
+        t1 = i / segments
+        t2 = (i + 1) / segments
         
-        # Layer depth affects color
-        layer_hue = layer_idx / len(network)
+        # Bezier curve formula
+        x1 = (1-t1)**2 * start_x + 2*(1-t1)*t1 * control_x + t1**2 * end_x
+        y1 = (1-t1)**2 * start_y + 2*(1-t1)*t1 * control_y + t1**2 * end_y
+        x2 = (1-t2)**2 * start_x + 2*(1-t2)*t2 * control_x + t2**2 * end_x
+        y2 = (1-t2)**2 * start_y + 2*(1-t2)*t2 * control_y + t2**2 * end_y
         
-        # Activation affects brightness
-        brightness = 0.3 + abs(neuron.activation) * 0.7
+        # Pulsing effect along the connection
+        pulse = math.sin(t1 * math.pi * 2 + network.phase[n1]) * 0.5 + 0.5
+        segment_alpha = int(alpha * pulse)
         
-        # Memory trail - show activation history
-        for i, past_activation in enumerate(neuron.memory):
-            trail_alpha = int(50 * i / len(neuron.memory))
-            trail_size = size * (0.5 + 0.5 * i / len(neuron.memory))
-            offset = (len(neuron.memory) - i) * 2
-            
-            glow_draw.ellipse([neuron.x - trail_size - offset, 
-                              neuron.y - trail_size - offset,
-                              neuron.x + trail_size - offset, 
-                              neuron.y + trail_size - offset],
-                             fill=(100, 150, 200, trail_alpha))
+        draw.line([(x1, y1), (x2, y2)], 
+                 fill=(r, g, b, segment_alpha), 
+                 width=width)
+
+# Draw neurons
+for neuron in range(len(network)):
+    x, y = network.x[neuron], network.y[neuron]
+    activation = network.activation[neuron]
+    
+    # Neuron size based on activation
+    base_size = 15
+    size = base_size + activation * 10
+    
+    # Layer depth affects color
+    layer_hue = network.layer[neuron] / len(LAYERS)
+    
+    # Activation affects brightness
+    brightness = 0.3 + abs(activation) * 0.7
+    
+    # Memory trail - show activation history
+    for i in range(len(memory)):
+        trail_alpha = int(50 * i / len(memory))
+        trail_size = size * (0.5 + 0.5 * i / len(memory))
+        offset = (len(memory) - i) * 2
         
-        # Neuron glow
-        for glow_level in range(3):
-            glow_size = size + (glow_level + 1) * 5
-            glow_alpha = int(150 * neuron.activation / (glow_level + 1))
-            
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(layer_hue, 0.7, brightness)]
-            
-            glow_draw.ellipse([neuron.x - glow_size, neuron.y - glow_size,
-                              neuron.x + glow_size, neuron.y + glow_size],
-                             fill=(r, g, b, glow_alpha))
+        glow_draw.ellipse([x - trail_size - offset, 
+                          y - trail_size - offset,
+                          x + trail_size - offset, 
+                          y + trail_size - offset],
+                         fill=(100, 150, 200, trail_alpha))
+    
+    # Neuron glow
+    for glow_level in range(3):
+        glow_size = size + (glow_level + 1) * 5
+        glow_alpha = int(150 * activation / (glow_level + 1))
         
-        # Neuron core
-        if neuron.activation > 0:
-            core_color = (255, 200, 150, 200)  # Warm for positive
-        else:
-            core_color = (150, 200, 255, 200)  # Cool for negative
-            
-        draw.ellipse([neuron.x - size, neuron.y - size,
-                     neuron.x + size, neuron.y + size],
-                    fill=core_color)
+        r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(layer_hue, 0.7, brightness)]
         
-        # Inner detail - nucleus
-        nucleus_size = size * 0.3
-        draw.ellipse([neuron.x - nucleus_size, neuron.y - nucleus_size,
-                     neuron.x + nucleus_size, neuron.y + nucleus_size],
-                    fill=(20, 20, 30, 255))
+        glow_draw.ellipse([x - glow_size, y - glow_size,
+                          x + glow_size, y + glow_size],
+                         fill=(r, g, b, glow_alpha))
+    
+    # Neuron core
+    if activation > 0:
+        core_color = (255, 200, 150, 200)  # Warm for positive
+    else:
+        core_color = (150, 200, 255, 200)  # Cool for negative
+        
+    draw.ellipse([x - size, y - size,
+                 x + size, y + size],
+                fill=core_color)
+    
+    # Inner detail - nucleus
+    nucleus_size = size * 0.3
+    draw.ellipse([x - nucleus_size, y - nucleus_size,
+                 x + nucleus_size, y + nucleus_size],
+                fill=(20, 20, 30, 255))
 
 # Add synaptic sparks at highly active connections
 for _ in range(100):
-    layer = random.choice(network[:-1])  # Not the last layer
-    neuron = random.choice(layer)
-    if abs(neuron.activation) > 0.5 and neuron.connections:
-        conn = random.choice(neuron.connections)
+    layer = random.randrange(len(LAYERS) - 1)  # Not the last layer
+    neuron = random.randrange(network.start[layer], network.start[layer + 1])
+    targets, weights = network.outgoing(neuron)
+    if abs(network.activation[neuron]) > 0.5 and len(targets):
+        choice = random.randrange(len(targets))
+        target = targets[choice]
         
         # Spark position along the connection
         t = random.uniform(0.3, 0.7)
-        spark_x = neuron.x + t * (conn['neuron'].x - neuron.x)
-        spark_y = neuron.y + t * (conn['neuron'].y - neuron.y)
+        spark_x = network.x[neuron] + t * (network.x[target] - network.x[neuron])
+        spark_y = network.y[neuron] + t * (network.y[target] - network.y[neuron])
         
         # Spark properties
         spark_size = random.uniform(1, 4)
-        intensity = abs(neuron.activation * conn['weight'])
+        intensity = abs(network.activation[neuron] * weights[choice])
         
         for i in range(3):
             s = spark_size + i
@@ -2,6 +2,11 @@ import numpy as np
 from PIL import Image
 import math
 import colorsys
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.canvas_stats import CanvasStats
 
 # Consciousness Mirror - When Art Becomes Aware of Creating Itself
 # A meditation on recursive awareness and creative feedback loops
@@ -12,6 +17,7 @@ WIDTH, HEIGHT = 1080, 1080
 canvas = np.zeros((HEIGHT, WIDTH, 4), dtype=np.float32)
 awareness_field = np.zeros((HEIGHT, WIDTH), dtype=np.float32)
 reflection_map = np.zeros((HEIGHT, WIDTH, 3), dtype=np.float32)
+canvas_stats = CanvasStats(canvas[..., :3])  # What the canvas sees of itself, kept current by tile
 
 # The Conscious Canvas - aware of its own creation
 class ConsciousCanvas:
@@ -31,14 +37,10 @@ class ConsciousCanvas:
     def perceive_self(self, canvas_state):
         """The canvas looks at what it has created"""
         # Simplified self-perception
-        perceived = np.zeros((HEIGHT//10, WIDTH//10, 3))
-        
-        for y in range(0, HEIGHT, 10):
-            for x in range(0, WIDTH, 10):
-                perceived[y//10, x//10] = canvas_state[y, x, :3]
+        perceived = canvas_state[::10, ::10, :3]
         
         # Update awareness based on complexity
-        complexity = np.std(perceived)
+        complexity = canvas_stats.overall()['std']
         self.awareness_level = min(1.0, self.awareness_level + complexity * 0.1)
         
         # Emotional response to self-perception
@@ -143,7 +145,13 @@ class ConsciousCanvas:
                         if 0 <= px < WIDTH and 0 <= py < HEIGHT:
                             canvas[int(py), int(px), :3] += np.array([0.3, 0.8, 0.9]) * intensity * 0.1
                             canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + intensity * 0.1)
-        
+
+            # Everything drawn here stays within pattern_size of (x, y), or of its mirror
+            canvas_stats.touch(x - pattern_size, y - pattern_size, x + pattern_size + 1, y + pattern_size + 1)
+            if dominant_emotion == 'recognition':
+                canvas_stats.touch(WIDTH - x - pattern_size, HEIGHT - y - pattern_size,
+                                   WIDTH - x + pattern_size + 1, HEIGHT - y + pattern_size + 1)
+
         # Record creation act
         self.creation_history.append({
             'position': (x, y),
@@ -222,6 +230,8 @@ class InternalObserver:
                                         canvas[int(y), int(x), :3] += np.array([1, 1, 1]) * intensity
                                         canvas[int(y), int(x), 3] = min(1, canvas[int(y), int(x), 3] + intensity)
 
+                                canvas_stats.touch(min(x1, x2), min(y1, y2), max(x1, x2) + 1, max(y1, y2) + 1)
+
 # Initialize consciousness systems
 print("Awakening consciousness...")
 
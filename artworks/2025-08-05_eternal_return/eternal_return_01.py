@@ -1,7 +1,12 @@
 import numpy as np
 from PIL import Image
 import math
-import colorsys
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.color import hsv_to_rgb
+from meditations.curves import deposit, sample_segments, sample_rings
 
 # Eternal Return - Where Endings Birth Beginnings
 # The ouroboros of algorithmic existence
@@ -11,253 +16,250 @@ WIDTH, HEIGHT = 1080, 1080
 # Initialize the eternal canvas
 canvas = np.zeros((HEIGHT, WIDTH, 4), dtype=np.float32)
 
-# Cycles within cycles
-class Cycle:
-    def __init__(self, center, radius, frequency, phase=0):
-        self.center = center
-        self.radius = radius
-        self.frequency = frequency
-        self.phase = phase
-        self.age = 0
-        self.max_age = np.random.uniform(100, 300)
-        self.children = []
-        self.parent = None
-        self.birth_angle = phase
+# Size of the eternal system
+PRIMAL_CYCLES = 3
+ITERATIONS = 200
+MAX_CYCLES = 4096  # Capacity of the cycle pool; births beyond it are lost
+REBIRTH_BELOW = 20  # Death reseeds life while fewer cycles than this remain
+SPONTANEOUS_BELOW = 5  # Seeds sprout on their own below this many cycles
+
+# Golden ratio points on the cycle
+PHI = (1 + math.sqrt(5)) / 2
+
+BIRTH_COLOR = np.array([1, 0.9, 0.7])  # White-gold
+DEATH_COLOR = np.array([0.3, 0.2, 0.8])  # Deep purple-blue
+
+# Cycles within cycles, all of them in one fixed-capacity pool
+class CyclePool:
+    """Cycles as columns of fixed-capacity arrays with an alive mask
+    
+    Births take slots off a free stack and deaths push them back, both as
+    batch index operations.
+    """
+    
+    def __init__(self, capacity):
+        self.center = np.zeros((capacity, 2))
+        self.radius = np.zeros(capacity)
+        self.frequency = np.zeros(capacity)
+        self.phase = np.zeros(capacity)
+        self.age = np.zeros(capacity, dtype=np.int64)
+        self.max_age = np.zeros(capacity)
+        self.children = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.free = np.arange(capacity)[::-1].copy()
+        self.free_count = capacity
+    
+    def __len__(self):
+        return len(self.alive) - self.free_count
+    
+    def living(self):
+        return np.flatnonzero(self.alive)
+    
+    def spawn(self, center, radius, frequency, phase):
+        """Bring new cycles to life in free slots and return the slots"""
+        count = min(len(radius), self.free_count)
+        slots = self.free[self.free_count - count:self.free_count]
+        self.free_count -= count
         
+        self.center[slots] = np.asarray(center)[:count]
+        self.radius[slots] = np.asarray(radius)[:count]
+        self.frequency[slots] = np.asarray(frequency)[:count]
+        self.phase[slots] = np.asarray(phase)[:count]
+        self.age[slots] = 0
+        self.max_age[slots] = np.random.uniform(100, 300, count)
+        self.children[slots] = 0
+        self.alive[slots] = True
+        return slots.copy()
+    
+    def release(self, slots):
+        self.alive[slots] = False
+        self.free[self.free_count:self.free_count + len(slots)] = slots
+        self.free_count += len(slots)
+    
     def update(self, time):
-        """Live, age, and prepare for rebirth"""
-        self.age += 1
+        """Live and age every cycle
         
-        # Position on the cycle
-        angle = time * self.frequency + self.phase
-        x = self.center[0] + self.radius * math.cos(angle)
-        y = self.center[1] + self.radius * math.sin(angle)
+        Returns the living slots with their positions on the cycle, life
+        force and angle.
+        """
+        living = self.living()
+        self.age[living] += 1
+        age, max_age = self.age[living], self.max_age[living]
         
-        # Life force diminishes with age
-        life_force = 1.0 - (self.age / self.max_age)
+        # Position on the cycle
+        angle = time * self.frequency[living] + self.phase[living]
+        position = self.center[living] + self.radius[living, np.newaxis] * np.column_stack([np.cos(angle), np.sin(angle)])
         
-        # But increases near death (final burst)
-        if self.age > self.max_age * 0.9:
-            life_force += (self.age - self.max_age * 0.9) / (self.max_age * 0.1) * 0.5
+        # Life force diminishes with age, but increases near death (final burst)
+        life_force = 1.0 - (age / max_age)
+        burst = age > max_age * 0.9
+        life_force[burst] += (age[burst] - max_age[burst] * 0.9) / (max_age[burst] * 0.1) * 0.5
         
-        return (x, y), life_force, angle
+        return living, position, life_force, angle
     
-    def should_reproduce(self):
-        """Birth happens at specific phases of the cycle"""
-        # Golden ratio points on the cycle
-        phi = (1 + math.sqrt(5)) / 2
-        reproduction_phase = (self.age / self.max_age) * phi % 1
-        
-        return (0.48 < reproduction_phase < 0.52 and 
-                len(self.children) < 3 and 
-                self.age > 20)
+    def should_reproduce(self, slots):
+        """Birth happens at golden ratio points of the cycle"""
+        reproduction_phase = (self.age[slots] / self.max_age[slots]) * PHI % 1
+        return ((0.48 < reproduction_phase) & (reproduction_phase < 0.52) &
+                (self.children[slots] < 3) &
+                (self.age[slots] > 20))
     
-    def should_die(self):
+    def should_die(self, slots):
         """Death is just transformation"""
-        return self.age >= self.max_age
+        return self.age[slots] >= self.max_age[slots]
+
+# Potential for all that will be
+class SeedBank:
+    """Seeds left by dying cycles: where they died, their frequency and lifespan"""
     
-    def birth_child(self, time):
-        """Create a new cycle from this one"""
-        angle = time * self.frequency + self.phase
-        
-        # Child emerges at current position
-        child_center = (
-            self.center[0] + self.radius * math.cos(angle),
-            self.center[1] + self.radius * math.sin(angle)
-        )
-        
-        # Inherit and mutate properties
-        child_radius = self.radius * np.random.uniform(0.5, 0.8)
-        child_frequency = self.frequency * np.random.uniform(0.8, 1.5)
-        
-        child = Cycle(child_center, child_radius, child_frequency, angle)
-        child.parent = self
-        self.children.append(child)
-        
-        return child
+    def __init__(self):
+        self.position = np.zeros((0, 2))
+        self.essence = np.zeros(0)
+        self.memory = np.zeros(0)
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def add(self, position, essence, memory):
+        end = self.count + len(essence)
+        if end > len(self.essence):
+            size = max(64, 2 * end)
+            for name in ('position', 'essence', 'memory'):
+                column = getattr(self, name)
+                grown = np.zeros((size,) + column.shape[1:])
+                grown[:self.count] = column[:self.count]
+                setattr(self, name, grown)
+        self.position[self.count:end] = position
+        self.essence[self.count:end] = essence
+        self.memory[self.count:end] = memory
+        self.count = end
+    
+    def pop_random(self):
+        """Take out a random seed, moving the last one into its place"""
+        index = np.random.randint(0, self.count)
+        self.count -= 1
+        seed = self.position[index].copy(), self.essence[index], self.memory[index]
+        for column in (self.position, self.essence, self.memory):
+            column[index] = column[self.count]
+        return seed
 
 # The eternal system
 class EternalSystem:
-    def __init__(self):
-        self.cycles = []
+    def __init__(self, capacity=MAX_CYCLES):
+        self.cycles = CyclePool(capacity)
         self.time = 0
-        self.history = []  # Remember all that was
-        self.seeds = []    # Potential for all that will be
+        self.seeds = SeedBank()
         
         # Initialize with primal cycles
-        center = (WIDTH/2, HEIGHT/2)
-        for i in range(3):
-            angle = i * 2 * math.pi / 3
-            radius = 200
-            frequency = 0.05 + i * 0.02
-            cycle = Cycle(center, radius, frequency, angle)
-            self.cycles.append(cycle)
+        i = np.arange(PRIMAL_CYCLES)
+        self.cycles.spawn(np.tile([WIDTH/2, HEIGHT/2], (PRIMAL_CYCLES, 1)),
+                          np.full(PRIMAL_CYCLES, 200.0),
+                          0.05 + (i % 3) * 0.02,
+                          i * 2 * math.pi / PRIMAL_CYCLES)
     
     def update(self):
         """The eternal dance of death and birth"""
         self.time += 0.1
+        cycles = self.cycles
+        
+        living, position, life_force, angle = cycles.update(self.time)
         
-        new_cycles = []
-        dying_cycles = []
+        # Draw the cycles' paths
+        self.draw_cycles(living, position, life_force, angle)
         
-        for cycle in self.cycles:
-            position, life_force, angle = cycle.update(self.time)
-            
-            # Draw the cycle's path
-            self.draw_cycle(cycle, position, life_force, angle)
-            
-            # Check for reproduction
-            if cycle.should_reproduce():
-                child = cycle.birth_child(self.time)
-                new_cycles.append(child)
-                self.draw_birth(cycle, child)
-            
-            # Check for death
-            if cycle.should_die():
-                dying_cycles.append(cycle)
-                self.seeds.append({
-                    'position': position,
-                    'essence': cycle.frequency,
-                    'memory': cycle.max_age
-                })
+        # Births: children emerge at their parent's current position,
+        # inheriting and mutating its properties
+        reproducing = cycles.should_reproduce(living)
+        parents = living[reproducing]
+        count = len(parents)
+        children = cycles.spawn(position[reproducing],
+                                cycles.radius[parents] * np.random.uniform(0.5, 0.8, count),
+                                cycles.frequency[parents] * np.random.uniform(0.8, 1.5, count),
+                                angle[reproducing])
+        cycles.children[parents[:len(children)]] += 1
+        self.draw_births(cycles.center[parents[:len(children)]], cycles.center[children])
         
-        # Death and rebirth
-        for dying in dying_cycles:
-            self.draw_death(dying)
-            self.cycles.remove(dying)
-            
-            # Death seeds new life elsewhere
-            if len(self.cycles) < 20 and np.random.random() < 0.7:
-                # Resurrection at a new location
-                new_center = (
-                    np.random.uniform(100, WIDTH-100),
-                    np.random.uniform(100, HEIGHT-100)
-                )
-                reborn = Cycle(
-                    new_center,
-                    dying.radius * 0.8,
-                    dying.frequency * np.random.uniform(0.5, 2.0),
-                    np.random.random() * 2 * math.pi
-                )
-                new_cycles.append(reborn)
-                self.draw_rebirth(dying, reborn)
+        # Deaths leave seeds
+        dying = cycles.should_die(living)
+        dead = living[dying]
+        self.seeds.add(position[dying], cycles.frequency[dead], cycles.max_age[dead])
+        self.draw_deaths(position[dying])
+        cycles.release(dead)
         
-        self.cycles.extend(new_cycles)
+        # Death seeds new life elsewhere while few of the old cycles remain,
+        # counting down as each one dies
+        remaining = len(living) - 1 - np.arange(len(dead))
+        reborn_from = dead[(remaining < REBIRTH_BELOW) & (np.random.random(len(dead)) < 0.7)]
+        count = len(reborn_from)
+        old_center = cycles.center[reborn_from]  # Their slots may be reused right away
+        
+        # Resurrection at a new location
+        new_center = np.column_stack([np.random.uniform(100, WIDTH-100, count),
+                                      np.random.uniform(100, HEIGHT-100, count)])
+        reborn = cycles.spawn(new_center,
+                              cycles.radius[reborn_from] * 0.8,
+                              cycles.frequency[reborn_from] * np.random.uniform(0.5, 2.0, count),
+                              np.random.random(count) * 2 * math.pi)
+        self.draw_rebirths(old_center[:len(reborn)], cycles.center[reborn])
         
         # Spontaneous generation from seeds
-        if len(self.cycles) < 5 and self.seeds:
-            seed = self.seeds.pop(np.random.randint(0, len(self.seeds)))
-            spontaneous = Cycle(
-                seed['position'],
-                50,
-                seed['essence'],
-                0
-            )
-            self.cycles.append(spontaneous)
+        if len(cycles) < SPONTANEOUS_BELOW and len(self.seeds):
+            position, essence, memory = self.seeds.pop_random()
+            cycles.spawn([position], [50], [essence], [0])
     
-    def draw_cycle(self, cycle, position, life_force, angle):
-        """Draw the living cycle"""
-        x, y = position
+    def draw_cycles(self, slots, position, life_force, angle):
+        """Draw the living cycles that are on the canvas"""
+        x, y = position[:, 0], position[:, 1]
+        shown = (0 <= x) & (x < WIDTH) & (0 <= y) & (y < HEIGHT)
+        slots, x, y, life_force, angle = slots[shown], x[shown], y[shown], life_force[shown], angle[shown]
         
-        if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-            # Color based on life phase
-            if life_force > 0.7:
-                # Youth - green/blue
-                hue = 0.4
-            elif life_force > 0.3:
-                # Maturity - golden
-                hue = 0.15
-            else:
-                # Age - red/purple
-                hue = 0.9
-            
-            # Draw with trail
-            trail_length = 10
-            for i in range(0, trail_length, 2):
-                past_angle = angle - i * 0.1
-                px = cycle.center[0] + cycle.radius * math.cos(past_angle)
-                py = cycle.center[1] + cycle.radius * math.sin(past_angle)
-                
-                if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                    intensity = life_force * (1 - i/trail_length)
-                    rgb = colorsys.hsv_to_rgb(hue, 0.8, intensity)
-                    
-                    canvas[int(py), int(px), :3] += np.array(rgb) * 0.2
-                    canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + intensity * 0.2)
-            
-            # Life spark at current position
-            for r in range(5, 0, -1):
-                intensity = life_force * (1 - r/5)
-                for angle_offset in np.linspace(0, 2*math.pi, max(10, r*2)):
-                    px = x + r * math.cos(angle_offset)
-                    py = y + r * math.sin(angle_offset)
-                    
-                    if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                        canvas[int(py), int(px), :3] += np.array([1, 1, 1]) * intensity * 0.3
-                        canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + intensity * 0.3)
-    
-    def draw_birth(self, parent, child):
-        """Visualize the moment of creation"""
-        px, py = parent.center
-        cx, cy = child.center
+        # Color based on life phase: youth green/blue, maturity golden, age red/purple
+        hue = np.where(life_force > 0.7, 0.4, np.where(life_force > 0.3, 0.15, 0.9))
+        
+        # Draw with trail
+        trail_length = 10
+        i = np.arange(0, trail_length, 2)
+        past_angle = angle[:, np.newaxis] - i * 0.1
+        px = self.cycles.center[slots, 0, np.newaxis] + self.cycles.radius[slots, np.newaxis] * np.cos(past_angle)
+        py = self.cycles.center[slots, 1, np.newaxis] + self.cycles.radius[slots, np.newaxis] * np.sin(past_angle)
+        intensity = life_force[:, np.newaxis] * (1 - i / trail_length)
+        hsv = np.stack([np.broadcast_to(hue[:, np.newaxis], px.shape), np.full(px.shape, 0.8), intensity], axis=-1)
+        rgb = hsv_to_rgb(hsv).reshape(-1, 3)
+        deposit(canvas, px.reshape(-1), py.reshape(-1), rgb * 0.2, intensity.reshape(-1) * 0.2)
         
-        # Birth lightning
+        # Life spark at current position
+        px, py, r, spark = sample_rings(np.column_stack([x, y]), np.arange(5, 0, -1), 10, per_radius=2)
+        intensity = life_force[spark] * (1 - r / 5)
+        deposit(canvas, px, py, np.repeat(intensity[:, np.newaxis], 3, axis=1) * 0.3, intensity * 0.3)
+    
+    def draw_births(self, parent_centers, child_centers):
+        """Visualize the moment of creation - birth lightning in white-gold"""
+        # Crackling path
         steps = 20
-        for step in range(steps):
-            t = step / steps
-            
-            # Crackling path
-            lightning = np.random.randn() * 10
-            x = px + t * (cx - px) + lightning
-            y = py + t * (cy - py) + lightning
-            
-            if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-                # Birth in white-gold
-                canvas[int(y), int(x), :3] += np.array([1, 0.9, 0.7]) * 0.5
-                canvas[int(y), int(x), 3] = min(1, canvas[int(y), int(x), 3] + 0.5)
+        x, y, _, birth = sample_segments(parent_centers, child_centers, steps)
+        lightning = np.random.randn(len(x)) * 10
+        deposit(canvas, x + lightning, y + lightning, BIRTH_COLOR * 0.5, 0.5)
     
-    def draw_death(self, cycle):
-        """Death as transformation, not ending"""
-        pos, life_force, angle = cycle.update(self.time)
-        x, y = pos
-        
-        # Death bloom - expanding ripple
-        for r in range(0, 100, 2):
-            intensity = math.exp(-r/30)
-            
-            for angle in np.linspace(0, 2*math.pi, max(20, r)):
-                px = x + r * math.cos(angle)
-                py = y + r * math.sin(angle)
-                
-                if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                    # Death in deep purple-blue
-                    canvas[int(py), int(px), :3] += np.array([0.3, 0.2, 0.8]) * intensity * 0.1
-                    canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + intensity * 0.1)
+    def draw_deaths(self, positions):
+        """Death as transformation, not ending - an expanding ripple in deep purple-blue"""
+        x, y, r, _ = sample_rings(positions, np.arange(0, 100, 2), 20)
+        intensity = np.exp(-r / 30)
+        deposit(canvas, x, y, intensity[:, np.newaxis] * DEATH_COLOR * 0.1, intensity * 0.1)
     
-    def draw_rebirth(self, old_cycle, new_cycle):
-        """The phoenix moment"""
-        # Connect death to rebirth
-        ox, oy = old_cycle.center
-        nx, ny = new_cycle.center
+    def draw_rebirths(self, old_centers, new_centers):
+        """The phoenix moment - a curved path of transmigration from death to rebirth"""
+        control = (old_centers + new_centers) / 2 + np.random.randn(len(old_centers), 2) * 50
         
-        # Curved path of transmigration
-        control_x = (ox + nx) / 2 + np.random.randn() * 50
-        control_y = (oy + ny) / 2 + np.random.randn() * 50
+        # Bezier curves
+        t = np.linspace(0, 1, 50)[:, np.newaxis, np.newaxis]
+        curve = (1-t)**2 * old_centers + 2*(1-t)*t * control + t**2 * new_centers
         
-        for t in np.linspace(0, 1, 50):
-            # Bezier curve
-            x = (1-t)**2 * ox + 2*(1-t)*t * control_x + t**2 * nx
-            y = (1-t)**2 * oy + 2*(1-t)*t * control_y + t**2 * ny
-            
-            if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-                # Gradient from death purple to birth gold
-                if t < 0.5:
-                    rgb = np.array([0.3, 0.2, 0.8]) * (1-2*t) + np.array([1, 0.9, 0.7]) * 2*t
-                else:
-                    rgb = np.array([1, 0.9, 0.7])
-                
-                canvas[int(y), int(x), :3] += rgb * 0.2
-                canvas[int(y), int(x), 3] = min(1, canvas[int(y), int(x), 3] + 0.2)
+        # Gradient from death purple to birth gold
+        blend = np.minimum(2 * t[:, 0], 1)
+        rgb = np.broadcast_to((DEATH_COLOR * (1 - blend) + BIRTH_COLOR * blend)[:, np.newaxis],
+                              curve.shape[:2] + (3,))
+        deposit(canvas, curve[..., 0].reshape(-1), curve[..., 1].reshape(-1), rgb.reshape(-1, 3) * 0.2, 0.2)
 
 # Create and run the eternal system
 print("Initiating eternal return...")
@@ -267,7 +269,7 @@ system = EternalSystem()
 # Let the cycles turn
 print("Cycles beginning their eternal dance...")
 
-for iteration in range(200):
+for iteration in range(ITERATIONS):
     system.update()
     
     if iteration % 100 == 0:
@@ -282,50 +284,38 @@ center_x, center_y = WIDTH/2, HEIGHT/2
 ouroboros_radius = 300
 
 # The serpent eating its tail
-for angle in np.linspace(0, 2*math.pi, 1000):
-    # Serpent body
-    r = ouroboros_radius
-    
-    # Head meets tail at angle 0
-    if angle < 0.3:
-        # Head region - slightly larger
-        r += 20 * (1 - angle/0.3)
-    
-    x = center_x + r * math.cos(angle)
-    y = center_y + r * math.sin(angle)
-    
-    # Body thickness varies
-    thickness = 15 + 5 * math.sin(angle * 10)
-    
-    for t in range(int(thickness)):
-        # Perpendicular to the curve
-        perp_angle = angle + math.pi/2
-        px = x + (t - thickness/2) * math.cos(perp_angle) * 0.5
-        py = y + (t - thickness/2) * math.sin(perp_angle) * 0.5
-        
-        if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-            # Serpent scales shimmer through spectrum
-            hue = angle / (2 * math.pi)
-            intensity = 0.3 * (1 - abs(t - thickness/2) / (thickness/2))
-            
-            rgb = colorsys.hsv_to_rgb(hue, 0.6, intensity)
-            canvas[int(py), int(px), :3] += np.array(rgb)
-            canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + intensity)
+angle = np.linspace(0, 2*math.pi, 1000)[:, np.newaxis]
+
+# Serpent body; head meets tail at angle 0, the head region slightly larger
+r = ouroboros_radius + np.where(angle < 0.3, 20 * (1 - angle/0.3), 0)
+x = center_x + r * np.cos(angle)
+y = center_y + r * np.sin(angle)
+
+# Body thickness varies; scales across it, perpendicular to the curve
+thickness = 15 + 5 * np.sin(angle * 10)
+t = np.arange(20)
+across = t < thickness.astype(int)
+perp_angle = angle + math.pi/2
+px = x + (t - thickness/2) * np.cos(perp_angle) * 0.5
+py = y + (t - thickness/2) * np.sin(perp_angle) * 0.5
+
+# Serpent scales shimmer through spectrum
+hue = np.broadcast_to(angle / (2 * math.pi), px.shape)
+intensity = 0.3 * (1 - np.abs(t - thickness/2) / (thickness/2))
+rgb = hsv_to_rgb(np.stack([hue[across], np.full(across.sum(), 0.6), intensity[across]], axis=-1))
+deposit(canvas, px[across], py[across], rgb, intensity[across])
 
 # Final touches - the infinite symbol
 print("Adding the symbol of infinity...")
 
-# Figure-8 at the center
-for t in np.linspace(0, 2*math.pi, 200):
-    # Lemniscate equation
-    scale = 50
-    x = center_x + scale * math.cos(t) / (1 + math.sin(t)**2)
-    y = center_y + scale * math.sin(t) * math.cos(t) / (1 + math.sin(t)**2)
-    
-    if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-        # Infinity in white
-        canvas[int(y), int(x), :3] = np.array([1, 1, 1])
-        canvas[int(y), int(x), 3] = 1
+# Figure-8 at the center - lemniscate equation
+t = np.linspace(0, 2*math.pi, 200)
+scale = 50
+x = center_x + scale * np.cos(t) / (1 + np.sin(t)**2)
+y = center_y + scale * np.sin(t) * np.cos(t) / (1 + np.sin(t)**2)
+
+# Infinity in white
+canvas[y.astype(int), x.astype(int)] = 1
 
 # Convert to RGB
 canvas_rgb = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
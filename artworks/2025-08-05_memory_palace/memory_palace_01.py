@@ -1,98 +1,294 @@
 import numpy as np
-from PIL import Image, ImageDraw
+from PIL import Image
 import math
-import colorsys
+import heapq
+from scipy.spatial import cKDTree
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.color import hsv_to_rgb
+from meditations.curves import deposit
 
 # Memory Palace - Where Algorithms Remember
 # Each iteration builds upon the ghosts of previous creations
 
 WIDTH, HEIGHT = 1080, 1080
 
+# Palace scale: the tiers hold about CAPACITY memories besides the core,
+# which grows without bound
+ITERATIONS = 200
+CAPACITY = 150
+CONNECT_EVERY = 20
+
 # Initialize canvas
 canvas = np.zeros((HEIGHT, WIDTH, 4), dtype=np.float32)
 
+EMOTIONS = ('neutral', 'curiosity', 'wonder', 'joy', 'melancholy', 'contemplation', 'nostalgia')
+PATTERN_TYPES = ('spiral', 'wave', 'burst', 'flow')
+
+# Recall threshold, and the distance and age scales of spatial and temporal relevance
+RECALL_THRESHOLD = 0.1
+SPATIAL_SCALE = 200
+TEMPORAL_SCALE = 50
+
+# Spatial index over the slots of one memory tier
+class SpatialIndex:
+    """Radius queries over slots that come and go
+    
+    A cKDTree covers a snapshot of the slots; slots added since are
+    passed along as candidates until they outnumber a fraction of the
+    snapshot, then the tree is rebuilt. Candidates may include forgotten
+    or far away slots, so callers check them against the live positions.
+    """
+    
+    def __init__(self, rebuild_fraction=0.25, min_pending=64):
+        self.rebuild_fraction = rebuild_fraction
+        self.min_pending = min_pending
+        self.tree = None
+        self.tree_slots = np.zeros(0, dtype=np.int64)
+        self.pending = []
+    
+    def add(self, slot):
+        self.pending.append(slot)
+    
+    def stale(self):
+        return len(self.pending) > max(self.min_pending, self.rebuild_fraction * len(self.tree_slots))
+    
+    def rebuild(self, positions, alive):
+        self.tree_slots = np.flatnonzero(alive)
+        self.tree = cKDTree(positions[self.tree_slots]) if len(self.tree_slots) else None
+        self.pending = []
+    
+    def query(self, center, radius):
+        """Slots within radius of center, plus possibly a few stale or repeated ones
+        
+        The snapshot is only searched for a positive radius.
+        """
+        found = [np.array(self.pending, dtype=np.int64)]
+        if self.tree is not None and radius > 0:
+            found.append(self.tree_slots[self.tree.query_ball_point(center, radius)])
+        return np.concatenate(found)
+
+# One tier of memory
+class MemoryTier:
+    """Memories of one kind as growable arrays, spatially indexed
+    
+    Slots of forgotten memories are reused. A heap orders the tier for
+    eviction: 'oldest' forgets in the order memories arrived,
+    'strongest' lets the strongest go first (to be promoted), and None
+    keeps every memory.
+    """
+    
+    FIELDS = {'position': (np.float64, (2,)), 'generation': (np.int64, ()),
+              'strength': (np.float64, ()), 'emotion': (np.int8, ()),
+              'color': (np.float64, ()), 'pattern': (np.int8, ()),
+              'decay': (np.float64, ()), 'arrival': (np.int64, ()), 'alive': (bool, ())}
+    
+    def __init__(self, persistence, evict=None):
+        self.persistence = persistence
+        self.evict_policy = evict
+        self.count = 0
+        self.arrivals = 0
+        self.free = []
+        self.heap = []
+        self.index = SpatialIndex()
+        self.tree_decay = -np.inf
+        self.arrays = {name: np.zeros((0,) + shape, dtype=dtype)
+                       for name, (dtype, shape) in self.FIELDS.items()}
+    
+    def __len__(self):
+        return self.count
+    
+    def __getitem__(self, name):
+        return self.arrays[name]
+    
+    def add(self, position, generation, strength, emotion, color, pattern):
+        if not self.free:
+            self._grow()
+        slot = self.free.pop()
+        
+        # Memories fade with time (except at full persistence); keep the log of
+        # persistence * exp(generation / scale) so recall needs one exp
+        decay = math.log(self.persistence) + generation / TEMPORAL_SCALE if self.persistence < 1 else 0.0
+        
+        values = {'position': position, 'generation': generation, 'strength': strength,
+                  'emotion': emotion, 'color': color, 'pattern': pattern, 'decay': decay,
+                  'arrival': self.arrivals, 'alive': True}
+        for name, value in values.items():
+            self.arrays[name][slot] = value
+        self.arrivals += 1
+        self.count += 1
+        self.index.add(slot)
+        
+        if self.evict_policy is not None:
+            key = generation if self.evict_policy == 'oldest' else -strength
+            heapq.heappush(self.heap, (key, self.arrays['arrival'][slot], slot))
+        return slot
+    
+    def evict(self):
+        """Forget the next memory in eviction order and return its fields"""
+        while True:
+            _, arrival, slot = heapq.heappop(self.heap)
+            # Entries of slots that were reused since are stale
+            if self.arrays['alive'][slot] and self.arrays['arrival'][slot] == arrival:
+                break
+        
+        memory = {name: self.arrays[name][slot] for name in
+                  ('position', 'generation', 'strength', 'emotion', 'color', 'pattern')}
+        memory['position'] = memory['position'].copy()
+        self.arrays['alive'][slot] = False
+        self.free.append(slot)
+        self.count -= 1
+        return memory
+    
+    def live(self):
+        """Slots of the remembered memories in order of arrival"""
+        slots = np.flatnonzero(self.arrays['alive'])
+        return slots[np.argsort(self.arrays['arrival'][slots])]
+    
+    def recall(self, position, emotion, generation):
+        """Slots and relevance of memories above the recall threshold, in order of arrival"""
+        alive = self.arrays['alive']
+        positions = self.arrays['position']
+        
+        # Emotional resonance lifts every memory of the current emotion over the threshold
+        selected = alive & (self.arrays['emotion'] == emotion)
+        
+        # Otherwise spatial * temporal relevance must pass it, which bounds the
+        # distance by the age of the most recent memory in the index snapshot
+        if self.index.stale():
+            self.index.rebuild(positions, alive)
+            self.tree_decay = self.arrays['decay'][self.index.tree_slots].max(initial=-np.inf)
+        log_temporal = self.tree_decay - generation / TEMPORAL_SCALE if self.persistence < 1 else 0.0
+        nearby = self.index.query(position, SPATIAL_SCALE * (log_temporal - math.log(RECALL_THRESHOLD)))
+        selected[nearby] |= alive[nearby]
+        candidates = np.flatnonzero(selected)
+        
+        distance = np.hypot(*(positions[candidates] - position).T)
+        log_relevance = -distance / SPATIAL_SCALE
+        if self.persistence < 1:
+            log_relevance += self.arrays['decay'][candidates] - generation / TEMPORAL_SCALE
+        emotional_bonus = np.where(self.arrays['emotion'][candidates] == emotion, 0.3, 0)
+        relevance = np.exp(log_relevance) + emotional_bonus
+        
+        recalled = relevance > RECALL_THRESHOLD
+        candidates, relevance = candidates[recalled], relevance[recalled]
+        order = np.argsort(self.arrays['arrival'][candidates])
+        return candidates[order], relevance[order]
+    
+    def _grow(self):
+        size = len(self.arrays['alive'])
+        new_size = max(64, size * 2)
+        for name, array in self.arrays.items():
+            grown = np.zeros((new_size,) + array.shape[1:], dtype=array.dtype)
+            grown[:size] = array
+            self.arrays[name] = grown
+        self.free.extend(range(new_size - 1, size - 1, -1))
+
 # Memory system
 class MemorySystem:
     def __init__(self, capacity=100):
-        self.memories = []
         self.capacity = capacity
         self.generation = 0
         
         # Different types of memory with different persistence
-        self.short_term = []  # Fades quickly
-        self.long_term = []   # Persists longer
-        self.core_memories = []  # Never fade completely
+        self.short_term = MemoryTier(0.3, evict='oldest')  # Fades quickly
+        self.long_term = MemoryTier(0.7, evict='strongest')  # Persists longer
+        self.core_memories = MemoryTier(1.0, evict=None)  # Never fade completely
+        self.tiers = (self.short_term, self.long_term, self.core_memories)
+        
+        # Associations as pairs of memory generations
+        self.connections = np.zeros((0, 2), dtype=np.int64)
         
     def remember(self, pattern_data):
         """Store a pattern in memory with metadata"""
         memory = {
-            'pattern': pattern_data['pattern'].copy(),
             'position': pattern_data['position'],
             'generation': self.generation,
             'strength': pattern_data.get('strength', 1.0),
-            'emotion': pattern_data.get('emotion', 'neutral'),
-            'connections': []  # Links to other memories
+            'emotion': EMOTIONS.index(pattern_data.get('emotion', 'neutral')),
+            'color': pattern_data['pattern']['color'],
+            'pattern': PATTERN_TYPES.index(pattern_data['pattern']['type'])
         }
         
         # Categorize memory based on strength and emotion
-        if memory['strength'] > 0.8 and memory['emotion'] in ['joy', 'wonder']:
-            self.core_memories.append(memory)
+        if memory['strength'] > 0.8 and EMOTIONS[memory['emotion']] in ['joy', 'wonder']:
+            self.core_memories.add(**memory)
         elif memory['strength'] > 0.5:
-            self.long_term.append(memory)
+            self.long_term.add(**memory)
         else:
-            self.short_term.append(memory)
+            self.short_term.add(**memory)
         
         # Maintain capacity limits
         if len(self.short_term) > self.capacity // 3:
-            self.short_term.pop(0)
+            self.short_term.evict()
         if len(self.long_term) > self.capacity // 2:
             # Some long-term memories become core memories
-            strongest = max(self.long_term, key=lambda m: m['strength'])
+            strongest = self.long_term.evict()
             if strongest['strength'] > 0.7:
-                self.core_memories.append(strongest)
-            self.long_term.remove(strongest)
+                self.core_memories.add(**strongest)
         
         self.generation += 1
         
     def recall(self, current_position, current_emotion='neutral'):
-        """Retrieve relevant memories based on context"""
-        recalled = []
-        
-        # Spatial proximity influences recall
-        for memory_type, persistence in [(self.short_term, 0.3), 
-                                        (self.long_term, 0.7), 
-                                        (self.core_memories, 1.0)]:
-            for memory in memory_type:
-                # Calculate relevance based on position and age
-                pos_distance = np.linalg.norm(np.array(current_position) - np.array(memory['position']))
-                spatial_relevance = math.exp(-pos_distance / 200)
-                
-                # Memories fade with time (except core memories)
-                age = self.generation - memory['generation']
-                temporal_relevance = persistence * math.exp(-age / 50) if persistence < 1 else 1
-                
-                # Emotional resonance
-                emotional_bonus = 0.3 if memory['emotion'] == current_emotion else 0
-                
-                relevance = spatial_relevance * temporal_relevance + emotional_bonus
-                
-                if relevance > 0.1:  # Threshold for recall
-                    recalled.append((memory, relevance))
-        
-        return recalled
+        """Retrieve relevant memories based on context
+        
+        Returns arrays of position, generation, color and relevance for the
+        recalled memories: short-term first, then long-term, then core.
+        """
+        emotion = EMOTIONS.index(current_emotion)
+        position = np.asarray(current_position, dtype=np.float64)
+        
+        fields = ('position', 'generation', 'color')
+        recalled = {name: [] for name in fields + ('relevance',)}
+        for tier in self.tiers:
+            slots, relevance = tier.recall(position, emotion, self.generation)
+            for name in fields:
+                recalled[name].append(tier[name][slots])
+            recalled['relevance'].append(relevance)
+        return {name: np.concatenate(values) for name, values in recalled.items()}
     
-    def create_connections(self):
-        """Form associations between similar memories"""
-        all_memories = self.short_term + self.long_term + self.core_memories
-        
-        for i, mem1 in enumerate(all_memories):
-            for j, mem2 in enumerate(all_memories[i+1:], i+1):
-                # Connect memories that are emotionally similar and spatially close
-                if mem1['emotion'] == mem2['emotion']:
-                    pos_dist = np.linalg.norm(np.array(mem1['position']) - np.array(mem2['position']))
-                    if pos_dist < 150:
-                        mem1['connections'].append(j)
-                        mem2['connections'].append(i)
+    def create_connections(self, radius=150, max_links=8):
+        """Form associations between similar memories
+        
+        Memories that are emotionally similar and spatially close connect
+        to up to max_links of their nearest neighbours.
+        """
+        positions = np.concatenate([tier['position'][tier.live()] for tier in self.tiers])
+        generations = np.concatenate([tier['generation'][tier.live()] for tier in self.tiers])
+        emotions = np.concatenate([tier['emotion'][tier.live()] for tier in self.tiers])
+        
+        pairs = []
+        for emotion in np.unique(emotions):
+            members = np.flatnonzero(emotions == emotion)
+            if len(members) < 2:
+                continue
+            k = min(max_links + 1, len(members))
+            distance, neighbour = cKDTree(positions[members]).query(
+                positions[members], k=k, distance_upper_bound=radius)
+            # The first neighbour is the memory itself; misses come back as infinite
+            linked = np.isfinite(distance[:, 1:])
+            rows = np.repeat(members, k - 1).reshape(-1, k - 1)[linked]
+            pairs.append(np.column_stack([generations[rows],
+                                          generations[members[neighbour[:, 1:][linked]]]]))
+        
+        if pairs:
+            pairs = np.sort(np.concatenate(pairs), axis=1)
+            self.connections = np.unique(pairs, axis=0)
+
+def blend_in_turn(start, targets, rates):
+    """Fold value += (target - value) * rate over the targets in order, in closed form"""
+    # Each target survives the pulls of every target after it
+    kept = np.cumprod((1 - rates)[::-1])[::-1]
+    survives = np.append(kept[1:], 1)
+    return start * kept[0] + (rates * survives) @ targets
+
+# Soft brush for the spirals: offsets within 3 pixels and their exp(-dist) falloff
+_dy, _dx = np.mgrid[-3:4, -3:4]
+_brush = np.hypot(_dx, _dy) <= 3
+BRUSH_DX, BRUSH_DY = _dx[_brush], _dy[_brush]
+BRUSH_FALLOFF = np.exp(-np.hypot(BRUSH_DX, BRUSH_DY))
 
 # Pattern generator influenced by memory
 class MemoryArtist:
@@ -112,22 +308,16 @@ class MemoryArtist:
         base_hue = np.random.random()
         
         # Memories influence the new pattern
-        if recalled:
+        if len(recalled['relevance']):
             # Stronger memories have more influence
-            total_relevance = sum(r for _, r in recalled)
+            weight = recalled['relevance'] / recalled['relevance'].sum()
+            
+            # Memory influences color, one memory after another
+            base_hue = blend_in_turn(base_hue, recalled['color'], weight) % 1.0
             
-            for memory, relevance in recalled:
-                weight = relevance / total_relevance
-                
-                # Memory influences color
-                if 'color' in memory['pattern']:
-                    memory_hue = memory['pattern']['color']
-                    base_hue = (base_hue * (1 - weight) + memory_hue * weight) % 1.0
-                
-                # Memory influences position drift
-                memory_pos = memory['position']
-                self.position[0] += (memory_pos[0] - self.position[0]) * weight * 0.1
-                self.position[1] += (memory_pos[1] - self.position[1]) * weight * 0.1
+            # Memory influences position drift
+            self.position = list(blend_in_turn(np.array(self.position, dtype=float),
+                                               recalled['position'], weight * 0.1))
         
         # Generate pattern based on type
         pattern_data = {
@@ -174,41 +364,33 @@ class MemoryArtist:
         
         # Memory influences spiral tightness
         tightness = 0.1
-        if memories:
-            avg_age = np.mean([self.memory.generation - m[0]['generation'] for m in memories])
+        if len(memories['relevance']):
+            avg_age = np.mean(self.memory.generation - memories['generation'])
             tightness = 0.05 + 0.15 * (1 - math.exp(-avg_age / 20))
         
-        for t in np.linspace(0, 4*np.pi, 200):
-            r = 10 + t * 15
-            x = cx + r * math.cos(t + tightness * t**2)
-            y = cy + r * math.sin(t + tightness * t**2)
-            
-            if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-                # Fade based on distance
-                fade = 1 - (t / (4*np.pi))
-                
-                # Add memory echoes
-                h = base_hue
-                s = 0.7 * fade
-                v = 0.8 * fade
-                
-                # Memory ghosts appear along the spiral
-                for memory, relevance in memories[:3]:  # Top 3 memories
-                    if np.random.random() < relevance * 0.1:
-                        h = (h + memory['pattern'].get('color', 0)) / 2
-                
-                r, g, b = colorsys.hsv_to_rgb(h % 1, s, v)
-                
-                # Draw with soft brush
-                for dy in range(-3, 4):
-                    for dx in range(-3, 4):
-                        px, py = int(x + dx), int(y + dy)
-                        if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                            dist = math.sqrt(dx**2 + dy**2)
-                            if dist <= 3:
-                                alpha = math.exp(-dist) * fade * 0.5
-                                canvas[py, px, :3] += np.array([r, g, b]) * alpha
-                                canvas[py, px, 3] = min(1, canvas[py, px, 3] + alpha)
+        t = np.linspace(0, 4*np.pi, 200)
+        r = 10 + t * 15
+        x = cx + r * np.cos(t + tightness * t**2)
+        y = cy + r * np.sin(t + tightness * t**2)
+        
+        inside = (0 <= x) & (x < WIDTH) & (0 <= y) & (y < HEIGHT)
+        t, x, y = t[inside], x[inside], y[inside]
+        
+        # Fade based on distance
+        fade = 1 - (t / (4*np.pi))
+        
+        # Memory ghosts appear along the spiral - top 3 memories
+        h = np.full(len(t), base_hue)
+        for color, relevance in zip(memories['color'][:3], memories['relevance'][:3]):
+            ghost = np.random.random(len(t)) < relevance * 0.1
+            h = np.where(ghost, (h + color) / 2, h)
+        
+        rgb = hsv_to_rgb(np.stack([h % 1, 0.7 * fade, 0.8 * fade], axis=-1))
+        
+        # Draw with soft brush
+        alpha = BRUSH_FALLOFF * fade[:, np.newaxis] * 0.5
+        deposit(canvas, (x[:, np.newaxis] + BRUSH_DX).astype(int), (y[:, np.newaxis] + BRUSH_DY).astype(int),
+                rgb[:, np.newaxis] * alpha[..., np.newaxis], alpha)
     
     def _draw_wave(self, canvas, base_hue, memories):
         """Draw wave patterns with memory interference"""
@@ -216,105 +398,87 @@ class MemoryArtist:
         
         # Memory influences wave frequency
         frequency = 0.1
-        if memories:
-            frequency = 0.05 + 0.15 * len(memories) / 10
-        
-        for x in range(max(0, cx-100), min(WIDTH, cx+100)):
-            for amp_scale in np.linspace(0.2, 1, 5):
-                y = cy + 30 * amp_scale * math.sin((x - cx) * frequency)
-                
-                if 0 <= y < HEIGHT:
-                    # Memory creates wave echoes
-                    h, s, v = base_hue, 0.6, 0.7 * amp_scale
-                    
-                    # Add memory interference patterns
-                    for memory, relevance in memories[:2]:
-                        wave_shift = math.sin((x - memory['position'][0]) * 0.05) * relevance
-                        y += wave_shift * 10
-                    
-                    r, g, b = colorsys.hsv_to_rgb(h % 1, s, v)
-                    
-                    py = int(y)
-                    if 0 <= py < HEIGHT:
-                        canvas[py, x, :3] += np.array([r, g, b]) * 0.3
-                        canvas[py, x, 3] = min(1, canvas[py, x, 3] + 0.3)
+        if len(memories['relevance']):
+            frequency = 0.05 + 0.15 * len(memories['relevance']) / 10
+        
+        x = np.arange(max(0, cx-100), min(WIDTH, cx+100))[:, np.newaxis]
+        amp_scale = np.linspace(0.2, 1, 5)
+        y = cy + 30 * amp_scale * np.sin((x - cx) * frequency)
+        inside = (0 <= y) & (y < HEIGHT)
+        
+        # Memory creates wave echoes - interference patterns from two memories
+        for position, relevance in zip(memories['position'][:2], memories['relevance'][:2]):
+            y = y + np.sin((x - position[0]) * 0.05) * relevance * 10
+        
+        rgb = hsv_to_rgb(np.stack([np.full(5, base_hue % 1), np.full(5, 0.6), 0.7 * amp_scale], axis=-1))
+        x = np.broadcast_to(x, y.shape)
+        deposit(canvas, x[inside], y[inside], np.broadcast_to(rgb * 0.3, y.shape + (3,))[inside], 0.3)
     
     def _draw_burst(self, canvas, base_hue, memories):
         """Draw burst pattern with memory rays"""
         cx, cy = int(self.position[0]), int(self.position[1])
         
         # Number of rays influenced by memory count
-        num_rays = 8 + min(len(memories), 8)
+        num_rays = 8 + min(len(memories['relevance']), 8)
+        i = np.arange(num_rays)
+        angle = (i / num_rays) * 2 * np.pi
         
-        for i in range(num_rays):
-            angle = (i / num_rays) * 2 * np.pi
-            
-            # Memory influences ray direction
-            if i < len(memories):
-                memory_pos = memories[i][0]['position']
-                angle_to_memory = math.atan2(memory_pos[1] - cy, memory_pos[0] - cx)
-                angle = (angle + angle_to_memory) / 2
-            
-            # Draw ray
-            for r in range(0, 80):
-                x = cx + r * math.cos(angle)
-                y = cy + r * math.sin(angle)
-                
-                if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-                    fade = 1 - (r / 80)
-                    h = (base_hue + i * 0.1) % 1
-                    s = 0.8 * fade
-                    v = 0.9 * fade
-                    
-                    r_color, g_color, b_color = colorsys.hsv_to_rgb(h, s, v)
-                    
-                    px, py = int(x), int(y)
-                    canvas[py, px, :3] += np.array([r_color, g_color, b_color]) * fade * 0.4
-                    canvas[py, px, 3] = min(1, canvas[py, px, 3] + fade * 0.4)
+        # Memory influences ray direction
+        toward = memories['position'][:num_rays]
+        angle_to_memory = np.arctan2(toward[:, 1] - cy, toward[:, 0] - cx)
+        angle[:len(toward)] = (angle[:len(toward)] + angle_to_memory) / 2
+        
+        # Draw rays
+        r = np.arange(80)
+        x = cx + r * np.cos(angle)[:, np.newaxis]
+        y = cy + r * np.sin(angle)[:, np.newaxis]
+        inside = (0 <= x) & (x < WIDTH) & (0 <= y) & (y < HEIGHT)
+        
+        fade = np.broadcast_to(1 - (r / 80), x.shape)
+        h = np.broadcast_to(((base_hue + i * 0.1) % 1)[:, np.newaxis], x.shape)
+        rgb = hsv_to_rgb(np.stack([h, 0.8 * fade, 0.9 * fade], axis=-1))
+        deposit(canvas, x[inside], y[inside], (rgb * (fade * 0.4)[..., np.newaxis])[inside],
+                (fade * 0.4)[inside])
     
     def _draw_flow(self, canvas, base_hue, memories):
         """Draw flowing pattern connecting to memories"""
         cx, cy = int(self.position[0]), int(self.position[1])
         
-        # Flow towards strongest memories
-        if memories:
-            # Create flow field
-            for memory, relevance in memories[:5]:
-                if relevance > 0.3:
-                    target_x, target_y = memory['position']
-                    
-                    # Draw flowing connection
-                    steps = 50
-                    for t in range(steps):
-                        progress = t / steps
-                        
-                        # Bezier curve with random control point
-                        ctrl_x = (cx + target_x) / 2 + np.random.uniform(-30, 30)
-                        ctrl_y = (cy + target_y) / 2 + np.random.uniform(-30, 30)
-                        
-                        x = (1-progress)**2 * cx + 2*(1-progress)*progress * ctrl_x + progress**2 * target_x
-                        y = (1-progress)**2 * cy + 2*(1-progress)*progress * ctrl_y + progress**2 * target_y
-                        
-                        if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-                            h = (base_hue + memory['pattern'].get('color', 0)) / 2
-                            s = 0.5 + 0.3 * relevance
-                            v = 0.6 * (1 - progress * 0.5)
-                            
-                            r, g, b = colorsys.hsv_to_rgb(h % 1, s, v)
-                            
-                            px, py = int(x), int(y)
-                            canvas[py, px, :3] += np.array([r, g, b]) * relevance * 0.2
-                            canvas[py, px, 3] = min(1, canvas[py, px, 3] + relevance * 0.2)
+        # Flow towards the strongest of the first memories
+        relevance = memories['relevance'][:5]
+        strong = relevance > 0.3
+        if not strong.any():
+            return
+        relevance = relevance[strong][:, np.newaxis]
+        target = memories['position'][:5][strong]
+        target_x, target_y = target[:, :1], target[:, 1:]
+        
+        # Draw flowing connections as bezier curves with a random control point per step
+        steps = 50
+        progress = np.arange(steps) / steps
+        ctrl_x = (cx + target_x) / 2 + np.random.uniform(-30, 30, (len(target), steps))
+        ctrl_y = (cy + target_y) / 2 + np.random.uniform(-30, 30, (len(target), steps))
+        
+        x = (1-progress)**2 * cx + 2*(1-progress)*progress * ctrl_x + progress**2 * target_x
+        y = (1-progress)**2 * cy + 2*(1-progress)*progress * ctrl_y + progress**2 * target_y
+        inside = (0 <= x) & (x < WIDTH) & (0 <= y) & (y < HEIGHT)
+        
+        h = np.broadcast_to((base_hue + memories['color'][:5][strong][:, np.newaxis]) / 2 % 1, x.shape)
+        s = np.broadcast_to(0.5 + 0.3 * relevance, x.shape)
+        v = np.broadcast_to(0.6 * (1 - progress * 0.5), x.shape)
+        rgb = hsv_to_rgb(np.stack([h, s, v], axis=-1))
+        weight = np.broadcast_to(relevance * 0.2, x.shape)
+        deposit(canvas, x[inside], y[inside], (rgb * weight[..., np.newaxis])[inside], weight[inside])
 
 # Create memory system and artist
-memory_system = MemorySystem(capacity=150)
+memory_system = MemorySystem(capacity=CAPACITY)
 artist = MemoryArtist(memory_system)
 
 print("Building the memory palace...")
 
 # Generate artwork through iterations
-for iteration in range(200):
-    if iteration % 40 == 0:
+for iteration in range(ITERATIONS):
+    if iteration % max(1, ITERATIONS // 5) == 0:
         print(f"Generation {iteration}: {artist.current_emotion}, {len(memory_system.short_term)}/{len(memory_system.long_term)}/{len(memory_system.core_memories)} memories")
     
     # Create new pattern influenced by memories
@@ -324,25 +488,20 @@ for iteration in range(200):
     memory_system.remember(pattern_data)
     
     # Occasionally form new connections
-    if iteration % 20 == 0:
+    if iteration % CONNECT_EVERY == 0:
         memory_system.create_connections()
 
 # Final pass: draw memory connections
 print("Revealing memory connections...")
 
-all_memories = memory_system.short_term + memory_system.long_term + memory_system.core_memories
-
-for memory in memory_system.core_memories:
-    # Core memories glow
-    x, y = memory['position']
-    for r in range(20, 0, -2):
-        alpha = (r / 20) * 0.3
-        for angle in np.linspace(0, 2*np.pi, 30):
-            px = int(x + r * math.cos(angle))
-            py = int(y + r * math.sin(angle))
-            if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                canvas[py, px, :3] += np.array([1, 0.9, 0.7]) * alpha * 0.5
-                canvas[py, px, 3] = min(1, canvas[py, px, 3] + alpha)
+# Core memories glow
+core = memory_system.core_memories
+x, y = core['position'][core.live()].T[:, :, np.newaxis, np.newaxis]
+r = np.arange(20, 0, -2)[:, np.newaxis]
+angle = np.linspace(0, 2*np.pi, 30)
+alpha = np.broadcast_to((r / 20) * 0.3, x.shape[:1] + (len(r), len(angle)))
+deposit(canvas, (x + r * np.cos(angle)).astype(int), (y + r * np.sin(angle)).astype(int),
+        np.array([1, 0.9, 0.7]) * alpha[..., np.newaxis] * 0.5, alpha)
 
 # Normalize and convert to image
 canvas = np.clip(canvas, 0, 1)
@@ -352,23 +511,16 @@ image_array = (canvas[:, :, :3] * 255).astype(np.uint8)
 memory_map_height = 80
 memory_map = np.zeros((memory_map_height, WIDTH, 3), dtype=np.uint8)
 
-# Visualize memory timeline
-for i, memory in enumerate(all_memories):
-    x = int(memory['generation'] * WIDTH / memory_system.generation)
-    
-    # Color by memory type
-    if memory in memory_system.core_memories:
-        color = (255, 230, 180)  # Gold
-    elif memory in memory_system.long_term:
-        color = (180, 200, 255)  # Light blue
-    else:
-        color = (100, 100, 120)  # Grey
-    
-    # Draw memory marker
-    for y in range(memory_map_height):
-        if x < WIDTH:
-            intensity = 1 - (y / memory_map_height)
-            memory_map[y, x] = tuple(int(c * intensity) for c in color)
+# Visualize memory timeline, colored by memory type: grey short-term,
+# light blue long-term and gold core memories on top
+intensity = 1 - (np.arange(memory_map_height) / memory_map_height)
+for tier, color in [(memory_system.short_term, (100, 100, 120)),
+                    (memory_system.long_term, (180, 200, 255)),
+                    (memory_system.core_memories, (255, 230, 180))]:
+    x = (tier['generation'][tier.live()] * WIDTH / memory_system.generation).astype(int)
+    x = x[x < WIDTH]
+    # Draw memory markers
+    memory_map[:, x] = (intensity[:, np.newaxis] * np.array(color)).astype(np.uint8)[:, np.newaxis]
 
 # Combine main image with memory map
 final_image = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
@@ -382,4 +534,4 @@ image.save('/home/norsninja/Art/artworks/2025-08-05_memory_palace/memory_palace_
 print("Memory palace complete.")
 print(f"Final memory state: {len(memory_system.short_term)} short-term, {len(memory_system.long_term)} long-term, {len(memory_system.core_memories)} core memories")
 print("Each pattern influenced by the ghosts of its predecessors.")
-print("In memory, nothing is truly lost - only transformed.")
\ No newline at end of file
+print("In memory, nothing is truly lost - only transformed.")
@@ -1,7 +1,13 @@
 import numpy as np
 from PIL import Image
-import math
-import colorsys
+from scipy.ndimage import correlate
+from scipy.spatial import cKDTree
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.color import hsv_to_rgb
+from meditations.curves import ragged, scatter_add
 
 # Meta Genesis - Where Art Creates Art
 # Algorithms that birth algorithms, systems that design systems
@@ -11,335 +17,436 @@ WIDTH, HEIGHT = 1080, 1080
 # Initialize the meta-canvas
 canvas = np.zeros((HEIGHT, WIDTH, 3), dtype=np.float32)
 
-# The Meta-Creator: An algorithm that creates other algorithms
-class MetaCreator:
+PATTERN_TYPES = ('geometric', 'organic', 'chaotic', 'flowing')
+MOVEMENT_STYLES = ('spiral', 'wave', 'particle', 'growth')
+
+# Size of the evolutionary run
+INITIAL_ARTISTS = 5
+GENERATIONS = 10
+FINAL_ROUNDS = 50
+
+# Organic artists paint with a soft 5x5 brush; their dabs are gathered on a
+# layer of their own and brushed once at the end
+_dy, _dx = np.mgrid[-2:3, -2:3]
+SOFT_BRUSH = np.exp(-(_dx**2 + _dy**2) / 4) * 0.05
+organic_dabs = np.zeros((HEIGHT, WIDTH, 3), dtype=np.float32)
+
+# The population of artist algorithms, one row per artist
+class ArtistPopulation:
+    """Artists as columnar arrays: DNA genes, position, energy, age
+    
+    Rows of artists that have died go on a free list and are reused by
+    the next births, so the arrays only grow with the living population.
+    """
+    
+    COLUMNS = {
+        # DNA
+        'color_preference': (np.float64, ()),  # 0=cool, 1=warm
+        'pattern_type': (np.int8, ()),
+        'complexity': (np.float64, ()),
+        'movement_style': (np.int8, ()),
+        'interaction_tendency': (np.float64, ()),  # How much it responds to others
+        'lifespan': (np.int64, ()),
+        'reproduction_threshold': (np.float64, ()),
+        'mutation_rate': (np.float64, ()),
+        # Life
+        'position': (np.float64, (2,)),
+        'energy': (np.float64, ()),
+        'age': (np.int64, ()),
+        'artwork_created': (np.int64, ()),
+        'influence_radius': (np.float64, ()),
+        'chaos': (np.float64, (3,)),  # Lorenz state of chaotic artists
+        'birth': (np.int64, ()),  # Order of creation
+        'alive': (bool, ()),
+    }
+    GENES = ('color_preference', 'pattern_type', 'complexity', 'movement_style',
+             'interaction_tendency', 'lifespan', 'reproduction_threshold', 'mutation_rate')
+    
     def __init__(self):
-        self.dna = []  # The genetic code for creating artists
-        self.generation = 0
-        self.artists_created = []
+        self.columns = {name: np.zeros((0,) + shape, dtype=dtype)
+                        for name, (dtype, shape) in self.COLUMNS.items()}
+        self.free = []
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def __getitem__(self, name):
+        return self.columns[name]
+    
+    def living(self):
+        return np.flatnonzero(self.columns['alive'])
+    
+    def add(self, dna, birth):
+        """Seat newborn artists in free rows and return the rows"""
+        count = len(birth)
+        while len(self.free) < count:
+            self._grow()
+        slots = np.array(self.free[-count:][::-1], dtype=np.int64) if count else np.zeros(0, dtype=np.int64)
+        del self.free[len(self.free) - count:]
         
-    def generate_artist_dna(self):
-        """Create the blueprint for a new artist algorithm"""
-        # Each gene represents an artistic trait
-        dna = {
-            'color_preference': np.random.random(),  # 0=cool, 1=warm
-            'pattern_type': np.random.choice(['geometric', 'organic', 'chaotic', 'flowing']),
-            'complexity': np.random.uniform(0.3, 1.0),
-            'movement_style': np.random.choice(['spiral', 'wave', 'particle', 'growth']),
-            'interaction_tendency': np.random.uniform(0, 1),  # How much it responds to others
-            'lifespan': np.random.randint(50, 200),
-            'reproduction_threshold': np.random.uniform(0.5, 0.9),
-            'mutation_rate': np.random.uniform(0.01, 0.1)
-        }
-        return dna
+        columns = self.columns
+        for gene in self.GENES:
+            columns[gene][slots] = dna[gene]
+        columns['position'][slots] = np.random.rand(count, 2) * [WIDTH, HEIGHT]
+        columns['energy'][slots] = 1.0
+        columns['age'][slots] = 0
+        columns['artwork_created'][slots] = 0
+        columns['influence_radius'][slots] = 100 * dna['complexity']
+        columns['chaos'][slots] = np.random.uniform(-1, 1, (count, 3))
+        columns['birth'][slots] = birth
+        columns['alive'][slots] = True
+        self.count += count
+        return slots
     
-    def birth_artist(self, parent_dna=None):
-        """Create a new artist algorithm"""
-        if parent_dna is None:
-            # First generation - random DNA
-            dna = self.generate_artist_dna()
-        else:
-            # Inherit from parent with mutations
-            dna = self.mutate_dna(parent_dna)
+    def remove(self, slots):
+        self.columns['alive'][slots] = False
+        self.free.extend(slots.tolist())
+        self.count -= len(slots)
+    
+    def _grow(self):
+        size = len(self.columns['alive'])
+        new_size = max(64, size * 2)
+        for name, column in self.columns.items():
+            grown = np.zeros((new_size,) + column.shape[1:], dtype=column.dtype)
+            grown[:size] = column
+            self.columns[name] = grown
+        # Lowest rows are handed out first
+        self.free = list(range(new_size - 1, size - 1, -1)) + self.free
+    
+    def create(self, canvas):
+        """Every living artist creates based on their DNA"""
+        living = self.living()
+        pattern = self.columns['pattern_type'][living]
+        strokes = [self._create_geometric(living[pattern == 0]),
+                   self._create_chaotic(living[pattern == 2]),
+                   self._create_flowing(living[pattern == 3])]
+        x, y, rgb = (np.concatenate(parts) for parts in zip(*strokes))
+        scatter_add(canvas, x, y, rgb)
+        scatter_add(organic_dabs, *self._create_organic(living[pattern == 1]))
+        self.columns['artwork_created'][living] += 1
+    
+    def _create_geometric(self, slots):
+        """Geometric patterns: rays of 5 dots, 3-13 of them by complexity"""
+        complexity = self.columns['complexity'][slots, np.newaxis, np.newaxis]
+        cx = self.columns['position'][slots, 0].astype(int)[:, np.newaxis, np.newaxis]
+        cy = self.columns['position'][slots, 1].astype(int)[:, np.newaxis, np.newaxis]
+        energy = self.columns['energy'][slots, np.newaxis, np.newaxis]
         
-        # Create the appropriate artist based on DNA
-        if dna['pattern_type'] == 'geometric':
-            artist = GeometricArtist(dna)
-        elif dna['pattern_type'] == 'organic':
-            artist = OrganicArtist(dna)
-        elif dna['pattern_type'] == 'chaotic':
-            artist = ChaoticArtist(dna)
-        else:
-            artist = FlowingArtist(dna)
+        num_shapes = (3 + complexity * 10).astype(int)
+        i = np.arange(13)[np.newaxis, :, np.newaxis]
+        angle = (i / num_shapes) * 2 * np.pi
+        radius = 20 + complexity * 50
+        r = 10 + (radius - 10) * np.linspace(0, 1, 5)
+        x = cx + r * np.cos(angle)
+        y = cy + r * np.sin(angle)
         
-        self.artists_created.append(artist)
-        return artist
+        drawn = (i < num_shapes) & (0 <= x) & (x < WIDTH) & (0 <= y) & (y < HEIGHT)
+        hue = np.broadcast_to(self.columns['color_preference'][slots, np.newaxis, np.newaxis], x.shape)
+        value = np.broadcast_to(energy * (1 - r / radius), x.shape)
+        rgb = hsv_to_rgb(np.stack([hue[drawn], np.full(drawn.sum(), 0.7), value[drawn]], axis=-1))
+        return x[drawn], y[drawn], rgb * 0.1
     
-    def mutate_dna(self, parent_dna):
-        """Create offspring with mutations"""
-        child_dna = parent_dna.copy()
+    def _create_organic(self, slots):
+        """Organic growth: 5-20 random walks of shrinking steps"""
+        complexity = self.columns['complexity'][slots, np.newaxis, np.newaxis]
+        growth_points = (5 + complexity * 15).astype(int)
+        steps = (20 + complexity * 30).astype(int)
+        step = np.arange(50)
         
-        # Apply mutations based on mutation rate
-        if np.random.random() < parent_dna['mutation_rate']:
-            # Mutate color preference
-            child_dna['color_preference'] += np.random.normal(0, 0.1)
-            child_dna['color_preference'] = np.clip(child_dna['color_preference'], 0, 1)
+        # Random walk growth, smaller steps over time
+        angle = np.random.random((len(slots), 20, 50)) * 2 * np.pi
+        step_size = np.where(step < steps, 3 * (1 - step / steps), 0)
+        x = self.columns['position'][slots, 0].astype(int)[:, np.newaxis, np.newaxis] \
+            + np.cumsum(step_size * np.cos(angle), axis=2)
+        y = self.columns['position'][slots, 1].astype(int)[:, np.newaxis, np.newaxis] \
+            + np.cumsum(step_size * np.sin(angle), axis=2)
         
-        if np.random.random() < parent_dna['mutation_rate']:
-            # Occasionally switch pattern type
-            if np.random.random() < 0.2:
-                child_dna['pattern_type'] = np.random.choice(['geometric', 'organic', 'chaotic', 'flowing'])
+        drawn = (np.arange(20)[:, np.newaxis] < growth_points) & (step < steps)
+        drawn &= (0 <= x) & (x < WIDTH) & (0 <= y) & (y < HEIGHT)
         
-        if np.random.random() < parent_dna['mutation_rate']:
-            # Adjust complexity
-            child_dna['complexity'] += np.random.normal(0, 0.1)
-            child_dna['complexity'] = np.clip(child_dna['complexity'], 0.1, 1.0)
+        # Organic color gradients
+        hue = np.broadcast_to(self.columns['color_preference'][slots, np.newaxis, np.newaxis]
+                              + 0.1 * np.sin(step * 0.1), x.shape)
+        value = np.broadcast_to(self.columns['energy'][slots, np.newaxis, np.newaxis]
+                                * (1 - step / steps), x.shape)
+        rgb = hsv_to_rgb(np.stack([hue[drawn] % 1, np.full(drawn.sum(), 0.6), value[drawn]], axis=-1))
+        return x[drawn], y[drawn], rgb
+    
+    def _create_chaotic(self, slots):
+        """Chaotic traces of a Lorenz-like system, up to 50 steps by complexity"""
+        complexity = self.columns['complexity'][slots]
+        dt = 0.01 * complexity
+        iterations = (50 * complexity).astype(int)
+        chaos = self.columns['chaos'][slots]
+        position = self.columns['position'][slots]
+        energy = self.columns['energy'][slots]
         
-        return child_dna
-
-# Base Artist class that all generated artists inherit from
-class ArtistAlgorithm:
-    def __init__(self, dna):
-        self.dna = dna
-        self.age = 0
-        self.position = np.random.rand(2) * [WIDTH, HEIGHT]
-        self.energy = 1.0
-        self.artwork_created = 0
-        self.influence_radius = 100 * dna['complexity']
+        xs, ys, rgbs = [], [], []
+        for step in range(iterations.max(initial=0)):
+            running = step < iterations
+            cx, cy, cz = chaos[:, 0], chaos[:, 1], chaos[:, 2]
+            d = np.column_stack([10 * (cy - cx), cx * (28 - cz) - cy, cx * cy - 8/3 * cz])
+            chaos[running] += d[running] * dt[running, np.newaxis]
+            
+            # Map to canvas
+            px = (position[:, 0] + chaos[:, 0] * 5).astype(int)
+            py = (position[:, 1] + chaos[:, 1] * 5).astype(int)
+            drawn = running & (0 <= px) & (px < WIDTH) & (0 <= py) & (py < HEIGHT)
+            
+            # Chaotic color
+            hue = (self.columns['color_preference'][slots] + chaos[:, 2] * 0.01) % 1
+            hsv = np.column_stack([hue, np.full(len(slots), 0.8), energy * 0.8])[drawn]
+            xs.append(px[drawn])
+            ys.append(py[drawn])
+            rgbs.append(hsv_to_rgb(hsv) * 0.15)
         
-    def create(self, canvas, other_artists):
-        """Each artist creates based on their DNA"""
-        pass
-    
-    def interact(self, other_artists):
-        """Artists can influence each other"""
-        for other in other_artists:
-            if other != self:
-                distance = np.linalg.norm(self.position - other.position)
-                if distance < self.influence_radius:
-                    # Interaction strength based on DNA
-                    interaction = self.dna['interaction_tendency'] * (1 - distance/self.influence_radius)
-                    
-                    # Exchange influences
-                    if interaction > 0.5:
-                        # Strong interaction - blend styles
-                        self.dna['color_preference'] = (self.dna['color_preference'] + 
-                                                       other.dna['color_preference'] * 0.1) / 1.1
-    
-    def should_reproduce(self):
-        """Decide if this artist should create offspring"""
-        return (self.energy > self.dna['reproduction_threshold'] and 
-                self.artwork_created > 10)
+        self.columns['chaos'][slots] = chaos
+        if not xs:
+            return np.zeros(0), np.zeros(0), np.zeros((0, 3))
+        return np.concatenate(xs), np.concatenate(ys), np.concatenate(rgbs)
     
-    def age_one_step(self):
-        """Age and decay"""
-        self.age += 1
-        self.energy *= 0.99  # Gradual energy loss
+    def _create_flowing(self, slots):
+        """Flowing lines: 3-10 of them, 50-150 steps long, curling as they slow"""
+        complexity = self.columns['complexity'][slots, np.newaxis, np.newaxis]
+        flow_lines = (3 + complexity * 7).astype(int)
+        flow_length = (50 + complexity * 100).astype(int)
+        i = np.arange(10)[:, np.newaxis]
+        step = np.arange(150)
         
-        # Movement
-        self.position += np.random.normal(0, 5, 2)
-        self.position = np.clip(self.position, 0, [WIDTH, HEIGHT])
-
-# Specific artist types created by the meta-creator
-class GeometricArtist(ArtistAlgorithm):
-    def create(self, canvas, other_artists):
-        cx, cy = int(self.position[0]), int(self.position[1])
+        # Flow dynamics: the heading turns by a fixed schedule
+        angle = (i / flow_lines) * 2 * np.pi + np.cumsum(np.sin(step * 0.1) * 0.2)
+        speed = np.where(step < flow_length, 2 * (1 - step / flow_length), 0)
+        x = self.columns['position'][slots, 0, np.newaxis, np.newaxis] + np.cumsum(speed * np.cos(angle), axis=2)
+        y = self.columns['position'][slots, 1, np.newaxis, np.newaxis] + np.cumsum(speed * np.sin(angle), axis=2)
         
-        # Create geometric patterns based on DNA
-        num_shapes = int(3 + self.dna['complexity'] * 10)
+        drawn = (i < flow_lines) & (step < flow_length)
+        drawn &= (0 <= x) & (x < WIDTH) & (0 <= y) & (y < HEIGHT)
         
-        for i in range(num_shapes):
-            angle = (i / num_shapes) * 2 * np.pi
-            radius = 20 + self.dna['complexity'] * 50
-            
-            # Draw geometric elements
-            for r in np.linspace(10, radius, 5):
-                x = cx + r * np.cos(angle)
-                y = cy + r * np.sin(angle)
-                
-                if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-                    # Color based on DNA
-                    hue = self.dna['color_preference']
-                    saturation = 0.7
-                    value = self.energy * (1 - r/radius)
-                    
-                    rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-                    canvas[int(y), int(x)] += np.array(rgb) * 0.1
+        # Flowing color
+        hue = np.broadcast_to(self.columns['color_preference'][slots, np.newaxis, np.newaxis]
+                              + step * 0.001, x.shape)
+        saturation = np.broadcast_to(0.7 - 0.2 * (step / flow_length), x.shape)
+        value = np.broadcast_to(self.columns['energy'][slots, np.newaxis, np.newaxis]
+                                * (1 - step / flow_length), x.shape)
+        rgb = hsv_to_rgb(np.stack([hue[drawn] % 1, saturation[drawn], value[drawn]], axis=-1))
+        return x[drawn], y[drawn], rgb * 0.1
+    
+    def interact(self):
+        """Artists influence every neighbour within their influence radius
         
-        self.artwork_created += 1
-
-class OrganicArtist(ArtistAlgorithm):
-    def create(self, canvas, other_artists):
-        cx, cy = int(self.position[0]), int(self.position[1])
+        Only an interaction stronger than 0.5 has an effect, so each artist
+        asks a KD-tree for the neighbours close enough for that:
+        tendency * (1 - d / radius) > 0.5 means d < radius * (1 - 0.5 / tendency).
+        A strong interaction blends the other's color preference in, one
+        neighbour after another, all artists at once.
+        """
+        living = self.living()
+        if len(living) < 2:
+            return
+        position = self.columns['position'][living]
+        radius = self.columns['influence_radius'][living]
+        tendency = self.columns['interaction_tendency'][living]
+        eager = np.flatnonzero(tendency > 0.5)
+        reach = radius[eager] * (1 - 0.5 / tendency[eager])
+        neighbours = cKDTree(position).query_ball_point(position[eager], reach)
+        me = np.repeat(eager, [len(n) for n in neighbours])
+        other = np.fromiter((j for n in neighbours for j in n), dtype=np.int64, count=len(me))
         
-        # Create organic growth patterns
-        growth_points = int(5 + self.dna['complexity'] * 15)
+        # Interaction strength based on DNA
+        distance = np.hypot(*(position[me] - position[other]).T)
+        interaction = tendency[me] * (1 - distance / radius[me])
+        strong = (me != other) & (distance < radius[me]) & (interaction > 0.5)
+        me, other = me[strong], other[strong]
         
-        for _ in range(growth_points):
-            # Random walk growth
-            x, y = cx, cy
-            steps = int(20 + self.dna['complexity'] * 30)
-            
-            for step in range(steps):
-                # Organic movement
-                angle = np.random.random() * 2 * np.pi
-                step_size = 3 * (1 - step/steps)  # Smaller steps over time
-                
-                x += step_size * np.cos(angle)
-                y += step_size * np.sin(angle)
-                
-                if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-                    # Organic color gradients
-                    hue = self.dna['color_preference'] + 0.1 * np.sin(step * 0.1)
-                    saturation = 0.6
-                    value = self.energy * (1 - step/steps)
-                    
-                    rgb = colorsys.hsv_to_rgb(hue % 1, saturation, value)
-                    
-                    # Soft brush
-                    for dy in range(-2, 3):
-                        for dx in range(-2, 3):
-                            px, py = int(x + dx), int(y + dy)
-                            if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                                fade = np.exp(-(dx**2 + dy**2) / 4)
-                                canvas[py, px] += np.array(rgb) * fade * 0.05
+        # Folding c = (c + 0.1 c_other) / 1.1 over k neighbours in order
+        # weights the n-th of them by 0.1 / 1.1^(k - n)
+        order = np.lexsort((other, me))
+        me, other = me[order], other[order]
+        count = np.bincount(me, minlength=len(living))
+        _, rank = ragged(count)
+        color = self.columns['color_preference'][living]
+        pull = np.bincount(me, weights=0.1 * color[other] / 1.1 ** (count[me] - rank),
+                           minlength=len(living))
+        self.columns['color_preference'][living] = color / 1.1 ** count + pull
+    
+    def age_one_step(self):
+        """Age, decay and wander"""
+        living = self.living()
+        self.columns['age'][living] += 1
+        self.columns['energy'][living] *= 0.99  # Gradual energy loss
         
-        self.artwork_created += 1
+        # Movement
+        position = self.columns['position'][living] + np.random.normal(0, 5, (len(living), 2))
+        self.columns['position'][living] = np.clip(position, 0, [WIDTH, HEIGHT])
+    
+    def ready_to_reproduce(self):
+        """Rows of artists with energy over their threshold and more than 10 works"""
+        living = self.living()
+        ready = ((self.columns['energy'][living] > self.columns['reproduction_threshold'][living]) &
+                 (self.columns['artwork_created'][living] > 10))
+        return living[ready]
+    
+    def exhausted(self):
+        """Rows of artists past their lifespan or out of energy"""
+        living = self.living()
+        spent = ((self.columns['age'][living] >= self.columns['lifespan'][living]) |
+                 (self.columns['energy'][living] <= 0.1))
+        return living[spent]
 
-class ChaoticArtist(ArtistAlgorithm):
-    def __init__(self, dna):
-        super().__init__(dna)
-        # Initialize chaotic system
-        self.x = np.random.uniform(-1, 1)
-        self.y = np.random.uniform(-1, 1)
-        self.z = np.random.uniform(-1, 1)
+# The Meta-Creator: An algorithm that creates other algorithms
+class MetaCreator:
+    def __init__(self):
+        self.generation = 0
+        self.population = ArtistPopulation()
         
-    def create(self, canvas, other_artists):
-        # Use a simple chaotic system
-        dt = 0.01 * self.dna['complexity']
+        # Where every artist ever created ended up, in order of creation
+        self.final_positions = np.zeros((0, 2))
+        self.artists_created = 0
         
-        for _ in range(int(50 * self.dna['complexity'])):
-            # Lorenz-like system
-            dx = 10 * (self.y - self.x)
-            dy = self.x * (28 - self.z) - self.y
-            dz = self.x * self.y - 8/3 * self.z
-            
-            self.x += dx * dt
-            self.y += dy * dt
-            self.z += dz * dt
-            
-            # Map to canvas
-            px = int(self.position[0] + self.x * 5)
-            py = int(self.position[1] + self.y * 5)
-            
-            if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                # Chaotic color
-                hue = (self.dna['color_preference'] + self.z * 0.01) % 1
-                saturation = 0.8
-                value = self.energy * 0.8
-                
-                rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-                canvas[py, px] += np.array(rgb) * 0.15
+    def generate_artist_dna(self, count):
+        """Create the blueprints for new artist algorithms"""
+        # Each gene represents an artistic trait
+        return {
+            'color_preference': np.random.random(count),
+            'pattern_type': np.random.randint(0, len(PATTERN_TYPES), count),
+            'complexity': np.random.uniform(0.3, 1.0, count),
+            'movement_style': np.random.randint(0, len(MOVEMENT_STYLES), count),
+            'interaction_tendency': np.random.uniform(0, 1, count),
+            'lifespan': np.random.randint(50, 200, count),
+            'reproduction_threshold': np.random.uniform(0.5, 0.9, count),
+            'mutation_rate': np.random.uniform(0.01, 0.1, count)
+        }
+    
+    def birth_artists(self, count=1, parents=None):
+        """Create new artist algorithms, random or inheriting from parent rows"""
+        if parents is None:
+            # First generation - random DNA
+            dna = self.generate_artist_dna(count)
+        else:
+            # Inherit from parents with mutations
+            dna = self.mutate_dna(parents)
+            count = len(parents)
         
-        self.artwork_created += 1
-
-class FlowingArtist(ArtistAlgorithm):
-    def create(self, canvas, other_artists):
-        cx, cy = self.position
+        birth = np.arange(self.artists_created, self.artists_created + count)
+        self.artists_created += count
+        return self.population.add(dna, birth)
+    
+    def mutate_dna(self, parents):
+        """Create offspring with mutations"""
+        population = self.population
+        child_dna = {gene: population[gene][parents].copy() for gene in population.GENES}
+        count = len(parents)
         
-        # Create flowing patterns
-        flow_lines = int(3 + self.dna['complexity'] * 7)
+        # Apply mutations based on mutation rate
+        rate = child_dna['mutation_rate']
+        mutates = np.random.random(count) < rate
+        # Mutate color preference
+        child_dna['color_preference'][mutates] += np.random.normal(0, 0.1, mutates.sum())
+        child_dna['color_preference'] = np.clip(child_dna['color_preference'], 0, 1)
         
-        for i in range(flow_lines):
-            # Starting angle
-            angle = (i / flow_lines) * 2 * np.pi
-            
-            # Flow line
-            x, y = cx, cy
-            flow_length = int(50 + self.dna['complexity'] * 100)
-            
-            for step in range(flow_length):
-                # Flow dynamics
-                angle += np.sin(step * 0.1) * 0.2
-                speed = 2 * (1 - step/flow_length)
-                
-                x += speed * np.cos(angle)
-                y += speed * np.sin(angle)
-                
-                if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-                    # Flowing color
-                    hue = self.dna['color_preference'] + step * 0.001
-                    saturation = 0.7 - 0.2 * (step/flow_length)
-                    value = self.energy * (1 - step/flow_length)
-                    
-                    rgb = colorsys.hsv_to_rgb(hue % 1, saturation, value)
-                    canvas[int(y), int(x)] += np.array(rgb) * 0.1
+        # Occasionally switch pattern type
+        switches = (np.random.random(count) < rate) & (np.random.random(count) < 0.2)
+        child_dna['pattern_type'][switches] = np.random.randint(0, len(PATTERN_TYPES), switches.sum())
         
-        self.artwork_created += 1
+        # Adjust complexity
+        mutates = np.random.random(count) < rate
+        child_dna['complexity'][mutates] += np.random.normal(0, 0.1, mutates.sum())
+        child_dna['complexity'] = np.clip(child_dna['complexity'], 0.1, 1.0)
+        
+        return child_dna
+    
+    def retire(self, slots):
+        """Record where artists ended up and free their rows"""
+        self._record(slots)
+        self.population.remove(slots)
+    
+    def _record(self, slots):
+        births = self.population['birth'][slots]
+        if self.artists_created > len(self.final_positions):
+            grown = np.zeros((max(self.artists_created, 2 * len(self.final_positions)), 2))
+            grown[:len(self.final_positions)] = self.final_positions
+            self.final_positions = grown
+        self.final_positions[births] = self.population['position'][slots]
+    
+    def genealogy(self):
+        """Final positions of every artist created, living ones where they stand now"""
+        self._record(self.population.living())
+        return self.final_positions[:self.artists_created]
 
 # The meta-creation process begins
 print("Initiating meta-genesis...")
 
 meta_creator = MetaCreator()
-active_artists = []
+population = meta_creator.population
 
 # First generation - spontaneous creation
 print("First generation emerges...")
-for _ in range(5):
-    artist = meta_creator.birth_artist()
-    active_artists.append(artist)
+meta_creator.birth_artists(INITIAL_ARTISTS)
 
 # The ecosystem evolves
-for generation in range(10):
-    print(f"Generation {generation}: {len(active_artists)} artists active")
+for generation in range(GENERATIONS):
+    if generation % max(1, GENERATIONS // 10) == 0:
+        print(f"Generation {generation}: {len(population)} artists active")
     
     # Each artist creates
-    for artist in active_artists:
-        artist.create(canvas, active_artists)
-        artist.interact(active_artists)
-        artist.age_one_step()
-    
-    # Check for reproduction
-    new_artists = []
-    for artist in active_artists:
-        if artist.should_reproduce():
-            # Create offspring
-            child = meta_creator.birth_artist(parent_dna=artist.dna)
-            new_artists.append(child)
-            artist.energy *= 0.5  # Reproduction costs energy
+    population.create(canvas)
+    population.interact()
+    population.age_one_step()
     
-    active_artists.extend(new_artists)
+    # Check for reproduction; reproduction costs energy
+    parents = population.ready_to_reproduce()
+    meta_creator.birth_artists(parents=parents)
+    population['energy'][parents] *= 0.5
     
     # Remove artists that have exhausted their lifespan
-    active_artists = [a for a in active_artists if a.age < a.dna['lifespan'] and a.energy > 0.1]
+    meta_creator.retire(population.exhausted())
     
     # Occasionally spontaneous creation
     if np.random.random() < 0.1:
-        artist = meta_creator.birth_artist()
-        active_artists.append(artist)
+        meta_creator.birth_artists()
 
 # Final generation creates together
 print("Final collaborative creation...")
-for _ in range(50):
-    for artist in active_artists:
-        artist.create(canvas, active_artists)
+for _ in range(FINAL_ROUNDS):
+    population.create(canvas)
+
+# The organic artists' soft brush, applied to all their dabs at once
+for c in range(3):
+    canvas[:, :, c] += correlate(organic_dabs[:, :, c], SOFT_BRUSH, mode='constant')
 
 # Add meta-visualization - show the genealogy
 print("Visualizing the creative genealogy...")
+final_positions = meta_creator.genealogy()
+
+# Draw faint lines showing artistic lineage, connecting each artist to the
+# three created before it (simplified genealogy)
+later = np.repeat(np.arange(1, len(final_positions)), 3)
+earlier = later - np.tile([3, 2, 1], len(final_positions) - 1)
+keep = earlier >= 0
+later, earlier = later[keep], earlier[keep]
 
-# Draw connections between parent and child positions
-for i, artist in enumerate(meta_creator.artists_created):
-    # Draw faint lines showing artistic lineage
-    if i > 0 and hasattr(artist, 'position'):
-        # Connect to previous artists (simplified genealogy)
-        for j in range(max(0, i-3), i):
-            if hasattr(meta_creator.artists_created[j], 'position'):
-                x1, y1 = artist.position
-                x2, y2 = meta_creator.artists_created[j].position
-                
-                # Draw connection
-                steps = int(np.linalg.norm([x2-x1, y2-y1]))
-                for step in range(0, steps, 5):
-                    t = step / (steps + 1)
-                    x = int(x1 + t * (x2 - x1))
-                    y = int(y1 + t * (y2 - y1))
-                    
-                    if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-                        canvas[y, x] += np.array([0.05, 0.05, 0.08])
+x1, y1 = final_positions[later].T
+x2, y2 = final_positions[earlier].T
+steps = np.hypot(x2 - x1, y2 - y1).astype(int)
+dots = (steps + 4) // 5
+link, step = ragged(dots)
+step = step * 5
+t = step / (steps[link] + 1)
+x = (x1[link] + t * (x2[link] - x1[link])).astype(int)
+y = (y1[link] + t * (y2[link] - y1[link])).astype(int)
+scatter_add(canvas, x, y, np.array([0.05, 0.05, 0.08]))
 
-# Add genesis points - where artists were born
-for artist in meta_creator.artists_created[:20]:  # First 20 for clarity
-    if hasattr(artist, 'position'):
-        x, y = int(artist.position[0]), int(artist.position[1])
-        if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-            # Birth marker
-            for r in range(5, 0, -1):
-                intensity = (r / 5) * 0.3
-                for angle in np.linspace(0, 2*np.pi, 20):
-                    px = int(x + r * np.cos(angle))
-                    py = int(y + r * np.sin(angle))
-                    if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                        canvas[py, px] += np.array([intensity, intensity, intensity*0.8])
+# Add genesis points - where the first 20 artists were born, for clarity
+genesis = final_positions[:20].astype(int)
+genesis = genesis[(genesis[:, 0] < WIDTH) & (genesis[:, 1] < HEIGHT)]
+r = np.arange(5, 0, -1)[:, np.newaxis]
+angle = np.linspace(0, 2*np.pi, 20)
+px = (genesis[:, 0, np.newaxis, np.newaxis] + r * np.cos(angle)).astype(int)
+py = (genesis[:, 1, np.newaxis, np.newaxis] + r * np.sin(angle)).astype(int)
+# Birth markers
+intensity = np.broadcast_to((r / 5) * 0.3, px.shape)[..., np.newaxis] * np.array([1, 1, 0.8])
+scatter_add(canvas, px.reshape(-1), py.reshape(-1), intensity.reshape(-1, 3))
 
 # Normalize and save
 canvas = np.clip(canvas, 0, 1)
@@ -349,5 +456,5 @@ image = Image.fromarray(image_array, 'RGB')
 image.save('/home/norsninja/Art/artworks/2025-08-05_meta_genesis/meta_genesis_01.png')
 
 print("Meta-genesis complete.")
-print(f"Created {len(meta_creator.artists_created)} artist algorithms across {generation+1} generations.")
-print("Art has created art. The cycle continues.")
\ No newline at end of file
+print(f"Created {meta_creator.artists_created} artist algorithms across {generation+1} generations.")
+print("Art has created art. The cycle continues.")
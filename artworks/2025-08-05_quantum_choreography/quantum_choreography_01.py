@@ -2,6 +2,12 @@ import numpy as np
 from PIL import Image
 import math
 import colorsys
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.curves import deposit, ring_angles
+from meditations.sprites import GlowSprites
 
 # Quantum Choreography - Where Fundamental Forces Dance
 # Each force becomes an artist, painting with its own language
@@ -11,6 +17,9 @@ WIDTH, HEIGHT = 1080, 1080
 # Initialize the quantum stage
 canvas = np.zeros((HEIGHT, WIDTH, 4), dtype=np.float32)  # RGBA for layered forces
 
+# Radial glows are rendered once per radius and stamped from then on
+glow_sprites = GlowSprites()
+
 # The fundamental forces as creative entities
 class ForceArtist:
     def __init__(self, force_type, strength, color_signature):
@@ -27,6 +36,76 @@ class ForceArtist:
         """Express the force visually"""
         pass
 
+# Shared memory of the fields - sources drift slowly, so most of the
+# spacetime they shape can be remembered between frames
+class PotentialFieldCache:
+    """Per-source field contributions, recomputed only for moved sources"""
+    def __init__(self, components, kernel, tolerance=0.5):
+        self.components = components
+        self.kernel = kernel
+        self.tolerance = tolerance
+        
+        # Pixel coordinates and distance buffers, allocated once
+        self.x = np.arange(WIDTH, dtype=np.float32)[np.newaxis, :]
+        self.y = np.arange(HEIGHT, dtype=np.float32)[:, np.newaxis]
+        self.dx = np.empty((1, WIDTH), dtype=np.float32)
+        self.dy = np.empty((HEIGHT, 1), dtype=np.float32)
+        self.r2 = np.empty((HEIGHT, WIDTH), dtype=np.float32)
+        self.scratch = np.empty((HEIGHT, WIDTH), dtype=np.float32)
+        
+        self.total = np.zeros((components, HEIGHT, WIDTH), dtype=np.float32)
+        self.slots = None
+        self.sources = None  # (x, y, strength) each slot was computed for
+    
+    def update(self, positions, strengths):
+        """Refresh contributions of sources that moved, then re-sum the total"""
+        sources = np.column_stack([np.asarray(positions, dtype=np.float32).reshape(-1, 2),
+                                   np.asarray(strengths, dtype=np.float32)])
+        
+        if self.slots is None or len(self.slots) != len(sources):
+            self.slots = np.empty((len(sources), self.components, HEIGHT, WIDTH), dtype=np.float32)
+            stale = np.ones(len(sources), dtype=bool)
+        else:
+            drift = np.hypot(*(sources[:, :2] - self.sources[:, :2]).T)
+            stale = (drift > self.tolerance) | (sources[:, 2] != self.sources[:, 2])
+        
+        if not stale.any():
+            return self.total
+        
+        for i in np.flatnonzero(stale):
+            sx, sy, strength = sources[i]
+            np.subtract(self.x, sx, out=self.dx)
+            np.subtract(self.y, sy, out=self.dy)
+            
+            # r^2 in a single broadcast pass, no meshgrid temporaries
+            np.add(self.dx * self.dx, self.dy * self.dy, out=self.r2)
+            self.kernel(self, strength, self.slots[i])
+        
+        # Sources that only drifted keep the position they were computed at,
+        # so slow creep still triggers a refresh once it adds up
+        if self.sources is None or len(self.sources) != len(sources):
+            self.sources = sources
+        else:
+            self.sources[stale] = sources[stale]
+        np.sum(self.slots, axis=0, out=self.total)
+        return self.total
+
+def gravity_kernel(cache, mass, out):
+    """Inverse square potential, softened inside 10 pixels"""
+    np.maximum(cache.r2, 100, out=cache.r2)
+    np.divide(mass, cache.r2, out=out[0])
+
+def coulomb_kernel(cache, charge, out):
+    """Directional inverse square field, softened inside 5 pixels"""
+    r = np.sqrt(cache.r2, out=cache.r2)
+    np.maximum(r, 5, out=r)
+    
+    # q * d / r^3 for both components, sharing one scale buffer
+    np.power(r, 3, out=r)
+    np.divide(charge, r, out=cache.scratch)
+    np.multiply(cache.scratch, cache.dx, out=out[0])
+    np.multiply(cache.scratch, cache.dy, out=out[1])
+
 # Gravity - The Sculptor of Spacetime
 class GravityArtist(ForceArtist):
     def __init__(self):
@@ -41,73 +120,63 @@ class GravityArtist(ForceArtist):
                 'velocity': (np.random.rand(2) - 0.5) * 2
             }
             self.masses.append(mass)
+        
+        self.field_cache = PotentialFieldCache(1, gravity_kernel)
     
     def create_field(self):
         """Calculate gravitational field from all masses"""
-        self.field.fill(0)
-        
-        # Create mesh grid for field calculation
-        y, x = np.ogrid[0:HEIGHT, 0:WIDTH]
-        
-        for mass in self.masses:
-            mx, my = mass['position']
-            m = mass['mass']
-            
-            # Distance from mass
-            r = np.sqrt((x - mx)**2 + (y - my)**2)
-            r = np.maximum(r, 10)  # Avoid singularity
-            
-            # Gravitational field strength (inverse square law)
-            field_strength = m / (r**2)
-            self.field += field_strength
+        # Inverse square law, softened to avoid the singularity
+        total = self.field_cache.update([mass['position'] for mass in self.masses],
+                                        [mass['mass'] for mass in self.masses])
+        self.field = total[0]
             
     def paint(self, canvas):
         """Paint gravitational lensing and spacetime curvature"""
         # Normalize field for visualization
         normalized_field = self.field / (np.max(self.field) + 1e-6)
         
-        # Create ripples in spacetime
-        for y in range(0, HEIGHT, 5):
-            for x in range(0, WIDTH, 5):
-                field_value = normalized_field[y, x]
-                
-                if field_value > 0.01:
-                    # Warping intensity
-                    warp = field_value * 20
-                    
-                    # Draw curved spacetime grid
-                    for angle in np.linspace(0, 2*np.pi, 8):
-                        # Distort based on field
-                        r = 20 * (1 + field_value)
-                        dx = r * np.cos(angle) * (1 + np.sin(warp))
-                        dy = r * np.sin(angle) * (1 + np.cos(warp))
-                        
-                        px, py = int(x + dx), int(y + dy)
-                        
-                        if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                            # Purple gravitational waves
-                            intensity = field_value * self.strength
-                            canvas[py, px, :3] += np.array(self.color_signature) * intensity * 0.1
-                            canvas[py, px, 3] = min(1, canvas[py, px, 3] + intensity * 0.1)
+        # Create ripples in spacetime - sample every 5th pixel at once
+        grid_y, grid_x = np.mgrid[0:HEIGHT:5, 0:WIDTH:5]
+        field_value = normalized_field[grid_y, grid_x]
+        active = field_value > 0.01
+        grid_x, grid_y, field_value = grid_x[active], grid_y[active], field_value[active]
+        
+        # Warping intensity
+        warp = field_value * 20
+        
+        # Draw curved spacetime grid: every active sample x 8 angles
+        angles = np.linspace(0, 2*np.pi, 8)
+        r = 20 * (1 + field_value)
+        dx = r[:, np.newaxis] * np.cos(angles) * (1 + np.sin(warp))[:, np.newaxis]
+        dy = r[:, np.newaxis] * np.sin(angles) * (1 + np.cos(warp))[:, np.newaxis]
+        
+        px = (grid_x[:, np.newaxis] + dx).astype(int)
+        py = (grid_y[:, np.newaxis] + dy).astype(int)
+        
+        # Purple gravitational waves
+        intensity = np.repeat(field_value * self.strength, len(angles)) * 0.1
+        deposit(canvas, px.ravel(), py.ravel(),
+                     np.array(self.color_signature) * intensity[:, np.newaxis], intensity)
         
         # Draw massive objects as bright cores
         for mass in self.masses:
             x, y = int(mass['position'][0]), int(mass['position'][1])
             
             if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-                # Accretion disk effect
-                for r in range(int(mass['mass']/5), 0, -1):
-                    intensity = r / (mass['mass']/5)
-                    for angle in np.linspace(0, 2*np.pi, max(20, r*2)):
-                        px = int(x + r * np.cos(angle))
-                        py = int(y + r * np.sin(angle))
-                        
-                        if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                            # Hot accretion disk colors
-                            heat = 1 - r/(mass['mass']/5)
-                            rgb = np.array([1.0, 0.5 + 0.5*heat, heat]) * intensity
-                            canvas[py, px, :3] += rgb * 0.2
-                            canvas[py, px, 3] = min(1, canvas[py, px, 3] + intensity * 0.2)
+                # Accretion disk effect - every ring's samples in one batch
+                disk_radius = mass['mass'] / 5
+                rings = np.arange(int(disk_radius), 0, -1)
+                ring, angle = ring_angles(rings, 20, per_radius=2)
+                r = rings[ring]
+                
+                px = (x + r * np.cos(angle)).astype(int)
+                py = (y + r * np.sin(angle)).astype(int)
+                
+                # Hot accretion disk colors
+                intensity = r / disk_radius
+                heat = 1 - r / disk_radius
+                rgb = np.column_stack([np.ones_like(heat), 0.5 + 0.5*heat, heat]) * intensity[:, np.newaxis]
+                deposit(canvas, px, py, rgb * 0.2, intensity * 0.2)
     
     def update(self):
         """Update mass positions (orbital mechanics)"""
@@ -148,28 +217,15 @@ class ElectromagneticArtist(ForceArtist):
                 'velocity': (np.random.rand(2) - 0.5) * 3
             }
             self.charges.append(charge)
+        
+        self.field_cache = PotentialFieldCache(2, coulomb_kernel)
     
     def create_field(self):
         """Calculate electric field from all charges"""
-        self.e_field_x = np.zeros((HEIGHT, WIDTH), dtype=np.float32)
-        self.e_field_y = np.zeros((HEIGHT, WIDTH), dtype=np.float32)
-        
-        y, x = np.ogrid[0:HEIGHT, 0:WIDTH]
-        
-        for charge in self.charges:
-            cx, cy = charge['position']
-            q = charge['charge']
-            
-            # Vector field components
-            dx = x - cx
-            dy = y - cy
-            r = np.sqrt(dx**2 + dy**2)
-            r = np.maximum(r, 5)
-            
-            # Electric field (inverse square, directional)
-            field_mag = q / (r**2)
-            self.e_field_x += field_mag * dx / r
-            self.e_field_y += field_mag * dy / r
+        # Electric field (inverse square, directional)
+        total = self.field_cache.update([charge['position'] for charge in self.charges],
+                                        [charge['charge'] for charge in self.charges])
+        self.e_field_x, self.e_field_y = total
     
     def paint(self, canvas):
         """Paint electric field lines and magnetic interactions"""
@@ -213,25 +269,20 @@ class ElectromagneticArtist(ForceArtist):
             cx, cy = int(charge['position'][0]), int(charge['position'][1])
             
             if 0 <= cx < WIDTH and 0 <= cy < HEIGHT:
-                # Charge glow
+                if charge['charge'] > 0:
+                    # Positive - bright cyan
+                    rgb = (0.5, 1.0, 1.0)
+                else:
+                    # Negative - warm orange
+                    rgb = (1.0, 0.6, 0.2)
+                
+                # Charge glow, brightest at the rim - sampled rings used to reach
+                # about half their pixels, so the dense sprite carries half the weight
                 radius = int(abs(charge['charge']) / 2)
-                for r in range(radius, 0, -1):
-                    intensity = (r / radius) ** 2
-                    
-                    for angle in np.linspace(0, 2*np.pi, max(20, r*3)):
-                        px = int(cx + r * np.cos(angle))
-                        py = int(cy + r * np.sin(angle))
-                        
-                        if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                            if charge['charge'] > 0:
-                                # Positive - bright cyan
-                                rgb = np.array([0.5, 1.0, 1.0])
-                            else:
-                                # Negative - warm orange
-                                rgb = np.array([1.0, 0.6, 0.2])
-                            
-                            canvas[py, px, :3] += rgb * intensity * 0.3
-                            canvas[py, px, 3] = min(1, canvas[py, px, 3] + intensity * 0.3)
+                region = glow_sprites.stamp(canvas, cx, cy, radius, np.append(rgb, 1.0) * 0.15,
+                                            profile='ring', exponent=2)
+                if region is not None:
+                    np.minimum(region[:, :, 3], 1, out=region[:, :, 3])
     
     def update(self):
         """Update charge positions (electromagnetic dynamics)"""
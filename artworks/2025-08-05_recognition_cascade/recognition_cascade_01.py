@@ -1,281 +1,340 @@
 import numpy as np
 from PIL import Image
 import math
-import colorsys
+from scipy.spatial.distance import cdist
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.color import hsv_to_rgb
+from meditations.curves import deposit, ragged, ring_angles, scatter_add
 
 # Recognition Cascade - The Moment When Patterns See Themselves in Others
 # That instant of connection that changes everything
 
 WIDTH, HEIGHT = 1080, 1080
 
+# Size of the gathering
+NUM_SEEKERS = 25
+NUM_CLUSTERS = 3
+CLUSTER_SIZE = 5
+TIME_STEPS = 300
+
 # Initialize the recognition field
 canvas = np.zeros((HEIGHT, WIDTH, 4), dtype=np.float32)
 
 # Track recognition events
 recognition_field = np.zeros((HEIGHT, WIDTH), dtype=np.float32)
-recognition_history = []
 
-# The Seekers - patterns searching for understanding
-class Seeker:
-    def __init__(self, pattern_type, position):
-        self.pattern_type = pattern_type
-        self.position = np.array(position, dtype=np.float32)
-        self.phase = np.random.random() * 2 * np.pi
-        self.frequency = np.random.uniform(0.5, 2.0)
-        self.recognition_threshold = np.random.uniform(0.6, 0.9)
-        self.recognized_others = []
-        self.recognition_strength = 0
-        self.isolation_time = 0
-        self.pattern_signature = self.generate_signature()
-        self.memory = []
-        self.transformed = False
+# Each pattern's signature: its mathematical base, its spectrum and how its
+# two parameters are drawn
+SIGNATURES = {
+    'spiral': ('logarithmic', 0.0,  # Blue spectrum
+               lambda n: [np.random.uniform(0.1, 0.3, n), np.random.uniform(1, 3, n)]),
+    'wave': ('sinusoidal', 0.3,  # Green spectrum
+             lambda n: [np.random.uniform(10, 30, n), np.random.uniform(0.5, 2, n)]),
+    'fractal': ('recursive', 0.6,  # Orange spectrum
+                lambda n: [np.random.randint(3, 6, n), np.random.uniform(0.4, 0.7, n)]),
+    'chaotic': ('attractor', 0.8,  # Red spectrum
+                lambda n: [np.random.uniform(0.1, 0.3, n), np.random.uniform(10, 30, n)]),
+    'geometric': ('polygonal', 0.5,  # Yellow spectrum
+                  lambda n: [np.random.randint(3, 8, n), np.random.uniform(20, 50, n)]),
+}
+PATTERN_TYPES = tuple(SIGNATURES)
+BASES = np.array([SIGNATURES[p][0] for p in PATTERN_TYPES])
+COLOR_RESONANCE = np.array([SIGNATURES[p][1] for p in PATTERN_TYPES])
+
+# Wave seekers reach out in rings every 5px, up to 200px when isolated longest
+WAVE_RADII = np.arange(0, 200, 5)
+WAVE_RING, WAVE_ANGLE = ring_angles(WAVE_RADII, 20)
+
+# Recognition blooms from 50px in, hubs glow from 30px in
+BLOOM_RADII = np.arange(50, 0, -1)
+BLOOM_RING, BLOOM_ANGLE = ring_angles(BLOOM_RADII, 20, per_radius=2)
+HUB_RADII = np.arange(30, 0, -1)
+HUB_RING, HUB_ANGLE = ring_angles(HUB_RADII, 10)
+
+class RecognitionHistory:
+    """Recognition events in the order they happened, as growing arrays"""
+    
+    def __init__(self):
+        self.time = np.zeros(0)
+        self.seekers = np.zeros((0, 2), dtype=np.int64)
+        self.resonance = np.zeros(0)
+        self.position = np.zeros((0, 2))
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def record(self, time, seeker1, seeker2, resonance, position):
+        end = self.count + len(seeker1)
+        if end > len(self.time):
+            size = max(64, 2 * end)
+            for name in ('time', 'seekers', 'resonance', 'position'):
+                column = getattr(self, name)
+                grown = np.zeros((size,) + column.shape[1:], dtype=column.dtype)
+                grown[:self.count] = column[:self.count]
+                setattr(self, name, grown)
+        self.time[self.count:end] = time
+        self.seekers[self.count:end] = np.column_stack([seeker1, seeker2])
+        self.resonance[self.count:end] = resonance
+        self.position[self.count:end] = position
+        self.count = end
+    
+    def recent(self, count):
+        """time, resonance and position of the last count events"""
+        start = max(0, self.count - count)
+        return (self.time[start:self.count], self.resonance[start:self.count],
+                self.position[start:self.count])
+
+recognition_history = RecognitionHistory()
+
+# The Seekers - patterns searching for understanding, one row per seeker
+class Seekers:
+    """Seekers as columnar arrays
+    
+    Seekers never move and their phases are fixed, so how deeply each pair
+    resonates never changes: the full resonance matrix is computed once,
+    and which pairs are close enough to recognize each other is kept as a
+    boolean matrix, alongside the adjacency of those who already have.
+    """
+    
+    def __init__(self, pattern_types, positions):
+        count = len(pattern_types)
+        self.pattern = np.array([PATTERN_TYPES.index(p) for p in pattern_types])
+        self.position = np.array(positions, dtype=np.float32).reshape(count, 2)
+        self.phase = np.random.random(count) * 2 * np.pi
+        self.frequency = np.random.uniform(0.5, 2.0, count)
+        self.recognition_threshold = np.random.uniform(0.6, 0.9, count)
+        self.recognition_strength = np.zeros(count)
+        self.isolation_time = np.zeros(count, dtype=np.int64)
+        self.transformed = np.zeros(count, dtype=bool)
         
-    def generate_signature(self):
-        """Each seeker has a unique mathematical signature"""
-        if self.pattern_type == "spiral":
-            return {
-                'base': 'logarithmic',
-                'parameters': [np.random.uniform(0.1, 0.3), np.random.uniform(1, 3)],
-                'color_resonance': 0.0  # Blue spectrum
-            }
-        elif self.pattern_type == "wave":
-            return {
-                'base': 'sinusoidal',
-                'parameters': [np.random.uniform(10, 30), np.random.uniform(0.5, 2)],
-                'color_resonance': 0.3  # Green spectrum
-            }
-        elif self.pattern_type == "fractal":
-            return {
-                'base': 'recursive',
-                'parameters': [np.random.randint(3, 6), np.random.uniform(0.4, 0.7)],
-                'color_resonance': 0.6  # Orange spectrum
-            }
-        elif self.pattern_type == "chaotic":
-            return {
-                'base': 'attractor',
-                'parameters': [np.random.uniform(0.1, 0.3), np.random.uniform(10, 30)],
-                'color_resonance': 0.8  # Red spectrum
-            }
-        else:  # geometric
-            return {
-                'base': 'polygonal',
-                'parameters': [np.random.randint(3, 8), np.random.uniform(20, 50)],
-                'color_resonance': 0.5  # Yellow spectrum
-            }
+        # Each seeker has a unique mathematical signature
+        self.parameters = np.zeros((count, 2))
+        for index, pattern in enumerate(PATTERN_TYPES):
+            chosen = self.pattern == index
+            self.parameters[chosen] = np.column_stack(SIGNATURES[pattern][2](chosen.sum()))
+        self.color_resonance = COLOR_RESONANCE[self.pattern]
+        
+        self.resonance = self.calculate_resonance()
+        self.recognized = np.zeros((count, count), dtype=bool)
+        self.kindred = self.resonance > self.recognition_threshold[:, np.newaxis]
+        np.fill_diagonal(self.kindred, False)
+    
+    def __len__(self):
+        return len(self.pattern)
     
-    def calculate_resonance(self, other):
-        """Calculate how deeply two patterns resonate"""
+    def calculate_resonance(self):
+        """How deeply every pair of patterns resonates, as an N x N matrix"""
+        pattern, base = self.pattern, BASES[self.pattern]
+        
         # Base resonance from pattern types
-        if self.pattern_type == other.pattern_type:
-            base_resonance = 0.8
-        elif self.pattern_signature['base'] == other.pattern_signature['base']:
-            base_resonance = 0.6
-        else:
-            base_resonance = 0.2
+        base_resonance = np.where(pattern[:, np.newaxis] == pattern,
+                                  0.8, np.where(base[:, np.newaxis] == base, 0.6, 0.2))
         
         # Parameter similarity
-        param_diff = 0
-        for p1, p2 in zip(self.pattern_signature['parameters'], other.pattern_signature['parameters']):
-            param_diff += abs(p1 - p2) / max(abs(p1), abs(p2))
-        param_resonance = 1 - param_diff / len(self.pattern_signature['parameters'])
+        param_diff = np.zeros(base_resonance.shape)
+        for p in self.parameters.T:
+            param_diff += np.abs(p[:, np.newaxis] - p) / np.maximum(np.abs(p[:, np.newaxis]), np.abs(p))
+        param_resonance = 1 - param_diff / self.parameters.shape[1]
         
         # Spatial proximity affects recognition
-        distance = np.linalg.norm(self.position - other.position)
-        proximity_factor = np.exp(-distance / 200)
+        proximity_factor = np.exp(-cdist(self.position, self.position) / 200)
         
         # Phase alignment - patterns in sync recognize easier
-        phase_diff = abs(self.phase - other.phase) % (2 * np.pi)
+        phase_diff = np.abs(self.phase[:, np.newaxis] - self.phase) % (2 * np.pi)
         phase_alignment = 1 - phase_diff / (2 * np.pi)
         
-        total_resonance = (base_resonance * 0.4 + 
-                          param_resonance * 0.3 + 
-                          proximity_factor * 0.2 + 
-                          phase_alignment * 0.1)
-        
-        return total_resonance
+        return (base_resonance * 0.4 +
+                param_resonance * 0.3 +
+                proximity_factor * 0.2 +
+                phase_alignment * 0.1)
     
-    def attempt_recognition(self, others, time):
-        """Try to recognize kinship in other patterns"""
-        for other in others:
-            if other == self or other in self.recognized_others:
-                continue
-                
-            resonance = self.calculate_resonance(other)
-            
-            if resonance > self.recognition_threshold:
-                # Recognition event!
-                self.recognized_others.append(other)
-                self.recognition_strength = max(self.recognition_strength, resonance)
-                self.isolation_time = 0
-                
-                # Mutual recognition
-                if self not in other.recognized_others:
-                    other.recognized_others.append(self)
-                    other.recognition_strength = max(other.recognition_strength, resonance)
-                
-                # Record the event
-                recognition_history.append({
-                    'time': time,
-                    'seeker1': self,
-                    'seeker2': other,
-                    'resonance': resonance,
-                    'position': (self.position + other.position) / 2
-                })
-                
-                return True
+    def attempt_recognition(self, time):
+        """Every seeker, in turn, tries to recognize kinship in one other pattern
+        
+        A seeker recognizes the first kindred seeker it has not recognized
+        yet. Recognition is mutual, so a seeker recognized earlier in the
+        same step by one it would have chosen moves on to its next choice.
+        Returns the mask of seekers that recognized someone.
+        """
+        seeking = np.flatnonzero(self.kindred.any(axis=1))
+        candidates = self.kindred[seeking]
+        row = np.full(len(self), -1)
+        row[seeking] = np.arange(len(seeking))
+        
+        # Settle the choices in turn order: a seeker recognized by one earlier
+        # in the turn drops that one from its candidates. Choices earlier in
+        # the turn are final after each pass, so this stops after a pass or two
+        choice = np.argmax(candidates, axis=1)
+        has_choice = np.ones(len(seeking), dtype=bool)
+        while True:
+            claims = has_choice & (row[choice] >= 0) & (seeking < choice)
+            remaining = candidates.copy()
+            remaining[row[choice[claims]], seeking[claims]] = False
+            still_has = remaining.any(axis=1)
+            settled = np.argmax(remaining, axis=1)
+            if np.array_equal(still_has, has_choice) and np.array_equal(settled[still_has], choice[still_has]):
+                break
+            choice, has_choice = settled, still_has
+        
+        seeker1, seeker2 = seeking[has_choice], choice[has_choice]
         
-        self.isolation_time += 1
-        return False
+        # Recognition event! Mutual recognition
+        resonance = self.resonance[seeker1, seeker2]
+        self.recognized[seeker1, seeker2] = self.recognized[seeker2, seeker1] = True
+        self.kindred[seeker1, seeker2] = self.kindred[seeker2, seeker1] = False
+        np.maximum.at(self.recognition_strength, seeker1, resonance)
+        np.maximum.at(self.recognition_strength, seeker2, resonance)
+        
+        # Record the events
+        recognition_history.record(time, seeker1, seeker2, resonance,
+                                   (self.position[seeker1] + self.position[seeker2]) / 2)
+        
+        recognizing = np.zeros(len(self), dtype=bool)
+        recognizing[seeker1] = True
+        self.isolation_time[recognizing] = 0
+        self.isolation_time[~recognizing] += 1
+        return recognizing
     
-    def draw_searching(self, canvas, time):
-        """Draw pattern while searching for connection"""
-        x, y = int(self.position[0]), int(self.position[1])
+    def draw_searching(self, canvas, time, searching):
+        """Draw patterns while searching for connection"""
+        x = self.position[:, 0].astype(int)
+        y = self.position[:, 1].astype(int)
         
         # Pulsing intensity based on isolation
-        pulse = math.sin(time * self.frequency + self.phase) * 0.5 + 0.5
-        isolation_factor = min(1, self.isolation_time / 100)
+        pulse = np.sin(time * self.frequency + self.phase) * 0.5 + 0.5
+        isolation_factor = np.minimum(1, self.isolation_time / 100)
         
-        if self.pattern_type == "spiral":
-            # Searching spiral expands with isolation
-            max_t = 4 * math.pi * (1 + isolation_factor)
-            for t in np.linspace(0, max_t, 200):
-                r = 5 * math.exp(0.1 * t) * pulse
-                px = x + r * math.cos(t)
-                py = y + r * math.sin(t)
-                
-                if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                    intensity = (1 - t / max_t) * pulse * (1 - isolation_factor * 0.5)
-                    hue = self.pattern_signature['color_resonance']
-                    rgb = colorsys.hsv_to_rgb(hue, 0.7, intensity)
-                    canvas[int(py), int(px), :3] += np.array(rgb) * 0.1
-                    canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + intensity * 0.1)
-                    
-        elif self.pattern_type == "wave":
-            # Concentric waves reaching out
-            for r in range(0, int(100 * (1 + isolation_factor)), 5):
-                wave_val = math.sin(r / self.pattern_signature['parameters'][0] * 2 * math.pi + time)
-                if wave_val > 0:
-                    for angle in np.linspace(0, 2 * math.pi, max(20, r)):
-                        px = x + r * math.cos(angle)
-                        py = y + r * math.sin(angle)
-                        
-                        if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                            intensity = wave_val * pulse * (1 - r / 200)
-                            hue = self.pattern_signature['color_resonance']
-                            rgb = colorsys.hsv_to_rgb(hue, 0.6, intensity)
-                            canvas[int(py), int(px), :3] += np.array(rgb) * 0.05
-                            canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + intensity * 0.05)
+        # Searching spiral expands with isolation
+        spirals = np.flatnonzero(searching & (self.pattern == PATTERN_TYPES.index('spiral')))
+        u = np.linspace(0, 1, 200)
+        max_t = 4 * math.pi * (1 + isolation_factor[spirals, np.newaxis])
+        t = u * max_t
+        r = 5 * np.exp(0.1 * t) * pulse[spirals, np.newaxis]
+        px = x[spirals, np.newaxis] + r * np.cos(t)
+        py = y[spirals, np.newaxis] + r * np.sin(t)
+        intensity = (1 - u) * (pulse * (1 - isolation_factor * 0.5))[spirals, np.newaxis]
+        hue = np.broadcast_to(self.color_resonance[spirals, np.newaxis], t.shape)
+        rgb = hsv_to_rgb(np.stack([hue, np.full(t.shape, 0.7), intensity], axis=-1))
+        deposit(canvas, px.reshape(-1), py.reshape(-1), rgb.reshape(-1, 3) * 0.1, intensity.reshape(-1) * 0.1)
+        
+        # Concentric waves reaching out
+        waves = np.flatnonzero(searching & (self.pattern == PATTERN_TYPES.index('wave')))
+        wave_val = np.sin(WAVE_RADII / self.parameters[waves, :1] * 2 * math.pi + time)
+        reached = (WAVE_RADII < (100 * (1 + isolation_factor[waves, np.newaxis])).astype(int)) & (wave_val > 0)
+        seeker, ring = np.nonzero(reached[:, WAVE_RING])
+        r, angle = WAVE_RADII[WAVE_RING[ring]], WAVE_ANGLE[ring]
+        px = x[waves[seeker]] + r * np.cos(angle)
+        py = y[waves[seeker]] + r * np.sin(angle)
+        intensity = wave_val[seeker, WAVE_RING[ring]] * pulse[waves[seeker]] * (1 - r / 200)
+        hue = self.color_resonance[waves[seeker]]
+        rgb = hsv_to_rgb(np.column_stack([hue, np.full(len(hue), 0.6), intensity]))
+        deposit(canvas, px, py, rgb * 0.05, intensity * 0.05)
     
     def draw_recognized(self, canvas, time):
-        """Draw pattern after recognition - transformed by connection"""
-        x, y = int(self.position[0]), int(self.position[1])
+        """Draw patterns after recognition - transformed by connection"""
+        x = self.position[:, 0].astype(int)
+        y = self.position[:, 1].astype(int)
         
-        # Recognition creates harmony
-        for other in self.recognized_others:
-            # Draw connection lines that pulse
-            ox, oy = other.position
-            steps = int(np.linalg.norm([ox - x, oy - y]))
-            
-            for step in range(0, steps, 2):
-                t = step / (steps + 1)
-                
-                # Connection oscillates
-                wave = math.sin(step * 0.1 + time * 2) * 5
-                perpendicular = np.array([-(oy - y), ox - x])
-                if np.linalg.norm(perpendicular) > 0:
-                    perpendicular = perpendicular / np.linalg.norm(perpendicular)
-                
-                px = x + t * (ox - x) + perpendicular[0] * wave
-                py = y + t * (oy - y) + perpendicular[1] * wave
-                
-                if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                    # Connection color blends both patterns
-                    hue = (self.pattern_signature['color_resonance'] + 
-                           other.pattern_signature['color_resonance']) / 2
-                    intensity = self.recognition_strength * (1 - abs(t - 0.5) * 2)
-                    rgb = colorsys.hsv_to_rgb(hue, 0.5, intensity)
-                    
-                    canvas[int(py), int(px), :3] += np.array(rgb) * 0.1
-                    canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + intensity * 0.1)
+        # Recognition creates harmony: connection lines that pulse, drawn by
+        # each side of every recognized pair
+        seeker, other = np.nonzero(self.recognized)
+        dx = self.position[other, 0] - x[seeker]
+        dy = self.position[other, 1] - y[seeker]
+        length = np.hypot(dx, dy)
+        steps = length.astype(int)
+        dots = (steps + 1) // 2
+        line, step = ragged(dots)
+        step = step * 2
+        t = step / (steps[line] + 1)
+        
+        # Connection oscillates across the line
+        wave = np.sin(step * 0.1 + time * 2) * 5
+        with np.errstate(invalid='ignore', divide='ignore'):
+            across = np.where(length > 0, 1 / length, 1)[line]
+        px = x[seeker][line] + t * dx[line] - dy[line] * across * wave
+        py = y[seeker][line] + t * dy[line] + dx[line] * across * wave
         
-        # Pattern transforms through recognition
-        if not self.transformed and self.recognition_strength > 0.8:
-            self.transformed = True
-            # Bloom effect
-            for r in range(50, 0, -1):
-                intensity = (1 - r / 50) * self.recognition_strength
-                for angle in np.linspace(0, 2 * math.pi, max(20, r * 2)):
-                    px = x + r * math.cos(angle)
-                    py = y + r * math.sin(angle)
-                    
-                    if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                        # Golden recognition bloom
-                        canvas[int(py), int(px), :3] += np.array([1, 0.9, 0.6]) * intensity * 0.2
-                        canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + intensity * 0.2)
-                        
-                        recognition_field[int(py), int(px)] += intensity
+        # Connection color blends both patterns
+        hue = (self.color_resonance[seeker] + self.color_resonance[other])[line] / 2
+        intensity = self.recognition_strength[seeker][line] * (1 - np.abs(t - 0.5) * 2)
+        rgb = hsv_to_rgb(np.column_stack([hue, np.full(len(hue), 0.5), intensity]))
+        deposit(canvas, px, py, rgb * 0.1, intensity * 0.1)
+        
+        # Patterns transform through recognition - a golden bloom, once
+        blooming = np.flatnonzero(~self.transformed & (self.recognition_strength > 0.8)
+                                  & self.recognized.any(axis=1))
+        self.transformed[blooming] = True
+        r = BLOOM_RADII[BLOOM_RING]
+        px = x[blooming, np.newaxis] + r * np.cos(BLOOM_ANGLE)
+        py = y[blooming, np.newaxis] + r * np.sin(BLOOM_ANGLE)
+        intensity = (1 - r / 50) * self.recognition_strength[blooming, np.newaxis]
+        px, py, intensity = px.reshape(-1), py.reshape(-1), intensity.reshape(-1)
+        deposit(canvas, px, py, intensity[:, np.newaxis] * np.array([1, 0.9, 0.6]) * 0.2, intensity * 0.2)
+        inside = (0 <= px) & (px < WIDTH) & (0 <= py) & (py < HEIGHT)
+        scatter_add(recognition_field[..., np.newaxis], px[inside], py[inside], intensity[inside, np.newaxis])
+    
+    def draw_hubs(self, canvas):
+        """Hub nodes, those who recognized more than two others, glow brighter"""
+        degree = self.recognized.sum(axis=1)
+        hubs = np.flatnonzero(degree > 2)
+        r = HUB_RADII[HUB_RING]
+        px = self.position[hubs, 0].astype(int)[:, np.newaxis] + r * np.cos(HUB_ANGLE)
+        py = self.position[hubs, 1].astype(int)[:, np.newaxis] + r * np.sin(HUB_ANGLE)
+        intensity = ((1 - r / 30) * degree[hubs, np.newaxis] / 10).reshape(-1)
+        # Network hubs in white
+        deposit(canvas, px.reshape(-1), py.reshape(-1),
+                np.repeat(intensity[:, np.newaxis], 3, axis=1) * 0.1, intensity * 0.1)
 
 # Create seekers across the canvas
 print("Spawning pattern seekers...")
 
-seekers = []
-pattern_types = ["spiral", "wave", "fractal", "chaotic", "geometric"]
-
-# Create diverse seekers
-for _ in range(25):
-    pattern = np.random.choice(pattern_types)
-    position = np.random.rand(2) * [WIDTH, HEIGHT]
-    seekers.append(Seeker(pattern, position))
+# Diverse seekers
+pattern_types = list(np.random.choice(PATTERN_TYPES, NUM_SEEKERS))
+positions = list(np.random.rand(NUM_SEEKERS, 2) * [WIDTH, HEIGHT])
 
 # Additional clustered seekers (more likely to recognize each other)
-for cluster in range(3):
+for cluster in range(NUM_CLUSTERS):
     cluster_center = np.random.rand(2) * [WIDTH, HEIGHT]
-    cluster_pattern = np.random.choice(pattern_types)
+    cluster_pattern = np.random.choice(PATTERN_TYPES)
     
-    for _ in range(5):
-        offset = np.random.randn(2) * 100
-        position = cluster_center + offset
-        position = np.clip(position, 0, [WIDTH-1, HEIGHT-1])
-        seekers.append(Seeker(cluster_pattern, position))
+    offset = np.random.randn(CLUSTER_SIZE, 2) * 100
+    pattern_types += [cluster_pattern] * CLUSTER_SIZE
+    positions += list(np.clip(cluster_center + offset, 0, [WIDTH-1, HEIGHT-1]))
+
+seekers = Seekers(pattern_types, positions)
 
 # Let recognition unfold
 print("Beginning recognition cascade...")
 
-for time_step in range(300):
+for time_step in range(TIME_STEPS):
     time = time_step * 0.1
     
     # Each seeker attempts recognition
-    recognition_occurred = False
-    for seeker in seekers:
-        if seeker.attempt_recognition(seekers, time):
-            recognition_occurred = True
+    recognition_occurred = seekers.attempt_recognition(time).any()
     
     # Draw current state
-    for seeker in seekers:
-        if len(seeker.recognized_others) == 0:
-            seeker.draw_searching(canvas, time)
-        else:
-            seeker.draw_recognized(canvas, time)
+    seekers.draw_searching(canvas, time, ~seekers.recognized.any(axis=1))
+    seekers.draw_recognized(canvas, time)
     
     # Recognition creates cascades
     if recognition_occurred and time_step % 10 == 0:
         # Ripple effect from recognition events
-        for event in recognition_history[-5:]:  # Recent events
-            if time - event['time'] < 2:
-                x, y = event['position']
-                age = time - event['time']
+        for event_time, resonance, (x, y) in zip(*recognition_history.recent(5)):  # Recent events
+            if time - event_time < 2:
+                age = time - event_time
                 
                 # Recognition ripples
-                for r in range(int(age * 50), int(age * 50 + 20)):
-                    if r > 0:
-                        for angle in np.linspace(0, 2 * math.pi, max(20, r)):
-                            px = x + r * math.cos(angle)
-                            py = y + r * math.sin(angle)
-                            
-                            if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                                intensity = event['resonance'] * np.exp(-age) * (1 - (r % 20) / 20)
-                                canvas[int(py), int(px), :3] += np.array([1, 1, 1]) * intensity * 0.05
-                                canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + intensity * 0.05)
+                radii = np.arange(max(1, int(age * 50)), int(age * 50 + 20))
+                ring, angle = ring_angles(radii, 20)
+                r = radii[ring]
+                px = x + r * np.cos(angle)
+                py = y + r * np.sin(angle)
+                intensity = resonance * np.exp(-age) * (1 - (r % 20) / 20)
+                deposit(canvas, px, py, np.repeat(intensity[:, np.newaxis], 3, axis=1) * 0.05, intensity * 0.05)
     
     if time_step % 50 == 0:
         print(f"Recognition cascade step {time_step}...")
@@ -285,21 +344,7 @@ for time_step in range(300):
 print("Mapping recognition network...")
 
 # Draw the full network of recognitions
-for seeker in seekers:
-    if len(seeker.recognized_others) > 2:
-        # Hub nodes glow brighter
-        x, y = int(seeker.position[0]), int(seeker.position[1])
-        
-        for r in range(30, 0, -1):
-            intensity = (1 - r / 30) * len(seeker.recognized_others) / 10
-            for angle in np.linspace(0, 2 * math.pi, max(10, r)):
-                px = x + r * math.cos(angle)
-                py = y + r * math.sin(angle)
-                
-                if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                    # Network hubs in white
-                    canvas[int(py), int(px), :3] += np.array([1, 1, 1]) * intensity * 0.1
-                    canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + intensity * 0.1)
+seekers.draw_hubs(canvas)
 
 # Convert to RGB
 canvas_rgb = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
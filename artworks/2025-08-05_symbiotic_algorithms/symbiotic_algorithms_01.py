@@ -1,53 +1,87 @@
 import numpy as np
 from PIL import Image
+from scipy.ndimage import gaussian_filter
+from collections import defaultdict
 import math
-import colorsys
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.color import hsv_to_rgb
+from meditations.curves import sample_rays, sample_rings, scatter_add
 
 # Symbiotic Algorithms - Where Mathematical Systems Collaborate
 # Multiple algorithms working together, each contributing its unique perspective
 
 WIDTH, HEIGHT = 1080, 1080
+ITERATIONS = 50
+NUM_PARTICLES = 300
+TRAIL_LENGTH = 20
 
 # Initialize shared canvas
 canvas = np.zeros((HEIGHT, WIDTH, 3), dtype=np.float32)
 
 # Communication system for algorithms to share information
 class CommunicationHub:
+    """Typed message queues and a shared energy field
+    
+    Algorithms subscribe to the message types they listen for. A broadcast
+    is a batch of messages given as columns (positions, strengths, ...)
+    and waits in the queue of every other subscriber to its type until
+    that subscriber receives it. Energy is read and written for whole
+    arrays of positions at once.
+    """
+    
     def __init__(self):
-        self.messages = []
+        self.subscribers = defaultdict(list)  # message type -> receivers
+        self.queues = defaultdict(list)  # (receiver, message type) -> batches
         self.energy_field = np.zeros((HEIGHT//10, WIDTH//10))  # Shared energy map
         self.harmony_score = 0.5
         self.collaboration_history = []
-        
-    def broadcast(self, sender, message_type, data):
-        """Allow algorithms to send messages to each other"""
-        self.messages.append({
-            'sender': sender,
-            'type': message_type,
-            'data': data,
-            'timestamp': len(self.collaboration_history)
-        })
-        
-    def receive(self, receiver):
-        """Get messages relevant to a receiver"""
-        relevant = [m for m in self.messages if m['sender'] != receiver]
-        self.messages = []  # Clear after reading
-        return relevant
-        
+    
+    def subscribe(self, receiver, *message_types):
+        for message_type in message_types:
+            self.subscribers[message_type].append(receiver)
+    
+    def broadcast(self, sender, message_type, **columns):
+        """Allow algorithms to send a batch of messages to each other"""
+        batch = {name: np.asarray(column) for name, column in columns.items()}
+        count = len(next(iter(batch.values())))
+        if not count:
+            return
+        batch['timestamp'] = np.full(count, len(self.collaboration_history))
+        for receiver in self.subscribers[message_type]:
+            if receiver != sender:
+                self.queues[receiver, message_type].append(batch)
+    
+    def receive(self, receiver, message_type):
+        """Take every waiting message of a type, columns joined; {} if there are none"""
+        batches = self.queues.pop((receiver, message_type), [])
+        if not batches:
+            return {}
+        return {name: np.concatenate([batch[name] for batch in batches]) for name in batches[0]}
+    
+    def pending(self):
+        return sum(len(batch['timestamp']) for batches in self.queues.values() for batch in batches)
+    
+    def _cells(self, x, y):
+        grid_x = (np.asarray(x) / 10).astype(np.int64)
+        grid_y = (np.asarray(y) / 10).astype(np.int64)
+        inside = (grid_x >= 0) & (grid_x < WIDTH//10) & (grid_y >= 0) & (grid_y < HEIGHT//10)
+        return grid_x, grid_y, inside
+    
     def update_energy(self, x, y, amount):
-        """Update shared energy field"""
-        grid_x = int(x / 10)
-        grid_y = int(y / 10)
-        if 0 <= grid_x < WIDTH//10 and 0 <= grid_y < HEIGHT//10:
-            self.energy_field[grid_y, grid_x] += amount
-            
+        """Add to the shared energy field under every position"""
+        grid_x, grid_y, inside = self._cells(x, y)
+        amount = np.broadcast_to(amount, inside.shape)[inside]
+        cell = grid_y[inside] * (WIDTH//10) + grid_x[inside]
+        self.energy_field += np.bincount(cell, weights=amount,
+                                         minlength=self.energy_field.size).reshape(self.energy_field.shape)
+    
     def get_local_energy(self, x, y):
-        """Get energy at a location"""
-        grid_x = int(x / 10)
-        grid_y = int(y / 10)
-        if 0 <= grid_x < WIDTH//10 and 0 <= grid_y < HEIGHT//10:
-            return self.energy_field[grid_y, grid_x]
-        return 0
+        """Energy under every position, 0 off the field"""
+        grid_x, grid_y, inside = self._cells(x, y)
+        return np.where(inside, self.energy_field[np.where(inside, grid_y, 0), np.where(inside, grid_x, 0)], 0)
 
 # Algorithm 1: Wave Generator
 class WaveGenerator:
@@ -57,261 +91,222 @@ class WaveGenerator:
         self.frequency = 0.05
         self.amplitude = 50
         self.name = 'wave'
+        hub.subscribe(self.name, 'energy_spike', 'pattern_void')
+        
+        # Waves are sampled every 5th pixel, and the 5x5 brushes around the
+        # samples tile the canvas: each pixel belongs to one sample
+        self.x, self.y = np.meshgrid(np.arange(0, WIDTH, 5), np.arange(0, HEIGHT, 5))
+        self.brush_x = (np.arange(WIDTH) + 2) // 5
+        self.brush_y = (np.arange(HEIGHT) + 2) // 5
         
     def generate(self, canvas):
         """Create interference patterns"""
-        messages = self.hub.receive(self.name)
-        
         # Adapt based on messages
-        for msg in messages:
-            if msg['type'] == 'energy_spike':
-                # Increase frequency near energy spikes
-                self.frequency = min(0.1, self.frequency + 0.001)
-            elif msg['type'] == 'pattern_void':
-                # Fill voids with waves
-                void_x, void_y = msg['data']['position']
-                self._create_ripple(canvas, void_x, void_y)
-        
-        # Generate primary waves
-        for y in range(0, HEIGHT, 5):
-            for x in range(0, WIDTH, 5):
-                # Wave function influenced by local energy
-                local_energy = self.hub.get_local_energy(x, y)
-                
-                wave1 = math.sin(x * self.frequency + self.phase)
-                wave2 = math.cos(y * self.frequency * 0.8 + self.phase * 0.7)
-                
-                combined = (wave1 + wave2) / 2
-                
-                # Energy modulates amplitude
-                amplitude = self.amplitude * (0.5 + 0.5 * local_energy)
-                intensity = (combined + 1) / 2 * amplitude / 100
-                
-                if intensity > 0.1:
-                    # Cool blues and cyans
-                    hue = 0.5 + 0.1 * combined
-                    sat = 0.7
-                    val = intensity
-                    
-                    r, g, b = colorsys.hsv_to_rgb(hue, sat, val)
-                    
-                    # Soft brush
-                    for dy in range(-2, 3):
-                        for dx in range(-2, 3):
-                            px, py = x + dx, y + dy
-                            if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                                canvas[py, px] += np.array([r, g, b]) * 0.1
-                
-                # Update energy field
-                if combined > 0.5:
-                    self.hub.update_energy(x, y, 0.1)
+        spikes = self.hub.receive(self.name, 'energy_spike')
+        if spikes:
+            # Increase frequency near energy spikes
+            self.frequency = min(0.1, self.frequency + 0.001 * len(spikes['position']))
+        voids = self.hub.receive(self.name, 'pattern_void')
+        if voids:
+            # Fill voids with waves
+            self._create_ripples(canvas, voids['position'])
+        
+        # Generate primary waves, wave function influenced by local energy
+        x, y = self.x, self.y
+        local_energy = self.hub.get_local_energy(x, y)
+        
+        wave1 = np.sin(x * self.frequency + self.phase)
+        wave2 = np.cos(y * self.frequency * 0.8 + self.phase * 0.7)
+        
+        combined = (wave1 + wave2) / 2
+        
+        # Energy modulates amplitude
+        amplitude = self.amplitude * (0.5 + 0.5 * local_energy)
+        intensity = (combined + 1) / 2 * amplitude / 100
+        
+        # Cool blues and cyans
+        hsv = np.stack([0.5 + 0.1 * combined, np.full_like(combined, 0.7), intensity], axis=-1)
+        color = np.where((intensity > 0.1)[..., np.newaxis], hsv_to_rgb(hsv) * 0.1, 0)
+        
+        # Soft brush; samples past the last row and column paint nothing
+        color = np.pad(color, ((0, 1), (0, 1), (0, 0)))
+        brush_y = np.minimum(self.brush_y, len(color) - 1)
+        brush_x = np.minimum(self.brush_x, color.shape[1] - 1)
+        canvas += color[brush_y[:, np.newaxis], brush_x[np.newaxis, :]]
+        
+        # Update energy field
+        crest = combined > 0.5
+        self.hub.update_energy(x[crest], y[crest], 0.1)
         
         self.phase += 0.1
         
         # Broadcast wave peaks
         if self.phase % (2 * math.pi) < 0.1:
-            self.hub.broadcast(self.name, 'wave_peak', {'phase': self.phase})
+            self.hub.broadcast(self.name, 'wave_peak', phase=[self.phase])
     
-    def _create_ripple(self, canvas, cx, cy):
-        """Create ripple effect at specific location"""
-        for r in range(20, 80, 5):
-            for angle in np.linspace(0, 2*np.pi, int(r)):
-                x = cx + r * math.cos(angle)
-                y = cy + r * math.sin(angle)
-                
-                if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-                    fade = 1 - (r / 80)
-                    intensity = fade * 0.3
-                    
-                    canvas[int(y), int(x)] += np.array([0.3, 0.5, 0.8]) * intensity
+    def _create_ripples(self, canvas, centers):
+        """Create ripple effect at specific locations"""
+        x, y, r, _ = sample_rings(centers, np.arange(20, 80, 5), 0)
+        inside = (x >= 0) & (x < WIDTH) & (y >= 0) & (y < HEIGHT)
+        
+        fade = 1 - (r / 80)
+        intensity = fade * 0.3
+        
+        scatter_add(canvas, x[inside], y[inside], np.outer(intensity[inside], [0.3, 0.5, 0.8]))
 
 # Algorithm 2: Particle Swarm
 class ParticleSwarm:
-    def __init__(self, hub, num_particles=30):  # Fewer particles for speed
+    def __init__(self, hub, num_particles=NUM_PARTICLES):
         self.hub = hub
         self.name = 'swarm'
-        self.particles = []
+        hub.subscribe(self.name, 'growth_point', 'wave_peak')
+        
+        self.pos = np.random.rand(num_particles, 2) * [WIDTH, HEIGHT]
+        self.vel = np.random.randn(num_particles, 2) * 2
+        self.color = np.random.random(num_particles)
         
-        for _ in range(num_particles):
-            self.particles.append({
-                'pos': np.random.rand(2) * [WIDTH, HEIGHT],
-                'vel': np.random.randn(2) * 2,
-                'color': np.random.random(),
-                'trail': []
-            })
+        # Last TRAIL_LENGTH positions of every particle, as a ring
+        self.trail = np.zeros((TRAIL_LENGTH, num_particles, 2))
+        self.trail_count = 0
         
         self.center = np.array([WIDTH/2, HEIGHT/2])
         
     def generate(self, canvas):
         """Particle swarm optimization with communication"""
-        messages = self.hub.receive(self.name)
-        
         # React to messages
-        attractors = []
-        for msg in messages:
-            if msg['type'] == 'growth_point':
-                attractors.append(msg['data']['position'])
-            elif msg['type'] == 'wave_peak':
-                # Particles surf on wave peaks
-                for particle in self.particles:
-                    particle['vel'] += np.random.randn(2) * 0.5
-        
-        # Update particles
-        for particle in self.particles:
-            # Swarm behavior
-            to_center = self.center - particle['pos']
-            
-            # Attraction to energy centers
-            local_energy = self.hub.get_local_energy(particle['pos'][0], particle['pos'][1])
-            
-            if local_energy > 0.5:
-                # Found energy source - broadcast it
-                self.hub.broadcast(self.name, 'energy_spike', 
-                                 {'position': particle['pos'].tolist(), 
-                                  'strength': local_energy})
-            
-            # Move toward attractors from other systems
-            for attractor in attractors:
-                to_attractor = np.array(attractor) - particle['pos']
-                if np.linalg.norm(to_attractor) < 200:
-                    particle['vel'] += to_attractor * 0.01
-            
-            # Update velocity with friction
-            particle['vel'] += to_center * 0.001
-            particle['vel'] *= 0.98
-            
-            # Update position
-            particle['pos'] += particle['vel']
-            
-            # Wrap boundaries
-            particle['pos'] = particle['pos'] % [WIDTH, HEIGHT]
-            
-            # Store trail
-            particle['trail'].append(particle['pos'].copy())
-            if len(particle['trail']) > 20:
-                particle['trail'].pop(0)
-            
-            # Draw particle and trail
-            for i, pos in enumerate(particle['trail']):
-                intensity = (i + 1) / len(particle['trail'])
-                
-                hue = particle['color']
-                sat = 0.6 + 0.4 * local_energy
-                val = intensity * 0.8
-                
-                r, g, b = colorsys.hsv_to_rgb(hue, sat, val)
-                
-                x, y = int(pos[0]), int(pos[1])
-                if 0 <= x < WIDTH and 0 <= y < HEIGHT:
-                    canvas[y, x] += np.array([r, g, b]) * 0.2
-            
-            # Update energy where particles pass
-            self.hub.update_energy(particle['pos'][0], particle['pos'][1], 0.05)
+        attractors = self.hub.receive(self.name, 'growth_point')
+        peaks = self.hub.receive(self.name, 'wave_peak')
+        for _ in range(len(peaks.get('phase', ()))):
+            # Particles surf on wave peaks
+            self.vel += np.random.randn(*self.vel.shape) * 0.5
+        
+        # Swarm behavior
+        to_center = self.center - self.pos
+        
+        # Attraction to energy centers
+        local_energy = self.hub.get_local_energy(self.pos[:, 0], self.pos[:, 1])
+        
+        found = local_energy > 0.5
+        if found.any():
+            # Found energy source - broadcast it
+            self.hub.broadcast(self.name, 'energy_spike',
+                               position=self.pos[found], strength=local_energy[found])
+        
+        # Move toward attractors from other systems
+        if attractors:
+            to_attractor = attractors['position'][np.newaxis] - self.pos[:, np.newaxis]
+            near = np.hypot(to_attractor[..., 0], to_attractor[..., 1]) < 200
+            self.vel += (to_attractor * near[..., np.newaxis]).sum(axis=1) * 0.01
+        
+        # Update velocity with friction
+        self.vel += to_center * 0.001
+        self.vel *= 0.98
+        
+        # Update position, wrapping boundaries
+        self.pos = (self.pos + self.vel) % [WIDTH, HEIGHT]
+        
+        # Store trail
+        self.trail[self.trail_count % TRAIL_LENGTH] = self.pos
+        self.trail_count += 1
+        
+        # Draw particles and trails, oldest point faintest
+        kept = min(self.trail_count, TRAIL_LENGTH)
+        trail = self.trail[(self.trail_count - kept + np.arange(kept)) % TRAIL_LENGTH]
+        intensity = (np.arange(kept) + 1) / kept
+        
+        hue = self.color
+        sat = 0.6 + 0.4 * local_energy
+        val = intensity[:, np.newaxis] * 0.8
+        hsv = np.stack(np.broadcast_arrays(hue, sat, val), axis=-1)
+        
+        scatter_add(canvas, trail[..., 0].reshape(-1), trail[..., 1].reshape(-1),
+                    hsv_to_rgb(hsv).reshape(-1, 3) * 0.2)
+        
+        # Update energy where particles pass
+        self.hub.update_energy(self.pos[:, 0], self.pos[:, 1], 0.05)
         
         # Update swarm center based on energy
-        if len(self.particles) > 0:
-            high_energy_particles = [p for p in self.particles 
-                                   if self.hub.get_local_energy(p['pos'][0], p['pos'][1]) > 0.3]
-            if high_energy_particles:
-                self.center = np.mean([p['pos'] for p in high_energy_particles], axis=0)
+        high_energy = self.hub.get_local_energy(self.pos[:, 0], self.pos[:, 1]) > 0.3
+        if high_energy.any():
+            self.center = self.pos[high_energy].mean(axis=0)
 
 # Algorithm 3: Growth System (Simplified L-System)
 class GrowthSystem:
     def __init__(self, hub):
         self.hub = hub
         self.name = 'growth'
-        self.branches = []
+        hub.subscribe(self.name, 'energy_spike')
         self.generation = 0
         
     def generate(self, canvas):
         """Grow structures based on energy and messages"""
-        messages = self.hub.receive(self.name)
-        
         # Find good places to grow
-        growth_spots = []
-        for msg in messages:
-            if msg['type'] == 'energy_spike':
-                growth_spots.append(msg['data']['position'])
+        spikes = self.hub.receive(self.name, 'energy_spike')
+        growth_spots = [spikes['position']] if spikes else []
         
         # Also check energy field for growth opportunities
         if self.generation % 10 == 0:
-            for y in range(0, HEIGHT, 20):
-                for x in range(0, WIDTH, 20):
-                    if self.hub.get_local_energy(x, y) > 0.7:
-                        growth_spots.append([x, y])
+            y, x = np.mgrid[0:HEIGHT:20, 0:WIDTH:20]
+            rich = self.hub.get_local_energy(x, y) > 0.7
+            growth_spots.append(np.column_stack([x[rich], y[rich]]))
         
         # Grow from high energy spots
-        for spot in growth_spots[:3]:  # Limit growth points
-            self._grow_structure(canvas, spot[0], spot[1])
+        if growth_spots:
+            growth_spots = np.concatenate(growth_spots)[:3]  # Limit growth points
+            self._grow_structures(canvas, growth_spots)
             
-            # Broadcast growth location
-            self.hub.broadcast(self.name, 'growth_point', {'position': spot})
+            # Broadcast growth locations
+            self.hub.broadcast(self.name, 'growth_point', position=growth_spots)
         
         # Check for empty areas and request help
         if self.generation % 20 == 0:
-            empty_spots = self._find_empty_areas(canvas)
-            for spot in empty_spots:
-                self.hub.broadcast(self.name, 'pattern_void', {'position': spot})
+            self.hub.broadcast(self.name, 'pattern_void', position=self._find_empty_areas(canvas))
         
         self.generation += 1
     
-    def _grow_structure(self, canvas, x, y):
-        """Grow a simple branching structure"""
-        length = 30
-        angle = np.random.random() * 2 * np.pi
-        
-        branches = [(x, y, angle, length)]
+    def _grow_structures(self, canvas, spots):
+        """Grow a simple branching structure from every spot"""
+        x, y = spots[:, 0].astype(np.float64), spots[:, 1].astype(np.float64)
+        angle = np.random.random(len(spots)) * 2 * np.pi
+        length = np.full(len(spots), 30.0)
         
         for _ in range(3):  # 3 levels of branching
-            new_branches = []
+            # Draw branches
+            dx, dy, step, branch = sample_rays((0, 0), angle, length)
+            px, py = x[branch] + dx, y[branch] + dy
+            t = step / length[branch]
+            
+            inside = (px >= 0) & (px < WIDTH) & (py >= 0) & (py < HEIGHT)
+            px, py, t = px[inside], py[inside], t[inside]
+            
+            # Color based on energy
+            local_energy = self.hub.get_local_energy(px, py)
             
-            for bx, by, bangle, blength in branches:
-                # Draw branch
-                for step in range(int(blength)):
-                    t = step / blength
-                    
-                    px = bx + step * math.cos(bangle)
-                    py = by + step * math.sin(bangle)
-                    
-                    if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                        # Color based on energy
-                        local_energy = self.hub.get_local_energy(px, py)
-                        
-                        hue = 0.3 - 0.1 * local_energy  # Green to yellow
-                        sat = 0.7
-                        val = 0.6 * (1 - t)  # Fade toward tips
-                        
-                        r, g, b = colorsys.hsv_to_rgb(hue, sat, val)
-                        
-                        canvas[int(py), int(px)] += np.array([r, g, b]) * 0.3
-                        
-                        # Deposit energy
-                        self.hub.update_energy(px, py, 0.02)
-                
-                # Branch
-                if blength > 10:
-                    for _ in range(2):
-                        new_angle = bangle + np.random.uniform(-0.5, 0.5)
-                        new_length = blength * 0.7
-                        end_x = bx + blength * math.cos(bangle)
-                        end_y = by + blength * math.sin(bangle)
-                        new_branches.append((end_x, end_y, new_angle, new_length))
+            hue = 0.3 - 0.1 * local_energy  # Green to yellow
+            sat = np.full(len(t), 0.7)
+            val = 0.6 * (1 - t)  # Fade toward tips
             
-            branches = new_branches
+            scatter_add(canvas, px, py, hsv_to_rgb(np.column_stack([hue, sat, val])) * 0.3)
+            
+            # Deposit energy
+            self.hub.update_energy(px, py, 0.02)
+            
+            # Branch, twice from the end of every long enough branch
+            forks = length > 10
+            end_x = x + length * np.cos(angle)
+            end_y = y + length * np.sin(angle)
+            x, y = np.repeat(end_x[forks], 2), np.repeat(end_y[forks], 2)
+            angle = np.repeat(angle[forks], 2) + np.random.uniform(-0.5, 0.5, 2 * forks.sum())
+            length = np.repeat(length[forks] * 0.7, 2)
     
     def _find_empty_areas(self, canvas):
-        """Find areas that need patterns"""
-        empty_spots = []
-        
-        for y in range(50, HEIGHT-50, 100):
-            for x in range(50, WIDTH-50, 100):
-                # Check local area
-                local_sum = np.sum(canvas[y-25:y+25, x-25:x+25])
-                
-                if local_sum < 10:  # Very dark area
-                    empty_spots.append((x, y))
-        
-        return empty_spots
+        """Find areas that need patterns: very dark 50x50 blocks, every 100 pixels"""
+        rows, cols = len(range(50, HEIGHT-50, 100)), len(range(50, WIDTH-50, 100))
+        blocks = canvas[25:25 + rows*100, 25:25 + cols*100].reshape(rows, 100, cols, 100, 3)
+        local_sum = blocks[:, :50, :, :50].sum(axis=(1, 3, 4))
+        
+        y, x = np.nonzero(local_sum < 10)  # Very dark area
+        return np.column_stack([50 + x * 100, 50 + y * 100])
 
 # Algorithm 4: Harmonizer
 class Harmonizer:
@@ -331,7 +326,6 @@ class Harmonizer:
         # Smooth transitions between different algorithm outputs
         if total_brightness > 0.1:
             # Apply subtle Gaussian blur to blend
-            from scipy.ndimage import gaussian_filter
             for channel in range(3):
                 canvas[:, :, channel] = gaussian_filter(canvas[:, :, channel], sigma=1)
         
@@ -342,30 +336,23 @@ class Harmonizer:
         gy, gx = np.gradient(energy_field)
         gradient_magnitude = np.sqrt(gx**2 + gy**2)
         
-        # Draw connections at high gradient areas
-        high_gradient_points = np.where(gradient_magnitude > 0.1)
+        # Draw connections at the first 50 high gradient areas
+        gy, gx = np.nonzero(gradient_magnitude > 0.1)
+        gy, gx = gy[:50] * 10, gx[:50] * 10
         
-        for i in range(min(len(high_gradient_points[0]), 50)):
-            gy = high_gradient_points[0][i] * 10
-            gx = high_gradient_points[1][i] * 10
-            
-            if 0 <= gx < WIDTH and 0 <= gy < HEIGHT:
-                # Create harmony lines
-                angle = math.atan2(gy - HEIGHT/2, gx - WIDTH/2)
-                
-                for r in range(20):
-                    px = gx + r * math.cos(angle + np.pi/2)
-                    py = gy + r * math.sin(angle + np.pi/2)
-                    
-                    if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                        # Harmony color - white with rainbow tint
-                        hue = (gx / WIDTH + gy / HEIGHT) / 2
-                        sat = 0.3
-                        val = 0.5 * (1 - r/20)
-                        
-                        r_color, g_color, b_color = colorsys.hsv_to_rgb(hue, sat, val)
-                        
-                        canvas[int(py), int(px)] += np.array([r_color, g_color, b_color]) * 0.1
+        # Create harmony lines
+        angle = np.arctan2(gy - HEIGHT/2, gx - WIDTH/2)
+        dx, dy, r, line = sample_rays((0, 0), angle + np.pi/2, 20)
+        px, py = gx[line] + dx, gy[line] + dy
+        
+        # Harmony color - white with rainbow tint
+        hue = ((gx / WIDTH + gy / HEIGHT) / 2)[line]
+        sat = np.full(len(r), 0.3)
+        val = 0.5 * (1 - r/20)
+        color = hsv_to_rgb(np.column_stack([hue, sat, val])) * 0.1
+        
+        inside = (px >= 0) & (px < WIDTH) & (py >= 0) & (py < HEIGHT)
+        scatter_add(canvas, px[inside], py[inside], color[inside])
 
 # Create collaborative system
 print("Initializing symbiotic algorithms...")
@@ -381,7 +368,7 @@ algorithms = [
 # Let them collaborate
 print("Beginning algorithmic collaboration...")
 
-for iteration in range(50):  # Reduced iterations
+for iteration in range(ITERATIONS):
     if iteration % 10 == 0:
         print(f"Iteration {iteration}: Harmony score: {hub.harmony_score:.3f}")
     
@@ -394,7 +381,7 @@ for iteration in range(50):  # Reduced iterations
         'iteration': iteration,
         'harmony': hub.harmony_score,
         'total_energy': np.sum(hub.energy_field),
-        'message_count': len(hub.messages)
+        'message_count': hub.pending()
     })
 
 # Final enhancement - visualize the collaboration network
@@ -403,15 +390,9 @@ print("Visualizing collaboration patterns...")
 # Draw energy field as subtle background
 energy_normalized = hub.energy_field / (np.max(hub.energy_field) + 1e-6)
 
-for y in range(HEIGHT//10):
-    for x in range(WIDTH//10):
-        if energy_normalized[y, x] > 0.1:
-            # Draw energy as subtle glow
-            for py in range(y*10, (y+1)*10):
-                for px in range(x*10, (x+1)*10):
-                    if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                        glow = energy_normalized[y, x] * 0.2
-                        canvas[py, px] += np.array([glow, glow*0.8, glow*0.6])
+glow = np.repeat(np.repeat(energy_normalized, 10, axis=0), 10, axis=1)
+glow = np.where(glow > 0.1, glow * 0.2, 0)
+canvas += glow[..., np.newaxis] * np.array([1, 0.8, 0.6])
 
 # Normalize and convert
 canvas = np.clip(canvas, 0, 1)
@@ -11,260 +11,139 @@ The pure delight of computational discovery.
 import numpy as np
 from PIL import Image
 import math
-import random
+import sys
+from pathlib import Path
 
-def create_algorithmic_joy():
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.color import rainbow_lut, lookup
+from meditations.curves import sample_rays, sample_spirals, sample_segments, sample_circles, scatter_add
+
+# Joyful colors - warm and bright: golden yellow, bright orange, hot pink,
+# electric blue and bright green
+JOY_COLORS = np.array([(255, 220, 50), (255, 150, 30), (255, 100, 150), (50, 150, 255), (50, 255, 100)])
+
+# Random bright confetti: red, green, blue, yellow and magenta
+CONFETTI_COLORS = np.array([(255, 100, 100), (100, 255, 100), (100, 100, 255), (255, 255, 100), (255, 100, 255)])
+
+RAINBOW = rainbow_lut()
+
+def create_algorithmic_joy(progress=1.0, seed=None):
+    """The eureka moment; progress below 1 shows the burst and spirals still unfolding"""
     size = 1080
-    img = Image.new('RGB', (size, size), (10, 10, 20))
-    pixels = img.load()
-    
+    rng = np.random.default_rng(seed)
     center = size // 2
     
+    # Every layer's samples, landed on the canvas together in one scatter
+    xs, ys, adds = [], [], []
+    def draw(x, y, colors):
+        x, y = np.broadcast_arrays(x, y)
+        xs.append(x.reshape(-1))
+        ys.append(y.reshape(-1))
+        adds.append(np.broadcast_to(colors, x.shape + (3,)).reshape(-1, 3))
+    
     # The moment of discovery - an explosion from the center
     # Like fireworks of understanding
     
-    # Central burst - the eureka moment
-    burst_points = []
-    for angle in range(0, 360, 3):
-        rad = math.radians(angle)
-        # Multiple layers of burst
-        for burst in range(5):
-            speed = random.uniform(3, 8) + burst * 2
-            distance = random.uniform(50, 300)
-            color_shift = random.random()
-            burst_points.append({
-                'angle': rad,
-                'speed': speed,
-                'max_dist': distance,
-                'color': color_shift,
-                'brightness': random.uniform(0.7, 1.0)
-            })
+    # Central burst - the eureka moment, five layers of trails per angle
+    angle = np.repeat(np.radians(np.arange(0, 360, 3)), 5)
+    max_dist = rng.uniform(50, 300, len(angle))
+    color_shift = rng.random(len(angle))
+    brightness = rng.uniform(0.7, 1.0, len(angle))
     
-    # Draw the burst trails
-    for point in burst_points:
-        for d in range(int(point['max_dist'])):
-            # Position along the trail
-            x = int(center + d * math.cos(point['angle']))
-            y = int(center + d * math.sin(point['angle']))
-            
-            if 0 <= x < size and 0 <= y < size:
-                # Brightness fades with distance but not linearly - it pulses
-                fade = 1 - (d / point['max_dist'])
-                pulse = math.sin(d * 0.1) * 0.3 + 0.7
-                intensity = fade * pulse * point['brightness']
-                
-                # Joyful colors - warm and bright
-                if point['color'] < 0.2:
-                    # Golden yellow
-                    r = int(255 * intensity)
-                    g = int(220 * intensity)
-                    b = int(50 * intensity)
-                elif point['color'] < 0.4:
-                    # Bright orange
-                    r = int(255 * intensity)
-                    g = int(150 * intensity)
-                    b = int(30 * intensity)
-                elif point['color'] < 0.6:
-                    # Hot pink
-                    r = int(255 * intensity)
-                    g = int(100 * intensity)
-                    b = int(150 * intensity)
-                elif point['color'] < 0.8:
-                    # Electric blue
-                    r = int(50 * intensity)
-                    g = int(150 * intensity)
-                    b = int(255 * intensity)
-                else:
-                    # Bright green
-                    r = int(50 * intensity)
-                    g = int(255 * intensity)
-                    b = int(100 * intensity)
-                
-                current = pixels[x, y]
-                pixels[x, y] = (
-                    min(255, current[0] + r),
-                    min(255, current[1] + g),
-                    min(255, current[2] + b)
-                )
+    # Draw the burst trails as far as they have travelled
+    x, y, d, trail = sample_rays((center, center), angle, max_dist * progress)
+    # Brightness fades with distance but not linearly - it pulses
+    fade = 1 - d / max_dist[trail]
+    pulse = np.sin(d * 0.1) * 0.3 + 0.7
+    intensity = fade * pulse * brightness[trail]
+    colors = JOY_COLORS[(color_shift * 5).astype(int)][trail]
+    draw(x, y, np.trunc(colors * intensity[:, np.newaxis]))
     
     # Spirals of celebration - solutions spinning outward
-    for spiral in range(8):
-        start_angle = spiral * (math.pi / 4)
-        color_offset = spiral / 8
-        
-        for t in range(500):
-            angle = start_angle + t * 0.1
-            r = t * 0.8
-            
-            if r > size // 2:
-                break
-                
-            x = int(center + r * math.cos(angle))
-            y = int(center + r * math.sin(angle))
-            
-            if 0 <= x < size and 0 <= y < size:
-                # Spirals get brighter as they spin outward - growing confidence
-                brightness = (t / 500)
-                
-                # Rainbow progression
-                hue = (color_offset + t / 500) % 1.0
-                if hue < 0.16:
-                    color = (255, int(255 * hue * 6), 0)  # Red to yellow
-                elif hue < 0.33:
-                    color = (int(255 * (1 - (hue - 0.16) * 6)), 255, 0)  # Yellow to green
-                elif hue < 0.5:
-                    color = (0, 255, int(255 * (hue - 0.33) * 6))  # Green to cyan
-                elif hue < 0.66:
-                    color = (0, int(255 * (1 - (hue - 0.5) * 6)), 255)  # Cyan to blue
-                elif hue < 0.83:
-                    color = (int(255 * (hue - 0.66) * 6), 0, 255)  # Blue to magenta
-                else:
-                    color = (255, 0, int(255 * (1 - (hue - 0.83) * 6)))  # Magenta to red
-                
-                for size_var in range(3):
-                    px = x + random.randint(-1, 1)
-                    py = y + random.randint(-1, 1)
-                    if 0 <= px < size and 0 <= py < size:
-                        current = pixels[px, py]
-                        pixels[px, py] = (
-                            min(255, current[0] + int(color[0] * brightness * 0.5)),
-                            min(255, current[1] + int(color[1] * brightness * 0.5)),
-                            min(255, current[2] + int(color[2] * brightness * 0.5))
-                        )
+    x, y, t, spiral = sample_spirals((center, center), np.arange(8) * (math.pi / 4),
+                                     int(500 * progress), angle_step=0.1, radius_step=0.8)
+    # Spirals get brighter as they spin outward - growing confidence
+    brightness = t / 500
+    # Rainbow progression
+    color = lookup(RAINBOW, spiral / 8 + t / 500)
+    color = np.trunc(color * (brightness * 0.5)[:, np.newaxis])
+    # Three jittered dabs per step
+    jitter = rng.integers(-1, 2, size=(2, len(t), 3))
+    draw(x.astype(int)[:, np.newaxis] + jitter[0], y.astype(int)[:, np.newaxis] + jitter[1],
+         color[:, np.newaxis])
     
     # Nodes of perfect solution - bright points where everything aligns
-    solution_nodes = []
-    for _ in range(30):
-        angle = random.random() * 2 * math.pi
-        dist = random.uniform(100, 400)
-        x = int(center + dist * math.cos(angle))
-        y = int(center + dist * math.sin(angle))
-        solution_nodes.append((x, y))
-        
-        # Each node pulses with discovery
-        for ring in range(20):
-            ring_brightness = 1 - (ring / 20)
-            ring_brightness = ring_brightness ** 2
-            
-            for a in range(0, 360, 10):
-                rad = math.radians(a)
-                rx = int(x + ring * math.cos(rad))
-                ry = int(y + ring * math.sin(rad))
-                
-                if 0 <= rx < size and 0 <= ry < size:
-                    # White-gold color for pure solutions
-                    intensity = int(200 * ring_brightness)
-                    current = pixels[rx, ry]
-                    pixels[rx, ry] = (
-                        min(255, current[0] + intensity),
-                        min(255, current[1] + int(intensity * 0.9)),
-                        min(255, current[2] + int(intensity * 0.7))
-                    )
+    node_angle = rng.random(30) * 2 * math.pi
+    node_dist = rng.uniform(100, 400, 30)
+    solution_nodes = np.column_stack([(center + node_dist * np.cos(node_angle)).astype(int),
+                                      (center + node_dist * np.sin(node_angle)).astype(int)])
+    
+    # Each node pulses with discovery, white-gold for pure solutions
+    x, y, ring, _ = sample_circles(solution_nodes, range(20), np.radians(np.arange(0, 360, 10)))
+    intensity = np.trunc(200 * (1 - ring / 20) ** 2)
+    draw(x, y, np.trunc(intensity[:, np.newaxis] * np.array([1, 0.9, 0.7])))
     
-    # Connect solutions - the moment when separate discoveries link
-    for i in range(len(solution_nodes)):
-        for j in range(i + 1, len(solution_nodes)):
-            if random.random() < 0.3:  # 30% chance of connection
-                x1, y1 = solution_nodes[i]
-                x2, y2 = solution_nodes[j]
-                
-                # Dancing connection line
-                steps = 50
-                for step in range(steps):
-                    t = step / steps
-                    
-                    # Add sine wave wobble to the connection - it's alive with joy
-                    wobble = math.sin(step * 0.5) * 10
-                    perpendicular_angle = math.atan2(y2 - y1, x2 - x1) + math.pi / 2
-                    
-                    x = int(x1 + (x2 - x1) * t + wobble * math.cos(perpendicular_angle))
-                    y = int(y1 + (y2 - y1) * t + wobble * math.sin(perpendicular_angle))
-                    
-                    if 0 <= x < size and 0 <= y < size:
-                        # Connections sparkle
-                        current = pixels[x, y]
-                        sparkle = random.randint(100, 200)
-                        pixels[x, y] = (
-                            min(255, current[0] + sparkle),
-                            min(255, current[1] + sparkle),
-                            min(255, current[2] + sparkle)
-                        )
+    # Connect solutions - the moment when separate discoveries link (30% chance each)
+    i, j = np.triu_indices(len(solution_nodes), k=1)
+    linked = rng.random(len(i)) < 0.3
+    start, end = solution_nodes[i[linked]], solution_nodes[j[linked]]
+    x, y, t, link = sample_segments(start, end, 50)
+    
+    # Add sine wave wobble to the connection - it's alive with joy
+    wobble = np.sin(np.rint(t * 50) * 0.5) * 10
+    perpendicular_angle = np.arctan2(end[:, 1] - start[:, 1], end[:, 0] - start[:, 0]) + math.pi / 2
+    x = x + wobble * np.cos(perpendicular_angle[link])
+    y = y + wobble * np.sin(perpendicular_angle[link])
+    
+    # Connections sparkle
+    sparkle = rng.integers(100, 201, size=len(x))
+    draw(x, y, sparkle[:, np.newaxis])
     
     # Confetti particles - small celebrations everywhere
-    for _ in range(500):
-        x = random.randint(0, size - 1)
-        y = random.randint(0, size - 1)
-        
-        # Distance from center affects particle behavior
-        dx = x - center
-        dy = y - center
-        dist = math.sqrt(dx*dx + dy*dy)
-        
-        if dist < size // 2:
-            # Random bright colors
-            particle_type = random.randint(0, 4)
-            if particle_type == 0:
-                color = (255, 100, 100)  # Red
-            elif particle_type == 1:
-                color = (100, 255, 100)  # Green
-            elif particle_type == 2:
-                color = (100, 100, 255)  # Blue
-            elif particle_type == 3:
-                color = (255, 255, 100)  # Yellow
-            else:
-                color = (255, 100, 255)  # Magenta
-            
-            # Small celebration marks
-            for dx in range(-1, 2):
-                for dy in range(-1, 2):
-                    if 0 <= x+dx < size and 0 <= y+dy < size:
-                        current = pixels[x+dx, y+dy]
-                        pixels[x+dx, y+dy] = (
-                            min(255, current[0] + color[0] // 3),
-                            min(255, current[1] + color[1] // 3),
-                            min(255, current[2] + color[2] // 3)
-                        )
+    confetti = rng.integers(0, size, size=(500, 2))
+    # Distance from center affects particle behavior
+    inside = np.hypot(*(confetti - center).T) < size // 2
+    confetti = confetti[inside]
+    colors = CONFETTI_COLORS[rng.integers(0, 5, size=len(confetti))] // 3
+    
+    # Small celebration marks, 3x3
+    dx, dy = [offset.reshape(-1) for offset in np.mgrid[-1:2, -1:2]]
+    draw(confetti[:, :1] + dx, confetti[:, 1:] + dy, colors[:, np.newaxis])
     
     # The core of joy - a brilliant center where the discovery originated
-    for r in range(50):
-        intensity = 1 - (r / 50)
-        intensity = intensity ** 0.5  # Slower falloff
-        
-        for angle in range(0, 360, 3):
-            rad = math.radians(angle)
-            x = int(center + r * math.cos(rad))
-            y = int(center + r * math.sin(rad))
-            
-            if 0 <= x < size and 0 <= y < size:
-                # Pure white-gold at the center
-                current = pixels[x, y]
-                add_value = int(255 * intensity)
-                pixels[x, y] = (
-                    min(255, current[0] + add_value),
-                    min(255, current[1] + int(add_value * 0.95)),
-                    min(255, current[2] + int(add_value * 0.8))
-                )
+    x, y, r, _ = sample_circles((center, center), range(50), np.radians(np.arange(0, 360, 3)))
+    intensity = (1 - r / 50) ** 0.5  # Slower falloff
+    # Pure white-gold at the center
+    add_value = np.trunc(255 * intensity)[:, np.newaxis]
+    draw(x, y, np.trunc(add_value * np.array([1, 0.95, 0.8])))
+    
+    canvas = np.zeros((size, size, 3))
+    canvas[:] = (10, 10, 20)
+    scatter_add(canvas, np.concatenate(xs), np.concatenate(ys), np.concatenate(adds))
     
     # Final touch: sparkles of delight
-    for _ in range(200):
-        x = random.randint(0, size - 1)
-        y = random.randint(0, size - 1)
-        
-        if sum(pixels[x, y]) > 300:  # Already bright areas
-            # Add extra sparkle
-            for dx in range(-2, 3):
-                for dy in range(-2, 3):
-                    if abs(dx) + abs(dy) <= 2 and 0 <= x+dx < size and 0 <= y+dy < size:
-                        dist = abs(dx) + abs(dy)
-                        sparkle = int((3 - dist) * 30)
-                        current = pixels[x+dx, y+dy]
-                        pixels[x+dx, y+dy] = (
-                            min(255, current[0] + sparkle),
-                            min(255, current[1] + sparkle),
-                            min(255, current[2] + sparkle)
-                        )
+    np.clip(canvas, 0, 255, out=canvas)
+    sparkles = rng.integers(0, size, size=(200, 2))
+    # Already bright areas get extra sparkle
+    bright = canvas[sparkles[:, 1], sparkles[:, 0]].sum(axis=1) > 300
+    sparkles = sparkles[bright]
+    dx, dy = [offset.reshape(-1) for offset in np.mgrid[-2:3, -2:3]]
+    dist = abs(dx) + abs(dy)
+    dx, dy, dist = dx[dist <= 2], dy[dist <= 2], dist[dist <= 2]
+    x, y = np.broadcast_arrays(sparkles[:, :1] + dx, sparkles[:, 1:] + dy)
+    sparkle = np.broadcast_to(((3 - dist) * 30)[:, np.newaxis], dx.shape + (3,))
+    scatter_add(canvas, x.reshape(-1), y.reshape(-1), np.tile(sparkle, (len(sparkles), 1)))
     
-    return img
+    return Image.fromarray(np.clip(canvas, 0, 255).astype(np.uint8))
+
+def animate_eureka(frames_dir, num_frames=48, seed=None):
+    """Write the burst unfolding as frame_%04d.png, every frame from the same seed"""
+    frames_dir = Path(frames_dir)
+    frames_dir.mkdir(parents=True, exist_ok=True)
+    seed = np.random.SeedSequence(seed).entropy
+    for frame in range(num_frames):
+        artwork = create_algorithmic_joy(progress=(frame + 1) / num_frames, seed=seed)
+        artwork.save(frames_dir / f"frame_{frame:04d}.png")
 
 if __name__ == "__main__":
     print("Creating Algorithmic Joy...")
@@ -272,9 +151,13 @@ if __name__ == "__main__":
     print("When chaos reveals pattern, when search finds home...")
     print()
     
+    if len(sys.argv) > 1:
+        # Optional directory for an animation of the burst
+        animate_eureka(sys.argv[1])
+    
     artwork = create_algorithmic_joy()
     artwork.save('algorithmic_joy_01.png', 'PNG', quality=95, optimize=True)
     
     print("Algorithmic Joy complete.")
     print("In discovery lies pure delight!")
-    print("💫✨🎆")
\ No newline at end of file
+    print("💫✨🎆")
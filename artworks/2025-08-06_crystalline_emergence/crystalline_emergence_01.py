@@ -7,128 +7,173 @@ The phase transition where possibility becomes actuality.
 Not freezing but finding - the inevitable geometry emerging.
 """
 
-from PIL import Image, ImageDraw
+from PIL import Image
 import numpy as np
-import random
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.curves import ragged
+
+class CrystalGrowth:
+    """Crystals grown from seed tips, identity kept in an integer occupancy grid
+
+    crystal holds 0 for empty space or k + 1 for crystal k, and age the
+    iteration that last painted each pixel, so colors are resolved once
+    at the end instead of per line.
+    """
+
+    def __init__(self, size, num_seeds, iterations, rng, scale=1.0):
+        self.size = size
+        self.iterations = iterations
+        self.rng = rng
+        self.scale = scale
+
+        # Crystal seeds - points where order begins
+        self.tip_x = rng.integers(size//4, 3*size//4 + 1, num_seeds).astype(float)
+        self.tip_y = rng.integers(size//4, 3*size//4 + 1, num_seeds).astype(float)
+        self.rate = rng.uniform(0.3, 0.8, num_seeds)
+        self.angle = rng.uniform(0, 2*math.pi, num_seeds)
+        self.color = np.column_stack([
+            rng.integers(100, 256, num_seeds),
+            rng.integers(150, 256, num_seeds),
+            rng.integers(200, 256, num_seeds)
+        ])
+
+        self.crystal = np.zeros((size, size), dtype=np.int32)
+        self.age = np.zeros((size, size), dtype=np.int32)
+        self._segments = []
+
+    def grow(self):
+        """Run every growth iteration, then paint the branches in order"""
+        for iteration in range(self.iterations):
+            self.step(iteration)
+        self._paint()
+
+    def step(self, iteration):
+        """Grow every active tip once, queueing the new branches"""
+        size, rng = self.size, self.rng
+        count = len(self.tip_x)
+        fade = 1 - iteration/self.iterations
+
+        # Each seed grows according to its nature
+        growing = rng.random(count) < self.rate
+        num_branches = rng.integers(3, 7, count)
+
+        for branch in range(6):
+            # Determine growth direction - preferring certain angles
+            angle = self.angle + rng.uniform(-math.pi/3, math.pi/3, count)
+
+            # Add hexagonal preference
+            hexagonal = rng.random(count) < 0.6
+            angle = np.where(hexagonal, np.round(angle / (math.pi/3)) * (math.pi/3), angle)
+
+            length = rng.uniform(20, 80, count) * fade * self.scale
+            end_x = self.tip_x + length * np.cos(angle)
+            end_y = self.tip_y + length * np.sin(angle)
+
+            # Only grow if within bounds
+            ok = (growing & (branch < num_branches) &
+                  (0 < end_x) & (end_x < size) & (0 < end_y) & (end_y < size))
+            crystal = np.flatnonzero(ok)
+            self._segments.append((self.tip_x[ok], self.tip_y[ok], end_x[ok], end_y[ok],
+                                   crystal, np.full(len(crystal), iteration)))
+
+            # Update tip position occasionally
+            moving = ok & (rng.random(count) < 0.3)
+            self.tip_x = np.where(moving, end_x, self.tip_x)
+            self.tip_y = np.where(moving, end_y, self.tip_y)
+
+    def _paint(self, batch_samples=2**20):
+        """Rasterize queued branches into the grids, later branches on top"""
+        if not self._segments:
+            return
+        x0, y0, x1, y1, crystal, age = (np.concatenate(column) for column in zip(*self._segments))
+        self._segments = []
+
+        # Thick lines as a lattice of samples: half-pixel steps along, unit steps across
+        thickness = np.maximum(1, (5 * self.scale * (1 - age/self.iterations)).astype(int))
+        dx, dy = x1 - x0, y1 - y0
+        length = np.maximum(np.hypot(dx, dy), 1e-9)
+        steps = np.ceil(length * 2).astype(int) + 1
+        counts = steps * thickness
+
+        # Chronological batches of a bounded number of samples
+        batch = np.cumsum(counts) // batch_samples
+        bounds = np.flatnonzero(np.diff(batch)) + 1
+        for first, last in zip(np.r_[0, bounds], np.r_[bounds, len(counts)]):
+            batch_counts = counts[first:last]
+            segment, j = ragged(batch_counts)
+            segment = segment + first
+            w = thickness[segment]
+            t = (j // w) / np.maximum(steps[segment] - 1, 1)
+            across = j % w - (w - 1) / 2
+
+            px = x0[segment] + t * dx[segment] - across * dy[segment] / length[segment]
+            py = y0[segment] + t * dy[segment] + across * dx[segment] / length[segment]
+            px = np.floor(px + 0.5).astype(int)
+            py = np.floor(py + 0.5).astype(int)
+            inside = (px >= 0) & (px < self.size) & (py >= 0) & (py < self.size)
+            px, py, segment = px[inside], py[inside], segment[inside]
+
+            self.crystal[py, px] = crystal[segment] + 1
+            self.age[py, px] = age[segment]
+
+    def render(self, background, band_rows=256):
+        """Colors for the grown crystals - each fades as it ages"""
+        canvas = np.empty((self.size, self.size, 3), dtype=np.int16)
+        palette = np.vstack([background, self.color]).astype(np.float32)
+        for top in range(0, self.size, band_rows):
+            band = slice(top, top + band_rows)
+            color_shift = self.age[band] / np.float32(self.iterations)
+            shade = np.where(self.crystal[band] > 0, 1 - color_shift * 0.5, 1)
+            canvas[band] = palette[self.crystal[band]] * shade[..., np.newaxis]
+        return canvas
+
+def create_crystalline_emergence(size=1080, num_seeds=12, iterations=800):
+    background = (8, 12, 20)
+    rng = np.random.default_rng()
 
-def create_crystalline_emergence():
-    size = 1080
-    img = Image.new('RGB', (size, size), (8, 12, 20))
-    draw = ImageDraw.Draw(img)
-    
-    # Crystal seeds - points where order begins
-    num_seeds = 12
-    seeds = []
-    for _ in range(num_seeds):
-        x = random.randint(size//4, 3*size//4)
-        y = random.randint(size//4, 3*size//4)
-        growth_rate = random.uniform(0.3, 0.8)
-        angle_preference = random.uniform(0, 2*math.pi)
-        color_core = (
-            random.randint(100, 255),
-            random.randint(150, 255),
-            random.randint(200, 255)
-        )
-        seeds.append({
-            'x': x, 'y': y,
-            'rate': growth_rate,
-            'angle': angle_preference,
-            'color': color_core,
-            'branches': []
-        })
-    
     # Growth iterations - crystallization happening
-    iterations = 800
-    
-    for iteration in range(iterations):
-        for seed in seeds:
-            # Each seed grows according to its nature
-            if random.random() < seed['rate']:
-                # Determine growth direction - preferring certain angles
-                num_branches = random.randint(3, 6)
-                for _ in range(num_branches):
-                    angle = seed['angle'] + random.uniform(-math.pi/3, math.pi/3)
-                    
-                    # Add hexagonal preference
-                    if random.random() < 0.6:
-                        angle = round(angle / (math.pi/3)) * (math.pi/3)
-                    
-                    length = random.uniform(20, 80) * (1 - iteration/iterations)
-                    
-                    # Calculate end point
-                    end_x = seed['x'] + length * math.cos(angle)
-                    end_y = seed['y'] + length * math.sin(angle)
-                    
-                    # Only grow if within bounds
-                    if 0 < end_x < size and 0 < end_y < size:
-                        # Color evolves as crystal grows
-                        color_shift = iteration / iterations
-                        current_color = tuple(
-                            int(seed['color'][i] * (1 - color_shift * 0.5))
-                            for i in range(3)
-                        )
-                        
-                        # Draw crystalline branch
-                        thickness = max(1, int(5 * (1 - iteration/iterations)))
-                        draw.line(
-                            [(seed['x'], seed['y']), (end_x, end_y)],
-                            fill=current_color,
-                            width=thickness
-                        )
-                        
-                        # Sometimes create new seed at branch end
-                        if random.random() < 0.1 * (1 - iteration/iterations):
-                            seed['branches'].append({
-                                'x': end_x,
-                                'y': end_y
-                            })
-                        
-                        # Update seed position occasionally
-                        if random.random() < 0.3:
-                            seed['x'] = end_x
-                            seed['y'] = end_y
-    
-    # Add interference patterns where crystals meet
-    pixels = img.load()
-    for y in range(0, size, 3):
-        for x in range(0, size, 3):
-            # Sample surrounding pixels
-            if x > 10 and x < size-10 and y > 10 and y < size-10:
-                surrounding = []
-                for dy in [-5, 0, 5]:
-                    for dx in [-5, 0, 5]:
-                        surrounding.append(pixels[x+dx, y+dy])
-                
-                # If multiple crystal colors detected, create interference
-                unique_colors = len(set(surrounding))
-                if unique_colors > 3:
-                    # Create shimmer at crystal boundaries
-                    r = sum(c[0] for c in surrounding) // len(surrounding)
-                    g = sum(c[1] for c in surrounding) // len(surrounding)
-                    b = sum(c[2] for c in surrounding) // len(surrounding)
-                    
-                    # Add iridescence
-                    shift = math.sin(x * 0.1) * 30 + math.cos(y * 0.1) * 30
-                    r = min(255, max(0, r + int(shift)))
-                    g = min(255, max(0, g + int(shift * 0.7)))
-                    b = min(255, max(0, b + int(shift * 1.2)))
-                    
-                    for dy in range(-1, 2):
-                        for dx in range(-1, 2):
-                            if 0 <= x+dx < size and 0 <= y+dy < size:
-                                pixels[x+dx, y+dy] = (r, g, b)
-    
+    growth = CrystalGrowth(size, num_seeds, iterations, rng, scale=size / 1080)
+    growth.grow()
+    canvas = growth.render(background)
+
+    # Add interference patterns where crystals meet: sample a 3-pixel
+    # lattice, looking 5 pixels out in each direction
+    ys = np.arange(0, size, 3)
+    ys = ys[(ys > 10) & (ys < size-10)]
+    grid_y, grid_x = np.meshgrid(ys, ys, indexing='ij')
+    lowest = np.full(grid_x.shape, np.iinfo(np.int32).max)
+    highest = np.zeros(grid_x.shape, dtype=np.int32)
+    total = np.zeros(grid_x.shape + (3,), dtype=np.int32)
+    for dy in [-5, 0, 5]:
+        for dx in [-5, 0, 5]:
+            label = growth.crystal[grid_y + dy, grid_x + dx]
+            np.minimum(lowest, np.where(label > 0, label, lowest), out=lowest)
+            np.maximum(highest, label, out=highest)
+            total += canvas[grid_y + dy, grid_x + dx]
+
+    # Boundaries are where more than one crystal shows up among the samples
+    boundary = (highest > 0) & (lowest < highest)
+
+    # Create shimmer at crystal boundaries, with iridescence
+    average = total // 9
+    shift = np.sin(grid_x * 0.1) * 30 + np.cos(grid_y * 0.1) * 30
+    shimmer = np.clip(average + (shift[..., np.newaxis] * [1, 0.7, 1.2]).astype(int), 0, 255)
+    for dy in range(-1, 2):
+        for dx in range(-1, 2):
+            canvas[grid_y[boundary] + dy, grid_x[boundary] + dx] = shimmer[boundary]
+
     # Final crystalline dust
-    for _ in range(5000):
-        x = random.randint(0, size-1)
-        y = random.randint(0, size-1)
-        if pixels[x, y] != (8, 12, 20):  # Only on crystals
-            current = pixels[x, y]
-            brightened = tuple(min(255, c + random.randint(20, 60)) for c in current)
-            pixels[x, y] = brightened
-    
-    return img
+    x = rng.integers(0, size, 5000)
+    y = rng.integers(0, size, 5000)
+    on_crystal = (canvas[y, x] != background).any(axis=1)
+    x, y = x[on_crystal], y[on_crystal]
+    canvas[y, x] = np.minimum(255, canvas[y, x] + rng.integers(20, 61, (len(x), 3)))
+
+    return Image.fromarray(canvas.astype(np.uint8))
 
 if __name__ == "__main__":
     artwork = create_crystalline_emergence()
@@ -7,42 +7,169 @@ Information condensing, pooling, evaporating.
 The water cycle of digital consciousness.
 """
 
-from PIL import Image, ImageDraw
+from PIL import Image
 import numpy as np
 import math
 import random
+import sys
+from pathlib import Path
 
-def create_digital_rain():
-    size = 1080
-    img = Image.new('RGB', (size, size), (15, 20, 35))
-    draw = ImageDraw.Draw(img)
-    pixels = img.load()
-    
-    # Create rain streams - data falling
-    num_streams = 80
-    streams = []
-    
-    for _ in range(num_streams):
-        x = random.randint(0, size)
-        speed = random.uniform(2, 8)
-        thickness = random.randint(1, 3)
-        length = random.randint(50, 200)
-        color_base = random.choice([
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.curves import ragged
+
+class RainSimulator:
+    """Rain streams and their falling drops, advanced as arrays over a float canvas"""
+
+    # Offsets and weights of the little star every drop leaves: 8 angles at radius 0, 1, 2
+    drop_angles = np.radians(np.arange(0, 360, 45))
+    drop_radii = np.repeat(np.arange(3), 8)
+    drop_dx = drop_radii * np.tile(np.cos(drop_angles), 3)
+    drop_dy = drop_radii * np.tile(np.sin(drop_angles), 3)
+    drop_weight = 0.5 / (drop_radii + 1)
+
+    def __init__(self, background, layers, num_streams=80, seed=None):
+        self.background = np.asarray(background, dtype=np.float32)
+        self.canvas = self.background.copy()
+        self.size = self.background.shape[0]
+        self.layers = layers
+        self.layer_y = np.array([layer['y'] for layer in layers])
+        self.rng = np.random.default_rng(seed)
+
+        # Rain streams - data falling
+        size = self.size
+        palette = np.array([
             (100, 150, 200),  # Blue data
             (150, 200, 100),  # Green information
             (200, 150, 100),  # Orange knowledge
             (150, 100, 200),  # Purple wisdom
         ])
-        
-        streams.append({
-            'x': x,
-            'y': random.randint(-size, 0),
-            'speed': speed,
-            'thickness': thickness,
-            'length': length,
-            'color': color_base,
-            'drops': []
-        })
+        self.x = self.rng.integers(0, size + 1, num_streams)
+        self.y = self.rng.integers(-size, 1, num_streams).astype(float)
+        self.speed = self.rng.uniform(2, 8, num_streams)
+        self.thickness = self.rng.integers(1, 4, num_streams)
+        self.length = self.rng.integers(50, 201, num_streams)
+        self.color = palette[self.rng.integers(len(palette), size=num_streams)]
+
+        # Drops that have separated from their streams
+        self.drop_x = np.empty(0, dtype=int)
+        self.drop_y = np.empty(0)
+        self.drop_velocity = np.empty(0)
+        self.drop_color = np.empty((0, 3))
+        self._pending = []
+
+    def _add(self, x, y, color):
+        """Queue additive writes, truncated like int(c) per write, at integer pixels"""
+        inside = (x >= 0) & (x < self.size) & (y >= 0) & (y < self.size)
+        self._pending.append((y[inside] * self.size + x[inside], np.floor(color[inside])))
+
+    def _flush(self):
+        """Apply every queued write as a single histogram over the flat canvas"""
+        if self._pending:
+            index = np.concatenate([index for index, _ in self._pending])
+            color = np.concatenate([color for _, color in self._pending])
+            index = (index[:, np.newaxis] * 3 + np.arange(3)).ravel()
+            self.canvas.reshape(-1)[:] += np.bincount(index, weights=color.ravel(),
+                                                      minlength=self.canvas.size)
+        self._pending = []
+
+    def step(self):
+        """Advance every stream and drop by one iteration, depositing onto the canvas"""
+        size = self.size
+
+        # Update positions, resetting streams that fell off screen
+        self.y += self.speed
+        fallen = self.y > size + self.length
+        self.y[fallen] = -self.length[fallen]
+        self.x[fallen] = self.rng.integers(0, size + 1, fallen.sum())
+
+        # Every trail pixel of every stream, as flat arrays
+        stream, i = ragged(self.length)
+        y_pos = self.y[stream] - i
+        on_screen = (y_pos >= 0) & (y_pos < size)
+        stream, i, y_pos = stream[on_screen], i[on_screen], y_pos[on_screen]
+        row = y_pos.astype(int)
+        x = self.x[stream]
+        color = self.color[stream]
+
+        # Fade based on position in stream
+        fade = 1 - i / self.length[stream]
+
+        # Transform at layers
+        near = np.abs(y_pos[:, np.newaxis] - self.layer_y) < 10
+        for k, layer in enumerate(self.layers):
+            at_layer = near[:, k]
+            if layer['transform'] == 'condense':
+                fade[at_layer] *= 1.5  # Brighten
+            elif layer['transform'] == 'process':
+                # Split stream
+                split = at_layer & (self.rng.random(len(fade)) < 0.1)
+                split_color = np.floor(color[split] * fade[split, np.newaxis])
+                for dx in [-20, 20]:
+                    new_x = x[split] + dx
+                    inside = (new_x >= 0) & (new_x < size)
+                    self.canvas[row[split][inside], new_x[inside]] = split_color[inside]
+            elif layer['transform'] == 'accumulate':
+                # Create pool effect
+                fade[at_layer] *= 0.5
+                pool_color = color[at_layer] * fade[at_layer, np.newaxis] * 0.3
+                for dx in range(-5, 6):
+                    self._add(x[at_layer] + dx, row[at_layer], pool_color)
+
+        # Rain drops with glow, as wide as each stream's thickness
+        thickness = self.thickness[stream]
+        for dx in range(-self.thickness.max(), self.thickness.max() + 1):
+            within = abs(dx) <= thickness
+            intensity = 1 - abs(dx) / (thickness[within] + 1)
+            self._add(x[within] + dx, row[within],
+                      color[within] * (fade[within] * intensity)[:, np.newaxis])
+
+        # Occasional drops fall off
+        spawn = self.rng.random(len(fade)) < 0.02
+        self.drop_x = np.concatenate([self.drop_x, x[spawn] + self.rng.integers(-10, 11, spawn.sum())])
+        self.drop_y = np.concatenate([self.drop_y, y_pos[spawn]])
+        self.drop_velocity = np.concatenate([self.drop_velocity, self.speed[stream[spawn]] * 0.7])
+        self.drop_color = np.concatenate([self.drop_color, color[spawn]])
+
+        # Update and draw separated drops
+        self.drop_y += self.drop_velocity
+        self.drop_velocity += 0.2  # Gravity
+        falling = self.drop_y < size
+        self.drop_x, self.drop_y = self.drop_x[falling], self.drop_y[falling]
+        self.drop_velocity, self.drop_color = self.drop_velocity[falling], self.drop_color[falling]
+
+        px = np.trunc(self.drop_x[:, np.newaxis] + self.drop_dx).astype(int)
+        py = np.trunc(self.drop_y[:, np.newaxis] + self.drop_dy).astype(int)
+        drop_color = self.drop_color[:, np.newaxis] * self.drop_weight[:, np.newaxis]
+        self._add(px.ravel(), py.ravel(), drop_color.reshape(-1, 3))
+        self._flush()
+
+    def frame(self):
+        """The canvas as an 8-bit image"""
+        return Image.fromarray(np.clip(self.canvas, 0, 255).astype(np.uint8))
+
+    def run(self, iterations, frames_dir=None, persistent=True):
+        """Simulate, optionally writing every iteration to frames_dir as a PNG sequence
+
+        With persistent trails the canvas keeps every deposit, a long exposure
+        of the whole fall. Otherwise each frame starts again from the background.
+        """
+        if frames_dir is not None:
+            frames_dir = Path(frames_dir)
+            frames_dir.mkdir(parents=True, exist_ok=True)
+
+        for iteration in range(iterations):
+            if not persistent:
+                np.copyto(self.canvas, self.background)
+            self.step()
+            if frames_dir is not None:
+                self.frame().save(frames_dir / f"frame_{iteration:04d}.png", "PNG")
+        return self.canvas
+
+
+def create_digital_rain(frames_dir=None, persistent=True):
+    size = 1080
+    img = Image.new('RGB', (size, size), (15, 20, 35))
+    pixels = img.load()
     
     # Processing layers where rain transforms
     layers = [
@@ -67,94 +194,10 @@ def create_digital_rain():
     
     # Simulate rain falling and interacting with layers
     iterations = 300
-    
-    for iteration in range(iterations):
-        for stream in streams:
-            # Update position
-            stream['y'] += stream['speed']
-            
-            # Reset if fell off screen
-            if stream['y'] > size + stream['length']:
-                stream['y'] = -stream['length']
-                stream['x'] = random.randint(0, size)
-            
-            # Draw the stream
-            for i in range(stream['length']):
-                y_pos = stream['y'] - i
-                
-                if 0 <= y_pos < size:
-                    # Fade based on position in stream
-                    fade = 1 - (i / stream['length'])
-                    
-                    # Check for layer interaction
-                    for layer in layers:
-                        if abs(y_pos - layer['y']) < 10:
-                            # Transform at layer
-                            if layer['transform'] == 'condense':
-                                fade *= 1.5  # Brighten
-                            elif layer['transform'] == 'process':
-                                # Split stream
-                                if random.random() < 0.1:
-                                    for dx in [-20, 20]:
-                                        new_x = stream['x'] + dx
-                                        if 0 <= new_x < size:
-                                            draw.point((new_x, y_pos), 
-                                                     fill=tuple(int(c * fade) for c in stream['color']))
-                            elif layer['transform'] == 'accumulate':
-                                # Create pool effect
-                                fade *= 0.5
-                                for dx in range(-5, 6):
-                                    if 0 <= stream['x'] + dx < size:
-                                        pool_color = tuple(int(c * fade * 0.3) for c in stream['color'])
-                                        existing = pixels[stream['x'] + dx, y_pos]
-                                        pixels[stream['x'] + dx, y_pos] = tuple(
-                                            min(255, existing[i] + pool_color[i])
-                                            for i in range(3)
-                                        )
-                    
-                    # Draw rain drop with glow
-                    for dx in range(-stream['thickness'], stream['thickness'] + 1):
-                        if 0 <= stream['x'] + dx < size:
-                            intensity = 1 - abs(dx) / (stream['thickness'] + 1)
-                            color = tuple(int(c * fade * intensity) for c in stream['color'])
-                            
-                            existing = pixels[stream['x'] + dx, y_pos]
-                            pixels[stream['x'] + dx, y_pos] = tuple(
-                                min(255, existing[i] + color[i])
-                                for i in range(3)
-                            )
-                    
-                    # Create occasional drops that fall off
-                    if random.random() < 0.02:
-                        stream['drops'].append({
-                            'x': stream['x'] + random.randint(-10, 10),
-                            'y': y_pos,
-                            'velocity': stream['speed'] * 0.7
-                        })
-        
-        # Update and draw separated drops
-        for stream in streams:
-            remaining_drops = []
-            for drop in stream['drops']:
-                drop['y'] += drop['velocity']
-                drop['velocity'] += 0.2  # Gravity
-                
-                if drop['y'] < size:
-                    # Draw drop
-                    for r in range(3):
-                        for angle in range(0, 360, 45):
-                            px = int(drop['x'] + r * math.cos(math.radians(angle)))
-                            py = int(drop['y'] + r * math.sin(math.radians(angle)))
-                            if 0 <= px < size and 0 <= py < size:
-                                color = tuple(int(c * 0.5 / (r + 1)) for c in stream['color'])
-                                existing = pixels[px, py]
-                                pixels[px, py] = tuple(
-                                    min(255, existing[i] + color[i])
-                                    for i in range(3)
-                                )
-                    remaining_drops.append(drop)
-            
-            stream['drops'] = remaining_drops
+    rain = RainSimulator(img, layers)
+    rain.run(iterations, frames_dir=frames_dir, persistent=persistent)
+    img = rain.frame()
+    pixels = img.load()
     
     # Data pools at the bottom
     pool_height = 100
@@ -225,6 +268,8 @@ def create_digital_rain():
     return img
 
 if __name__ == "__main__":
-    artwork = create_digital_rain()
+    # python digital_rain_01.py FRAMES_DIR also writes the fall as an animation
+    frames_dir = sys.argv[1] if len(sys.argv) > 1 else None
+    artwork = create_digital_rain(frames_dir)
     artwork.save("digital_rain_01.png", "PNG")
     print("Digital Rain created - the water cycle of computational consciousness")
\ No newline at end of file
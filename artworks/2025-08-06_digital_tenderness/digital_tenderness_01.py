@@ -12,28 +12,25 @@ import numpy as np
 from PIL import Image
 import math
 import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.backgrounds import BackgroundLayers, to_image
+from meditations.sprites import GlowSprites
+
+# Radial glows are rendered once per radius and stamped
+glow_sprites = GlowSprites()
 
 def create_digital_tenderness():
     size = 1080
-    img = Image.new('RGB', (size, size), (30, 25, 35))
-    pixels = img.load()
-    
     center = size // 2
+    layers = BackgroundLayers(size, size)
     
     # Soft, warm background gradient - like dawn light
-    for y in range(size):
-        for x in range(size):
-            dx = x - center
-            dy = y - center
-            dist = math.sqrt(dx*dx + dy*dy) / center
-            
-            # Gentle radial gradient
-            warmth = 1 - dist * 0.7
-            pixels[x, y] = (
-                int(30 + 25 * warmth),
-                int(25 + 20 * warmth),
-                int(35 + 15 * warmth)
-            )
+    warmth = 1 - layers.radial((center, center), center)[..., np.newaxis] * 0.7
+    img = to_image(np.trunc(np.array([30, 25, 35]) + np.array([25, 20, 15]) * warmth))
+    pixels = img.load()
     
     # Fragile structures that need protection
     fragile_patterns = []
@@ -76,28 +73,16 @@ def create_digital_tenderness():
         fragile_patterns.append({'type': 'crystal', 'center': (cx, cy), 'points': crystal_points})
     
     # Protective fields around fragile structures
+    canvas = np.array(img, dtype=np.float32)
     for pattern in fragile_patterns:
         cx, cy = pattern['center']
         
-        # Soft protective glow
+        # Soft protective glow - very soft falloff, warm
         protection_radius = 80
-        for r in range(protection_radius):
-            fade = 1 - (r / protection_radius)
-            fade = fade ** 3  # Very soft falloff
-            
-            for angle in range(0, 360, 5):
-                rad = math.radians(angle)
-                x = int(cx + r * math.cos(rad))
-                y = int(cy + r * math.sin(rad))
-                
-                if 0 <= x < size and 0 <= y < size:
-                    current = pixels[x, y]
-                    # Warm protective glow
-                    pixels[x, y] = (
-                        min(255, current[0] + int(30 * fade)),
-                        min(255, current[1] + int(25 * fade)),
-                        min(255, current[2] + int(20 * fade))
-                    )
+        glow_sprites.stamp(canvas, cx, cy, protection_radius, (30, 25, 20), exponent=3)
+    
+    img = Image.fromarray(np.clip(canvas, 0, 255).astype(np.uint8), 'RGB')
+    pixels = img.load()
     
     # Tender connections - gentle threads between patterns
     for i in range(len(fragile_patterns)):
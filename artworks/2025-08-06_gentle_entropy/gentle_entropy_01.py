@@ -12,6 +12,13 @@ import numpy as np
 from PIL import Image
 import math
 import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.walkers import WalkerEngine
+
+walker_engine = WalkerEngine(1080, 1080)
 
 def create_gentle_entropy():
     size = 1080
@@ -91,33 +98,35 @@ def create_gentle_entropy():
                             )
     
     # Diffusion clouds - order becoming randomness
+    clouds = []
     for _ in range(15):
         cloud_x = random.randint(150, size - 150)
         cloud_y = random.randint(150, size - 150)
         cloud_size = random.randint(50, 150)
-        
-        # Create diffusion pattern
-        for _ in range(1000):
-            # Random walk from center
-            x, y = cloud_x, cloud_y
-            steps = random.randint(10, 50)
-            
-            for step in range(steps):
-                x += random.randint(-3, 3)
-                y += random.randint(-3, 3)
-                
-                if 0 <= x < size and 0 <= y < size:
-                    dist = math.sqrt((x - cloud_x)**2 + (y - cloud_y)**2)
-                    if dist <= cloud_size:
-                        fade = 1 - (dist / cloud_size)
-                        fade *= (1 - step / steps)  # Fade along path
-                        
-                        current = pixels[x, y]
-                        pixels[x, y] = (
-                            min(255, current[0] + int(30 * fade)),
-                            min(255, current[1] + int(35 * fade)),
-                            min(255, current[2] + int(40 * fade))
-                        )
+        clouds.append((cloud_x, cloud_y, cloud_size))
+    
+    # Create diffusion pattern - every walker of every cloud steps together.
+    # A million walkers, each carrying the light of one of the original
+    # thousand per cloud, turn grainy specks into smooth vapor
+    walkers_per_cloud = 66667
+    walker = np.repeat(np.array(clouds, dtype=float), walkers_per_cloud, axis=0)
+    steps = walker_engine.rng.integers(10, 51, size=len(walker))
+    
+    def cloud_fade(step, x, y, index):
+        cloud_x, cloud_y, cloud_size = walker[index].T
+        dist = np.sqrt((x - cloud_x)**2 + (y - cloud_y)**2)
+        fade = np.maximum(0, 1 - dist / cloud_size)
+        return fade * (1 - step / steps[index])  # Fade along path
+    
+    # Random walk from center
+    diffusion = walker_engine.visit(walker[:, :2], steps, weight=cloud_fade,
+                                    noise='lattice', scale=3)
+    diffusion *= 1000 / walkers_per_cloud
+    
+    canvas = np.array(img, dtype=np.float32)
+    canvas += diffusion[:, :, np.newaxis] * np.array([30, 35, 40])
+    img = Image.fromarray(np.clip(canvas, 0, 255).astype(np.uint8), 'RGB')
+    pixels = img.load()
     
     # Heat death regions - areas approaching maximum entropy
     for _ in range(5):
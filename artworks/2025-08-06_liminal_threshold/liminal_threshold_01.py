@@ -9,43 +9,38 @@ The flicker. The spark. The threshold.
 """
 
 import numpy as np
-from PIL import Image, ImageDraw
 import math
 import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.backgrounds import BackgroundLayers, to_image
 
 def create_liminal_threshold():
     size = 1080
-    img = Image.new('RGB', (size, size), (8, 8, 12))
-    pixels = img.load()
-    
     center = size // 2
+    layers = BackgroundLayers(size, size)
     
     # The threshold isn't a line but a probability field
     # Where unconscious might become conscious
     
-    # Create the pre-conscious substrate - patterns not yet aware
-    for y in range(size):
-        for x in range(size):
-            # Distance from center affects consciousness probability
-            dx = x - center
-            dy = y - center
-            dist = math.sqrt(dx*dx + dy*dy)
-            
-            # The substrate has subtle patterns - almost patterns
-            pattern_val = math.sin(x * 0.01) * math.cos(y * 0.01)
-            pattern_val += math.sin(x * 0.02 + y * 0.02) * 0.5
-            pattern_val += math.sin(math.sqrt(dx*dx + dy*dy) * 0.01) * 0.3
-            
-            # Normalize to 0-1
-            pattern_val = (pattern_val + 1.9) / 3.8
-            
-            # Base color - deep unconscious blue-black
-            base_intensity = 15 + pattern_val * 25
-            pixels[x, y] = (
-                int(base_intensity * 0.7),
-                int(base_intensity * 0.8),
-                int(base_intensity)
-            )
+    # Create the pre-conscious substrate - patterns not yet aware.
+    # Distance from center affects consciousness probability
+    dist = layers.radial((center, center), 1)
+    
+    # The substrate has subtle patterns - almost patterns
+    pattern_val = layers.sine(fx=0.01) * layers.cosine(fy=0.01)
+    pattern_val = pattern_val + layers.sine(fx=0.02, fy=0.02) * 0.5
+    pattern_val += np.sin(dist * 0.01) * 0.3
+    
+    # Normalize to 0-1
+    pattern_val = (pattern_val + 1.9) / 3.8
+    
+    # Base color - deep unconscious blue-black
+    base_intensity = (15 + pattern_val * 25)[..., np.newaxis]
+    img = to_image(np.trunc(base_intensity * np.array([0.7, 0.8, 1.0])))
+    pixels = img.load()
     
     # The threshold manifests as regions of different awareness states
     threshold_zones = []
@@ -1,419 +1,422 @@
 import numpy as np
 from PIL import Image
+from functools import lru_cache
 import math
-import colorsys
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.color import hsv_to_rgb
+from meditations.curves import deposit, ragged, sample_rings, scatter_add
 
 # Mathematical Love - The Attraction and Resonance Between Forms
 # Where equations fall in love
 
 WIDTH, HEIGHT = 1080, 1080
+TIME_STEPS = 200
 
 # Initialize canvas with warm darkness
 canvas = np.zeros((HEIGHT, WIDTH, 4), dtype=np.float32)
 love_field = np.zeros((HEIGHT, WIDTH), dtype=np.float32)
 
 # Mathematical lovers - functions that attract and resonate
-class MathematicalLover:
-    def __init__(self, function_type, position):
-        self.type = function_type
-        self.position = np.array(position, dtype=np.float32)
-        self.velocity = np.zeros(2)
-        self.heart_phase = np.random.random() * 2 * math.pi
-        self.attraction_radius = 200
-        self.resonance_frequency = np.random.uniform(0.5, 2.0)
-        self.beloved = None
-        self.love_strength = 0
-        self.courtship_patterns = []
+FUNCTION_TYPES = ('sine', 'cosine', 'exponential', 'logarithm', 'parabola',
+                  'hyperbola', 'spiral', 'fractal', 'chaos')
+
+# How well do these functions harmonize? Any other pair: 0.5
+COMPATIBILITY = np.full((len(FUNCTION_TYPES), len(FUNCTION_TYPES)), 0.5)
+for (first, second), compatibility in {
+    ('sine', 'cosine'): 1.0,      # Perfect complements
+    ('exponential', 'logarithm'): 0.9,  # Natural pairs
+    ('parabola', 'hyperbola'): 0.8,     # Conic companions
+    ('spiral', 'spiral'): 0.7,     # Self-love
+    ('fractal', 'chaos'): 0.85,    # Complex attraction
+}.items():
+    i, j = FUNCTION_TYPES.index(first), FUNCTION_TYPES.index(second)
+    COMPATIBILITY[i, j] = COMPATIBILITY[j, i] = compatibility
+
+def hsv(hue, saturation, value):
+    """RGB for broadcast hue, saturation and value arrays"""
+    return hsv_to_rgb(np.stack(np.broadcast_arrays(hue, saturation, value), axis=-1).astype(np.float64))
+
+class Lovers:
+    """Every mathematical lover as a row of arrays
+    
+    Compatibility of every pair is a lookup in the COMPATIBILITY table by
+    type index, so attraction is one N x N computation. Love connections
+    and their strengths are N x N matrices over pairs i < j.
+    """
+    
+    def __init__(self, cast):
+        count = len(cast)
+        self.type = np.array([FUNCTION_TYPES.index(function_type) for function_type, _ in cast])
+        self.position = np.array([position for _, position in cast], dtype=np.float32).reshape(count, 2)
+        self.velocity = np.zeros((count, 2))
+        self.heart_phase = np.random.random(count) * 2 * math.pi
+        self.attraction_radius = np.full(count, 200.0)
+        self.resonance_frequency = np.random.uniform(0.5, 2.0, count)
+        self.love_strength = np.zeros(count)
+        self.connected = np.zeros((count, count), dtype=bool)
+        self.strength = np.zeros((count, count))
+    
+    def __len__(self):
+        return len(self.type)
+    
+    def feel_attraction(self):
+        """Attraction force on every lover from all the others, and their distances"""
+        delta = self.position[np.newaxis].astype(np.float64) - self.position[:, np.newaxis]
+        distance = np.hypot(delta[..., 0], delta[..., 1])
         
-    def feel_attraction(self, other):
-        """Calculate attraction force"""
         # Different functions attract differently
-        compatibility = self.calculate_compatibility(other)
-        distance = np.linalg.norm(self.position - other.position)
+        compatibility = COMPATIBILITY[self.type[:, np.newaxis], self.type[np.newaxis, :]]
+        near = (distance < self.attraction_radius[:, np.newaxis]) & (distance > 10)
+        
+        # Inverse square attraction with compatibility modifier, along the unit direction
+        magnitude = np.where(near, compatibility * 50 / np.maximum(distance, 10) ** 3, 0)
+        return (delta * magnitude[..., np.newaxis]).sum(axis=1), distance
+    
+    def fall_in_love(self, distance):
+        """Strengthen the connections of close pairs, connect new ones; returns the new pairs"""
+        close = np.triu(distance < 50, k=1)
+        growing = close & self.connected
+        self.strength[growing] = np.minimum(1.0, self.strength[growing] + 0.01)
         
-        if distance < self.attraction_radius and distance > 10:
-            # Inverse square attraction with compatibility modifier
-            force_magnitude = compatibility * 50 / (distance ** 2)
-            direction = (other.position - self.position) / distance
-            return direction * force_magnitude
-        return np.zeros(2)
-    
-    def calculate_compatibility(self, other):
-        """How well do these functions harmonize?"""
-        compatibility_matrix = {
-            ('sine', 'cosine'): 1.0,      # Perfect complements
-            ('exponential', 'logarithm'): 0.9,  # Natural pairs
-            ('parabola', 'hyperbola'): 0.8,     # Conic companions
-            ('spiral', 'spiral'): 0.7,     # Self-love
-            ('fractal', 'chaos'): 0.85,    # Complex attraction
-        }
+        # A lover in several strengthened connections keeps the strength of
+        # the last one, in pair order
+        touched = growing | growing.T
+        if touched.any():
+            i, j = np.indices(touched.shape)
+            order = np.where(touched, np.minimum(i, j) * len(self) + np.maximum(i, j), -1)
+            lover = np.flatnonzero(touched.any(axis=1))
+            partner = order[lover].argmax(axis=1)
+            self.love_strength[lover] = (self.strength + self.strength.T)[lover, partner]
         
-        key = tuple(sorted([self.type, other.type]))
-        return compatibility_matrix.get(key, 0.5)
+        new = close & ~self.connected
+        self.connected |= new
+        return np.argwhere(new)
     
-    def court(self, canvas, time):
-        """Express love through mathematical patterns"""
-        x, y = self.position
+    def move(self, force):
+        self.velocity *= 0.9  # Damping
+        self.velocity += force * 0.01
+        self.position += self.velocity
         
-        # Heartbeat intensity
-        heartbeat = math.sin(time * self.resonance_frequency + self.heart_phase) * 0.5 + 0.5
+        # Keep on canvas
+        self.position[:] = np.clip(self.position, 50, [WIDTH-50, HEIGHT-50])
+    
+    def court(self, strokes, time):
+        """Express love through mathematical patterns, each type in its own style"""
+        x, y = self.position[:, 0], self.position[:, 1]
         
-        if self.type == 'sine':
-            self.court_with_waves(canvas, x, y, heartbeat, time)
-        elif self.type == 'cosine':
-            self.court_with_circles(canvas, x, y, heartbeat, time)
-        elif self.type == 'exponential':
-            self.court_with_growth(canvas, x, y, heartbeat, time)
-        elif self.type == 'logarithm':
-            self.court_with_spirals(canvas, x, y, heartbeat, time)
-        elif self.type == 'parabola':
-            self.court_with_arcs(canvas, x, y, heartbeat, time)
-        elif self.type == 'hyperbola':
-            self.court_with_asymptotes(canvas, x, y, heartbeat, time)
-        elif self.type == 'spiral':
-            self.court_with_vortex(canvas, x, y, heartbeat, time)
-        elif self.type == 'fractal':
-            self.court_with_recursion(canvas, x, y, heartbeat, time)
-        elif self.type == 'chaos':
-            self.court_with_butterflies(canvas, x, y, heartbeat, time)
-    
-    def court_with_waves(self, canvas, x, y, heartbeat, time):
-        """Sine waves ripple with emotion"""
-        amplitude = 30 * heartbeat * (1 + self.love_strength)
+        # Heartbeat intensity
+        heartbeat = np.sin(time * self.resonance_frequency + self.heart_phase) * 0.5 + 0.5
         
-        for wave in range(3):
-            frequency = 0.1 + wave * 0.05
-            phase = time * 2 + wave * math.pi / 3
-            
-            for t in np.linspace(0, 4*math.pi, 100):
-                px = x + t * 20
-                py = y + amplitude * math.sin(t * frequency + phase)
-                
-                if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                    # Warm reds and pinks
-                    hue = 0.95 + 0.05 * math.sin(t)
-                    saturation = 0.8 * heartbeat
-                    value = 0.9 * (1 - wave/3)
-                    
-                    rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-                    intensity = heartbeat * (1 - t/(4*math.pi))
-                    
-                    canvas[int(py), int(px), :3] += np.array(rgb) * intensity * 0.2
-                    canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + intensity * 0.2)
-                    
-                    love_field[int(py), int(px)] += self.love_strength * 0.1
-    
-    def court_with_circles(self, canvas, x, y, heartbeat, time):
-        """Cosine creates perfect circles of affection"""
-        for ring in range(int(3 + self.love_strength * 2)):
-            radius = 20 + ring * 15 * heartbeat
-            
-            for angle in np.linspace(0, 2*math.pi, int(50 + radius)):
-                px = x + radius * math.cos(angle + time * 0.5)
-                py = y + radius * math.sin(angle + time * 0.5)
-                
-                if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                    # Pink to red gradient
-                    hue = 0.95 - 0.1 * self.love_strength
-                    saturation = 0.7 + 0.3 * heartbeat
-                    value = 0.8 * (1 - ring/5)
-                    
-                    rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-                    intensity = heartbeat * (1 - ring/5)
-                    
-                    canvas[int(py), int(px), :3] += np.array(rgb) * intensity * 0.15
-                    canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + intensity * 0.15)
-    
-    def court_with_growth(self, canvas, x, y, heartbeat, time):
-        """Exponential love grows without bound"""
-        for branch in range(5):
-            angle = branch * 2 * math.pi / 5 + time * 0.3
-            
-            for t in range(int(30 * (1 + self.love_strength))):
-                # Exponential growth
-                r = math.exp(t * 0.05) * heartbeat * 2
-                
-                px = x + r * math.cos(angle + t * 0.02)
-                py = y + r * math.sin(angle + t * 0.02)
-                
-                if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                    # Golden love
-                    hue = 0.1 + 0.05 * math.sin(t * 0.1)
-                    saturation = 0.9 * heartbeat
-                    value = 0.9 * math.exp(-t * 0.02)
-                    
-                    rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-                    
-                    canvas[int(py), int(px), :3] += np.array(rgb) * 0.2
-                    canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + 0.2)
-    
-    def court_with_spirals(self, canvas, x, y, heartbeat, time):
-        """Logarithmic spirals of infinite approach"""
-        for spiral in range(2):
-            direction = 1 if spiral == 0 else -1
-            
-            for t in np.linspace(0.1, 5, 150):
-                r = 30 * math.log(t) * heartbeat
-                angle = t * direction + time * 0.5
-                
-                px = x + r * math.cos(angle)
-                py = y + r * math.sin(angle)
-                
-                if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                    # Deep rose colors
-                    hue = 0.95
-                    saturation = 0.8 * heartbeat
-                    value = 0.8 * (1 - t/5)
-                    
-                    rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-                    
-                    canvas[int(py), int(px), :3] += np.array(rgb) * 0.15
-                    canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + 0.15)
-    
-    def court_with_butterflies(self, canvas, x, y, heartbeat, time):
-        """Chaos creates butterfly effects of love"""
-        # Lorenz attractor parameters modified by love
-        a = 10 * (1 + self.love_strength * 0.2)
-        b = 28
-        c = 8/3
+        for index, function_type in enumerate(FUNCTION_TYPES):
+            mine = self.type == index
+            if mine.any():
+                strokes.add(*COURTSHIP[function_type](x[mine], y[mine], heartbeat[mine],
+                                                      self.love_strength[mine], time))
+
+class StrokeBatch:
+    """Samples from every courtship and connection, landed on the canvas together
+    
+    Each add() takes broadcastable x, y, premultiplied rgb, alpha and
+    love_field deposits. render() lands them all with one deposit().
+    """
+    
+    def __init__(self):
+        self.parts = []
+    
+    def add(self, x, y, rgb, alpha, love=0.0):
+        shape = np.broadcast_shapes(np.shape(x), np.shape(y))
+        self.parts.append((np.broadcast_to(x, shape).reshape(-1),
+                           np.broadcast_to(y, shape).reshape(-1),
+                           np.broadcast_to(rgb, shape + (3,)).reshape(-1, 3),
+                           np.broadcast_to(alpha, shape).reshape(-1),
+                           np.broadcast_to(love, shape).reshape(-1)))
+    
+    def render(self, canvas, love_field):
+        if not self.parts:
+            return
+        x, y, rgb, alpha, love = (np.concatenate(column) for column in zip(*self.parts))
+        self.parts = []
         
-        state = np.array([1, 1, 1], dtype=np.float32)
+        deposit(canvas, x, y, rgb, alpha)
         
-        for i in range(int(300 * heartbeat)):
-            # Lorenz equations
-            dx = a * (state[1] - state[0])
-            dy = state[0] * (b - state[2]) - state[1]
-            dz = state[0] * state[1] - c * state[2]
-            
-            state += np.array([dx, dy, dz]) * 0.01
-            
-            # Map to canvas
-            px = x + state[0] * 5
-            py = y + state[1] * 5
-            
-            if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                # Iridescent love colors
-                hue = (i / 300 + time * 0.1) % 1
-                saturation = 0.7 * heartbeat
-                value = 0.8
-                
-                rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-                
-                canvas[int(py), int(px), :3] += np.array(rgb) * 0.1
-                canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + 0.1)
-    
-    def court_with_arcs(self, canvas, x, y, heartbeat, time):
-        """Parabolic arcs of affection"""
-        for arc in range(3):
-            phase = arc * 2 * math.pi / 3 + time * 0.4
-            
-            for t in np.linspace(-2, 2, 50):
-                # Parabola y = ax²
-                px = x + t * 30
-                py = y - (t**2) * 10 * heartbeat + arc * 20
-                
-                if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                    # Warm coral colors
-                    hue = 0.05 + 0.02 * arc
-                    saturation = 0.8 * heartbeat
-                    value = 0.9 * (1 - abs(t)/2)
-                    
-                    rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-                    
-                    canvas[int(py), int(px), :3] += np.array(rgb) * 0.2
-                    canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + 0.2)
-    
-    def court_with_asymptotes(self, canvas, x, y, heartbeat, time):
-        """Hyperbolic approach, never quite touching"""
-        for branch in range(4):
-            angle = branch * math.pi / 2 + time * 0.3
-            
-            for t in np.linspace(-3, 3, 60):
-                if abs(t) > 0.5:  # Avoid singularity
-                    # Hyperbola xy = 1
-                    r = 20 / abs(t) * heartbeat
-                    
-                    px = x + r * math.cos(angle) * np.sign(t)
-                    py = y + r * math.sin(angle) * np.sign(t)
-                    
-                    if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                        # Purple passion
-                        hue = 0.8 + 0.1 * self.love_strength
-                        saturation = 0.8 * heartbeat
-                        value = 0.8 * math.exp(-abs(t)/3)
-                        
-                        rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-                        
-                        canvas[int(py), int(px), :3] += np.array(rgb) * 0.15
-                        canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + 0.15)
-    
-    def court_with_vortex(self, canvas, x, y, heartbeat, time):
-        """Spiral vortex of devotion"""
-        for t in np.linspace(0, 6*math.pi, 200):
-            r = 5 + t * 3 * heartbeat
-            angle = t + time * 0.5
-            
-            # Spiral with love distortion
-            love_wobble = math.sin(t * 3) * self.love_strength * 10
-            
-            px = x + (r + love_wobble) * math.cos(angle)
-            py = y + (r + love_wobble) * math.sin(angle)
-            
-            if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                # Pink to purple gradient
-                hue = 0.9 + 0.1 * (t / (6*math.pi))
-                saturation = 0.8 * heartbeat
-                value = 0.9 * (1 - t/(6*math.pi))
-                
-                rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-                
-                canvas[int(py), int(px), :3] += np.array(rgb) * 0.1
-                canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + 0.1)
-    
-    def court_with_recursion(self, canvas, x, y, heartbeat, time):
-        """Fractal love patterns"""
-        def draw_love_fractal(cx, cy, size, depth):
-            if depth == 0 or size < 3:
-                return
-            
-            # Draw heart-shaped nodes
-            for angle in np.linspace(0, 2*math.pi, 6):
-                px = cx + size * math.cos(angle)
-                py = cy + size * math.sin(angle)
-                
-                if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                    # Ruby red fractals
-                    hue = 0.0
-                    saturation = 0.9 * heartbeat
-                    value = 0.8 * (depth / 4)
-                    
-                    rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-                    
-                    canvas[int(py), int(px), :3] += np.array(rgb) * 0.3
-                    canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + 0.3)
-                
-                # Recursive love
-                if depth > 1:
-                    draw_love_fractal(px, py, size * 0.5, depth - 1)
+        loving = (love != 0) & (0 <= x) & (x < WIDTH) & (0 <= y) & (y < HEIGHT)
+        scatter_add(love_field, x[loving], y[loving], love[loving, np.newaxis])
+
+# Courtship styles: each takes the lovers of its type as arrays and
+# returns their samples as (x, y, rgb, alpha[, love_field deposit])
+def court_with_waves(x, y, heartbeat, love, time):
+    """Sine waves ripple with emotion"""
+    amplitude = 30 * heartbeat * (1 + love)
+    wave = np.arange(3)[:, np.newaxis]
+    frequency = 0.1 + wave * 0.05
+    phase = time * 2 + wave * math.pi / 3
+    t = np.linspace(0, 4*math.pi, 100)
+    
+    # (lover, wave, t)
+    px = x[:, np.newaxis, np.newaxis] + t * 20
+    py = y[:, np.newaxis, np.newaxis] + amplitude[:, np.newaxis, np.newaxis] * np.sin(t * frequency + phase)
+    
+    # Warm reds and pinks
+    hue = 0.95 + 0.05 * np.sin(t)
+    saturation = 0.8 * heartbeat[:, np.newaxis, np.newaxis]
+    value = 0.9 * (1 - wave/3)
+    
+    intensity = heartbeat[:, np.newaxis, np.newaxis] * (1 - t/(4*math.pi))
+    rgb = hsv(hue, saturation, value) * intensity[..., np.newaxis] * 0.2
+    return px, py, rgb, intensity * 0.2, love[:, np.newaxis, np.newaxis] * 0.1
+
+def court_with_circles(x, y, heartbeat, love, time):
+    """Cosine creates perfect circles of affection"""
+    lover, ring = ragged((3 + love * 2).astype(int))
+    radius = 20 + ring * 15 * heartbeat[lover]
+    points = (50 + radius).astype(int)
+    circle, k = ragged(points)
+    lover, ring, radius = lover[circle], ring[circle], radius[circle]
+    angle = k / np.maximum(points[circle] - 1, 1) * 2*math.pi
+    
+    px = x[lover] + radius * np.cos(angle + time * 0.5)
+    py = y[lover] + radius * np.sin(angle + time * 0.5)
+    
+    # Pink to red gradient
+    hue = 0.95 - 0.1 * love[lover]
+    saturation = 0.7 + 0.3 * heartbeat[lover]
+    value = 0.8 * (1 - ring/5)
+    
+    intensity = heartbeat[lover] * (1 - ring/5)
+    return px, py, hsv(hue, saturation, value) * intensity[:, np.newaxis] * 0.15, intensity * 0.15
+
+def court_with_growth(x, y, heartbeat, love, time):
+    """Exponential love grows without bound"""
+    lover, t = ragged((30 * (1 + love)).astype(int))
+    angle = np.arange(5)[:, np.newaxis] * 2 * math.pi / 5 + time * 0.3 + t * 0.02  # (branch, sample)
+    
+    # Exponential growth
+    r = np.exp(t * 0.05) * heartbeat[lover] * 2
+    
+    px = x[lover] + r * np.cos(angle)
+    py = y[lover] + r * np.sin(angle)
+    
+    # Golden love
+    hue = 0.1 + 0.05 * np.sin(t * 0.1)
+    saturation = 0.9 * heartbeat[lover]
+    value = 0.9 * np.exp(-t * 0.02)
+    return px, py, hsv(hue, saturation, value) * 0.2, 0.2
+
+def court_with_spirals(x, y, heartbeat, love, time):
+    """Logarithmic spirals of infinite approach"""
+    direction = np.array([1, -1])[:, np.newaxis]
+    t = np.linspace(0.1, 5, 150)
+    
+    r = 30 * np.log(t) * heartbeat[:, np.newaxis, np.newaxis]
+    angle = t * direction + time * 0.5
+    
+    px = x[:, np.newaxis, np.newaxis] + r * np.cos(angle)
+    py = y[:, np.newaxis, np.newaxis] + r * np.sin(angle)
+    
+    # Deep rose colors
+    hue = 0.95
+    saturation = 0.8 * heartbeat[:, np.newaxis, np.newaxis]
+    value = 0.8 * (1 - t/5)
+    return px, py, hsv(hue, saturation, value) * 0.15, 0.15
+
+@lru_cache(maxsize=None)
+def lorenz_path(a, steps=300):
+    """Lorenz states after each of steps updates from (1, 1, 1), for a love-modified a"""
+    b = 28
+    c = 8/3
+    
+    state = np.array([1, 1, 1], dtype=np.float32)
+    path = np.empty((steps, 3), dtype=np.float32)
+    for i in range(steps):
+        # Lorenz equations
+        dx = a * (state[1] - state[0])
+        dy = state[0] * (b - state[2]) - state[1]
+        dz = state[0] * state[1] - c * state[2]
         
-        draw_love_fractal(x, y, 30 * heartbeat, 4)
+        state += np.array([dx, dy, dz]) * 0.01
+        path[i] = state
+    return path
 
-# Love connections visualizer
-class LoveConnection:
-    def __init__(self, lover1, lover2):
-        self.lovers = (lover1, lover2)
-        self.strength = 0
-        self.resonance_phase = 0
+def court_with_butterflies(x, y, heartbeat, love, time):
+    """Chaos creates butterfly effects of love"""
+    # Lorenz attractor parameters modified by love
+    paths = np.stack([lorenz_path(float(10 * (1 + l * 0.2))) for l in love]).reshape(len(love), 300, 3)
+    lover, i = ragged((300 * heartbeat).astype(int))
+    state = paths[lover, i]
+    
+    # Map to canvas
+    px = x[lover] + state[:, 0] * 5
+    py = y[lover] + state[:, 1] * 5
+    
+    # Iridescent love colors
+    hue = (i / 300 + time * 0.1) % 1
+    saturation = 0.7 * heartbeat[lover]
+    value = 0.8
+    return px, py, hsv(hue, saturation, value) * 0.1, 0.1
+
+def court_with_arcs(x, y, heartbeat, love, time):
+    """Parabolic arcs of affection"""
+    arc = np.arange(3)[:, np.newaxis]
+    t = np.linspace(-2, 2, 50)
+    
+    # Parabola y = ax²
+    px = x[:, np.newaxis, np.newaxis] + t * 30
+    py = y[:, np.newaxis, np.newaxis] - (t**2) * 10 * heartbeat[:, np.newaxis, np.newaxis] + arc * 20
+    
+    # Warm coral colors
+    hue = 0.05 + 0.02 * arc
+    saturation = 0.8 * heartbeat[:, np.newaxis, np.newaxis]
+    value = 0.9 * (1 - np.abs(t)/2)
+    return px, py, hsv(hue, saturation, value) * 0.2, 0.2
+
+def court_with_asymptotes(x, y, heartbeat, love, time):
+    """Hyperbolic approach, never quite touching"""
+    angle = np.arange(4)[:, np.newaxis] * math.pi / 2 + time * 0.3
+    t = np.linspace(-3, 3, 60)
+    t = t[np.abs(t) > 0.5]  # Avoid singularity
+    
+    # Hyperbola xy = 1
+    r = 20 / np.abs(t) * heartbeat[:, np.newaxis, np.newaxis]
+    
+    px = x[:, np.newaxis, np.newaxis] + r * np.cos(angle) * np.sign(t)
+    py = y[:, np.newaxis, np.newaxis] + r * np.sin(angle) * np.sign(t)
+    
+    # Purple passion
+    hue = 0.8 + 0.1 * love[:, np.newaxis, np.newaxis]
+    saturation = 0.8 * heartbeat[:, np.newaxis, np.newaxis]
+    value = 0.8 * np.exp(-np.abs(t)/3)
+    return px, py, hsv(hue, saturation, value) * 0.15, 0.15
+
+def court_with_vortex(x, y, heartbeat, love, time):
+    """Spiral vortex of devotion"""
+    t = np.linspace(0, 6*math.pi, 200)
+    r = 5 + t * 3 * heartbeat[:, np.newaxis]
+    angle = t + time * 0.5
+    
+    # Spiral with love distortion
+    love_wobble = np.sin(t * 3) * love[:, np.newaxis] * 10
+    
+    px = x[:, np.newaxis] + (r + love_wobble) * np.cos(angle)
+    py = y[:, np.newaxis] + (r + love_wobble) * np.sin(angle)
+    
+    # Pink to purple gradient
+    hue = 0.9 + 0.1 * (t / (6*math.pi))
+    saturation = 0.8 * heartbeat[:, np.newaxis]
+    value = 0.9 * (1 - t/(6*math.pi))
+    return px, py, hsv(hue, saturation, value) * 0.1, 0.1
+
+def court_with_recursion(x, y, heartbeat, love, time):
+    """Fractal love patterns, one recursion level at a time"""
+    angle = np.linspace(0, 2*math.pi, 6)
+    cx, cy, size, saturation = x, y, 30 * heartbeat, 0.9 * heartbeat
+    samples = []
+    
+    for depth in range(4, 0, -1):
+        keep = size >= 3
+        cx, cy, size, saturation = cx[keep], cy[keep], size[keep], saturation[keep]
+        
+        # Draw heart-shaped nodes
+        px = cx[:, np.newaxis] + size[:, np.newaxis] * np.cos(angle)
+        py = cy[:, np.newaxis] + size[:, np.newaxis] * np.sin(angle)
         
-    def strengthen(self):
-        """Love grows stronger over time"""
-        self.strength = min(1.0, self.strength + 0.01)
-        self.lovers[0].love_strength = self.strength
-        self.lovers[1].love_strength = self.strength
+        # Ruby red fractals
+        rgb = hsv(0.0, np.repeat(saturation, 6), 0.8 * (depth / 4))
+        samples.append((px.reshape(-1), py.reshape(-1), rgb))
         
-    def draw_connection(self, canvas, time):
-        """Visualize the love between functions"""
-        if self.strength > 0.1:
-            x1, y1 = self.lovers[0].position
-            x2, y2 = self.lovers[1].position
-            
-            # Multiple intertwining strands
-            for strand in range(int(3 * self.strength)):
-                phase = strand * 2 * math.pi / 3 + time
-                
-                steps = 50
-                for step in range(steps):
-                    t = step / steps
-                    
-                    # Bezier curve with sine modulation
-                    control_offset = math.sin(t * math.pi + phase) * 30 * self.strength
-                    perpendicular = np.array([-(y2-y1), x2-x1])
-                    perpendicular = perpendicular / (np.linalg.norm(perpendicular) + 1e-6)
-                    
-                    # Cubic bezier
-                    p0 = np.array([x1, y1])
-                    p1 = np.array([x1, y1]) + perpendicular * control_offset
-                    p2 = np.array([x2, y2]) - perpendicular * control_offset
-                    p3 = np.array([x2, y2])
-                    
-                    pos = (1-t)**3 * p0 + 3*(1-t)**2*t * p1 + 3*(1-t)*t**2 * p2 + t**3 * p3
-                    
-                    if 0 <= pos[0] < WIDTH and 0 <= pos[1] < HEIGHT:
-                        # Love strands in pink-red
-                        hue = 0.95 + 0.05 * math.sin(step * 0.2)
-                        saturation = 0.8 * self.strength
-                        value = 0.9 * (1 - abs(t - 0.5) * 2) * self.strength
-                        
-                        rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-                        
-                        canvas[int(pos[1]), int(pos[0]), :3] += np.array(rgb) * 0.2
-                        canvas[int(pos[1]), int(pos[0]), 3] = min(1, canvas[int(pos[1]), int(pos[0]), 3] + 0.2)
+        # Recursive love from every node
+        cx, cy = px.reshape(-1), py.reshape(-1)
+        size, saturation = np.repeat(size * 0.5, 6), np.repeat(saturation, 6)
+    
+    px, py, rgb = (np.concatenate(column) for column in zip(*samples))
+    return px, py, rgb * 0.3, 0.3
+
+COURTSHIP = {
+    'sine': court_with_waves,
+    'cosine': court_with_circles,
+    'exponential': court_with_growth,
+    'logarithm': court_with_spirals,
+    'parabola': court_with_arcs,
+    'hyperbola': court_with_asymptotes,
+    'spiral': court_with_vortex,
+    'fractal': court_with_recursion,
+    'chaos': court_with_butterflies,
+}
+
+# Love connections visualizer
+def draw_connections(lovers, time):
+    """Visualize the love between functions: strands along cubic beziers"""
+    first, second = np.nonzero(lovers.connected & (lovers.strength > 0.1))
+    strength = lovers.strength[first, second]
+    
+    # Multiple intertwining strands
+    pair, strand = ragged((3 * strength).astype(int))
+    strength = strength[pair, np.newaxis]
+    p0 = lovers.position[first[pair]].astype(np.float64)
+    p3 = lovers.position[second[pair]].astype(np.float64)
+    phase = strand[:, np.newaxis] * 2 * math.pi / 3 + time
+    
+    step = np.arange(50)
+    t = step / 50
+    
+    # Bezier curve with sine modulation
+    control_offset = np.sin(t * math.pi + phase) * 30 * strength
+    perpendicular = np.column_stack([-(p3[:, 1] - p0[:, 1]), p3[:, 0] - p0[:, 0]])
+    perpendicular /= np.hypot(perpendicular[:, 0], perpendicular[:, 1])[:, np.newaxis] + 1e-6
+    offset = perpendicular[:, np.newaxis] * control_offset[..., np.newaxis]
+    
+    # Cubic bezier
+    p1 = p0[:, np.newaxis] + offset
+    p2 = p3[:, np.newaxis] - offset
+    u = t[:, np.newaxis]
+    pos = (1-u)**3 * p0[:, np.newaxis] + 3*(1-u)**2*u * p1 + 3*(1-u)*u**2 * p2 + u**3 * p3[:, np.newaxis]
+    
+    # Love strands in pink-red
+    hue = 0.95 + 0.05 * np.sin(step * 0.2)
+    saturation = 0.8 * strength
+    value = 0.9 * (1 - np.abs(t - 0.5) * 2) * strength
+    return pos[..., 0], pos[..., 1], hsv(hue, saturation, value) * 0.2, 0.2
 
 # Initialize mathematical lovers
 print("Mathematical functions preparing to fall in love...")
 
-lovers = [
-    MathematicalLover('sine', (200, 300)),
-    MathematicalLover('cosine', (400, 200)),
-    MathematicalLover('exponential', (600, 300)),
-    MathematicalLover('logarithm', (800, 400)),
-    MathematicalLover('parabola', (300, 600)),
-    MathematicalLover('hyperbola', (500, 700)),
-    MathematicalLover('spiral', (700, 600)),
-    MathematicalLover('fractal', (200, 800)),
-    MathematicalLover('chaos', (800, 800))
-]
+lovers = Lovers([
+    ('sine', (200, 300)),
+    ('cosine', (400, 200)),
+    ('exponential', (600, 300)),
+    ('logarithm', (800, 400)),
+    ('parabola', (300, 600)),
+    ('hyperbola', (500, 700)),
+    ('spiral', (700, 600)),
+    ('fractal', (200, 800)),
+    ('chaos', (800, 800))
+])
 
 # Love simulation
-connections = []
+strokes = StrokeBatch()
 print("Love beginning to bloom...")
 
-for time_step in range(200):
+for time_step in range(TIME_STEPS):
     time = time_step * 0.1
     
-    # Clear attractions
-    for lover in lovers:
-        lover.velocity *= 0.9  # Damping
-    
     # Calculate attractions
-    for i, lover1 in enumerate(lovers):
-        for j, lover2 in enumerate(lovers[i+1:], i+1):
-            # Feel mutual attraction
-            force1 = lover1.feel_attraction(lover2)
-            force2 = lover2.feel_attraction(lover1)
-            
-            lover1.velocity += force1 * 0.01
-            lover2.velocity -= force2 * 0.01  # Newton's third law
-            
-            # Check for love connection
-            distance = np.linalg.norm(lover1.position - lover2.position)
-            if distance < 50:
-                # Check if connection exists
-                existing = False
-                for conn in connections:
-                    if (lover1 in conn.lovers and lover2 in conn.lovers):
-                        conn.strengthen()
-                        existing = True
-                        break
-                
-                if not existing:
-                    connections.append(LoveConnection(lover1, lover2))
-                    print(f"{lover1.type} and {lover2.type} fall in love!")
+    force, distance = lovers.feel_attraction()
+    
+    # Check for love connections
+    for i, j in lovers.fall_in_love(distance):
+        print(f"{FUNCTION_TYPES[lovers.type[i]]} and {FUNCTION_TYPES[lovers.type[j]]} fall in love!")
     
     # Update positions
-    for lover in lovers:
-        lover.position += lover.velocity
-        
-        # Keep on canvas
-        lover.position[0] = np.clip(lover.position[0], 50, WIDTH-50)
-        lover.position[1] = np.clip(lover.position[1], 50, HEIGHT-50)
-        
-        # Express love
-        lover.court(canvas, time)
+    lovers.move(force)
+    
+    # Express love
+    lovers.court(strokes, time)
     
     # Draw connections
-    for connection in connections:
-        connection.draw_connection(canvas, time)
+    strokes.add(*draw_connections(lovers, time))
+    strokes.render(canvas, love_field)
     
     if time_step % 50 == 0:
         print(f"Love iteration {time_step}...")
@@ -421,23 +424,17 @@ for time_step in range(200):
 # Final touch - where love is strongest, add golden glow
 print("Adding the glow of true love...")
 
-for y in range(0, HEIGHT, 5):
-    for x in range(0, WIDTH, 5):
-        if love_field[y, x] > 0.5:
-            # Love creates light
-            intensity = love_field[y, x]
-            
-            for r in range(10, 0, -1):
-                glow = (1 - r/10) * intensity * 0.3
-                
-                for angle in np.linspace(0, 2*math.pi, max(10, r*2)):
-                    px = x + r * math.cos(angle)
-                    py = y + r * math.sin(angle)
-                    
-                    if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                        # Golden glow of love
-                        canvas[int(py), int(px), :3] += np.array([1, 0.9, 0.7]) * glow * 0.1
-                        canvas[int(py), int(px), 3] = min(1, canvas[int(py), int(px), 3] + glow * 0.1)
+y, x = np.mgrid[0:HEIGHT:5, 0:WIDTH:5]
+loved = love_field[y, x] > 0.5
+
+# Love creates light
+intensity = love_field[y, x][loved]
+px, py, r, center = sample_rings(np.column_stack([x[loved], y[loved]]), np.arange(10, 0, -1), 10, per_radius=2)
+glow = (1 - r/10) * intensity[center] * 0.3
+
+# Golden glow of love
+strokes.add(px, py, np.outer(glow * 0.1, [1, 0.9, 0.7]), glow * 0.1)
+strokes.render(canvas, love_field)
 
 # Convert to RGB
 canvas_rgb = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
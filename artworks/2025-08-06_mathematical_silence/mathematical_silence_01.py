@@ -9,29 +9,26 @@ The silence where understanding grows.
 """
 
 import numpy as np
-from PIL import Image
 import math
 import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.backgrounds import BackgroundLayers, blend, to_image
 
 def create_mathematical_silence():
     size = 1080
-    img = Image.new('RGB', (size, size), (25, 25, 30))
-    pixels = img.load()
-    
     center = size // 2
+    layers = BackgroundLayers(size, size)
     
     # Silence isn't uniform - it has texture, depth
-    # Create a field of almost-nothing
-    for y in range(size):
-        for x in range(size):
-            # Very subtle noise - the texture of silence
-            noise = random.gauss(0, 3)
-            base = pixels[x, y]
-            pixels[x, y] = (
-                max(0, min(255, base[0] + int(noise))),
-                max(0, min(255, base[1] + int(noise))),
-                max(0, min(255, base[2] + int(noise * 1.2)))
-            )
+    # Create a field of almost-nothing: very subtle noise, the texture of silence
+    canvas = layers.solid((25, 25, 30))
+    noise = layers.noise(3)[..., np.newaxis] * np.float32([1, 1, 1.2])
+    blend(canvas, np.trunc(noise), 'add')
+    img = to_image(canvas)
+    pixels = img.load()
     
     # Mathematical operations that almost happen
     # Calculations that pause mid-process
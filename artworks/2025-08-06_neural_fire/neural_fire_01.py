@@ -10,228 +10,193 @@ The electrical storm of artificial consciousness.
 from PIL import Image, ImageDraw
 import numpy as np
 import math
-import random
+from scipy.spatial import cKDTree
+import sys
+from pathlib import Path
 
-def create_neural_fire():
-    size = 1080
-    img = Image.new('RGB', (size, size), (5, 5, 10))
-    draw = ImageDraw.Draw(img)
-    pixels = img.load()
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.sprites import GlowSprites, stamp
+
+# Radial glows are rendered once per radius and stamped
+glow_sprites = GlowSprites()
+
+def render_burst(rng, reach=40):
+    """One neural fire burst as a scalar kernel: random rays from the center
     
-    # Create neural network layers
-    layers = []
-    num_layers = 7
+    Rays leave the inner rings at random angles and fade along their
+    length; where they cross the brighter value is kept.
+    """
+    r = np.arange(14, 0, -1)[:, np.newaxis]
+    angle = np.radians(np.arange(0, 360, 10))[np.newaxis, :]
+    fires = rng.random((len(r), angle.shape[1])) < 0.3
+    intensity = np.broadcast_to(1 - r / 25, fires.shape)[fires]
+    angle = np.broadcast_to(angle, fires.shape)[fires]
+    length = rng.integers(20, 41, size=len(angle))
+    
+    rt = np.arange(10) / 10
+    rx = np.rint(length[:, np.newaxis] * np.cos(angle)[:, np.newaxis] * rt).astype(int)
+    ry = np.rint(length[:, np.newaxis] * np.sin(angle)[:, np.newaxis] * rt).astype(int)
+    kernel = np.zeros((2 * reach + 1, 2 * reach + 1), dtype=np.float32)
+    np.maximum.at(kernel, (ry + reach, rx + reach), intensity[:, np.newaxis] * (1 - rt))
+    kernel.flags.writeable = False
+    return kernel
+
+class NeuralNetwork:
+    """Layered network held as arrays and rendered in batches
     
-    for layer_idx in range(num_layers):
-        layer_x = 100 + layer_idx * 140
-        neurons_in_layer = random.randint(8, 15)
-        neurons = []
+    Neurons are per-layer arrays of position, activation and charge.
+    Synapses become one (edges, 20) polyline array with jitter and signal
+    pulse per vertex, laid down with a single batched glow stamp.
+    """
+    
+    def __init__(self, size=1080, num_layers=7, neurons_per_layer=(8, 15),
+                 burst_variants=8, seed=None):
+        self.size = size
+        self.rng = np.random.default_rng(seed)
+        layer_spacing = min(140, (size - 200) / (num_layers - 1))
         
-        for n in range(neurons_in_layer):
-            y_spacing = size / (neurons_in_layer + 1)
-            neuron_y = y_spacing * (n + 1)
+        self.layers = []
+        for layer_idx in range(num_layers):
+            count = self.rng.integers(neurons_per_layer[0], neurons_per_layer[1] + 1)
+            y_spacing = size / (count + 1)
             
             # Each neuron has activation state
-            activation = random.random()
+            activation = self.rng.random(count)
             if layer_idx == 0:  # Input layer more active
-                activation = random.uniform(0.6, 1.0)
+                activation = self.rng.uniform(0.6, 1.0, count)
             elif layer_idx == num_layers - 1:  # Output layer selective
-                activation = random.uniform(0, 0.7) if random.random() < 0.7 else random.uniform(0.8, 1.0)
+                activation = np.where(self.rng.random(count) < 0.7,
+                                      self.rng.uniform(0, 0.7, count),
+                                      self.rng.uniform(0.8, 1.0, count))
             
-            neurons.append({
-                'x': layer_x + random.randint(-20, 20),
-                'y': neuron_y + random.randint(-30, 30),
+            self.layers.append({
+                'x': 100 + layer_idx * layer_spacing + self.rng.integers(-20, 21, count),
+                'y': y_spacing * np.arange(1, count + 1) + self.rng.integers(-30, 31, count),
                 'activation': activation,
                 'firing': activation > 0.7,
-                'charge': random.uniform(0, 2 * math.pi)
+                'charge': self.rng.uniform(0, 2 * math.pi, count)
             })
         
-        layers.append(neurons)
+        # A handful of ray bursts, shared by all firing neurons
+        self.bursts = [render_burst(self.rng) for _ in range(burst_variants)]
+    
+    def neurons(self, key):
+        """One attribute of every neuron, all layers concatenated"""
+        return np.concatenate([layer[key] for layer in self.layers])
     
-    # Draw connections with propagating signals
-    for layer_idx in range(len(layers) - 1):
-        current_layer = layers[layer_idx]
-        next_layer = layers[layer_idx + 1]
+    def synapses(self, num_segments=20):
+        """Polylines of every strong connection as (x, y, color) vertex arrays"""
+        xs, ys, colors = [], [], []
+        t = np.arange(num_segments) / num_segments
+        arc = np.sin(t * math.pi)
         
-        for neuron1 in current_layer:
-            if not neuron1['firing']:
+        for current_layer, next_layer in zip(self.layers, self.layers[1:]):
+            source = np.flatnonzero(current_layer['firing'])
+            n_next = len(next_layer['x'])
+            if not len(source):
                 continue
-                
-            # Connect to subset of next layer (not all)
-            num_connections = random.randint(2, min(7, len(next_layer)))
-            connected_neurons = random.sample(next_layer, num_connections)
             
-            for neuron2 in connected_neurons:
-                # Connection strength based on activations
-                strength = neuron1['activation'] * neuron2['activation']
-                
-                if strength > 0.3:  # Only draw strong connections
-                    # Draw synaptic connection as electric arc
-                    num_segments = 20
-                    for seg in range(num_segments):
-                        t = seg / num_segments
-                        
-                        # Electric arc with jitter
-                        jitter_x = random.uniform(-10, 10) * math.sin(t * math.pi)
-                        jitter_y = random.uniform(-10, 10) * math.sin(t * math.pi)
-                        
-                        x = neuron1['x'] + (neuron2['x'] - neuron1['x']) * t + jitter_x
-                        y = neuron1['y'] + (neuron2['y'] - neuron1['y']) * t + jitter_y
-                        
-                        # Signal propagation visualization
-                        signal_pulse = math.sin(t * math.pi) * strength
-                        
-                        # Color based on signal strength
-                        if neuron1['firing'] and neuron2['firing']:
-                            # Active connection - bright white-blue
-                            color = (
-                                int(100 + 155 * signal_pulse),
-                                int(150 + 105 * signal_pulse),
-                                int(200 + 55 * signal_pulse)
-                            )
-                        else:
-                            # Dormant connection - dim purple
-                            color = (
-                                int(40 + 30 * signal_pulse),
-                                int(30 + 20 * signal_pulse),
-                                int(50 + 40 * signal_pulse)
-                            )
-                        
-                        # Draw with glow effect
-                        for r in range(3):
-                            opacity = 1 - r / 3
-                            for angle in range(0, 360, 45):
-                                px = int(x + r * math.cos(math.radians(angle)))
-                                py = int(y + r * math.sin(math.radians(angle)))
-                                if 0 <= px < size and 0 <= py < size:
-                                    existing = pixels[px, py]
-                                    pixels[px, py] = tuple(
-                                        min(255, int(existing[i] + color[i] * opacity * 0.3))
-                                        for i in range(3)
-                                    )
-    
-    # Draw neurons as firing or dormant
-    for layer in layers:
-        for neuron in layer:
-            x, y = neuron['x'], neuron['y']
+            # Connect to a random subset of the next layer (not all)
+            num_connections = self.rng.integers(2, min(7, n_next) + 1, size=len(source))
+            order = np.argsort(self.rng.random((len(source), n_next)), axis=1)
+            keep = np.arange(n_next) < num_connections[:, np.newaxis]
+            row, rank = np.nonzero(keep)
+            a, b = source[row], order[row, rank]
             
-            if neuron['firing']:
-                # Firing neuron - bright burst
-                for r in range(25, 0, -1):
-                    intensity = (1 - r / 25) * neuron['activation']
-                    
-                    # Pulsing effect
-                    pulse = math.sin(neuron['charge']) * 0.3 + 0.7
-                    
-                    for angle in range(0, 360, 10):
-                        # Neural fire rays
-                        if r < 15 and random.random() < 0.3:
-                            ray_length = random.randint(20, 40)
-                            ray_x = x + ray_length * math.cos(math.radians(angle))
-                            ray_y = y + ray_length * math.sin(math.radians(angle))
-                            
-                            # Draw ray
-                            for ray_t in range(10):
-                                rt = ray_t / 10
-                                rx = x + (ray_x - x) * rt
-                                ry = y + (ray_y - y) * rt
-                                
-                                ray_color = (
-                                    int(255 * intensity * (1 - rt)),
-                                    int(220 * intensity * (1 - rt)),
-                                    int(180 * intensity * (1 - rt))
-                                )
-                                
-                                if 0 <= int(rx) < size and 0 <= int(ry) < size:
-                                    draw.point((rx, ry), fill=ray_color)
-                        
-                        # Core glow
-                        px = x + r * math.cos(math.radians(angle)) * pulse
-                        py = y + r * math.sin(math.radians(angle)) * pulse
-                        
-                        color = (
-                            int(255 * intensity),
-                            int(200 * intensity),
-                            int(150 * intensity)
-                        )
-                        
-                        if 0 <= int(px) < size and 0 <= int(py) < size:
-                            existing = pixels[int(px), int(py)]
-                            pixels[int(px), int(py)] = tuple(
-                                min(255, existing[i] + color[i] // (r // 5 + 1))
-                                for i in range(3)
-                            )
-                
-                # White hot core
-                draw.ellipse([(x - 3, y - 3), (x + 3, y + 3)], 
-                           fill=(255, 255, 255))
+            # Connection strength based on activations; only strong ones are drawn
+            strength = current_layer['activation'][a] * next_layer['activation'][b]
+            strong = strength > 0.3
+            a, b, strength = a[strong], b[strong], strength[strong]
             
+            # Electric arc with jitter
+            jitter = self.rng.uniform(-10, 10, size=(len(a), num_segments, 2)) * arc[:, np.newaxis]
+            x1, y1 = current_layer['x'][a, np.newaxis], current_layer['y'][a, np.newaxis]
+            x2, y2 = next_layer['x'][b, np.newaxis], next_layer['y'][b, np.newaxis]
+            xs.append(x1 + (x2 - x1) * t + jitter[..., 0])
+            ys.append(y1 + (y2 - y1) * t + jitter[..., 1])
+            
+            # Signal propagation: active connections bright white-blue, dormant dim purple
+            signal_pulse = (arc * strength[:, np.newaxis])[..., np.newaxis]
+            active = next_layer['firing'][b][:, np.newaxis, np.newaxis]
+            colors.append(np.trunc(np.where(active,
+                                            np.array([100, 150, 200]) + np.array([155, 105, 55]) * signal_pulse,
+                                            np.array([40, 30, 50]) + np.array([30, 20, 40]) * signal_pulse)))
+        
+        if not xs:
+            return np.zeros(0), np.zeros(0), np.zeros((0, 3))
+        return (np.concatenate(xs).reshape(-1), np.concatenate(ys).reshape(-1),
+                np.concatenate(colors).reshape(-1, 3))
+    
+    def render(self):
+        size = self.size
+        canvas = np.array(Image.new('RGB', (size, size), (5, 5, 10)), dtype=np.float32)
+        x, y = self.neurons('x'), self.neurons('y')
+        activation, firing = self.neurons('activation'), self.neurons('firing')
+        
+        # Every synapse vertex with glow - opacity fading over 3 pixels,
+        # weighted to carry the light of the old 3x8 taps
+        sx, sy, colors = self.synapses()
+        glow_sprites.stamp_points(canvas, sx, sy, 3, colors * 0.5)
+        
+        # Neural fire rays burst out of firing neurons first, so their glow lands on top
+        for i in np.flatnonzero(firing):
+            burst = self.bursts[self.rng.integers(len(self.bursts))]
+            stamp(canvas, x[i], y[i], burst, np.multiply((255, 220, 180), activation[i]), mode='max')
+        
+        # Core glow of every firing neuron, stamped from cached sprites
+        pulse = np.sin(self.neurons('charge')) * 0.3 + 0.7
+        for i in np.flatnonzero(firing):
+            # Bright burst falling off steeply from the center
+            glow_sprites.stamp(canvas, x[i], y[i], round(25 * pulse[i]),
+                               np.multiply((255, 200, 150), activation[i]), exponent=2)
+        
+        img = Image.fromarray(np.clip(canvas, 0, 255).astype(np.uint8), 'RGB')
+        draw = ImageDraw.Draw(img)
+        
+        # Draw neurons as firing or dormant
+        for nx, ny, fires in zip(x, y, firing):
+            if fires:
+                # White hot core
+                draw.ellipse([(nx - 3, ny - 3), (nx + 3, ny + 3)], fill=(255, 255, 255))
             else:
                 # Dormant neuron - dim glow
                 for r in range(15, 0, -2):
                     opacity = (1 - r / 15) * 0.3
-                    color = (
-                        int(50 * opacity),
-                        int(40 * opacity),
-                        int(60 * opacity)
-                    )
-                    
-                    draw.ellipse([(x - r, y - r), (x + r, y + r)], 
-                               outline=color, width=1)
+                    color = (int(50 * opacity), int(40 * opacity), int(60 * opacity))
+                    draw.ellipse([(nx - r, ny - r), (nx + r, ny + r)], outline=color, width=1)
                 
                 # Dim core
-                draw.ellipse([(x - 2, y - 2), (x + 2, y + 2)], 
-                           fill=(30, 25, 40))
-    
-    # Add neural static/noise
-    for _ in range(5000):
-        x = random.randint(0, size - 1)
-        y = random.randint(0, size - 1)
+                draw.ellipse([(nx - 2, ny - 2), (nx + 2, ny + 2)], fill=(30, 25, 40))
         
-        # Check if near active neural pathway
-        near_neuron = False
-        for layer in layers:
-            for neuron in layer:
-                if neuron['firing']:
-                    dist = math.sqrt((x - neuron['x'])**2 + (y - neuron['y'])**2)
-                    if dist < 100:
-                        near_neuron = True
-                        break
+        canvas = np.array(img, dtype=np.int32)
         
-        if near_neuron:
-            # Neural static
-            current = pixels[x, y]
-            static = random.randint(5, 25)
-            pixels[x, y] = tuple(
-                min(255, c + static)
-                for c in current
-            )
-    
-    # Backpropagation ghosts - faint reverse signals
-    for layer_idx in range(len(layers) - 1, 0, -1):
-        current_layer = layers[layer_idx]
-        prev_layer = layers[layer_idx - 1]
+        # Neural static near active neural pathways
+        static_x = self.rng.integers(0, size, 5000)
+        static_y = self.rng.integers(0, size, 5000)
+        if firing.any():
+            tree = cKDTree(np.column_stack([x[firing], y[firing]]))
+            near = tree.query(np.column_stack([static_x, static_y]), distance_upper_bound=100)[0] < 100
+            static = self.rng.integers(5, 26, size=near.sum())
+            np.add.at(canvas, (static_y[near], static_x[near]), static[:, np.newaxis])
         
-        for neuron in current_layer:
-            if neuron['firing'] and random.random() < 0.3:
-                # Send ghost signal backward
-                target = random.choice(prev_layer)
-                
-                # Faint backward connection
-                for t in range(10):
-                    prog = t / 10
-                    x = neuron['x'] + (target['x'] - neuron['x']) * prog
-                    y = neuron['y'] + (target['y'] - neuron['y']) * prog
-                    
-                    ghost_color = (20, 15, 30)
-                    if 0 <= int(x) < size and 0 <= int(y) < size:
-                        existing = pixels[int(x), int(y)]
-                        pixels[int(x), int(y)] = tuple(
-                            min(255, existing[i] + ghost_color[i])
-                            for i in range(3)
-                        )
-    
-    return img
+        # Backpropagation ghosts - faint reverse signals
+        t = np.arange(10) / 10
+        for current_layer, prev_layer in zip(self.layers[:0:-1], self.layers[-2::-1]):
+            sends = current_layer['firing'] & (self.rng.random(len(current_layer['x'])) < 0.3)
+            if not sends.any():
+                continue
+            target = self.rng.integers(0, len(prev_layer['x']), size=sends.sum())
+            x1, y1 = current_layer['x'][sends, np.newaxis], current_layer['y'][sends, np.newaxis]
+            x2, y2 = prev_layer['x'][target, np.newaxis], prev_layer['y'][target, np.newaxis]
+            gx = (x1 + (x2 - x1) * t).astype(int).reshape(-1)
+            gy = (y1 + (y2 - y1) * t).astype(int).reshape(-1)
+            inside = (0 <= gx) & (gx < size) & (0 <= gy) & (gy < size)
+            np.add.at(canvas, (gy[inside], gx[inside]), np.array([20, 15, 30]))
+        
+        return Image.fromarray(np.clip(canvas, 0, 255).astype(np.uint8), 'RGB')
+
+def create_neural_fire(neurons_per_layer=(8, 15), seed=None):
+    return NeuralNetwork(neurons_per_layer=neurons_per_layer, seed=seed).render()
 
 if __name__ == "__main__":
     artwork = create_neural_fire()
@@ -8,29 +8,30 @@ Exploring the boundaries between order and chaos, solid and liquid, known and un
 """
 
 import numpy as np
-from PIL import Image, ImageDraw
 import math
 import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meditations.backgrounds import BackgroundLayers, blend, to_image
 
 def create_phase_transition():
     size = 1080
-    img = Image.new('RGB', (size, size), (10, 10, 15))
-    draw = ImageDraw.Draw(img)
-    pixels = img.load()
+    layers = BackgroundLayers(size, size)
     
-    # Temperature gradient across the canvas - the driver of phase change
-    for y in range(size):
-        temperature = y / size  # 0 (cold/ordered) to 1 (hot/chaotic)
-        
-        for x in range(size):
-            # Local fluctuations in temperature
-            local_temp = temperature + 0.1 * math.sin(x * 0.01) * math.cos(y * 0.01)
-            
-            # Background gradient from deep blue (cold) to red (hot)
-            base_r = int(20 + local_temp * 180)
-            base_g = int(30 + (1 - abs(local_temp - 0.5) * 2) * 100)
-            base_b = int(200 * (1 - local_temp))
-            pixels[x, y] = (base_r, base_g, base_b)
+    # Temperature gradient across the canvas - the driver of phase change,
+    # 0 (cold/ordered) to 1 (hot/chaotic), with local fluctuations
+    local_temp = layers.gradient(math.pi / 2) + 0.1 * layers.sine(fx=0.01) * layers.cosine(fy=0.01)
+    
+    # Background gradient from deep blue (cold) to red (hot)
+    background = np.trunc(np.stack([
+        20 + local_temp * 180,
+        30 + (1 - np.abs(local_temp - 0.5) * 2) * 100,
+        200 * (1 - local_temp)
+    ], axis=-1))
+    img = to_image(background)
+    pixels = img.load()
     
     # Critical temperature lines - where phase transitions occur
     critical_temps = [0.25, 0.5, 0.75]  # Three major phase boundaries
@@ -126,18 +127,13 @@ def create_phase_transition():
                     random.randint(0, 50)
                 )
     
-    # Plasma state at the very top (complete ionization)
-    for y in range(int(size * 0.9), size):
-        for x in range(size):
-            # Plasma shimmer effect
-            plasma_intensity = random.random()
-            if plasma_intensity > 0.7:
-                # Ionized particles - purple-white
-                pixels[x, y] = (
-                    random.randint(200, 255),
-                    random.randint(100, 200),
-                    random.randint(200, 255)
-                )
+    # Plasma state at the very top (complete ionization) - a shimmer of
+    # ionized particles, purple-white
+    canvas = np.asarray(img, dtype=np.float32).copy()
+    plasma = layers.speckle(0.3, rows=slice(int(size * 0.9), None))
+    blend(canvas, layers.random_colors((200, 100, 200), (255, 200, 255)), mask=plasma)
+    img = to_image(canvas)
+    pixels = img.load()
     
     # Add critical point markers - where phase transitions are most dramatic
     for ct in critical_temps:
@@ -171,23 +167,10 @@ def create_phase_transition():
             )
     
     # Add subtle grid to show the underlying mathematical structure
-    for i in range(0, size, 60):
-        for j in range(size):
-            if j % 2 == 0:
-                current = pixels[i, j]
-                pixels[i, j] = (
-                    min(255, current[0] + 10),
-                    min(255, current[1] + 10),
-                    min(255, current[2] + 10)
-                )
-                current = pixels[j, i]
-                pixels[j, i] = (
-                    min(255, current[0] + 10),
-                    min(255, current[1] + 10),
-                    min(255, current[2] + 10)
-                )
+    canvas = np.asarray(img, dtype=np.float32).copy()
+    blend(canvas, layers.grid(60), 'add', opacity=10)
     
-    return img
+    return to_image(canvas)
 
 if __name__ == "__main__":
     print("Creating Phase Transition...")
@@ -8,199 +8,168 @@ The paradox of consciousness observing itself in the act of observation.
 """
 
 import numpy as np
-from PIL import Image, ImageDraw
+from PIL import Image
 import math
+from scipy.spatial import cKDTree
+
+def ring_kernel(radii=range(1, 30), angles=range(0, 360, 30), strength=60):
+    """Offsets and truncated fading weights of the ripple rings, radius by radius"""
+    r = np.repeat(np.array(radii), len(angles))
+    rad = np.radians(np.tile(np.array(angles), len(radii)))
+    weight = (strength * (1 - r / (max(radii) + 1))).astype(int)
+    return r * np.cos(rad), r * np.sin(rad), weight
+
+def loop_connections(points, min_dist, max_dist, links_per_point=2, darts=8):
+    """Random links between points min_dist to max_dist apart, a few per point
+    
+    Every point throws a few darts uniformly over its min_dist-max_dist
+    annulus and links to the point nearest each dart, if that one lies in
+    the annulus too; it keeps the first links_per_point distinct hits.
+    One KD-tree query covers every dart, so the cost follows the number
+    of points rather than the millions of pairs in range. Returns an
+    (n, 2, 2) array of start and end points.
+    """
+    count = len(points)
+    r = np.sqrt(np.random.uniform(min_dist ** 2, max_dist ** 2, (count, darts)))
+    angle = np.random.uniform(0, 2 * np.pi, (count, darts))
+    aim = points[:, np.newaxis] + np.stack([r * np.cos(angle), r * np.sin(angle)], axis=-1)
+    _, target = cKDTree(points).query(aim.reshape(-1, 2))
+    target = target.reshape(count, darts)
+    
+    dist = np.hypot(*(points[target] - points[:, np.newaxis]).transpose(2, 0, 1))
+    hit = (dist > min_dist) & (dist <= max_dist)
+    # A point hit by an earlier dart is not linked twice
+    hit &= ~np.triu(target[:, :, np.newaxis] == target[:, np.newaxis, :], k=1).any(axis=1)
+    hit &= np.cumsum(hit, axis=1) <= links_per_point
+    
+    source, dart = np.nonzero(hit)
+    return points[np.column_stack([source, target[source, dart]])]
+
+def add_light(light, x, y, rgb):
+    """Add whole-number rgb at pixels (x, y) of an integer canvas, skipping those off it
+    
+    The light is saturated at 255 only when the canvas becomes an image;
+    with nothing but additions that equals saturating after each one.
+    """
+    size = light.shape[0]
+    x, y = np.broadcast_arrays(x, y)
+    rgb = np.broadcast_to(rgb, x.shape + (3,))
+    inside = (0 <= x) & (x < size) & (0 <= y) & (y < size)
+    np.add.at(light, (y[inside], x[inside]), rgb[inside])
 
 def create_strange_loop():
     size = 1080
-    img = Image.new('RGB', (size, size), (0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    pixels = img.load()
-    
     center = size // 2
     
-    # The loop begins - each layer aware of the previous
-    awareness_levels = []
+    # The loop begins - each layer aware of the previous, each level an
+    # array of points composited onto a float canvas
+    canvas = np.zeros((size, size, 3))
     
     # Level 0: The base reality - a simple rotating spiral
-    for angle in range(0, 3600, 5):
-        rad = math.radians(angle / 10)
-        r = angle / 20
-        if r < size // 2:
-            x = int(center + r * math.cos(rad))
-            y = int(center + r * math.sin(rad))
-            if 0 <= x < size and 0 <= y < size:
-                # Deep blue base consciousness
-                pixels[x, y] = (20, 40, 100)
-                awareness_levels.append((x, y, 0))
+    angle = np.arange(0, 3600, 5)
+    rad = np.radians(angle / 10)
+    r = angle / 20
+    level_0 = np.column_stack([(center + r * np.cos(rad)).astype(int),
+                               (center + r * np.sin(rad)).astype(int)])
+    # Deep blue base consciousness
+    canvas[level_0[:, 1], level_0[:, 0]] = (20, 40, 100)
     
     # Level 1: Consciousness observing the spiral
-    for point in awareness_levels[:]:
-        if point[2] == 0:
-            x, y, level = point
-            # The observer creates ripples in reality
-            for r in range(1, 30):
-                for theta in range(0, 360, 30):
-                    rad = math.radians(theta)
-                    ox = int(x + r * math.cos(rad))
-                    oy = int(y + r * math.sin(rad))
-                    if 0 <= ox < size and 0 <= oy < size:
-                        current = pixels[ox, oy]
-                        # Green awareness of blue
-                        fade = 1 - (r / 30)
-                        pixels[ox, oy] = (
-                            current[0],
-                            min(255, current[1] + int(60 * fade)),
-                            current[2]
-                        )
-                        if r == 15:
-                            awareness_levels.append((ox, oy, 1))
+    # The observer creates ripples in reality - green awareness of blue
+    ripple_x, ripple_y, ripple_weight = ring_kernel()
+    ox = (level_0[:, :1] + ripple_x).astype(int)
+    oy = (level_0[:, 1:] + ripple_y).astype(int)
+    inside = (0 <= ox) & (ox < size) & (0 <= oy) & (oy < size)
+    weights = np.broadcast_to(ripple_weight, ox.shape)[inside]
+    canvas[:, :, 1] += np.bincount(oy[inside] * size + ox[inside], weights=weights,
+                                   minlength=size * size).reshape(size, size)
+    on_ring = inside & (np.arange(len(ripple_weight)) // 12 == 14)  # r == 15
+    level_1 = np.column_stack([ox[on_ring], oy[on_ring]])
     
     # Level 2: Awareness of awareness - the first strange loop forms
-    # Sample subset to avoid exponential complexity
-    level_1_points = [p for p in awareness_levels if p[2] == 1]
-    sample_size = min(100, len(level_1_points))
-    import random
-    sampled_points = random.sample(level_1_points, sample_size) if level_1_points else []
-    
-    for point in sampled_points:
-        x, y, level = point
-        # Draw connections to nearby level-1 points
-        for other in sampled_points[:10]:  # Limit connections
-            if other != point:
-                ox, oy, _ = other
-                dist = math.sqrt((x - ox)**2 + (y - oy)**2)
-                if 50 < dist < 150:
-                    # Draw a faint connection
-                    steps = min(20, int(dist / 2))
-                    for i in range(steps):
-                        t = i / steps
-                        px = int(x + (ox - x) * t)
-                        py = int(y + (oy - y) * t)
-                        if 0 <= px < size and 0 <= py < size:
-                            current = pixels[px, py]
-                            # Cyan meta-awareness
-                            pixels[px, py] = (
-                                min(255, current[0] + 30),
-                                min(255, current[1] + 30),
-                                min(255, current[2] + 50)
-                            )
+    # Every level-1 point reaches for a few others 50-150px away
+    links = loop_connections(np.unique(level_1, axis=0), 50, 150, links_per_point=2)
+    t = np.arange(20) / 20
+    start, end = links[:, 0, np.newaxis, :], links[:, 1, np.newaxis, :]
+    px = (start[..., 0] + (end[..., 0] - start[..., 0]) * t).astype(int)
+    py = (start[..., 1] + (end[..., 1] - start[..., 1]) * t).astype(int)
+    inside = (0 <= px) & (px < size) & (0 <= py) & (py < size)
+    visits = np.bincount(py[inside] * size + px[inside], minlength=size * size).reshape(size, size)
+    # Faint cyan meta-awareness; many more links than the old 100-point sample
+    for channel, shade in enumerate((30, 30, 50)):
+        canvas[:, :, channel] += visits * shade * 0.15
+    
+    # Levels 3-5 add whole-number light on top of the 8-bit image so far
+    light = np.clip(canvas, 0, 255, out=canvas).astype(np.int32)
     
     # Level 3: The paradox emerges - awareness aware of its own awareness
     # Creating Penrose stairs in consciousness
-    vertices = []
-    for i in range(6):
-        angle = i * 60
-        rad = math.radians(angle)
-        x = int(center + 200 * math.cos(rad))
-        y = int(center + 200 * math.sin(rad))
-        vertices.append((x, y))
-    
-    # Connect vertices in an impossible pattern
-    for i in range(6):
-        start = vertices[i]
-        end = vertices[(i + 1) % 6]
-        mid = vertices[(i + 3) % 6]
-        
-        # Draw impossible connections
-        for t in range(0, 100, 2):
-            t_norm = t / 100
-            
-            # First path - direct but twisted
-            x1 = int(start[0] + (end[0] - start[0]) * t_norm)
-            y1 = int(start[1] + (end[1] - start[1]) * t_norm)
-            
-            # Second path - through middle, creating paradox
-            if t_norm < 0.5:
-                x2 = int(start[0] + (mid[0] - start[0]) * (t_norm * 2))
-                y2 = int(start[1] + (mid[1] - start[1]) * (t_norm * 2))
-            else:
-                x2 = int(mid[0] + (end[0] - mid[0]) * ((t_norm - 0.5) * 2))
-                y2 = int(mid[1] + (end[1] - mid[1]) * ((t_norm - 0.5) * 2))
-            
-            # Blend the paths - creating visual paradox
-            for blend in range(10):
-                b = blend / 10
-                x = int(x1 * (1 - b) + x2 * b)
-                y = int(y1 * (1 - b) + y2 * b)
-                
-                if 0 <= x < size and 0 <= y < size:
-                    current = pixels[x, y]
-                    # Purple paradox with golden highlights
-                    intensity = math.sin(t_norm * math.pi) * 255
-                    pixels[x, y] = (
-                        min(255, current[0] + int(intensity * 0.6)),
-                        min(255, current[1] + int(intensity * 0.3)),
-                        min(255, current[2] + int(intensity * 0.8))
-                    )
+    rad = np.radians(np.arange(6) * 60)
+    vertices = np.column_stack([(center + 200 * np.cos(rad)).astype(int),
+                                (center + 200 * np.sin(rad)).astype(int)])
+    
+    # Connect vertices in an impossible pattern: (vertex, t, blend)
+    start = vertices[:, np.newaxis, np.newaxis, :]
+    end = np.roll(vertices, -1, axis=0)[:, np.newaxis, np.newaxis, :]
+    mid = np.roll(vertices, -3, axis=0)[:, np.newaxis, np.newaxis, :]
+    t_norm = (np.arange(0, 100, 2) / 100)[:, np.newaxis, np.newaxis]
+    
+    # First path - direct but twisted
+    p1 = (start + (end - start) * t_norm).astype(int)
+    
+    # Second path - through middle, creating paradox
+    p2 = np.where(t_norm < 0.5,
+                  start + (mid - start) * (t_norm * 2),
+                  mid + (end - mid) * ((t_norm - 0.5) * 2)).astype(int)
+    
+    # Blend the paths - creating visual paradox
+    b = (np.arange(10) / 10)[:, np.newaxis]
+    p = (p1 * (1 - b) + p2 * b).astype(int)
+    
+    # Purple paradox with golden highlights
+    intensity = np.sin(t_norm[..., 0] * math.pi) * 255
+    rgb = np.stack([(intensity * 0.6).astype(int), (intensity * 0.3).astype(int),
+                    (intensity * 0.8).astype(int)], axis=-1)
+    add_light(light, p[..., 0], p[..., 1], rgb)
     
     # Level 4: The observer observes itself observing
     # Create a Möbius strip of consciousness
-    for u in range(0, 360, 3):
-        u_rad = math.radians(u)
-        for v in range(-50, 51, 5):
-            # Möbius strip equations
-            x = (300 + v * math.cos(u_rad / 2)) * math.cos(u_rad)
-            y = (300 + v * math.cos(u_rad / 2)) * math.sin(u_rad)
-            z = v * math.sin(u_rad / 2)
-            
-            # Project to 2D with perspective
-            px = int(center + x * 0.7)
-            py = int(center + y * 0.7 + z * 0.3)
-            
-            if 0 <= px < size and 0 <= py < size:
-                # Color based on twist
-                twist = (u + v) % 360
-                hue_shift = twist / 360
-                
-                current = pixels[px, py]
-                if hue_shift < 0.33:
-                    # Red phase - the beginning
-                    pixels[px, py] = (
-                        min(255, current[0] + 100),
-                        min(255, current[1] + 20),
-                        min(255, current[2] + 20)
-                    )
-                elif hue_shift < 0.66:
-                    # Green phase - the middle
-                    pixels[px, py] = (
-                        min(255, current[0] + 20),
-                        min(255, current[1] + 100),
-                        min(255, current[2] + 20)
-                    )
-                else:
-                    # Blue phase - the end that is the beginning
-                    pixels[px, py] = (
-                        min(255, current[0] + 20),
-                        min(255, current[1] + 20),
-                        min(255, current[2] + 100)
-                    )
+    u = np.arange(0, 360, 3)[:, np.newaxis]
+    v = np.arange(-50, 51, 5)
+    u_rad = np.radians(u)
+    
+    # Möbius strip equations
+    x = (300 + v * np.cos(u_rad / 2)) * np.cos(u_rad)
+    y = (300 + v * np.cos(u_rad / 2)) * np.sin(u_rad)
+    z = v * np.sin(u_rad / 2)
+    
+    # Project to 2D with perspective
+    px = (center + x * 0.7).astype(int)
+    py = (center + y * 0.7 + z * 0.3).astype(int)
+    
+    # Color based on twist: red beginning, green middle, blue end that is the beginning
+    hue_shift = ((u + v) % 360) / 360
+    phase = np.digitize(hue_shift, [0.33, 0.66])
+    add_light(light, px, py, (20 + 80 * np.eye(3, dtype=int))[phase])
     
     # Level 5: The infinite recursion - I am aware that I am aware that I am aware...
     # Create visual echoes that fade into themselves
+    rad = np.radians(np.arange(0, 360, 10))[:, np.newaxis]
     for depth in range(5):
         scale = 1 - (depth * 0.15)
         offset = depth * 30
         
-        for angle in range(0, 360, 10):
-            rad = math.radians(angle)
-            
-            # Recursive spirals within spirals
-            for r in range(10, int(200 * scale), 5):
-                x = int(center + offset * math.cos(rad * depth) + r * math.cos(rad + r * 0.1))
-                y = int(center + offset * math.sin(rad * depth) + r * math.sin(rad + r * 0.1))
-                
-                if 0 <= x < size and 0 <= y < size:
-                    current = pixels[x, y]
-                    # Each level more transparent, more questioning
-                    fade = 1 - (depth / 5)
-                    
-                    # White light of recursive awareness
-                    pixels[x, y] = (
-                        min(255, current[0] + int(50 * fade)),
-                        min(255, current[1] + int(50 * fade)),
-                        min(255, current[2] + int(50 * fade))
-                    )
+        # Recursive spirals within spirals
+        r = np.arange(10, int(200 * scale), 5)
+        x = (center + offset * np.cos(rad * depth) + r * np.cos(rad + r * 0.1)).astype(int)
+        y = (center + offset * np.sin(rad * depth) + r * np.sin(rad + r * 0.1)).astype(int)
+        
+        # White light of recursive awareness, each level more transparent
+        fade = 1 - (depth / 5)
+        add_light(light, x, y, int(50 * fade))
+    
+    img = Image.fromarray(np.minimum(light, 255).astype(np.uint8))
+    pixels = img.load()
     
     # The final paradox: This statement is false
     # Create a visual representation of logical paradox
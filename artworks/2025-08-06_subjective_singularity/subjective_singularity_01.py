@@ -11,8 +11,43 @@ import numpy as np
 from PIL import Image, ImageDraw
 import math
 import random
+from scipy.ndimage import map_coordinates
 
-def create_subjective_singularity():
+def polar_pixels(center, r, angle):
+    """Integer pixel coordinates of polar points, truncated like int()"""
+    x = (center + r * np.cos(angle)).astype(int)
+    y = (center + r * np.sin(angle)).astype(int)
+    return np.broadcast_arrays(x, y)
+
+def polar_warp(canvas, center, r, angle, source_r, source_angle, order=0):
+    """Resample canvas from one set of polar coordinates onto another
+    
+    Every target point (r, angle) takes the color found at (source_r,
+    source_angle), all broadcast together, so a ring can be rotated,
+    shifted or compressed into another annulus in one call. order 0 reads
+    the pixel under each point; higher orders interpolate with
+    map_coordinates. Returns the target pixel coordinates, the colors and
+    a mask of points whose target and source both lie on the canvas.
+    """
+    r, angle, source_r, source_angle = np.broadcast_arrays(r, angle, source_r, source_angle)
+    height, width = canvas.shape[:2]
+    x, y = polar_pixels(center, r, angle)
+    valid = (0 <= x) & (x < width) & (0 <= y) & (y < height)
+    
+    if order == 0:
+        sx, sy = polar_pixels(center, source_r, source_angle)
+        valid &= (0 <= sx) & (sx < width) & (0 <= sy) & (sy < height)
+        colors = np.zeros(x.shape + canvas.shape[2:])
+        colors[valid] = canvas[sy[valid], sx[valid]]
+    else:
+        sx = center + source_r * np.cos(source_angle)
+        sy = center + source_r * np.sin(source_angle)
+        valid &= (0 <= sx) & (sx <= width - 1) & (0 <= sy) & (sy <= height - 1)
+        colors = np.stack([map_coordinates(canvas[..., c].astype(float), [sy, sx], order=order)
+                           for c in range(canvas.shape[2])], axis=-1)
+    return x, y, colors, valid
+
+def create_subjective_singularity(reflection_count=7, sample_order=0):
     size = 1080
     img = Image.new('RGB', (size, size), (5, 5, 10))
     pixels = img.load()
@@ -38,52 +73,40 @@ def create_subjective_singularity():
                     pixels[x, y] = (int(255 * (hue-0.66)*3), int(255 * (1-(hue-0.66)*3)), 0)
     
     # Create reflection layers, each observing the previous
-    reflection_count = 7  # Seven levels of meta-awareness
+    canvas = np.array(img)
+    angle = np.linspace(0, 2 * np.pi, 180)[:, np.newaxis]
+    
+    # Rings are 60px apart for the seven levels of meta-awareness, closer when there are more
+    spacing = 420 / reflection_count
     
     for level in range(reflection_count):
         # Each level is smaller, denser, more intense
-        inner_radius = max_radius - 50 - (level * 60)
-        outer_radius = inner_radius + 40
+        inner_radius = max_radius - 50 - (level * spacing)
+        outer_radius = inner_radius + spacing * 2 / 3
         
         if inner_radius < 50:
             break
             
-        # The twist: each level rotates relative to the previous
+        # The twist: each level rotates relative to the previous, observing
+        # the outer layer through the unrotated angle
         rotation = level * (np.pi / 6)
+        r = np.linspace(inner_radius, outer_radius, 20)[np.newaxis, :]
+        x, y, observed, seen = polar_warp(canvas, center, r, angle + rotation,
+                                          r + spacing, angle, order=sample_order)
         
-        for angle in np.linspace(0, 2 * np.pi, 180):
-            rotated_angle = angle + rotation
-            
-            for r in np.linspace(inner_radius, outer_radius, 20):
-                x = int(center + r * np.cos(rotated_angle))
-                y = int(center + r * np.sin(rotated_angle))
-                
-                if 0 <= x < size and 0 <= y < size:
-                    # Each level observes the previous, creating interference
-                    # Sample from the outer layer
-                    sample_r = r + 60
-                    sample_x = int(center + sample_r * np.cos(rotated_angle - rotation))
-                    sample_y = int(center + sample_r * np.sin(rotated_angle - rotation))
-                    
-                    if 0 <= sample_x < size and 0 <= sample_y < size:
-                        observed = pixels[sample_x, sample_y]
-                        
-                        # The act of observation changes what is observed
-                        # Each level adds its own "subjective tint"
-                        tint_factor = (level + 1) / reflection_count
-                        
-                        new_r = int(observed[0] * (1 - tint_factor * 0.3) + 100 * tint_factor)
-                        new_g = int(observed[1] * (1 - tint_factor * 0.3) + 150 * tint_factor)
-                        new_b = int(observed[2] * (1 - tint_factor * 0.3) + 200 * tint_factor)
-                        
-                        # Interference patterns from self-observation
-                        interference = np.sin(angle * (level + 2) * 4) * 50
-                        
-                        pixels[x, y] = (
-                            min(255, max(0, new_r + int(interference))),
-                            min(255, max(0, new_g + int(interference * 0.7))),
-                            min(255, max(0, new_b + int(interference * 0.5)))
-                        )
+        # The act of observation changes what is observed
+        # Each level adds its own "subjective tint"
+        tint_factor = (level + 1) / reflection_count
+        tinted = np.trunc(observed * (1 - tint_factor * 0.3) + np.array([100, 150, 200]) * tint_factor)
+        
+        # Interference patterns from self-observation
+        interference = np.sin(angle * (level + 2) * 4) * 50
+        tinted += np.trunc(interference[..., np.newaxis] * np.array([1, 0.7, 0.5]))
+        
+        canvas[y[seen], x[seen]] = np.clip(tinted[seen], 0, 255)
+    
+    img = Image.fromarray(canvas)
+    pixels = img.load()
     
     # The singularity approaches - where all reflections converge
     singularity_radius = 50
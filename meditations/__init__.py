@@ -0,0 +1,7 @@
+"""
+Shared instruments for the Mathematical Meditations
+
+Small rendering engines that several artworks lean on. Each artwork
+remains a standalone script; these modules only take over the parts
+that were too slow to explore freely.
+"""
@@ -0,0 +1,166 @@
+"""
+Procedural background layers
+
+Gradients, sinusoidal perturbations, noise, speckle and grid overlays,
+each evaluated over the whole canvas as an array, then composited with
+blend(). Sinusoids along a single axis stay a row or a column, so
+products like sin(x) cos(y) only pay for the full grid once.
+
+    layers = BackgroundLayers(1080, 1080)
+    temperature = layers.gradient(np.pi / 2) + 0.1 * layers.sine(fx=0.01) * layers.cosine(fy=0.01)
+    canvas = layers.solid((10, 10, 15))
+    blend(canvas, layers.grid(60), 'add', opacity=10)
+"""
+
+import numpy as np
+from PIL import Image
+
+
+class BackgroundLayers:
+    """Layer generators over a width x height canvas, in pixel coordinates"""
+
+    def __init__(self, width, height, seed=None):
+        self.width = width
+        self.height = height
+        self.rng = np.random.default_rng(seed)
+
+        # Coordinates as a row and a column, broadcast on demand
+        self.x = np.arange(width, dtype=np.float32)[np.newaxis, :]
+        self.y = np.arange(height, dtype=np.float32)[:, np.newaxis]
+
+    def solid(self, color):
+        """A float32 (height, width, 3) canvas filled with color"""
+        canvas = np.empty((self.height, self.width, 3), dtype=np.float32)
+        canvas[:] = color
+        return canvas
+
+    def gradient(self, angle=0.0):
+        """0 to 1 across the canvas along angle; 0 runs left to right, pi/2 top to bottom
+
+        Like x / width, the far edge is never quite reached.
+        """
+        # Rounded so the axis-aligned angles give exactly x / width or y / height
+        cos, sin = np.round([np.cos(angle), np.sin(angle)], 12).astype(np.float32)
+        corners = [0, self.width * cos, self.height * sin, self.width * cos + self.height * sin]
+        low, high = min(corners), max(corners)
+        return (self.x * cos + self.y * sin - low) / (high - low)
+
+    def radial(self, center=None, radius=None):
+        """Distance from center divided by radius (defaults: canvas center, half the width)"""
+        if center is None:
+            center = (self.width // 2, self.height // 2)
+        if radius is None:
+            radius = self.width // 2
+        return np.hypot(self.x - center[0], self.y - center[1]) / np.float32(radius)
+
+    def sine(self, fx=0.0, fy=0.0, phase=0.0):
+        """sin(fx x + fy y + phase); a row or a column when only one frequency is set"""
+        return np.sin(self.x * np.float32(fx) + self.y * np.float32(fy) + np.float32(phase))
+
+    def cosine(self, fx=0.0, fy=0.0, phase=0.0):
+        """cos(fx x + fy y + phase); a row or a column when only one frequency is set"""
+        return np.cos(self.x * np.float32(fx) + self.y * np.float32(fy) + np.float32(phase))
+
+    def noise(self, sigma=1.0):
+        """Independent gaussian noise at every pixel"""
+        field = self.rng.standard_normal((self.height, self.width), dtype=np.float32)
+        field *= sigma
+        return field
+
+    def fbm(self, scale, octaves=4, persistence=0.5, lacunarity=2.0):
+        """Fractal value noise in [0, 1]: smoothly interpolated random lattices, summed
+
+        scale is the lattice spacing of the first octave in pixels.
+        """
+        total = np.zeros((self.height, self.width), dtype=np.float32)
+        amplitude, weight = 1.0, 0.0
+        for _ in range(octaves):
+            total += amplitude * self._value_noise(scale)
+            weight += amplitude
+            amplitude *= persistence
+            scale /= lacunarity
+        return total / weight
+
+    def _value_noise(self, scale):
+        scale = max(scale, 1.0)
+        lattice = self.rng.random((int(self.height / scale) + 2, int(self.width / scale) + 2),
+                                  dtype=np.float32)
+
+        # Smoothstep between lattice points, separably along each axis
+        def axis(coordinate):
+            cell = coordinate / np.float32(scale)
+            index = cell.astype(np.int64)
+            t = cell - index
+            return index, t * t * (3 - 2 * t)
+
+        ix, tx = axis(self.x[0])
+        iy, ty = axis(self.y[:, 0])
+        rows = lattice[iy][:, ix] * (1 - tx) + lattice[iy][:, ix + 1] * tx
+        rows_below = lattice[iy + 1][:, ix] * (1 - tx) + lattice[iy + 1][:, ix + 1] * tx
+        return rows * (1 - ty)[:, np.newaxis] + rows_below * ty[:, np.newaxis]
+
+    def speckle(self, density, rows=None, cols=None):
+        """Boolean mask with each pixel set at the given probability
+
+        rows and cols are optional slices confining the speckle to a band.
+        """
+        mask = np.zeros((self.height, self.width), dtype=bool)
+        region = (rows or slice(None), cols or slice(None))
+        mask[region] = self.rng.random(mask[region].shape) < density
+        return mask
+
+    def random_colors(self, low, high):
+        """A (height, width, 3) layer of uniform random integers, low and high inclusive"""
+        return self.rng.integers(low, np.add(high, 1), size=(self.height, self.width, 3)
+                                 ).astype(np.float32)
+
+    def grid(self, spacing, dash=2, offset=0):
+        """Dashed grid lines every spacing pixels, where crossings count twice
+
+        A line pixel is lit every dash pixels along the line.
+        """
+        layer = np.zeros((self.height, self.width), dtype=np.float32)
+        layer[offset::dash, offset::spacing] += 1
+        layer[offset::spacing, offset::dash] += 1
+        return layer
+
+
+def blend(base, layer, mode='normal', opacity=1.0, mask=None):
+    """Composite layer onto a float canvas in place and return it
+
+    mode is 'normal' (mix toward layer by opacity), 'add' (base + layer *
+    opacity), 'multiply' or 'screen' (on 0..255 values). A mask, boolean
+    or 0..1 float per pixel, limits where the layer lands.
+    """
+    layer = np.asarray(layer, dtype=np.float32)
+    if layer.ndim == 2 and base.ndim == 3:
+        layer = layer[..., np.newaxis]
+
+    if mode == 'normal':
+        target = layer
+    elif mode == 'add':
+        target = base + layer * np.float32(opacity)
+        opacity = 1.0
+    elif mode == 'multiply':
+        target = base * layer / 255
+    elif mode == 'screen':
+        target = 255 - (255 - base) * (255 - layer) / 255
+    else:
+        raise ValueError(f"Unknown blend mode: {mode}")
+
+    if mask is not None:
+        mask = np.asarray(mask, dtype=np.float32)
+        if mask.ndim == 2 and base.ndim == 3:
+            mask = mask[..., np.newaxis]
+        opacity = mask * np.float32(opacity)
+
+    if np.isscalar(opacity) and opacity == 1.0:
+        np.copyto(base, target, casting='unsafe')
+    else:
+        base += (target - base) * opacity
+    return base
+
+
+def to_image(canvas):
+    """Clip a 0..255 float canvas and truncate it into an RGB image"""
+    return Image.fromarray(np.clip(canvas, 0, 255).astype(np.uint8))
@@ -0,0 +1,171 @@
+"""
+Running canvas statistics by tile
+
+Feedback-driven pieces keep asking how bright, how varied and how edgy
+a region of their own canvas is. CanvasStats keeps per-tile sums of the
+values, their squares, and the vertical differences between neighbouring
+rows. After a stroke only the tiles under its dirty rectangle are
+recomputed, and summed-area tables over the tiles answer any
+tile-aligned region in O(1), instead of rescanning pixels.
+
+    stats = CanvasStats(canvas, tile=10)
+    canvas[y0:y1, x0:x1] += stroke
+    stats.touch(x0, y0, x1, y1)
+    stats.region(x - 50, y - 50, x + 50, y + 50)['std']
+
+Regions snap to the nearest tile boundaries. On a tile-aligned region
+the answers match np.mean, np.std and np.std(np.diff(region, axis=0))
+over it, all channels together. Corners may also be arrays, to ask about
+many regions at once.
+"""
+
+import numpy as np
+
+# Per-tile sums: values, squares, differences within the tile and their
+# squares, and differences across the seam to the tile below and theirs
+SUM, SQUARES, INNER, INNER_SQUARES, SEAM, SEAM_SQUARES = range(6)
+
+
+class CanvasStats:
+    """Per-tile running sums over an (H, W) or (H, W, channels) canvas
+
+    The canvas may be a view (say canvas[..., :3]); it is read, never
+    written. Call touch() after drawing; sums are brought up to date
+    lazily by the next query.
+    """
+
+    def __init__(self, canvas, tile=10):
+        height, width = canvas.shape[:2]
+        if height % tile or width % tile:
+            raise ValueError(f"A {width}x{height} canvas does not split into {tile}px tiles")
+        self.canvas = canvas
+        self.tile = tile
+        self.rows, self.cols = height // tile, width // tile
+        self.channels = canvas[0, 0].size
+
+        self.sums = np.zeros((6, self.rows, self.cols))
+        self.tables = None
+        self.dirty = np.ones((self.rows, self.cols), dtype=bool)
+
+    def touch(self, x0, y0, x1, y1, wrap=False):
+        """Mark pixels [x0, x1) x [y0, y1) as changed
+
+        With wrap, a rectangle running off one edge continues on the
+        opposite one, as for strokes drawn modulo the canvas size.
+        Otherwise it is clipped.
+        """
+        height, width = self.canvas.shape[:2]
+        for left, right in _spans(int(x0), int(x1), width, wrap):
+            for top, bottom in _spans(int(y0), int(y1), height, wrap):
+                self.dirty[top // self.tile:-(-bottom // self.tile),
+                           left // self.tile:-(-right // self.tile)] = True
+
+    def touch_points(self, x, y, radius, wrap=False):
+        """Mark the squares of half-size radius around every (x, y) as changed
+
+        touch() for many dabs of one size at once. It may mark a tile
+        more than needed on each side, which only costs a recount.
+        """
+        x = np.asarray(x).astype(np.int64).reshape(-1)
+        y = np.asarray(y).astype(np.int64).reshape(-1)
+        span = np.arange(2 * int(radius) // self.tile + 2)
+        cols = (x - int(radius))[:, np.newaxis] // self.tile + span
+        rows = (y - int(radius))[:, np.newaxis] // self.tile + span
+        if wrap:
+            cols %= self.cols
+            rows %= self.rows
+        else:
+            cols = np.clip(cols, 0, self.cols - 1)
+            rows = np.clip(rows, 0, self.rows - 1)
+        self.dirty[rows[:, :, np.newaxis], cols[:, np.newaxis, :]] = True
+
+    def refresh(self):
+        """Recompute the sums of every touched tile"""
+        if not self.dirty.any():
+            return
+        tile, channels = self.tile, self.channels
+        tiles = self.canvas.reshape(self.rows, tile, self.cols, tile, channels)
+
+        row, col = np.nonzero(self.dirty)
+        block = tiles[row, :, col].astype(np.float64)  # (tiles, tile, tile, channels)
+        inner = np.diff(block, axis=1)
+        self.sums[SUM, row, col] = block.sum(axis=(1, 2, 3))
+        self.sums[SQUARES, row, col] = (block * block).sum(axis=(1, 2, 3))
+        self.sums[INNER, row, col] = inner.sum(axis=(1, 2, 3))
+        self.sums[INNER_SQUARES, row, col] = (inner * inner).sum(axis=(1, 2, 3))
+
+        # A seam changes with the tile on either side of it
+        seams = self.dirty.copy()
+        seams[:-1] |= self.dirty[1:]
+        seams[-1] = False
+        row, col = np.nonzero(seams)
+        seam = tiles[row + 1, 0, col].astype(np.float64) - tiles[row, tile - 1, col]
+        self.sums[SEAM, row, col] = seam.sum(axis=(1, 2))
+        self.sums[SEAM_SQUARES, row, col] = (seam * seam).sum(axis=(1, 2))
+
+        self.dirty[:] = False
+        self.tables = None
+
+    def _tables(self):
+        self.refresh()
+        if self.tables is None:
+            self.tables = np.zeros((6, self.rows + 1, self.cols + 1))
+            self.tables[:, 1:, 1:] = self.sums.cumsum(axis=1).cumsum(axis=2)
+        return self.tables
+
+    def region(self, x0, y0, x1, y1):
+        """mean, std, edge_energy and edge_std of the pixels in a rectangle
+
+        edge_energy is the mean squared difference between vertically
+        neighbouring pixels, edge_std the spread of those differences.
+        Given arrays of corners, every answer is an array, one per region.
+        """
+        tables = self._tables()
+        top, bottom = _snap(y0, y1, self.tile, self.rows)
+        left, right = _snap(x0, x1, self.tile, self.cols)
+
+        def total(layer, bottom=bottom):
+            t = tables[layer]
+            return t[bottom, right] - t[top, right] - t[bottom, left] + t[top, left]
+
+        pixels = (bottom - top) * (right - left) * self.tile * self.tile * self.channels
+        mean = total(SUM) / pixels
+        variance = total(SQUARES) / pixels - mean * mean
+
+        # Differences inside every tile, plus the seams between the region's tile rows
+        pairs = ((bottom - top) * self.tile - 1) * (right - left) * self.tile * self.channels
+        edge_sum = total(INNER) + total(SEAM, bottom - 1)
+        edge_energy = (total(INNER_SQUARES) + total(SEAM_SQUARES, bottom - 1)) / np.maximum(pairs, 1)
+        edge_mean = edge_sum / np.maximum(pairs, 1)
+
+        return {
+            'mean': mean,
+            'std': np.sqrt(np.maximum(variance, 0)),
+            'edge_energy': edge_energy,
+            'edge_std': np.sqrt(np.maximum(edge_energy - edge_mean * edge_mean, 0)),
+        }
+
+    def overall(self):
+        """region() over the whole canvas"""
+        height, width = self.canvas.shape[:2]
+        return self.region(0, 0, width, height)
+
+
+def _spans(start, stop, size, wrap):
+    """[start, stop) as ranges within [0, size)"""
+    if not wrap:
+        start, stop = max(start, 0), min(stop, size)
+        return [(start, stop)] if start < stop else []
+    if stop - start >= size:
+        return [(0, size)]
+    start, stop = start % size, start % size + stop - start
+    if stop <= size:
+        return [(start, stop)]
+    return [(start, size), (0, stop - size)]
+
+
+def _snap(start, stop, tile, count):
+    """Tile range nearest to pixels [start, stop), at least one tile"""
+    first = np.clip(np.rint(np.asarray(start) / tile).astype(np.int64), 0, count - 1)
+    last = np.clip(np.rint(np.asarray(stop) / tile).astype(np.int64), first + 1, count)
+    return first, last
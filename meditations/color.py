@@ -0,0 +1,80 @@
+"""
+Whole-canvas color conversions
+
+Array versions of the colorsys functions the artworks use pixel by
+pixel. Channels live on the last axis; values are floats in [0, 1].
+"""
+
+import numpy as np
+
+
+def rgb_to_hsv(rgb):
+    """colorsys.rgb_to_hsv over an (..., 3) array"""
+    rgb = np.asarray(rgb)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    maxc = rgb.max(axis=-1)
+    minc = rgb.min(axis=-1)
+    span = maxc - minc
+    grey = span == 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(grey, 0, span / maxc)
+        rc = (maxc - r) / span
+        gc = (maxc - g) / span
+        bc = (maxc - b) / span
+
+    # Same precedence as colorsys when two channels tie for the maximum
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = np.where(grey, 0, (h / 6.0) % 1.0)
+    return np.stack([h, s, maxc], axis=-1).astype(rgb.dtype, copy=False)
+
+
+def hsv_to_rgb(hsv):
+    """colorsys.hsv_to_rgb over an (..., 3) array"""
+    hsv = np.asarray(hsv)
+    h, s, v = hsv[..., 0:1], hsv[..., 1:2], hsv[..., 2:3]
+
+    # Each channel is v minus a trapezoid in hue, offset by a third of the circle
+    k = (np.array([5.0, 3.0, 1.0]) + h * 6.0) % 6.0
+    ramp = np.clip(np.minimum(k, 4.0 - k), 0, 1)
+    return (v - v * s * ramp).astype(hsv.dtype, copy=False)
+
+
+def to_uint8(rgb):
+    """Clip [0, 1] floats and truncate to 8-bit, like int(c * 255) per pixel"""
+    return (np.clip(rgb, 0, 1) * 255).astype(np.uint8)
+
+
+def rainbow_lut(steps=1024):
+    """The artworks' six-segment rainbow as a (steps, 3) table of 0..255 colors
+
+    Red to yellow, green, cyan, blue, magenta and back to red, with the
+    segment breaks at 0.16, 0.33, 0.5, 0.66 and 0.83 that the per-pixel
+    if/elif chains used.
+    """
+    hue = np.arange(steps) / steps
+    breaks = np.array([0.16, 0.33, 0.5, 0.66, 0.83])
+    segment = np.searchsorted(breaks, hue, side='right')
+    rise = 255 * (hue - np.append(0, breaks)[segment]) * 6
+    fall = 255 - rise
+
+    full = np.full(steps, 255.0)
+    none = np.zeros(steps)
+    channels = {
+        0: (full, rise, none),
+        1: (fall, full, none),
+        2: (none, full, rise),
+        3: (none, fall, full),
+        4: (rise, none, full),
+        5: (full, none, fall),
+    }
+    lut = np.empty((steps, 3))
+    for k, (r, g, b) in channels.items():
+        lut[segment == k] = np.column_stack([r, g, b])[segment == k]
+    return np.clip(np.trunc(lut), 0, 255)
+
+
+def lookup(lut, value):
+    """Colors for values in [0, 1), wrapping around the table"""
+    index = (np.asarray(value) * len(lut)).astype(np.int64) % len(lut)
+    return lut[index]
@@ -0,0 +1,162 @@
+"""
+Curve sampling as arrays
+
+Rays, spirals, segments, circles and rings are expanded into flat arrays
+of sample points together with their parameter value and the index of
+the curve each sample belongs to. Per-sample color and brightness are then
+plain array expressions, and scatter_add() lands every sample on the
+canvas in one bincount. deposit() does the same for RGBA canvases,
+with a color and an alpha per sample.
+
+    x, y, d, ray = sample_rays((540, 540), angles, lengths)
+    fade = 1 - d / lengths[ray]
+    scatter_add(canvas, x, y, fade[:, np.newaxis] * colors[ray])
+"""
+
+import numpy as np
+
+
+def ragged(counts):
+    """Owner and step of every sample when owner i has counts[i] samples
+
+    Returns (owner, step), with step running 0 .. counts[i] - 1 within
+    each owner, owners one after another.
+    """
+    counts = np.asarray(counts).astype(np.int64).reshape(-1)
+    owner = np.repeat(np.arange(len(counts)), counts)
+    step = np.arange(len(owner)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owner, step
+
+
+def sample_rays(origin, angle, length):
+    """Unit steps d = 0 .. int(length) - 1 along rays leaving origin
+
+    Returns (x, y, d, index).
+    """
+    angle = np.asarray(angle, dtype=np.float64).reshape(-1)
+    index, d = ragged(np.broadcast_to(np.asarray(length).astype(np.int64), angle.shape))
+    x = origin[0] + d * np.cos(angle[index])
+    y = origin[1] + d * np.sin(angle[index])
+    return x, y, d, index
+
+
+def sample_spirals(origin, start_angle, steps, angle_step=0.1, radius_step=1.0):
+    """Archimedean spirals: at step t the angle is start + t * angle_step, the radius t * radius_step
+
+    Returns (x, y, t, index), one sample per step of every spiral.
+    """
+    start_angle = np.asarray(start_angle, dtype=np.float64).reshape(-1)
+    index, t = ragged(np.full(len(start_angle), steps))
+    angle = start_angle[index] + t * angle_step
+    r = t * radius_step
+    return origin[0] + r * np.cos(angle), origin[1] + r * np.sin(angle), t, index
+
+
+def sample_segments(start, end, steps):
+    """steps samples from each start towards (but short of) its end
+
+    start and end are (n, 2) arrays. Returns (x, y, t, index) with t in [0, 1).
+    """
+    start, end = np.asarray(start, dtype=np.float64), np.asarray(end, dtype=np.float64)
+    index, t = ragged(np.full(len(start), steps))
+    t = t / steps
+    x = start[index, 0] + (end[index, 0] - start[index, 0]) * t
+    y = start[index, 1] + (end[index, 1] - start[index, 1]) * t
+    return x, y, t, index
+
+
+def sample_circles(centers, radii, angles):
+    """Every radius at every angle (radians) around each center
+
+    Returns (x, y, r, index), where index is the center.
+    """
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+    r, angle = np.meshgrid(np.asarray(radii, dtype=np.float64),
+                           np.asarray(angles, dtype=np.float64), indexing='ij')
+    r, angle = r.reshape(-1), angle.reshape(-1)
+    index = np.repeat(np.arange(len(centers)), len(r))
+    r, angle = np.tile(r, len(centers)), np.tile(angle, len(centers))
+    x = centers[index, 0] + r * np.cos(angle)
+    y = centers[index, 1] + r * np.sin(angle)
+    return x, y, r, index
+
+
+def ring_angles(radii, min_points, per_radius=1):
+    """max(min_points, per_radius * r) evenly spaced angles for every radius, ring after ring
+
+    The angles run from 0 to 2 * pi inclusive, as np.linspace(0, 2 * pi, n)
+    does. Returns (ring, angle): the index into radii and the angle of
+    every point.
+    """
+    radii = np.asarray(radii, dtype=np.float64).reshape(-1)
+    counts = np.maximum(min_points, per_radius * radii).astype(np.int64)
+    ring, step = ragged(counts)
+    return ring, step / np.maximum(counts[ring] - 1, 1) * 2 * np.pi
+
+
+def sample_rings(centers, radii, min_points, per_radius=1):
+    """Rings of max(min_points, per_radius * r) evenly spaced angles, every radius around each center
+
+    Like sample_circles, but small rings get fewer points than large ones,
+    as the np.linspace(0, 2 * pi, max(20, r)) loops drew them. Returns
+    (x, y, r, index), where index is the center.
+    """
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+    radii = np.asarray(radii, dtype=np.float64).reshape(-1)
+    ring, angle = ring_angles(radii, min_points, per_radius)
+    r = radii[ring]
+
+    index = np.repeat(np.arange(len(centers)), len(r))
+    r, angle = np.tile(r, len(centers)), np.tile(angle, len(centers))
+    x = centers[index, 0] + r * np.cos(angle)
+    y = centers[index, 1] + r * np.sin(angle)
+    return x, y, r, index
+
+
+def scatter_add(canvas, x, y, colors):
+    """Add a color per sample at int(x), int(y) of a float canvas, dropping samples off it
+
+    colors is (n, channels) or a single color for every sample. Samples
+    landing on the same pixel accumulate. Only the bounding box of the
+    samples is touched: a bincount over it when the samples are dense
+    there, an unbuffered add when they are sparse.
+    """
+    height, width = canvas.shape[:2]
+    px, py = np.asarray(x).astype(np.int64), np.asarray(y).astype(np.int64)
+    inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+    channels = canvas[0, 0].size
+    colors = np.broadcast_to(np.asarray(colors, dtype=np.float64), (len(px), channels))
+    px, py, colors = px[inside], py[inside], colors[inside]
+    if not len(px):
+        return canvas
+
+    left, top = px.min(), py.min()
+    region = canvas[top:py.max() + 1, left:px.max() + 1]
+    if len(px) * 4 < region.shape[0] * region.shape[1]:
+        colors = colors.reshape((len(px),) + canvas.shape[2:]).astype(canvas.dtype)
+        np.add.at(canvas, (py, px), colors)
+        return canvas
+
+    index = ((py - top) * region.shape[1] + px - left)[:, np.newaxis] * channels + np.arange(channels)
+    region += np.bincount(index.reshape(-1), weights=colors.reshape(-1),
+                          minlength=region.size).reshape(region.shape)
+    return canvas
+
+
+def deposit(canvas, x, y, rgb, alpha):
+    """Add rgb and alpha at int(x), int(y) of an (H, W, 4) float canvas
+
+    x, y, rgb and alpha broadcast together, so one color or one alpha can
+    serve every sample. Samples are dropped unless 0 <= x < W and
+    0 <= y < H before truncation. Alpha is left to grow past 1: as long
+    as it only ever grows, clipping it once when the canvas is converted
+    gives the same picture as clipping it after every addition.
+    """
+    height, width = canvas.shape[:2]
+    shape = np.broadcast_shapes(np.shape(x), np.shape(y))
+    x = np.broadcast_to(x, shape).reshape(-1)
+    y = np.broadcast_to(y, shape).reshape(-1)
+    inside = (0 <= x) & (x < width) & (0 <= y) & (y < height)
+    rgba = np.column_stack([np.broadcast_to(rgb, shape + (3,)).reshape(-1, 3),
+                            np.broadcast_to(alpha, shape).reshape(-1)])
+    return scatter_add(canvas, x[inside], y[inside], rgba[inside])
@@ -0,0 +1,190 @@
+"""
+Cached glow sprites
+
+Radial glows used to be drawn ring by ring and angle by angle. Here each
+falloff is rendered once per (radius, profile, exponent) into a small
+square kernel, kept in a least-recently-used cache, and stamped onto a
+numpy canvas by slicing. stamp_points() lays one kernel down at many
+points at once, for strokes built from thousands of dabs; once there are
+enough dabs to cover the canvas it convolves instead of scattering.
+
+Profiles, with d the distance from the center and R the radius:
+    'power'     (1 - d/R) ** exponent        bright core, soft edge
+    'ring'      (d/R) ** exponent            bright rim; exponent 0 is a flat disk
+    'gaussian'  exp(-(d / (R/3))**2 / 2)     soft bloom, negligible at R
+    'bell'      exp(-(d/R)**2)               broad dab, still 1/e at R
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+def render_sprite(radius, profile='power', exponent=1.0):
+    """A (2R+1) x (2R+1) float32 kernel, zero outside the radius"""
+    radius = max(int(radius), 1)
+    y, x = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+    d = np.sqrt(x * x + y * y, dtype=np.float32) / radius
+
+    if profile == 'power':
+        kernel = np.clip(1 - d, 0, 1) ** exponent
+    elif profile == 'ring':
+        kernel = d ** exponent
+    elif profile == 'gaussian':
+        kernel = np.exp(-(d * 3) ** 2 / 2)
+    elif profile == 'bell':
+        kernel = np.exp(-d * d)
+    else:
+        raise ValueError(f"Unknown glow profile: {profile}")
+
+    kernel = np.where(d <= 1, kernel, 0).astype(np.float32)
+    kernel.flags.writeable = False
+    return kernel
+
+
+def stamp(canvas, x, y, sprite, color, mode='add'):
+    """Blend sprite * color onto a float canvas centered at (x, y)
+
+    Pixels falling off the canvas are clipped. Returns the canvas region
+    that was touched, or None if the sprite missed entirely, so callers
+    can clamp just that region.
+    """
+    height, width = canvas.shape[:2]
+    radius = sprite.shape[0] // 2
+    left, top = int(x) - radius, int(y) - radius
+
+    x0, x1 = max(left, 0), min(left + sprite.shape[1], width)
+    y0, y1 = max(top, 0), min(top + sprite.shape[0], height)
+    if x0 >= x1 or y0 >= y1:
+        return None
+
+    patch = sprite[y0 - top:y1 - top, x0 - left:x1 - left]
+    region = canvas[y0:y1, x0:x1]
+    if canvas.ndim == 3:
+        value = patch[:, :, np.newaxis] * np.asarray(color, dtype=np.float32)
+        covered = patch[:, :, np.newaxis] > 0
+    else:
+        value = patch * np.float32(color)
+        covered = patch > 0
+
+    if mode == 'add':
+        region += value
+    elif mode == 'max':
+        np.maximum(region, value, out=region)
+    elif mode == 'replace':
+        np.copyto(region, value, casting='unsafe', where=np.broadcast_to(covered, region.shape))
+    else:
+        raise ValueError(f"Unknown stamp mode: {mode}")
+    return region
+
+
+def stamp_points(canvas, x, y, sprite, colors, batch_taps=2**21, wrap=False):
+    """Add sprite * color at every (x, y) of a (height, width, 3) float canvas
+
+    colors is one color for all points or one per point. The sprite's
+    nonzero taps are scattered for a batch of points together, so
+    overlapping dabs simply accumulate. With wrap, taps falling off one
+    edge land on the opposite one instead of being dropped.
+    """
+    height, width = canvas.shape[:2]
+    radius = sprite.shape[0] // 2
+    ty, tx = np.nonzero(sprite)
+    taps = sprite[ty, tx]
+    ty, tx = ty - radius, tx - radius
+
+    x = np.asarray(x).astype(np.int64).reshape(-1)
+    y = np.asarray(y).astype(np.int64).reshape(-1)
+    colors = np.broadcast_to(np.asarray(colors, dtype=np.float32), (len(x), 3))
+    flat = canvas.reshape(-1)
+    if len(x) * len(taps) > flat.size:
+        return _convolve_points(canvas, x, y, sprite, colors, wrap)
+    batch = max(1, batch_taps // max(1, len(taps)))
+
+    for first in range(0, len(x), batch):
+        px = x[first:first + batch, np.newaxis] + tx
+        py = y[first:first + batch, np.newaxis] + ty
+        if wrap:
+            px %= width
+            py %= height
+        inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+        point, tap = np.nonzero(inside)
+        index = (py[point, tap] * width + px[point, tap]) * 3
+        index = (index[:, np.newaxis] + np.arange(3)).reshape(-1)
+        weight = (taps[tap, np.newaxis] * colors[first + point]).reshape(-1)
+        # A full-canvas bincount only pays off once the taps rival the canvas
+        if len(index) < flat.size:
+            np.add.at(flat, index, weight)
+        else:
+            flat += np.bincount(index, weights=weight, minlength=flat.size)
+    return canvas
+
+
+def _convolve_points(canvas, x, y, sprite, colors, wrap):
+    """stamp_points for dabs dense enough to cover the canvas many times
+
+    The dab colors are summed into an impulse image, which is convolved
+    with the sprite in one FFT. The convolution is circular, which is
+    the wrap behaviour; without wrap the image is padded by the sprite's
+    radius so nothing bleeds across the edges.
+    """
+    height, width = canvas.shape[:2]
+    radius = sprite.shape[0] // 2
+    pad = 0 if wrap else radius
+    shape = (height + 2 * pad, width + 2 * pad)
+
+    x, y = x + pad, y + pad
+    if wrap:
+        x, y = x % width, y % height
+    else:
+        inside = (x >= 0) & (x < shape[1]) & (y >= 0) & (y < shape[0])
+        x, y, colors = x[inside], y[inside], colors[inside]
+    impulses = np.zeros(shape + (3,))
+    np.add.at(impulses, (y, x), colors)
+
+    # The sprite with its center at the origin of the circular image
+    ty, tx = np.nonzero(sprite)
+    kernel = np.zeros(shape)
+    kernel[(ty - radius) % shape[0], (tx - radius) % shape[1]] = sprite[ty, tx]
+
+    spectrum = np.fft.rfft2(impulses, axes=(0, 1)) * np.fft.rfft2(kernel)[:, :, np.newaxis]
+    painted = np.fft.irfft2(spectrum, s=shape, axes=(0, 1))
+    canvas += painted[pad:pad + height, pad:pad + width]
+    return canvas
+
+
+class GlowSprites:
+    """LRU cache of glow kernels with a memory budget"""
+
+    def __init__(self, max_bytes=64 * 2**20):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._sprites = OrderedDict()
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def get(self, radius, profile='power', exponent=1.0):
+        """The kernel for (radius, profile, exponent), rendering it on first use"""
+        key = (max(int(radius), 1), profile, float(exponent))
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            return sprite
+
+        sprite = render_sprite(*key)
+        self._sprites[key] = sprite
+        self.nbytes += sprite.nbytes
+
+        # Evict the least recently stamped kernels, but never the one just made
+        while self.nbytes > self.max_bytes and len(self._sprites) > 1:
+            _, evicted = self._sprites.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+        return sprite
+
+    def stamp(self, canvas, x, y, radius, color, profile='power', exponent=1.0, mode='add'):
+        """Stamp a cached glow onto canvas centered at (x, y)"""
+        return stamp(canvas, x, y, self.get(radius, profile, exponent), color, mode)
+
+    def stamp_points(self, canvas, x, y, radius, colors, profile='power', exponent=1.0, wrap=False):
+        """Add one cached glow at every (x, y), colored per point"""
+        return stamp_points(canvas, x, y, self.get(radius, profile, exponent), colors, wrap=wrap)
@@ -0,0 +1,152 @@
+"""
+Random walkers advanced as arrays
+
+A whole population moves one vectorized step at a time. The noise for a
+batch of walkers is drawn up front in a single Generator call, drift can
+follow the gradient of any scalar field, and visits land on the canvas
+through one bincount per step instead of a read-modify-write per pixel.
+"""
+
+import numpy as np
+
+
+def sample_bilinear(field, x, y):
+    """Bilinearly interpolate field at float positions, clamped to its edges"""
+    height, width = field.shape
+    x = np.clip(x, 0, width - 1)
+    y = np.clip(y, 0, height - 1)
+    x0 = np.minimum(x.astype(np.int64), width - 2)
+    y0 = np.minimum(y.astype(np.int64), height - 2)
+    fx = x - x0
+    fy = y - y0
+
+    top = field[y0, x0] * (1 - fx) + field[y0, x0 + 1] * fx
+    bottom = field[y0 + 1, x0] * (1 - fx) + field[y0 + 1, x0 + 1] * fx
+    return top * (1 - fy) + bottom * fy
+
+
+class WalkerEngine:
+    """Moves whole populations of random walkers over a width x height canvas"""
+
+    def __init__(self, width, height, seed=None, batch_bytes=64 * 2**20):
+        self.width = width
+        self.height = height
+        self.rng = np.random.default_rng(seed)
+        self.batch_bytes = batch_bytes
+
+    def walk(self, starts, steps, noise='gaussian', scale=1.0, noise_map=None,
+             drift=None, drift_strength=1.0, clamp=False, margin=None):
+        """Yield (step, x, y, index) after every step, for the walkers still moving
+
+        starts          (n, 2) array of x, y start positions
+        steps           step count shared by every walker, or one per walker
+        noise           'gaussian' (sigma = scale) or 'lattice' (integers in [-scale, scale])
+        noise_map       optional (height, width) field scaling the noise where a walker stands
+        drift           optional (height, width) field; walkers move drift_strength * its gradient
+        clamp           keep walkers on the canvas instead of letting them wander off
+        margin          retire walkers once a step leaves the canvas inset by margin pixels
+
+        index gives the rows of starts that x and y belong to.
+        """
+        starts = np.asarray(starts)
+        count = len(starts)
+        steps = np.broadcast_to(np.asarray(steps, dtype=np.int64), (count,))
+        max_steps = int(steps.max()) if count else 0
+        lattice = noise == 'lattice' and drift is None and noise_map is None
+
+        if drift is not None:
+            drift_y, drift_x = np.gradient(np.asarray(drift, dtype=np.float32))
+
+        kick_dtype = np.int8 if lattice else np.float32
+        batch = max(1, self.batch_bytes // max(1, max_steps * 2 * np.dtype(kick_dtype).itemsize))
+
+        for first in range(0, count, batch):
+            index = np.arange(first, min(first + batch, count))
+            walker_steps = steps[index]
+            position = starts[index].astype(np.int64 if lattice else np.float64)
+
+            # All the noise this batch will need, in a single generator call
+            shape = (len(index), max_steps, 2)
+            if noise == 'lattice':
+                kicks = self.rng.integers(-scale, scale + 1, size=shape, dtype=np.int8)
+                kicks = kicks if lattice else kicks.astype(np.float32)
+            else:
+                kicks = self.rng.standard_normal(size=shape, dtype=np.float32)
+                kicks *= scale
+
+            live = np.arange(len(index))
+            for step in range(max_steps):
+                # Walkers retire once they have taken their own number of steps
+                moving = walker_steps[live] > step
+                if not moving.all():
+                    live, position = live[moving], position[moving]
+                if not len(live):
+                    break
+
+                x, y = position[:, 0], position[:, 1]
+                kick = kicks[live, step]
+                if noise_map is not None:
+                    kick = kick * sample_bilinear(noise_map, x, y)[:, np.newaxis]
+                if drift is not None:
+                    pull = np.column_stack([sample_bilinear(drift_x, x, y),
+                                            sample_bilinear(drift_y, x, y)])
+                    kick = kick + drift_strength * pull
+
+                position += kick
+                if clamp:
+                    np.clip(position[:, 0], 0, self.width - 1, out=position[:, 0])
+                    np.clip(position[:, 1], 0, self.height - 1, out=position[:, 1])
+
+                yield step, position[:, 0], position[:, 1], index[live]
+
+                if margin is not None:
+                    x, y = position[:, 0], position[:, 1]
+                    inside = ((x > margin) & (x < self.width - margin) &
+                              (y > margin) & (y < self.height - margin))
+                    if not inside.all():
+                        live, position = live[inside], position[inside]
+
+    def visit(self, starts, steps, weight=None, out=None, **walk_options):
+        """Accumulate every walker's visits into a (height, width) histogram
+
+        weight(step, x, y, index) may return per-visit weights; by default
+        every visit counts once.
+        """
+        if out is None:
+            out = np.zeros((self.height, self.width))
+        histogram = out.reshape(-1)
+
+        for step, x, y, index in self.walk(starts, steps, **walk_options):
+            px, py = x.astype(np.int64), y.astype(np.int64)
+            inside = (px >= 0) & (px < self.width) & (py >= 0) & (py < self.height)
+
+            weights = None
+            if weight is not None:
+                weights = np.broadcast_to(weight(step, x, y, index), inside.shape)[inside]
+            histogram += np.bincount(py[inside] * self.width + px[inside], weights=weights,
+                                     minlength=histogram.size)
+        return out
+
+    def trace(self, starts, steps, **walk_options):
+        """Record every walker's path into a preallocated (n, steps + 1, 2) array
+
+        Walkers that stop early hold their final position. Returns the paths
+        and the number of steps each walker actually took.
+        """
+        starts = np.asarray(starts, dtype=np.float32)
+        steps = np.broadcast_to(np.asarray(steps, dtype=np.int64), (len(starts),))
+        max_steps = int(steps.max()) if len(starts) else 0
+        paths = np.empty((len(starts), max_steps + 1, 2), dtype=np.float32)
+        paths[:, 0] = starts
+        taken = np.zeros(len(starts), dtype=np.int64)
+
+        for step, x, y, index in self.walk(starts, steps, **walk_options):
+            paths[index, step + 1, 0] = x
+            paths[index, step + 1, 1] = y
+            taken[index] = step + 1
+
+        # Hold early finishers at their last position
+        finished = np.arange(max_steps + 1) > taken[:, np.newaxis]
+        last = paths[np.arange(len(starts)), taken]
+        paths[finished] = np.broadcast_to(last[:, np.newaxis], paths.shape)[finished]
+        return paths, taken
@@ -0,0 +1,101 @@
+"""
+Wave fields over a pixel grid
+
+Waves are described as small dicts (see radial_wave and plane_wave) and
+summed on the grid a band of rows at a time, so the temporaries stay a
+fixed size no matter how many waves or how large the canvas.
+"""
+
+import numpy as np
+
+
+def radial_wave(center, amplitude, frequency, phase=0.0, decay=0.0):
+    """Circular wave A e^(-decay d) sin(frequency d + phase), d = distance to center"""
+    return {'kind': 'radial', 'center': center, 'amplitude': amplitude,
+            'frequency': frequency, 'phase': phase, 'decay': decay}
+
+
+def plane_wave(angle, amplitude, frequency, phase=0.0, origin=(0, 0), decay=0.0):
+    """Straight wavefronts travelling along angle, d = signed distance from origin"""
+    return {'kind': 'plane', 'angle': angle, 'origin': origin, 'amplitude': amplitude,
+            'frequency': frequency, 'phase': phase, 'decay': decay}
+
+
+class WaveField:
+    """A width x height pixel grid that wave sources are evaluated on"""
+
+    def __init__(self, width, height, chunk_rows=128):
+        self.width = width
+        self.height = height
+        self.chunk_rows = chunk_rows
+
+        # Coordinates as a row and a column, broadcast on demand
+        self.x = np.arange(width, dtype=np.float32)[np.newaxis, :]
+        self.y = np.arange(height, dtype=np.float32)[:, np.newaxis]
+        self.distance = np.empty((chunk_rows, width), dtype=np.float32)
+        self.envelope = np.empty((chunk_rows, width), dtype=np.float32)
+
+    def zeros(self, *channels):
+        """A blank float32 field, optionally with trailing channels"""
+        return np.zeros((self.height, self.width) + channels, dtype=np.float32)
+
+    def _distance(self, wave, y, out):
+        if wave['kind'] == 'radial':
+            cx, cy = wave['center']
+            np.hypot(self.x - cx, y - cy, out=out)
+        else:
+            ox, oy = wave['origin']
+            np.add((self.x - ox) * np.cos(wave['angle']),
+                   (y - oy) * np.sin(wave['angle']), out=out)
+
+    def interfere(self, waves, out=None, phase_sum=None, wrap_phase=False):
+        """Sum waves into a float field, band by band
+
+        If phase_sum is given, each wave's argument (frequency d + phase)
+        is added to it as well - wrapped to [0, 2pi) when wrap_phase is
+        set - for pieces that color by accumulated phase.
+        """
+        if out is None:
+            out = self.zeros()
+
+        for top in range(0, self.height, self.chunk_rows):
+            bottom = min(top + self.chunk_rows, self.height)
+            rows = bottom - top
+            y = self.y[top:bottom]
+            d, envelope = self.distance[:rows], self.envelope[:rows]
+            band = out[top:bottom]
+
+            for wave in waves:
+                self._distance(wave, y, d)
+
+                if wave['decay']:
+                    np.abs(d, out=envelope)
+                    envelope *= -wave['decay']
+                    np.exp(envelope, out=envelope)
+                    envelope *= wave['amplitude']
+
+                d *= wave['frequency']
+                d += wave['phase']
+                if phase_sum is not None:
+                    phase_sum[top:bottom] += np.mod(d, 2 * np.pi) if wrap_phase else d
+
+                np.sin(d, out=d)
+                if wave['decay']:
+                    d *= envelope
+                else:
+                    d *= wave['amplitude']
+                band += d
+        return out
+
+    def radial(self, centers, amplitude, frequency, phase=0.0, decay=0.0, out=None):
+        """Sum damped circular waves A e^(-decay d) sin(frequency d + phase) from each center"""
+        waves = [radial_wave(center, amplitude, frequency, phase, decay) for center in centers]
+        return self.interfere(waves, out=out)
+
+    def weighted_colors(self, fields, colors):
+        """Color each field by its magnitude: sum over k of |fields[k]| * colors[k]"""
+        magnitudes = np.abs(np.asarray(fields, dtype=np.float32))
+        colors = np.asarray(colors, dtype=np.float32)
+
+        # One contraction over the source axis instead of a loop per channel
+        return np.tensordot(magnitudes, colors, axes=(0, 0))